@@ -7,29 +7,26 @@ __docformat__ = "restructuredtext en"
 __version__ = '2.0dev'
 __release_date__ = 'notyet'
 
-# Check basic dependencies
+# Check basic dependencies. Only numpy is needed for importing Brian, the other
+# packages are only located here and imported when they are first used (sympy
+# and pyparsing for parsing equations, scipy.weave for C++ code generation),
+# this keeps the import of Brian fast.
 import sys
+import pkgutil
 missing = []
 try:
     import numpy
 except ImportError as ex:
     print >>sys.stderr, 'Importing numpy failed:', ex
     missing.append('numpy')
-try:
-    import scipy
-except ImportError as ex:
-    print >>sys.stderr, 'Importing scipy failed:', ex
-    missing.append('scipy')
-try:
-    import sympy
-except ImportError as ex:
-    print >>sys.stderr, 'Importing sympy failed:', ex
-    missing.append('sympy')
-try:
-    import pyparsing
-except ImportError as ex:
-    print >>sys.stderr, 'Importing pyparsing failed:', ex
-    missing.append('pyparsing')
+for _package in ['scipy', 'sympy', 'pyparsing']:
+    try:
+        _found = pkgutil.find_loader(_package) is not None
+    except ImportError:
+        _found = False
+    if not _found:
+        print >>sys.stderr, 'Package %s could not be found' % _package
+        missing.append(_package)
 
 if len(missing):
     raise ImportError('Some required dependencies are missing:\n' + ', '.join(missing))
@@ -4,6 +4,8 @@ implement a new language.
 '''
 import functools
 
+import numpy
+
 from brian2.utils.stringtools import get_identifiers, deindent
 
 from ..specifiers import ArrayVariable
@@ -39,10 +41,12 @@ class Language(object):
         '''
         raise NotImplementedError
 
-    def translate_statement_sequence(self, statements, specifiers):
+    def translate_statement_sequence(self, statements, specifiers, dtype=None):
         '''
         Translate a sequence of Statements into the target language, taking
-        care to declare variables, etc. if necessary.
+        care to declare variables, etc. if necessary. If ``dtype`` is given,
+        values read from arrays of a less precise floating point type are
+        converted to ``dtype`` for the calculations (see `local_dtype`).
         
         Returns either a string, in which case when it in inserted into a
         template it should go in the ``%CODE%`` slot, or a dictionary
@@ -52,6 +56,23 @@ class Language(object):
         '''
         raise NotImplementedError
     
+    def local_dtype(self, array_dtype, dtype=None):
+        '''
+        Return the dtype used for calculations with the values of an array
+        with dtype ``array_dtype``, i.e. ``dtype`` if both are floating point
+        types and ``dtype`` is more precise, otherwise ``array_dtype``. This
+        allows to store values with lower precision (e.g. ``float32``) while
+        doing all calculations with higher precision (e.g. ``float64``).
+        '''
+        if dtype is None:
+            return array_dtype
+        array_dtype_obj = numpy.dtype(array_dtype)
+        dtype_obj = numpy.dtype(dtype)
+        if (array_dtype_obj.kind == 'f' and dtype_obj.kind == 'f' and
+                dtype_obj.itemsize > array_dtype_obj.itemsize):
+            return dtype
+        return array_dtype
+
     def code_object(self, code):
         '''
         Return an executable code object from the given code string.
@@ -146,6 +167,26 @@ class Language(object):
         '''
         return self.template_iterate_index_array('_neuron_idx', '_spikes', '_num_spikes')
     
+    def template_state_monitor(self):
+        '''
+        Template for recording state variables, the variable ``_neuron_idx``
+        ranges through the recorded indices ``_indices`` and
+        ``_monitor_idx`` is the position in this array.
+        Templates should have
+        slots indicated by strings like ``%CODE%`` (the default slot).
+        '''
+        raise NotImplementedError
+
+    def template_spike_monitor(self):
+        '''
+        Template for recording spikes, the variable ``_neuron_idx`` ranges
+        through the spikes ``_spikes`` and ``_spike_idx`` is the position in
+        this array.
+        Templates should have
+        slots indicated by strings like ``%CODE%`` (the default slot).
+        '''
+        raise NotImplementedError
+    
     def template_threshold(self):
         '''
         Template for threshold code.
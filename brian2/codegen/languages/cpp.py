@@ -1,10 +1,7 @@
 '''
 TODO: restrict keyword optimisations
 '''
-import sympy
-from sympy.printing.ccode import CCodePrinter
 import numpy
-from scipy import weave
 
 from brian2.utils.stringtools import deindent
 from brian2.utils.parsing import parse_to_sympy
@@ -102,6 +99,7 @@ class CPPLanguage(Language):
         self.flush_denormals = flush_denormals
     
     def translate_expression(self, expr):
+        from sympy.printing.ccode import CCodePrinter
         expr = parse_to_sympy(expr)
         return CCodePrinter().doprint(expr)
 
@@ -116,7 +114,7 @@ class CPPLanguage(Language):
             decl = ''
         return decl+var+' '+op+' '+self.translate_expression(expr)+';'
 
-    def translate_statement_sequence(self, statements, specifiers):
+    def translate_statement_sequence(self, statements, specifiers, dtype=None):
         read, write = self.array_read_write(statements, specifiers)
         lines = []
         # read arrays
@@ -128,14 +126,16 @@ class CPPLanguage(Language):
                 line = 'const '
             else:
                 line = ''
-            line = line+c_data_type(spec.dtype)+' '+var+' = '
+            local_dtype = self.local_dtype(spec.dtype, dtype)
+            line = line+c_data_type(local_dtype)+' '+var+' = '
             line = line+'_ptr'+spec.array+'['+index_var+'];'
             lines.append(line)
         # simply declare variables that will be written but not read
         for var in write:
             if var not in read:
                 spec = specifiers[var]
-                line = c_data_type(spec.dtype)+' '+var+';'
+                local_dtype = self.local_dtype(spec.dtype, dtype)
+                line = c_data_type(local_dtype)+' '+var+';'
                 lines.append(line)
         # the actual code
         lines.extend([self.translate_statement(stmt) for stmt in statements])
@@ -221,6 +221,40 @@ class CPPLanguage(Language):
             '%SUPPORT_CODE%':'%SUPPORT_CODE%',
             }
 
+    def template_state_monitor(self):
+        return {
+            '%MAIN%':self.denormals_to_zero_code()+'''
+            /*
+            %SUPPORT_CODE%
+            */
+            %HASHDEFINES%
+            %POINTERS%
+            for(int _monitor_idx=0; _monitor_idx<_num_indices; _monitor_idx++)
+            {
+                const int _neuron_idx = _indices[_monitor_idx];
+                %CODE%
+            }
+            ''',
+            '%SUPPORT_CODE%':'%SUPPORT_CODE%',
+            }
+
+    def template_spike_monitor(self):
+        return {
+            '%MAIN%':self.denormals_to_zero_code()+'''
+            /*
+            %SUPPORT_CODE%
+            */
+            %HASHDEFINES%
+            %POINTERS%
+            for(int _spike_idx=0; _spike_idx<_num_spikes; _spike_idx++)
+            {
+                const int _neuron_idx = _spikes[_spike_idx];
+                %CODE%
+            }
+            ''',
+            '%SUPPORT_CODE%':'%SUPPORT_CODE%',
+            }
+
     def template_threshold(self):
         return {
             '%MAIN%':self.denormals_to_zero_code()+'''
@@ -235,6 +269,7 @@ class CPPLanguage(Language):
                 %CODE%
                 if(_cond) {
                     _spikes_space[_cpp_numspikes++] = _neuron_idx;
+                    _array_refractory_until[_neuron_idx] = t + _array_refractory[_neuron_idx];
                 }
             }
             _array_num_spikes[0] = _cpp_numspikes;
@@ -278,6 +313,8 @@ class CPPCodeObject(CodeObject):
         self.extra_compile_args = extra_compile_args
         
     def __call__(self, **kwds):
+        # weave is only imported when C++ code is actually run
+        from scipy import weave
         self.namespace.update(kwds)
         weave.inline(self.code['%MAIN%'], self.namespace.keys(),
                      local_dict=self.namespace,
@@ -11,7 +11,7 @@ class CUDALanguage(CPPLanguage):
     
     def template_iterate_all(self, index, size):
         return '''
-        __global__ stateupdate(int _num_neurons, double t, double dt)
+        __global__ void stateupdate(int _num_neurons, double t, double dt)
         {{
             const int {index} = threadIdx.x+blockIdx.x*blockDim.x;
             if({index}>={size}) return;
@@ -22,7 +22,7 @@ class CUDALanguage(CPPLanguage):
     
     def template_iterate_index_array(self, index, array, size):
         return '''
-        __global__ stateupdate(int _num_neurons, double t, double dt)
+        __global__ void stateupdate(int _num_neurons, double t, double dt)
         {{
             const int _index_{array} = threadIdx.x+blockIdx.x*blockDim.x;
             if(_index_{array}>={size}) return;
@@ -34,7 +34,7 @@ class CUDALanguage(CPPLanguage):
 
     def template_threshold(self):
         return '''
-        __global__ threshold(int _num_neurons, double t, double dt)
+        __global__ void threshold(int _num_neurons, double t, double dt)
         {
             const int _neuron_idx = threadIdx.x+blockIdx.x*blockDim.x;
             if(_neuron_idx>=_num_neurons) return;
@@ -44,6 +44,30 @@ class CUDALanguage(CPPLanguage):
         }
         '''
         
+    def template_state_monitor(self):
+        return '''
+        __global__ void state_monitor(int _num_indices, double t, double dt)
+        {
+            const int _monitor_idx = threadIdx.x+blockIdx.x*blockDim.x;
+            if(_monitor_idx>=_num_indices) return;
+            const int _neuron_idx = _indices[_monitor_idx];
+            %POINTERS%
+            %CODE%
+        }
+        '''
+
+    def template_spike_monitor(self):
+        return '''
+        __global__ void spike_monitor(int _num_spikes, double t, double dt)
+        {
+            const int _spike_idx = threadIdx.x+blockIdx.x*blockDim.x;
+            if(_spike_idx>=_num_spikes) return;
+            const int _neuron_idx = _spikes[_spike_idx];
+            %POINTERS%
+            %CODE%
+        }
+        '''
+        
     def template_synapses(self):
         raise NotImplementedError
     
@@ -1,3 +1,8 @@
+import numpy
+
+from brian2.utils.stringtools import get_identifiers
+
+from ..specifiers import ArrayVariable
 from .base import Language, CodeObject
 
 
@@ -18,8 +23,15 @@ class PythonLanguage(Language):
             op = '='
         return var+' '+op+' '+self.translate_expression(expr)
 
-    def translate_statement_sequence(self, statements, specifiers):
+    def translate_statement_sequence(self, statements, specifiers, dtype=None):
         read, write = self.array_read_write(statements, specifiers)
+        # variables that are converted to a more precise type when read
+        converted = set(var for var in read
+                        if self.local_dtype(specifiers[var].dtype,
+                                            dtype) != specifiers[var].dtype)
+        gathered = self.gathered_copies(statements, specifiers, converted)
+        read = read - set(stmt.expr.strip() for stmt in gathered)
+        write = write - set(stmt.var for stmt in gathered)
         lines = []
         # read arrays
         for var in read:
@@ -28,16 +40,25 @@ class PythonLanguage(Language):
             line = var+' = '+spec.array
             if not index_spec.all:
                 line = line+'['+spec.index+']'
+            if var in converted:
+                line = line+'.astype(%r)' % numpy.dtype(dtype).name
             lines.append(line)
         # the actual code
-        lines.extend([self.translate_statement(stmt) for stmt in statements])
+        for stmt in statements:
+            if stmt in gathered:
+                source, target = gathered[stmt]
+                lines.append('%s.take(%s, out=%s)' % (source.array,
+                                                      source.index,
+                                                      target.array))
+            else:
+                lines.append(self.translate_statement(stmt))
         # write arrays
         for var in write:
             index_var = specifiers[var].index
             index_spec = specifiers[index_var]
             # check if all operations were inplace and we're operating on the
             # whole vector, if so we don't need to write the array back
-            if not index_spec.all:
+            if not index_spec.all or var in converted:
                 all_inplace = False
             else:
                 all_inplace = True
@@ -55,6 +76,48 @@ class PythonLanguage(Language):
                 lines.append(line)
         return '\n'.join(lines)
     
+    def gathered_copies(self, statements, specifiers, converted):
+        '''
+        Find statements copying an array read with an index array into an
+        array that is written as a whole (e.g. ``_record_v = v`` in a
+        `StateMonitor` recording a subset of neurons). These are translated
+        into ``take(..., out=...)`` calls, avoiding the temporary array of
+        the indexed read.
+
+        Returns
+        -------
+        gathered : dict
+            A dictionary mapping the statements to ``(source, target)``
+            tuples of `ArrayVariable` specifiers.
+        '''
+        gathered = {}
+        for stmt in statements:
+            if stmt.inplace:
+                continue
+            source_var = stmt.expr.strip()
+            source = specifiers.get(source_var, None)
+            target = specifiers.get(stmt.var, None)
+            if not (isinstance(source, ArrayVariable) and
+                    isinstance(target, ArrayVariable)):
+                continue
+            if (specifiers[source.index].all or
+                    not specifiers[target.index].all or
+                    source.dtype != target.dtype or
+                    source_var in converted):
+                continue
+            # Neither variable may be used by any other statement
+            used = False
+            for other in statements:
+                if other is not stmt:
+                    identifiers = set(get_identifiers(other.expr))
+                    identifiers.add(other.var)
+                    if source_var in identifiers or stmt.var in identifiers:
+                        used = True
+                        break
+            if not used:
+                gathered[stmt] = (source, target)
+        return gathered
+
     def code_object(self, code, specifiers):
         return PythonCodeObject(code, self.compile_methods(specifiers))
 
@@ -69,11 +132,31 @@ class PythonLanguage(Language):
         %CODE%
         '''.format(index=index, array=array)
 
+    def template_state_monitor(self):
+        return '''
+        _neuron_idx = _indices
+        %CODE%
+        '''
+
+    def template_spike_monitor(self):
+        return '''
+        _neuron_idx = _spikes
+        %CODE%
+        '''
+
     def template_threshold(self):
         return '''
         %CODE%
-        _spikes_space, = _cond.nonzero()
-        _array_num_spikes[0] = len(_spikes_space)
+        _array_num_spikes[0] = _cond.sum()
+        _new_spikes = _spikes_space[:_array_num_spikes[0]]
+        _indices.compress(_cond, out=_new_spikes)
+        # start the refractory period without allocating temporary arrays
+        _new_refractory = _refractory_space[:_array_num_spikes[0]]
+        _array_refractory.take(_new_spikes, out=_new_refractory)
+        _new_refractory_until = _refractory_until_space[:_array_num_spikes[0]]
+        _new_refractory_until[:] = _new_refractory
+        _new_refractory_until += t
+        _array_refractory_until.put(_new_spikes, _new_refractory_until)
         '''
 
     def template_synapses(self):
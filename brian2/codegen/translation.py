@@ -188,14 +188,18 @@ def translate(code, specifiers, dtype, language):
         should correspond to that given in the :class:`ArrayVariable`
         specifiers.
     ``dtype``
-        The default dtype for newly created variables (usually float64).
+        The default dtype for newly created variables (usually float64). Values
+        read from arrays with a less precise floating point dtype (e.g. float32)
+        are converted to this dtype, i.e. all calculations are done with the
+        precision of ``dtype`` and values are only rounded when they are
+        stored.
     ``language``
         The :class:`Language` to translate to.
     
     Returns a multi-line string.
     '''
     statements = make_statements(code, specifiers, dtype)
-    return language.translate_statement_sequence(statements, specifiers)
+    return language.translate_statement_sequence(statements, specifiers, dtype)
     
 
 if __name__=='__main__':
@@ -170,8 +170,11 @@ def clear(erase=False):
     run, reinit, MagicError
     '''
     if erase:
-        for obj in BrianObject.__instances__():
+        # Erasing the attributes can delete other objects, iterate over a copy
+        for obj in list(BrianObject.__instances__()):
             obj = obj()
+            if obj is None:
+                continue
             for k, v in obj.__dict__.iteritems():
                 object.__setattr__(obj, k, None)
     BrianObject.__instances__().clear()
@@ -1,3 +1,5 @@
+from numpy import zeros, arange, count_nonzero
+
 __all__ = ['SpikeSource']
 
 class SpikeSource(object):
@@ -17,14 +19,76 @@ class SpikeSource(object):
     * A `clock` attribute, this will be used as the default clock for objects
       with this as a source.
       
+    Classes deriving from `SpikeSource` can use its spike buffer: a
+    preallocated array `spike_space` of length ``len(obj)`` and an array
+    `spike_count` of length 1. A spike source (or its generated threshold
+    code) writes the indices of the spiking neurons into the beginning of
+    `spike_space` and their number into ``spike_count[0]``, the `spikes`
+    attribute is then a read-only view on this buffer. Emitting spikes
+    therefore does not allocate any memory.
+    
     .. attribute:: spikes
     
         An array of ints, each from 0 to ``len(obj)-1`` with no repeats (but
-        possibly not in sorted order). Updated each time step.
+        possibly not in sorted order). Updated each time step. If the spike
+        buffer is used, this is a read-only view that is only valid until the
+        next update, it has to be copied to be stored.
         
     .. attribute:: clock
     
         The clock on which the spikes will be updated.
     '''
-    # No implementation, just used for documentation purposes.
-    pass
\ No newline at end of file
+    #: Whether the `spikes` are always sorted in increasing order (allows
+    #: more efficient processing by objects using this spike source)
+    sorted_spikes = False
+    
+    def init_spike_buffer(self, N):
+        '''
+        Allocate the spike buffer for ``N`` neurons.
+        
+        Parameters
+        ----------
+        N : int
+            The number of neurons.
+        '''
+        #: Preallocated space for the indices of the spiking neurons
+        self.spike_space = zeros(N, dtype=int)
+        #: The number of spikes in the current time step (``spike_count[0]``)
+        self.spike_count = zeros(1, dtype=int)
+        self._indices = None
+        self._spikes_view = self.spike_space[:0]
+        self._spikes_view.flags.writeable = False
+    
+    def _get_spikes(self):
+        num_spikes = self.spike_count[0]
+        # The view is only recreated if the number of spikes changes
+        if len(self._spikes_view) != num_spikes:
+            self._spikes_view = self.spike_space[:num_spikes]
+            self._spikes_view.flags.writeable = False
+        return self._spikes_view
+    
+    def _set_spikes(self, spikes):
+        num_spikes = len(spikes)
+        self.spike_space[:num_spikes] = spikes
+        self.spike_count[0] = num_spikes
+    
+    spikes = property(_get_spikes, _set_spikes,
+                      doc='The indices of the neurons that spiked in the '
+                      'current time step.')
+    
+    def set_spikes_from_condition(self, condition):
+        '''
+        Fill the spike buffer with the indices where ``condition`` is
+        ``True`` (in increasing order).
+        
+        Parameters
+        ----------
+        condition : `ndarray`
+            A boolean array of length ``len(self)``.
+        '''
+        if self._indices is None:
+            self._indices = arange(len(self.spike_space))
+        num_spikes = count_nonzero(condition)
+        self._indices.compress(condition,
+                               out=self.spike_space[:num_spikes])
+        self.spike_count[0] = num_spikes
@@ -6,7 +6,6 @@ information about its namespace. Only serves as a parent class, its subclasses
 
 import inspect
 
-import sympy
 import numpy as np
 
 from .unitcheck import get_default_unit_namespace, SPECIAL_VARS
@@ -57,7 +56,67 @@ def get_default_numpy_namespace():
     namespace.update([(func.__name__, func) for func in replacements])
     
     return namespace
+
+
+# The numpy namespace never changes, build it only once
+_numpy_namespace = get_default_numpy_namespace()
+
+
+class NamespaceLookup(object):
+    '''
+    Lookup of identifiers in the namespaces of a `CodeString`, together with
+    the default unit and numpy namespaces. The namespaces are merged once
+    (in resolution order) and the matches for each identifier are cached.
+    
+    The namespaces of a `CodeString` are copies taken when it is created and
+    the numpy namespace does not change, the cache is therefore only
+    invalidated when the unit namespace changes, i.e. when new units are
+    registered.
     
+    Parameters
+    ----------
+    namespaces : dict
+        A dictionary mapping namespace descriptions (e.g. ``'locals'``) to
+        namespaces.
+    '''
+    def __init__(self, namespaces):
+        #: The namespaces of the `CodeString`
+        self.namespaces = namespaces
+        merged = dict(namespaces)
+        merged.update({'units': get_default_unit_namespace(),
+                       'numpy': _numpy_namespace})
+        #: List of (description, namespace) tuples in resolution order
+        self.merged_namespaces = merged.items()
+        self._cache = {}
+        self._version = None
+
+    def lookup(self, identifier):
+        '''
+        Look up an identifier in all namespaces.
+        
+        Parameters
+        ----------
+        identifier : str
+            The identifier to look up.
+        
+        Returns
+        -------
+        matches : list of tuple
+            A list of (namespace description, referred object) tuples for all
+            namespaces containing `identifier`, in resolution order.
+        '''
+        version = get_default_unit_namespace().version
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+        
+        if not identifier in self._cache:
+            self._cache[identifier] = [(description, namespace[identifier])
+                                       for description, namespace
+                                       in self.merged_namespaces
+                                       if identifier in namespace]
+        return self._cache[identifier]
+
 
 def _conflict_warning(message, resolutions, the_logger):
     '''
@@ -132,6 +191,8 @@ class CodeString(object):
         
         if namespace is not None:
             self._namespaces['user-defined'] = dict(namespace)
+        
+        self._lookup = None
 
     code = property(lambda self: self._code,
                     doc='The code string.')
@@ -142,6 +203,17 @@ class CodeString(object):
     namespaces = property(lambda self: self._namespaces,
                           doc='Namespaces that will be used for resolving the identifiers.')
     
+    def _get_lookup(self):
+        if self._lookup is None or self._lookup.namespaces is not self._namespaces:
+            self._lookup = NamespaceLookup(self._namespaces)
+        return self._lookup
+    
+    lookup = property(_get_lookup,
+                      doc='''
+                      The `NamespaceLookup` object used for resolving the
+                      identifiers (shared with all `CodeString` objects
+                      created by `replace_code`).''')
+    
     def replace_code(self, code):
         '''
         Return a new `CodeString` object with a new code string but the same
@@ -166,8 +238,11 @@ class CodeString(object):
         `Expression` object and not a generic `CodeString`.
         '''
         
-        new_object = type(self)(code)
+        # Use an empty namespace to avoid taking a copy of the locals and
+        # globals, the namespaces are replaced anyway
+        new_object = type(self)(code, namespace={})
         new_object._namespaces = self._namespaces
+        new_object._lookup = self.lookup
         
         return new_object 
 
@@ -200,22 +275,13 @@ class CodeString(object):
             `internal_variables`.
         '''
 
-        unit_namespace = get_default_unit_namespace()
-        numpy_namespace = get_default_numpy_namespace()
+        lookup = self.lookup
         
         resolved_namespace = {}
         for identifier in self.identifiers:
-            # We save tuples of (namespace description, referred object) to
+            # We get tuples of (namespace description, referred object) to
             # give meaningful warnings in case of duplicate definitions
-            matches = []
-            
-            namespaces = self.namespaces.copy()
-            namespaces.update({'units': unit_namespace,
-                               'numpy': numpy_namespace})
-            
-            for description, namespace in namespaces.iteritems():
-                if identifier in namespace:
-                    matches.append((description, namespace[identifier]))            
+            matches = lookup.lookup(identifier)
 
             # raise warnings in case of conflicts
             if identifier in SPECIAL_VARS:
@@ -331,7 +397,7 @@ class Expression(CodeString):
             assuming that all other variables are constants.
         
         '''
-
+        import sympy
     
         x = sympy.Symbol(variable)
     
@@ -448,6 +514,8 @@ class Expression(CodeString):
             ``(self, None)`` will be returned with the unchanged `Expression`
             object.
         '''
+        import sympy
+
         s_expr = self._sympy_expr.expand()
         xi = sympy.Symbol('xi')
         if not xi in s_expr:
@@ -6,12 +6,10 @@ import keyword
 import re
 import string
 
-from pyparsing import (Group, ZeroOrMore, OneOrMore, Optional, Word, CharsNotIn,
-                       Combine, Suppress, restOfLine, LineEnd, ParseException)
-
 from brian2.units.fundamentalunits import DimensionMismatchError
 from brian2.units.allunits import second
 from brian2.utils.stringtools import word_substitute
+from brian2.utils.caching import LRUCache
 from brian2.utils.logger import get_logger
 
 from .codestrings import Expression
@@ -28,62 +26,86 @@ DIFFERENTIAL_EQUATION = 'differential equation'
 STATIC_EQUATION = 'static equation'
 
 
-# Definitions of equation structure for parsing with pyparsing
-# TODO: Maybe move them somewhere else to not pollute the namespace here?
-#       Only IDENTIFIER and EQUATIONS are ever used later
-###############################################################################
-# Basic Elements
-###############################################################################
-
-# identifiers like in C: can start with letter or underscore, then a
-# combination of letters, numbers and underscores
-# Note that the check_identifiers function later performs more checks, e.g.
-# names starting with underscore should only be used internally
-IDENTIFIER = Word(string.ascii_letters + '_',
-                  string.ascii_letters + string.digits + '_').setResultsName('identifier')
-
-# very broad definition here, expression will be analysed by sympy anyway
-# allows for multi-line expressions, where each line can have comments
-EXPRESSION = Combine(OneOrMore((CharsNotIn(':#\n') +
-                                Suppress(Optional(LineEnd()))).ignore('#' + restOfLine)),
-                     joinString=' ').setResultsName('expression')
-
-
-# a unit
-# very broad definition here, again. Whether this corresponds to a valid unit
-# string will be checked later
-UNIT = Word(string.ascii_letters + string.digits + '*/. ').setResultsName('unit')
-
-# a single Flag (e.g. "const" or "event-driven")
-FLAG = Word(string.ascii_letters + '_-')
-
-# Flags are comma-separated and enclosed in parantheses: "(flag1, flag2)"
-FLAGS = (Suppress('(') + FLAG + ZeroOrMore(Suppress(',') + FLAG) +
-         Suppress(')')).setResultsName('flags')
-
-###############################################################################
-# Equations
-###############################################################################
-# Three types of equations
-# Parameter:
-# x : volt (flags)
-PARAMETER_EQ = Group(IDENTIFIER + Suppress(':') + UNIT +
-                     Optional(FLAGS)).setResultsName(PARAMETER)
-
-# Static equation:
-# x = 2 * y : volt (flags)
-STATIC_EQ = Group(IDENTIFIER + Suppress('=') + EXPRESSION + Suppress(':') +
-                  UNIT + Optional(FLAGS)).setResultsName(STATIC_EQUATION)
-
-# Differential equation
-# dx/dt = -x / tau : volt
-DIFF_OP = (Suppress('d') + IDENTIFIER + Suppress('/') + Suppress('dt'))
-DIFF_EQ = Group(DIFF_OP + Suppress('=') + EXPRESSION + Suppress(':') + UNIT +
-                Optional(FLAGS)).setResultsName(DIFFERENTIAL_EQUATION)
-
-# ignore comments
-EQUATION = (PARAMETER_EQ | STATIC_EQ | DIFF_EQ).ignore('#' + restOfLine)
-EQUATIONS = ZeroOrMore(EQUATION)
+# Definitions of equation structure for parsing with pyparsing. The grammar is
+# only built (and pyparsing only imported) when it is used for the first time,
+# see `_get_grammar`. This avoids the import cost for pyparsing when Brian is
+# imported but no equations are parsed.
+_GRAMMAR = {}
+
+def _get_grammar(name):
+    '''
+    Return an element of the pyparsing grammar for equations, building the
+    grammar on first use.
+
+    Parameters
+    ----------
+    name : {'IDENTIFIER', 'EQUATIONS'}
+        The grammar element to return, only ``IDENTIFIER`` and ``EQUATIONS``
+        are used outside of the grammar definition.
+    '''
+    if not _GRAMMAR:
+        from pyparsing import (Group, ZeroOrMore, OneOrMore, Optional, Word,
+                               CharsNotIn, Combine, Suppress, restOfLine,
+                               LineEnd)
+
+        #######################################################################
+        # Basic Elements
+        #######################################################################
+
+        # identifiers like in C: can start with letter or underscore, then a
+        # combination of letters, numbers and underscores
+        # Note that the check_identifiers function later performs more checks, e.g.
+        # names starting with underscore should only be used internally
+        IDENTIFIER = Word(string.ascii_letters + '_',
+                          string.ascii_letters + string.digits + '_').setResultsName('identifier')
+
+        # very broad definition here, expression will be analysed by sympy anyway
+        # allows for multi-line expressions, where each line can have comments
+        EXPRESSION = Combine(OneOrMore((CharsNotIn(':#\n') +
+                                        Suppress(Optional(LineEnd()))).ignore('#' + restOfLine)),
+                             joinString=' ').setResultsName('expression')
+
+
+        # a unit
+        # very broad definition here, again. Whether this corresponds to a valid unit
+        # string will be checked later
+        UNIT = Word(string.ascii_letters + string.digits + '*/. ').setResultsName('unit')
+
+        # a single Flag (e.g. "const" or "event-driven")
+        FLAG = Word(string.ascii_letters + '_-')
+
+        # Flags are comma-separated and enclosed in parantheses: "(flag1, flag2)"
+        FLAGS = (Suppress('(') + FLAG + ZeroOrMore(Suppress(',') + FLAG) +
+                 Suppress(')')).setResultsName('flags')
+
+        #######################################################################
+        # Equations
+        #######################################################################
+        # Three types of equations
+        # Parameter:
+        # x : volt (flags)
+        PARAMETER_EQ = Group(IDENTIFIER + Suppress(':') + UNIT +
+                             Optional(FLAGS)).setResultsName(PARAMETER)
+
+        # Static equation:
+        # x = 2 * y : volt (flags)
+        STATIC_EQ = Group(IDENTIFIER + Suppress('=') + EXPRESSION + Suppress(':') +
+                          UNIT + Optional(FLAGS)).setResultsName(STATIC_EQUATION)
+
+        # Differential equation
+        # dx/dt = -x / tau : volt
+        DIFF_OP = (Suppress('d') + IDENTIFIER + Suppress('/') + Suppress('dt'))
+        DIFF_EQ = Group(DIFF_OP + Suppress('=') + EXPRESSION + Suppress(':') + UNIT +
+                        Optional(FLAGS)).setResultsName(DIFFERENTIAL_EQUATION)
+
+        # ignore comments
+        EQUATION = (PARAMETER_EQ | STATIC_EQ | DIFF_EQ).ignore('#' + restOfLine)
+        EQUATIONS = ZeroOrMore(EQUATION)
+
+        _GRAMMAR['IDENTIFIER'] = IDENTIFIER
+        _GRAMMAR['EQUATIONS'] = EQUATIONS
+
+    return _GRAMMAR[name]
 
 
 def check_identifier_basic(identifier):
@@ -110,7 +132,7 @@ def check_identifier_basic(identifier):
     # Check whether the identifier is parsed correctly -- this is always the
     # case, if the identifier results from the parsing of an equation but there
     # might be situations where the identifier is specified directly
-    parse_result = list(IDENTIFIER.scanString(identifier))
+    parse_result = list(_get_grammar('IDENTIFIER').scanString(identifier))
     
     # parse_result[0][0][0] refers to the matched string -- this should be the
     # full identifier, if not it is an illegal identifier like "3foo" which only
@@ -167,6 +189,48 @@ def check_identifier(identifier):
         check_func(identifier)
 
 
+#: Cache for the parsed structure of equation strings, see
+#: `parse_string_equations`
+parsed_equations_cache = LRUCache(maxsize=1000)
+
+
+def _parse_equations_structure(eqns):
+    '''
+    Parse an equations string with pyparsing, returning a tuple of
+    ``(eq_type, identifier, expression, unit, flags)`` tuples (all strings,
+    except for `flags`, a tuple of strings). The result is cached in
+    `parsed_equations_cache`.
+    '''
+    try:
+        return parsed_equations_cache[eqns]
+    except KeyError:
+        pass
+    
+    from pyparsing import ParseException
+    
+    try:
+        parsed = _get_grammar('EQUATIONS').parseString(eqns, parseAll=True)
+    except ParseException as p_exc:
+        raise SyntaxError('Parsing failed: \n' + str(p_exc.line) + '\n' +
+                          ' '*(p_exc.column - 1) + '^\n' + str(p_exc))
+    
+    structure = []
+    for eq in parsed:
+        eq_content = dict(eq.items())
+        expression = eq_content.get('expression', None)
+        if not expression is None:
+            # Replace multiple whitespaces (arising from joining multiline
+            # strings) with single space
+            expression = re.sub(r'\s{2,}', ' ', expression)
+        structure.append((eq.getName(), eq_content['identifier'], expression,
+                          eq_content['unit'],
+                          tuple(eq_content.get('flags', []))))
+    structure = tuple(structure)
+    parsed_equations_cache[eqns] = structure
+    
+    return structure
+
+
 def parse_string_equations(eqns, namespace, exhaustive, level):
     """
     Parse a string defining equations.
@@ -193,29 +257,22 @@ def parse_string_equations(eqns, namespace, exhaustive, level):
         `~brian2.quations.equations.Equation` objects
     """
     equations = {}
+    # All expressions share the namespaces (and the cache for looking up
+    # identifiers) of the first expression
+    first_expression = None
     
-    try:
-        parsed = EQUATIONS.parseString(eqns, parseAll=True)
-    except ParseException as p_exc:
-        raise SyntaxError('Parsing failed: \n' + str(p_exc.line) + '\n' +
-                          ' '*(p_exc.column - 1) + '^\n' + str(p_exc))
-    for eq in parsed:
-        eq_type = eq.getName()
-        eq_content = dict(eq.items())
-        # Check for reserved keywords
-        identifier = eq_content['identifier']
-        
+    for eq_type, identifier, expression, unit, flags in _parse_equations_structure(eqns):
         # Convert unit string to Unit object
-        unit = get_unit_from_string(eq_content['unit'])
+        unit = get_unit_from_string(unit)
         
-        expression = eq_content.get('expression', None)
         if not expression is None:
-            # Replace multiple whitespaces (arising from joining multiline
-            # strings) with single space
-            p = re.compile(r'\s{2,}')
-            expression = Expression(p.sub(' ', expression),
-                                    namespace, exhaustive, level + 1)
-        flags = list(eq_content.get('flags', []))
+            if first_expression is None:
+                expression = Expression(expression, namespace, exhaustive,
+                                        level + 1)
+                first_expression = expression
+            else:
+                expression = first_expression.replace_code(expression)
+        flags = list(flags)
 
         equation = SingleEquation(eq_type, identifier, unit, expression, flags) 
         
@@ -396,6 +453,7 @@ class Equations(object):
                                       (eq.varname, uses_xi))
                 else:
                     uses_xi = eq.varname
+        self._stochastic_variable = uses_xi
         
         # rearrange static equations
         self._sort_static_equations()
@@ -572,6 +630,15 @@ class Equations(object):
     
     is_conditionally_linear = property(lambda self: self._is_linear(conditionally_linear=True),
                                        doc='Whether all equations are conditionally linear')
+
+    stochastic_variable = property(lambda self: self._stochastic_variable,
+                                   doc='The name of the variable whose '
+                                   'equation contains the noise term ``xi`` '
+                                   '(or ``None``)')
+
+    is_stochastic = property(lambda self: self._stochastic_variable is not None,
+                             doc='Whether the equations contain the noise '
+                             'term ``xi``')
     
     units = property(_get_units)
     
@@ -2,31 +2,102 @@
 Utility functions for handling the units in `Equations`.
 '''
 
+from collections import Mapping
+
 from brian2.units.fundamentalunits import Quantity, Unit
+from brian2.units import allunits
 from brian2.units.allunits import second
 from brian2.units.stdunits import stdunits
-from brian2.units.fundamentalunits import (all_registered_units, DIMENSIONLESS)
+from brian2.units.fundamentalunits import (user_unit_register,
+                                           additional_unit_register,
+                                           DIMENSIONLESS)
 
-__all__ = ['get_default_unit_namespace', 'get_unit_from_string']
+__all__ = ['UnitNamespace', 'get_default_unit_namespace',
+           'get_unit_from_string']
 
 # Units of the special variables that are always defined
 UNITS_SPECIAL_VARS = {'t': second, 'dt': second, 'xi': second**-0.5}
 SPECIAL_VARS = UNITS_SPECIAL_VARS.keys()
 
+
+class UnitNamespace(Mapping):
+    '''
+    Read-only mapping from names to units, containing all registered units and
+    everything from `brian2.units.stdunits` (ms, mV, nS, etc.).
+
+    Standard units (e.g. ``mvolt``) are only looked up (and therefore only
+    created, see `brian2.units.allunits`) when they are requested. Units in
+    the user and additional registries are indexed by name incrementally,
+    i.e. only units that have been registered since the last lookup are
+    added.
+
+    In case of name clashes, `stdunits` take precedence over additional units,
+    which take precedence over user-registered units, which take precedence
+    over standard units.
+    '''
+    def __init__(self):
+        # In order of precedence
+        self._registries = [additional_unit_register, user_unit_register]
+        # name -> unit dictionaries for each registry
+        self._units = [{}, {}]
+        # Number of units already indexed for each registry
+        self._n_indexed = [0, 0]
+
+    version = property(lambda self: tuple(len(registry.units)
+                                          for registry in self._registries),
+                       doc='''
+                       A value that changes whenever the namespace changes
+                       (i.e. when new units are registered).''')
+
+    def _update(self):
+        for idx, registry in enumerate(self._registries):
+            for unit in registry.units[self._n_indexed[idx]:]:
+                self._units[idx][unit.name] = unit
+            self._n_indexed[idx] = len(registry.units)
+
+    def __getitem__(self, name):
+        if name in stdunits:
+            return stdunits[name]
+        self._update()
+        for units in self._units:
+            if name in units:
+                return units[name]
+        if name in allunits.standard_unit_names:
+            return getattr(allunits, name)
+        raise KeyError(name)
+
+    def _names(self):
+        self._update()
+        names = set(stdunits)
+        names.update(allunits.standard_unit_names)
+        for units in self._units:
+            names.update(units)
+        return names
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+
+_default_unit_namespace = UnitNamespace()
+
+
 def get_default_unit_namespace():
     '''
     Return the namespace that is used by default for looking up units when
     defining equations. Contains all registered units and everything from
-    `brian2.units.stdunits` (ms, mV, nS, etc.).
+    `brian2.units.stdunits` (ms, mV, nS, etc.). The same (read-only)
+    `UnitNamespace` object is returned for every call, units are only created
+    when they are looked up.
     
     Returns
     -------
-    namespace : dict
+    namespace : `UnitNamespace`
         The unit namespace
     '''    
-    namespace = dict([(u.name, u) for u in all_registered_units()])
-    namespace.update(stdunits)
-    return namespace
+    return _default_unit_namespace
 
 
 def get_unit_from_string(unit_string, unit_namespace=None,
@@ -41,7 +112,7 @@ def get_unit_from_string(unit_string, unit_namespace=None,
     unit_string : str
         The string that should evaluate to a unit
     
-    unit_namespace : dict, optional
+    unit_namespace : mapping, optional
         An optional namespace containing units. If not given, defaults to all
         the units returned by `get_default_unit_namespace`.
     
@@ -73,7 +144,8 @@ def get_unit_from_string(unit_string, unit_namespace=None,
     # Check first whether the expression evaluates at all, using only
     # registered units
     try:
-        evaluated_unit = eval(unit_string, namespace)
+        # The namespace is not necessarily a dictionary, use it as locals
+        evaluated_unit = eval(unit_string, {}, namespace)
     except Exception as ex:
         raise ValueError('"%s" does not evaluate to a unit: %s' %
                          (unit_string, ex))
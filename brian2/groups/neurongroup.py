@@ -1,18 +1,21 @@
 import weakref
 
 import numpy as np
-from numpy import array, zeros
+from numpy import arange
 
 from brian2.equations.codestrings import Statements
 from brian2.equations.equations import (Equations, DIFFERENTIAL_EQUATION,
                                         STATIC_EQUATION, PARAMETER) 
 from brian2.equations.refractory import add_refractoriness
 from brian2.stateupdaters.integration import euler
+from brian2.stateupdaters.stochastic import NoiseBuffer, NOISE_VARIABLE
+from brian2.stateupdaters.automatic import AutoStateUpdater, auto
 from brian2.codegen.languages import PythonLanguage
 from brian2.codegen.specifiers import (Value, ArrayVariable, Subexpression,
                                        Index)
-from brian2.codegen.translation import translate
-from brian2.memory import allocate_array
+from brian2.codegen.translation import translate, make_statements
+from brian2.memory import (allocate_array, allocate_state_matrix,
+                           get_storage_dtype, get_computation_dtype)
 from brian2.core.preferences import brian_prefs
 from brian2.core.base import BrianObject
 from brian2.core.spikesource import SpikeSource
@@ -25,6 +28,14 @@ __all__ = ['NeuronGroup',
 
 logger = get_logger(__name__)
 
+brian_prefs.define('specialize_scalar_parameters', True,
+    '''
+    Whether parameters of a `NeuronGroup` that have the same value for all
+    neurons (and are not changed by the group's code) are treated as
+    scalar values in the generated code, instead of being read from an
+    array, see `NeuronGroup.scalar_parameters`.
+    ''')
+
 class CodeRunner(BrianObject):
     '''
     Runs a code object on an update schedule.
@@ -53,39 +64,27 @@ class NeuronGroupCodeRunner(CodeRunner):
     def __init__(self, group, codeobj, when=None, name=None):
         CodeRunner.__init__(self, codeobj, when=when, name=name)
         self.group = weakref.proxy(group)
-        self.prepared = False
-        
-    def prepare(self):
-        if not self.prepared:
-            self.is_active = self.group.is_active_
-            self.refractory_until = self.group.refractory_until_
-            self.refractory = self.group.refractory_
-            self.prepared = True
 
 
 class StateUpdater(NeuronGroupCodeRunner):
     def update(self):
-        self.prepare()
-        self.is_active[:] = self.clock.t_>=self.refractory_until
+        # The is_active variable is computed in the state update code
+        noise = self.group.noise
+        if noise is not None:
+            # Hand over the random numbers for this time step (a view into a
+            # pre-drawn block)
+            self.codeobj.namespace['_array'+NOISE_VARIABLE] = noise.next()
         NeuronGroupCodeRunner.update(self)
         
         
 class Thresholder(NeuronGroupCodeRunner):
-    def update(self):
-        self.prepare()
-        NeuronGroupCodeRunner.update(self)
-        ns = self.codeobj.namespace
-        spikesarray = ns['_spikes_space']
-        numspikes = ns['_array_num_spikes'][0]
-        spikes = spikesarray[:numspikes]
-        spikes = spikes[array(self.is_active[spikes], dtype=bool)]
-        self.group.spikes = spikes
-        self.refractory_until[spikes] = self.clock.t_+self.refractory[spikes]
+    # The threshold code writes the spikes into the group's spike buffer,
+    # excludes refractory neurons and sets refractory_until
+    pass
 
 
 class Resetter(NeuronGroupCodeRunner):
     def update(self):
-        self.prepare()
         spikes = self.group.spikes
         self.codeobj.namespace['_spikes'] = spikes
         self.codeobj.namespace['_num_spikes'] = len(spikes)
@@ -108,7 +107,8 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
     equations : (str, `Equations`)
         The differential equations defining the group
     method : ?, optional
-        The numerical integration method.
+        The numerical integration method. Use ``'auto'`` to select the method
+        based on the equations (see `AutoStateUpdater`).
     threshold : str, optional
         The condition which produces spikes. Should be a single line boolean
         expression.
@@ -117,7 +117,17 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
     dtype : (`dtype`, `dict`), optional
         The `numpy.dtype` that will be used to store the values, or
         :bpref:`default_scalar_dtype` if not specified (`numpy.float64` by
-        default).
+        default). A dictionary can specify the dtype of individual variables,
+        the others use the default. In :bpref:`mixed_precision` mode, values are stored as
+        `numpy.float32` by default, but all calculations are done with
+        `numpy.float64`.
+    language : `Language`, optional
+        The language used for the generated code, `PythonLanguage` if not
+        specified.
+    contiguous : bool, optional
+        Whether to store all state variables with the same dtype in a single
+        contiguous 2D array (see `state_matrices`), defaults to the
+        :bpref:`contiguous_state_arrays` preference.
     clock : Clock, optional
         The update clock to be used, or defaultclock if not specified.
     name : str, optional
@@ -136,12 +146,22 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
     values of `Scheduler.when` take these values). The `Scheduler.order`
     attribute is set to 0 initially, but this can be modified using the
     attributes `state_updater`, `thresholder` and `resetter`.    
+    
+    Parameters that have the same value for all neurons are treated as
+    scalar values in the generated code (see `scalar_parameters`): parameters
+    with the ``constant`` flag from the start, all other parameters when the
+    group is prepared for a run. Setting a parameter to different values for
+    different neurons (or accessing its array with ``G.x_``) switches back to
+    reading it from an array, regenerating the code.
     '''
     basename = 'neurongroup'
+    sorted_spikes = True
+    #: Parameters written by the code templates, never treated as scalars
+    template_written_variables = frozenset(['refractory_until'])
     def __init__(self, N, equations, method=euler,
                  threshold=None,
                  reset=None,
-                 dtype=None, language=None,
+                 dtype=None, language=None, contiguous=None,
                  clock=None, name=None,
                  level=0):
         BrianObject.__init__(self, when=clock, name=name)
@@ -165,6 +185,13 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         # add refractoriness
         equations = add_refractoriness(equations)
         self.equations = equations
+        if isinstance(method, basestring):
+            if method != 'auto':
+                raise ValueError(('Unknown integration method "%s", use a '
+                                  'state updater or "auto".') % method)
+            method = auto
+        if isinstance(method, AutoStateUpdater):
+            self.method = method = method.select(equations, self.clock.dt_)
         
         logger.debug("Creating NeuronGroup of size {self.N}, "
                      "equations {self.equations}.".format(self=self))
@@ -178,10 +205,28 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         self.units = dict((var, equations.units[var]) for var in equations.equations.keys())
         
         # Allocate memory (TODO: this should be refactored somewhere at some point)
-        self.allocate_memory()
+        if contiguous is None:
+            contiguous = brian_prefs.contiguous_state_arrays
+        self.allocate_memory(contiguous=contiguous)
 
-        #: The array of spikes from the most recent threshold operation
-        self.spikes = array([], dtype=int)
+        #: The parameters that are treated as scalar values in the generated
+        #: code, since they have the same value for all neurons
+        self.scalar_parameters = set()
+        if brian_prefs.specialize_scalar_parameters:
+            # All parameters are initialised to 0
+            self.scalar_parameters.update(eq.varname for eq in
+                                          equations.equations.itervalues()
+                                          if eq.eq_type == PARAMETER and
+                                          'constant' in eq.flags and
+                                          not eq.varname in
+                                          self.template_written_variables)
+        # The definitions of the code objects, to be able to regenerate the
+        # code when the scalar parameters change
+        self._code_definitions = []
+
+        # The spikes from the most recent threshold operation are stored in
+        # the spike buffer, accessible as the spikes attribute
+        self.init_spike_buffer(N)
 
         # Set these for documentation purposes
         #: Performs numerical integration step
@@ -223,19 +268,42 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         self.dtypes = {}
         for name in arrayvarnames:
             if isinstance(dtype, dict):
-                curdtype = dtype[name]
+                # Variables not in the dictionary use the default dtype
+                curdtype = dtype.get(name, None)
             else:
                 curdtype = dtype
             if curdtype is None:
-                curdtype = brian_prefs.default_scalar_dtype
+                if name == 'refractory_until':
+                    # Absolute times need the full precision
+                    curdtype = get_computation_dtype()
+                else:
+                    curdtype = get_storage_dtype()
             self.dtypes[name] = curdtype
         logger.debug("NeuronGroup dtypes: "+", ".join(name+'='+str(dtype) for name, dtype in self.dtypes.iteritems()))
 
-    def allocate_memory(self, dtype=None):
+    def allocate_memory(self, contiguous=False):
         # Allocate memory (TODO: this should be refactored somewhere at some point)
         self.arrays = {}
-        for name, curdtype in self.dtypes.iteritems():
-            self.arrays[name] = allocate_array(self.N, dtype=curdtype)
+        #: A dictionary mapping dtypes to ``(names, matrix)`` tuples, where
+        #: ``matrix`` is a 2D array (variables x neurons) storing the state
+        #: variables ``names`` (only used for the contiguous layout). The
+        #: arrays of the individual variables are views into this matrix.
+        self.state_matrices = {}
+        if contiguous:
+            names_by_dtype = {}
+            for name, curdtype in self.dtypes.iteritems():
+                names_by_dtype.setdefault(np.dtype(curdtype), []).append(name)
+            for curdtype, names in names_by_dtype.iteritems():
+                names = sorted(names)
+                matrix, arrays = allocate_state_matrix(names, self.N,
+                                                       dtype=curdtype,
+                                                       owner=self.name)
+                self.state_matrices[curdtype] = (names, matrix)
+                self.arrays.update(arrays)
+        else:
+            for name, curdtype in self.dtypes.iteritems():
+                self.arrays[name] = allocate_array(self.N, dtype=curdtype,
+                                                  owner=self.name, name=name)
         logger.debug("NeuronGroup memory allocated successfully.")
 
     def create_codeobj(self, name, abstract_code, specs, template_method,
@@ -243,7 +311,7 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         lang = self.language
         logger.debug("NeuronGroup "+name+" abstract code:\n"+abstract_code)
         innercode = translate(abstract_code, specs,
-                              brian_prefs.default_scalar_dtype,
+                              get_computation_dtype(),
                               lang)
         logger.debug("NeuronGroup "+name+" inner code:\n"+str(innercode))
         code = lang.apply_template(innercode, template_method())
@@ -258,19 +326,145 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         self.namespace['_num_neurons'] = self.N
         self.namespace['dt'] = self.clock.dt_
         self.namespace['t'] = self.clock.t_
+        for name in self.scalar_parameters:
+            self.namespace[name] = self.arrays[name][0]
         codeobj.compile(self.namespace)
         return codeobj
+
+    def _register_code(self, runner, name, abstract_code, template_method,
+                       specifier_overrides={}):
+        '''
+        Store the definition of the code object of the given runner, to be
+        able to regenerate it when the scalar parameters change. Parameters
+        that are written by the code cannot be treated as scalars.
+        '''
+        written = _get_written_variables(abstract_code, self.specifiers)
+        self._code_definitions.append((weakref.ref(runner), name,
+                                       abstract_code, template_method,
+                                       specifier_overrides, written))
+
+    def _regenerate_code(self):
+        '''
+        Regenerate all code objects after a change of the scalar parameters.
+        '''
+        definitions = []
+        for definition in self._code_definitions:
+            runner = definition[0]()
+            if runner is None:
+                continue
+            _, name, abstract_code, template_method, overrides, _ = definition
+            specs = self.specifiers
+            specs.update(overrides)
+            runner.codeobj = self.create_codeobj(name, abstract_code, specs,
+                                                 template_method)
+            definitions.append(definition)
+        self._code_definitions = definitions
+        self.state_update_codeobj = self.state_updater.codeobj
+        if self.thresholder is not None:
+            self.thresholder_codeobj = self.thresholder.codeobj
+        if self.resetter is not None:
+            self.resetter_codeobj = self.resetter.codeobj
+
+    def _get_code_written_variables(self):
+        '''
+        Return the set of variables written by the group's code.
+        '''
+        written = set(self.template_written_variables)
+        for definition in self._code_definitions:
+            if definition[0]() is not None:
+                written.update(definition[5])
+        return written
+
+    def specialize_parameters(self):
+        '''
+        Treat all parameters that have the same value for all neurons (and
+        are not written by the group's code) as scalar values in the
+        generated code, and read parameters that are no longer homogeneous
+        from arrays again. Called automatically before a run.
+        '''
+        if not brian_prefs.specialize_scalar_parameters:
+            return
+        written = self._get_code_written_variables()
+        scalar_parameters = set()
+        for eq in self.equations.equations.itervalues():
+            if (eq.eq_type == PARAMETER and not eq.varname in written and
+                    _is_homogeneous(self.arrays[eq.varname])):
+                scalar_parameters.add(eq.varname)
+        for name in scalar_parameters:
+            self.namespace[name] = self.arrays[name][0]
+        if scalar_parameters != self.scalar_parameters:
+            logger.debug('Treating parameters %s of %s as scalars' %
+                         (', '.join(sorted(scalar_parameters)), self.name))
+            self.scalar_parameters = scalar_parameters
+            self._regenerate_code()
+
+    def despecialize_parameter(self, name):
+        '''
+        Read the parameter ``name`` from its array in the generated code
+        (regenerating the code if it was treated as a scalar value).
+        '''
+        if name in self.scalar_parameters:
+            logger.debug('Parameter %s of %s is no longer treated as a scalar'
+                         % (name, self.name))
+            self.scalar_parameters.remove(name)
+            self._regenerate_code()
+
+    def _despecialize_written_parameters(self, abstract_code):
+        '''
+        Read all parameters written by the given code from arrays.
+        '''
+        for var in _get_written_variables(abstract_code, self.specifiers):
+            self.despecialize_parameter(var)
+
+    def prepare(self):
+        self.specialize_parameters()
+
+    def state_(self, name):
+        # The array might be changed in-place
+        if name in self.__dict__.get('scalar_parameters', ()):
+            self.despecialize_parameter(name)
+        return Group.state_(self, name)
+
+    def __setattr__(self, name, val):
+        Group.__setattr__(self, name, val)
+        if len(name) and name[-1] == '_':
+            name = name[:-1]
+        if name in self.__dict__.get('scalar_parameters', ()):
+            if _is_homogeneous(self.arrays[name]):
+                # Still the same value for all neurons
+                self.namespace[name] = self.arrays[name][0]
+            else:
+                self.despecialize_parameter(name)
             
     def create_state_updater(self):
+        # State updaters can provide additional values (e.g. precomputed
+        # propagator matrices) that depend on the time step
+        if hasattr(self.method, 'get_namespace'):
+            namespace = self.method.get_namespace(self.equations,
+                                                  self.clock.dt_)
+        else:
+            namespace = {}
+        if self.equations.is_stochastic:
+            self.noise = NoiseBuffer(self.N)
+            namespace['_array'+NOISE_VARIABLE] = self.noise.next()
+        else:
+            self.noise = None
+        # Determine whether neurons are refractory in the same loop (as a
+        # number, the negation of a boolean array would be a logical not)
+        abstract_code = ('is_active = 1.0*(t >= refractory_until)\n' +
+                         self.abstract_code)
         codeobj = self.create_codeobj("state updater",
-                                      self.abstract_code,
+                                      abstract_code,
                                       self.specifiers,
                                       self.language.template_state_update,
+                                      additional_namespace=namespace,
                                       )
         self.state_update_codeobj = codeobj
         self.state_updater = StateUpdater(self, codeobj,
                                           name=self.name+'_state_updater',
                                           when=(self.clock, 'groups'))
+        self._register_code(self.state_updater, "state updater",
+                            abstract_code, self.language.template_state_update)
         
     def runner(self, code, init=None, pre=None, post=None,
                when=None, name=None,
@@ -306,6 +500,8 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         stmt.resolve(self.units.keys())
         stmt = stmt.frozen()
         abstract_code = stmt.code        
+        # Parameters written by the runner cannot be treated as scalars
+        self._despecialize_written_parameters(abstract_code)
         codeobj = self.create_codeobj("runner",
                                       abstract_code,
                                       self.specifiers,
@@ -313,20 +509,36 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
                                       )
         runner = CodeRunner(codeobj, name=name, when=when,
                             init=init, pre=pre, post=post)
+        self._register_code(runner, "runner", abstract_code,
+                            self.language.template_state_update)
         return runner
         
     def create_thresholder(self, threshold, level=1):
         if threshold is None:
             self.thresholder = None
             return
-        stmt = Statements('_cond = '+threshold, level=level+1)
+        # Refractory neurons cannot spike
+        stmt = Statements('_cond = (%s) * (t >= refractory_until)' % threshold,
+                          level=level+1)
         stmt.resolve(self.units.keys()+['_cond'])
         stmt = stmt.frozen()
         abstract_code = stmt.code        
+        # Scratch space for the refractory times of the spiking neurons
+        refractory_space = allocate_array(self.N,
+                                          dtype=self.dtypes['refractory'],
+                                          owner=self.name,
+                                          name='refractory_space')
+        until_space = allocate_array(self.N,
+                                     dtype=self.dtypes['refractory_until'],
+                                     owner=self.name,
+                                     name='refractory_until_space')
         additional_ns = {
             '_spikes': self.spikes,
-            '_spikes_space': zeros(self.N, dtype=int),
-            '_array_num_spikes': zeros(1, dtype=int),
+            '_spikes_space': self.spike_space,
+            '_array_num_spikes': self.spike_count,
+            '_indices': arange(self.N),
+            '_refractory_space': refractory_space,
+            '_refractory_until_space': until_space,
             }
         codeobj = self.create_codeobj("thresholder",
                                       abstract_code,
@@ -338,17 +550,22 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         self.thresholder = Thresholder(self, codeobj,
                                        name=self.name+'_thresholder',
                                        when=(self.clock, 'thresholds'))
+        self._register_code(self.thresholder, "thresholder", abstract_code,
+                            self.language.template_threshold)
         
     def create_resetter(self, reset, level=1):
         if reset is None:
             self.resetter = None
             return
-        specs = self.specifiers
-        specs['_neuron_idx'] = Index(all=False)
+        specifier_overrides = {'_neuron_idx': Index(all=False)}
         stmt = Statements(reset, level=level+1)
         stmt.resolve(self.units.keys())
         stmt = stmt.frozen()
         abstract_code = stmt.code        
+        # Parameters written by the reset cannot be treated as scalars
+        self._despecialize_written_parameters(abstract_code)
+        specs = self.specifiers
+        specs.update(specifier_overrides)
         additional_ns = {
             '_spikes': self.spikes,
             '_num_spikes': len(self.spikes),
@@ -363,6 +580,8 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         self.resetter = Resetter(self, codeobj,
                                  name=self.name+'_resetter',
                                  when=(self.clock, 'resets'))
+        self._register_code(self.resetter, "resetter", abstract_code,
+                            self.language.template_reset, specifier_overrides)
         
     def get_specifiers(self):
         '''
@@ -372,9 +591,14 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
         s = {'_neuron_idx': Index(all=True),
              'dt': Value(np.float64),
              't': Value(np.float64)}
-        # TODO: What about xi?
+        if self.equations.is_stochastic:
+            # Standard normal random numbers provided by the noise buffer
+            s[NOISE_VARIABLE] = ArrayVariable('_array'+NOISE_VARIABLE,
+                                              '_neuron_idx', np.float64)
         for eq in self.equations.equations.itervalues():
-            if eq.eq_type in (DIFFERENTIAL_EQUATION, PARAMETER):
+            if eq.varname in self.scalar_parameters:
+                s[eq.varname] = Value(self.dtypes[eq.varname])
+            elif eq.eq_type in (DIFFERENTIAL_EQUATION, PARAMETER):
                 s.update({eq.varname: ArrayVariable('_array_'+eq.varname,
                           '_neuron_idx', self.dtypes[eq.varname])})
             elif eq.eq_type == STATIC_EQUATION:                
@@ -388,6 +612,22 @@ class NeuronGroup(BrianObject, Group, SpikeSource):
     specifiers = property(get_specifiers)
 
 
+def _get_written_variables(abstract_code, specifiers):
+    '''
+    Return the set of variables that are assigned to in the abstract code.
+    '''
+    return set(stmt.var for stmt in
+               make_statements(abstract_code, specifiers,
+                               brian_prefs.default_scalar_dtype))
+
+
+def _is_homogeneous(arr):
+    '''
+    Whether all values of the array are identical.
+    '''
+    return len(arr) == 0 or (arr == arr[0]).all()
+
+
 if __name__=='__main__':
     from pylab import *
     from brian2 import *
@@ -31,6 +31,7 @@ class PoissonGroup(BrianObject, SpikeSource):
     TODO: make rates not have to be a value/array, use code generation for str
     '''
     basename = 'poisson_group'
+    sorted_spikes = True
     @check_units(rates=Hz)
     def __init__(self, N, rates, when=None, name=None):
         # TODO: sort out the default values in Scheduler
@@ -38,11 +39,9 @@ class PoissonGroup(BrianObject, SpikeSource):
         scheduler.when = 'thresholds'
         BrianObject.__init__(self, when=scheduler, name=name)
 
-        #: The array of spikes from the most recent time step
-        self.spikes = array([], dtype=int)
-        
         self.rates = rates
         self.N = N = int(N)
+        self.init_spike_buffer(N)
         
         self.pthresh = array(rates*self.clock.dt)
         
@@ -50,7 +49,7 @@ class PoissonGroup(BrianObject, SpikeSource):
         return self.N
         
     def update(self):
-        self.spikes, = (rand(self.N)<self.pthresh).nonzero()
+        self.set_spikes_from_condition(rand(self.N)<self.pthresh)
 
 
 if __name__=='__main__':
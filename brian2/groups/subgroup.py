@@ -1,6 +1,6 @@
 import weakref
 
-from numpy import array, logical_and
+from numpy import logical_and, subtract
 
 from brian2.core.base import BrianObject
 from brian2.core.spikesource import SpikeSource
@@ -29,8 +29,8 @@ class Subgroup(BrianObject, SpikeSource):
     
     * It works for any spike source
     * You need to keep a reference to it
-    * It makes a copy of the spikes, and there is no direct support for
-      subgroups in `Connection` (or rather `Synapses`)
+    * It makes a copy of the spikes (into a preallocated buffer), and there is
+      no direct support for subgroups in `Connection` (or rather `Synapses`)
     
     TODO: Group state variable access
     '''
@@ -44,19 +44,29 @@ class Subgroup(BrianObject, SpikeSource):
         schedule = Scheduler(clock=source.clock, when='thresholds',
                              order=source.order+1)
         BrianObject.__init__(self, when=schedule, name=name)
-        self.spikes = array([], dtype=int)
         self.N = end-start
         self.start = start
         self.end = end
+        self.sorted_spikes = getattr(source, 'sorted_spikes', False)
+        self.init_spike_buffer(self.N)
         
     def __len__(self):
         return self.N
         
     def update(self):
         spikes = self.source.spikes
-        # TODO: improve efficiency with bisect?
-        spikes = spikes[logical_and(spikes>=self.start, spikes<self.end)]
-        self.spikes = spikes-self.start
+        if self.sorted_spikes:
+            # The spikes of the subgroup are a contiguous part of the source
+            # spikes, copy them without any temporary arrays
+            low = spikes.searchsorted(self.start)
+            high = spikes.searchsorted(self.end)
+            num_spikes = high-low
+            subtract(spikes[low:high], self.start,
+                     self.spike_space[:num_spikes])
+            self.spike_count[0] = num_spikes
+        else:
+            spikes = spikes[logical_and(spikes>=self.start, spikes<self.end)]
+            self.spikes = spikes-self.start
 
 
 if __name__=='__main__':
@@ -1 +1,3 @@
 from allocation import *
+from ledger import *
+from streaming import *
\ No newline at end of file
@@ -1,21 +1,184 @@
 '''
 Memory management
 '''
-from numpy import zeros, dtype
+import mmap
+import ctypes
+
+from numpy import zeros, dtype, uint8, frombuffer, float32, float64, asarray
 
 from brian2.core.preferences import brian_prefs
+from brian2.utils.logger import get_logger
+from brian2.memory.ledger import memory_ledger
 
 __all__ = ['allocate_array',
+           'allocate_state_matrix',
+           'clear_memory_pool',
+           'get_storage_dtype',
+           'get_computation_dtype',
            ]
 
+logger = get_logger(__name__)
+
 brian_prefs.define('default_scalar_dtype', float,
     '''
     Default dtype for all arrays of scalars (state variables, weights, etc.).
     ''', validator=dtype)
 
-def allocate_array(shape, dtype=None):
+brian_prefs.define('mixed_precision', False,
+    '''
+    Whether to store floating point state variables in single precision
+    (``float32``) while doing all calculations in the generated code in double
+    precision (``float64``). This halves the memory (and the memory bandwidth)
+    used for the state variables, values are only rounded when they are
+    stored. Variables with an explicitly specified dtype are not affected.
+    ''')
+
+brian_prefs.define('contiguous_state_arrays', False,
+    '''
+    Whether to store all state variables of a group that have the same dtype
+    in a single contiguous 2D array (variables x neurons), see
+    `allocate_state_matrix`.
+    ''')
+
+brian_prefs.define('array_alignment', 64,
+    '''
+    The alignment (in bytes) of the start of allocated arrays and of the rows
+    of contiguous state arrays. The default of 64 bytes corresponds to the
+    size of a cache line and of the largest SIMD registers.
+    ''')
+
+brian_prefs.define('use_huge_pages', False,
+    '''
+    Whether to back large arrays (at least 2 MiB) by anonymous memory maps
+    that are marked as candidates for transparent huge pages (only on
+    systems supporting ``madvise``, otherwise normal pages are used).
+    ''')
+
+brian_prefs.define('memory_pool_size', 64*1024*1024,
+    '''
+    The maximal number of bytes of freed arrays that are kept for re-use by
+    later allocations of the same size. Use 0 to disable the pooling.
+    ''')
+
+#: The minimal size (in bytes) of arrays backed by huge pages
+HUGE_PAGE_SIZE = 2*1024*1024
+
+# The value of MADV_HUGEPAGE on Linux
+_MADV_HUGEPAGE = 14
+
+# Freed buffers, by size in bytes
+_pool = {}
+# The total number of bytes in the pool (in a list to be modifiable from the
+# release callbacks)
+_pool_bytes = [0]
+
+
+def get_storage_dtype():
+    '''
+    Return the default dtype for storing state variables, i.e. ``float32``
+    in :bpref:`mixed_precision` mode and the :bpref:`default_scalar_dtype`
+    otherwise.
+    '''
+    if brian_prefs.mixed_precision:
+        return float32
+    return brian_prefs.default_scalar_dtype
+
+
+def get_computation_dtype():
+    '''
+    Return the dtype used for intermediate values in generated code, i.e.
+    ``float64`` in :bpref:`mixed_precision` mode and the
+    :bpref:`default_scalar_dtype` otherwise.
+    '''
+    if brian_prefs.mixed_precision:
+        return float64
+    return brian_prefs.default_scalar_dtype
+
+
+def clear_memory_pool():
+    '''
+    Release all buffers kept for re-use by the allocator.
+    '''
+    _pool.clear()
+    _pool_bytes[0] = 0
+
+
+def _allocate_huge_pages(nbytes):
+    '''
+    Allocate a buffer as an anonymous memory map and advise the kernel to use
+    huge pages for it.
     '''
-    Allocates a 1D array initialised to 0
+    raw = frombuffer(mmap.mmap(-1, nbytes), dtype=uint8)
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        result = libc.madvise(ctypes.c_void_p(raw.ctypes.data),
+                              ctypes.c_size_t(nbytes), _MADV_HUGEPAGE)
+        if result != 0:
+            logger.debug('madvise failed with error %d, huge pages are not '
+                         'used' % ctypes.get_errno())
+    except (OSError, AttributeError):
+        logger.debug('madvise is not available, huge pages are not used')
+    return raw
+
+
+class _BufferOwner(object):
+    '''
+    The owner of an allocated part of a buffer. Arrays are created from this
+    object via its ``__array_interface__``, so that it is the base of all
+    arrays and views using the memory (with any numpy version, since it is
+    not an array itself). It is therefore only deleted when none of these
+    arrays exist any more, and the buffer can then be re-used.
+    '''
+    def __init__(self, raw, offset, nbytes):
+        self.__array_interface__ = {'shape': (nbytes, ),
+                                    'typestr': '|u1',
+                                    'data': (raw.ctypes.data + offset, False),
+                                    'version': 3}
+
+
+def _release_buffer(raw):
+    '''
+    Return a buffer that is no longer used to the pool, if there is space left
+    in the pool.
+    '''
+    if _pool_bytes[0] + raw.nbytes > brian_prefs.memory_pool_size:
+        return
+    _pool.setdefault(raw.nbytes, []).append(raw)
+    _pool_bytes[0] += raw.nbytes
+
+
+def _allocate_buffer(nbytes, alignment, owner=None, name=None):
+    '''
+    Allocate a zero-initialised buffer of ``nbytes`` bytes (a ``uint8`` array)
+    starting at an address that is a multiple of ``alignment``. The buffer is
+    registered in the `memory_ledger` and returned to the pool when it and
+    all arrays created from it (views, reshaped arrays, etc.) are deleted.
+    '''
+    memory_ledger.check_budget(nbytes, owner, name)
+    size = nbytes + alignment
+    buffers = _pool.get(size)
+    if buffers:
+        raw = buffers.pop()
+        _pool_bytes[0] -= size
+        raw[:] = 0
+    elif brian_prefs.use_huge_pages and size >= HUGE_PAGE_SIZE:
+        raw = _allocate_huge_pages(size)
+    else:
+        raw = zeros(size, dtype=uint8)
+    offset = -raw.ctypes.data % alignment
+    buffer_owner = _BufferOwner(raw, offset, nbytes)
+    memory_ledger.register(buffer_owner, nbytes, owner, name,
+                           callback=lambda: _release_buffer(raw))
+    return asarray(buffer_owner)
+
+
+def allocate_array(shape, dtype=None, owner=None, name=None):
+    '''
+    Allocates an array initialised to 0, starting at an address that is
+    aligned to :bpref:`array_alignment` bytes. The memory is accounted for in
+    the `memory_ledger` (raising a `MemoryError` if the
+    :bpref:`memory_budget` would be exceeded) and re-used for later
+    allocations after the array has been deleted.
     
     Parameters
     ----------
@@ -24,6 +187,12 @@ def allocate_array(shape, dtype=None):
     dtype : dtype, optional
         The numpy datatype of the array. If not specified, use the
         :bpref:`default_scalar_dtype` preference. 
+    owner : str, optional
+        The name of the object using the array (e.g. a `NeuronGroup`), used
+        for the memory accounting.
+    name : str, optional
+        The name of the variable stored in the array, used for the memory
+        accounting.
         
     Returns
     -------
@@ -32,9 +201,66 @@ def allocate_array(shape, dtype=None):
     '''
     if dtype is None:
         dtype = brian_prefs.default_scalar_dtype
-    arr = zeros(shape, dtype=dtype)
+    try:
+        shape = tuple(shape)
+    except TypeError:
+        shape = (shape, )
+    itemsize = zeros(0, dtype=dtype).itemsize
+    nbytes = itemsize
+    for dim in shape:
+        nbytes *= dim
+    buf = _allocate_buffer(nbytes, brian_prefs.array_alignment, owner, name)
+    arr = buf.view(dtype).reshape(shape)
     return arr
 
+def allocate_state_matrix(names, N, dtype=None, alignment=None, owner=None):
+    '''
+    Allocates a contiguous 2D array (initialised to 0) for several variables
+    of the same dtype, with one row per variable. Each row starts at an
+    address that is a multiple of ``alignment`` bytes (the rows are padded
+    if necessary). The memory is allocated and accounted for in the same way
+    as for `allocate_array`.
+    
+    Parameters
+    ----------
+    names : list of str
+        The names of the variables, in the order of the rows.
+    N : int
+        The number of values per variable.
+    dtype : dtype, optional
+        The numpy datatype of the array. If not specified, use the
+        :bpref:`default_scalar_dtype` preference.
+    alignment : int, optional
+        The alignment of the rows in bytes, if not specified use the
+        :bpref:`array_alignment` preference.
+    owner : str, optional
+        The name of the object using the array (e.g. a `NeuronGroup`), used
+        for the memory accounting.
+        
+    Returns
+    -------
+    matrix, arrays : (ndarray, dict)
+        The 2D array of shape ``(len(names), N)`` and a dictionary mapping
+        the variable names to the 1D rows of this array (views, not copies).
+    '''
+    if dtype is None:
+        dtype = brian_prefs.default_scalar_dtype
+    if alignment is None:
+        alignment = brian_prefs.array_alignment
+    itemsize = zeros(0, dtype=dtype).itemsize
+    if alignment % itemsize:
+        raise ValueError(('The alignment (%d bytes) has to be a multiple of '
+                          'the item size (%d bytes)') % (alignment, itemsize))
+    row_alignment = alignment // itemsize
+    # Pad the rows so that every row starts at an aligned address
+    row_length = ((N + row_alignment - 1) // row_alignment) * row_alignment
+    buf = _allocate_buffer(len(names) * row_length * itemsize, alignment,
+                           owner, ', '.join(names))
+    block = buf.view(dtype)
+    matrix = block.reshape((len(names), row_length))[:, :N]
+    arrays = dict((name, matrix[idx]) for idx, name in enumerate(names))
+    return matrix, arrays
+
 if __name__=='__main__':
     arr = allocate_array(100)
     print arr.shape, arr.dtype
@@ -3,7 +3,20 @@ TODO: rewrite this (verbatim from Brian 1.x), more efficiency
 '''
 from numpy import *
 
-__all__ = ['DynamicArray', 'DynamicArray1D']
+from brian2.core.preferences import brian_prefs
+from brian2.memory.allocation import allocate_array
+from brian2.memory.ledger import memory_ledger
+
+__all__ = ['DynamicArray', 'DynamicArray1D', 'SegmentedDynamicArray']
+
+brian_prefs.define('monitor_segment_size', 0,
+    '''
+    The number of rows (e.g. spikes or time steps) in each segment of the
+    arrays used by monitors to store recorded values. For a value of 0 (the
+    default), the values are stored in contiguous `DynamicArray` objects,
+    otherwise in `SegmentedDynamicArray` objects with segments of the given
+    size, avoiding copies of the recorded values when the arrays grow.
+    ''')
 
 def getslices(shape):
     return tuple(slice(0, x) for x in shape)
@@ -39,6 +52,11 @@ class DynamicArray(object):
         object. If you are sure you know what you're doing, you can switch this
         reference check off. Note that resizing in this way is only done if you
         resize in the first dimension.
+    ``owner``, ``name``
+        The name of the object using the array (e.g. a monitor) and of the
+        stored variable. The memory used by the array is accounted for under
+        these names in the `memory_ledger`, and growing the array raises a
+        `MemoryError` if it would exceed the :bpref:`memory_budget`.
         
     The array is initialised with zeros. The data is stored in the attribute
     ``data`` which is a Numpy array.
@@ -76,16 +94,36 @@ class DynamicArray(object):
     ensures that the amortized cost of increasing the size of the array is O(1).  
     '''
     def __init__(self, shape, dtype=float, factor=2,
-                 use_numpy_resize=False, refcheck=True):
+                 use_numpy_resize=False, refcheck=True, owner=None, name=None):
         if isinstance(shape, int):
             shape = (shape,)
+        self.owner = owner
+        self.name = name
+        memory_ledger.check_budget(prod(shape)*zeros(0, dtype=dtype).itemsize,
+                                   owner, name)
         self._data = zeros(shape, dtype=dtype)
+        self._update_ledger()
         self.data = self._data
         self.dtype = dtype
         self.shape = self._data.shape
         self.factor = factor
         self.use_numpy_resize = use_numpy_resize
         self.refcheck = refcheck
+
+    def _check_budget(self, newdatashape):
+        '''
+        Check that the memory budget allows to grow the allocated data to
+        the given shape.
+        '''
+        additional = (prod(newdatashape)*self._data.itemsize -
+                      self._data.nbytes)
+        memory_ledger.check_budget(additional, self.owner, self.name)
+
+    def _update_ledger(self):
+        '''
+        Update the memory used by the allocated data in the `memory_ledger`.
+        '''
+        memory_ledger.register(self, self._data.nbytes, self.owner, self.name)
     
     def resize(self, newshape):
         '''
@@ -109,6 +147,7 @@ class DynamicArray(object):
             newdims = maximum(incdims, dimstoinc+1)
             minnewshapearr[resizedimensions] = newdims
             newshapearr = maximum(newshapearr, minnewshapearr)
+            self._check_budget(newshapearr)
             do_resize = False
             if self.use_numpy_resize and self._data.flags['C_CONTIGUOUS']:
                 if sum(resizedimensions)==resizedimensions[0]:
@@ -121,6 +160,7 @@ class DynamicArray(object):
                 slices = getslices(self._data.shape)
                 newdata[slices] = self._data
                 self._data = newdata
+            self._update_ledger()
         self.data = self._data[getslices(newshape)]
         self.shape = self.data.shape
         
@@ -141,6 +181,7 @@ class DynamicArray(object):
             newdata = zeros(newshapearr, dtype=self.dtype)
             newdata[:] = self._data[getslices(newshapearr)]
             self._data = newdata
+            self._update_ledger()
             self.shape = tuple(newshapearr)
             self.data = self._data
     
@@ -178,6 +219,7 @@ class DynamicArray1D(DynamicArray):
         datashape, = self._data.shape
         if newshape>datashape:
             newdatashape = max(newshape, int(shape*self.factor)+1)
+            self._check_budget((newdatashape, ))
             if self.use_numpy_resize and self._data.flags['C_CONTIGUOUS']:
                 self.data = None
                 self._data.resize(newdatashape, refcheck=self.refcheck)
@@ -185,9 +227,184 @@ class DynamicArray1D(DynamicArray):
                 newdata = zeros(newdatashape, dtype=self.dtype)
                 newdata[:shape] = self.data
                 self._data = newdata
+            self._update_ledger()
         self.data = self._data[:newshape]
         self.shape = (newshape,)      
+
+
+class SegmentedDynamicArray(object):
+    '''
+    A dynamic array stored as a list of segments
+    
+    The array can only be resized in the first dimension. Contrary to
+    :class:`DynamicArray`, growing the array never copies the data: new rows
+    are stored in new segments (of ``segment_size`` rows). The segments are
+    only concatenated when the ``data`` attribute is accessed.
     
+    Initialisation arguments:
+    
+    ``shape``, ``dtype``
+        The shape and dtype of the array to initialise, as in Numpy. For 1D
+        arrays, shape can be a single int, for ND arrays it should be a tuple.
+    ``segment_size``
+        The number of rows in a segment (segments can be larger if more rows
+        are reserved at once with :meth:`reserve`).
+    ``owner``, ``name``
+        The name of the object using the array (e.g. a monitor) and of the
+        stored variable, used for the `memory_ledger`.
+    
+    The array is initialised with zeros. New rows are added with
+    :meth:`resize`, :meth:`reserve` (returning a view of the new rows, that
+    can be filled in without copying) or :meth:`append`.
+    
+    Examples
+    --------
+    
+    >>> x = SegmentedDynamicArray(0, dtype=int, segment_size=4)
+    >>> x.append([1, 2, 3])
+    >>> x.reserve(2)[:] = [4, 5]
+    >>> len(x._segments)
+    2
+    >>> print x.data
+    [1 2 3 4 5]
+    
+    Notes
+    -----
+    
+    When the ``data`` attribute is accessed, the segments are concatenated
+    and replaced by the concatenated array, which is then cached until new
+    rows are added. Rows added later are stored in new segments, i.e. the
+    data is copied only once for each access to ``data`` after adding rows.
+    '''
+    def __init__(self, shape, dtype=float, segment_size=65536, owner=None,
+                 name=None):
+        if isinstance(shape, int):
+            shape = (shape,)
+        self.dtype = dtype
+        self.row_shape = tuple(shape[1:])
+        self.segment_size = int(segment_size)
+        self.owner = owner
+        self.name = name
+        # All segments but the last one are completely filled
+        self._segments = []
+        # The number of filled rows of the last segment
+        self._fill = 0
+        self._length = 0
+        # The cached concatenation of the segments
+        self._data = None
+        self.resize(shape)
+
+    shape = property(lambda self: (self._length,) + self.row_shape,
+                     doc='The shape of the array.')
+
+    def _filled_segments(self):
+        if not len(self._segments):
+            return []
+        return self._segments[:-1] + [self._segments[-1][:self._fill]]
+
+    def reserve(self, num_rows):
+        '''
+        Add ``num_rows`` rows and return them (as a view on a single
+        segment, so that they can be filled without copying).
+        '''
+        if (not len(self._segments) or
+                self._fill + num_rows > len(self._segments[-1])):
+            if len(self._segments) and self._fill < len(self._segments[-1]):
+                self._segments[-1] = self._segments[-1][:self._fill]
+            self._segments.append(allocate_array((max(self.segment_size,
+                                                      num_rows),) +
+                                                 self.row_shape,
+                                                 dtype=self.dtype,
+                                                 owner=self.owner,
+                                                 name=self.name))
+            self._fill = 0
+        rows = self._segments[-1][self._fill:self._fill+num_rows]
+        self._fill += num_rows
+        self._length += num_rows
+        self._data = None
+        return rows
+
+    def append(self, values):
+        '''
+        Add the given rows at the end of the array.
+        '''
+        values = asarray(values)
+        self.reserve(len(values))[:] = values
+
+    def resize(self, newshape):
+        '''
+        Resizes the data to the new shape, only the first dimension can be
+        changed. New rows are initialised with zeros.
+        '''
+        if isscalar(newshape):
+            newshape = (newshape,)
+        if tuple(newshape[1:]) != self.row_shape:
+            raise ValueError(('Only the first dimension of a '
+                              'SegmentedDynamicArray can be resized.'))
+        newlength = newshape[0]
+        while self._length < newlength:
+            # Fill the last segment, then add new segments
+            if len(self._segments):
+                available = len(self._segments[-1]) - self._fill
+            else:
+                available = 0
+            if available == 0:
+                available = self.segment_size
+            self.reserve(min(available, newlength - self._length))
+        while self._length > newlength:
+            # Remove rows from the end
+            excess = self._length - newlength
+            last = self._segments[-1]
+            if excess < self._fill:
+                last[self._fill-excess:self._fill] = 0
+                self._fill -= excess
+                self._length = newlength
+            else:
+                self._segments.pop()
+                self._length -= self._fill
+                if len(self._segments):
+                    self._fill = len(self._segments[-1])
+                else:
+                    self._fill = 0
+            self._data = None
+
+    def _get_data(self):
+        if self._data is None:
+            segments = self._filled_segments()
+            if len(segments) == 1:
+                self._data = segments[0]
+            else:
+                data = allocate_array(self.shape, dtype=self.dtype,
+                                      owner=self.owner, name=self.name)
+                start = 0
+                for segment in segments:
+                    data[start:start+len(segment)] = segment
+                    start += len(segment)
+                # Replace the segments by the concatenated array
+                self._segments = [data]
+                self._fill = len(data)
+                self._data = data
+        return self._data
+
+    data = property(_get_data, doc='''
+        The concatenated data (cached until rows are added).
+        ''')
+
+    def __getitem__(self, item):
+        return self.data.__getitem__(item)
+
+    def __setitem__(self, item, val):
+        self.data.__setitem__(item, val)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return self.data.__str__()
+
+    def __repr__(self):
+        return self.data.__repr__()
+
             
 if __name__=='__main__':
     if 1:
@@ -0,0 +1,178 @@
+'''
+Accounting of the memory used by arrays of Brian objects.
+'''
+import weakref
+
+from brian2.core.preferences import brian_prefs
+from brian2.utils.logger import get_logger
+
+__all__ = ['MemoryLedger', 'memory_ledger', 'report']
+
+logger = get_logger(__name__)
+
+brian_prefs.define('memory_budget', 0,
+    '''
+    The maximal number of bytes that can be used by the arrays allocated for
+    Brian objects (state variables, recorded values, etc.). Allocating an
+    array that would exceed this budget raises a `MemoryError`, before the
+    memory is actually allocated. Use 0 for no limit.
+    ''')
+
+
+def _format_bytes(nbytes):
+    '''
+    Format a number of bytes with a binary unit, e.g. ``'1.5 MiB'``.
+    '''
+    for unit in ['B', 'KiB', 'MiB', 'GiB']:
+        if abs(nbytes) < 1024 or unit == 'GiB':
+            if unit == 'B':
+                return '%d %s' % (nbytes, unit)
+            return '%.1f %s' % (nbytes, unit)
+        nbytes /= 1024.
+
+
+class MemoryLedger(object):
+    '''
+    Keeps track of the memory used by arrays, by owner (e.g. the name of a
+    `NeuronGroup` or `SpikeMonitor`) and variable name. Entries are
+    registered for an object (e.g. an array) and automatically removed when
+    this object is deleted.
+    '''
+    def __init__(self):
+        # Maps keys to (owner, name, nbytes) tuples
+        self._entries = {}
+        # Keeps the weak references (and their callbacks) alive
+        self._references = {}
+
+    def _get_total_bytes(self):
+        return sum(nbytes for _, _, nbytes in self._entries.itervalues())
+
+    total_bytes = property(_get_total_bytes,
+                           doc='The total number of bytes of all entries.')
+
+    def check_budget(self, nbytes, owner=None, name=None):
+        '''
+        Check whether ``nbytes`` additional bytes can be allocated without
+        exceeding the :bpref:`memory_budget`.
+
+        Parameters
+        ----------
+        nbytes : int
+            The number of additional bytes.
+        owner : str, optional
+            The owner of the memory (used in the error message).
+        name : str, optional
+            The name of the variable (used in the error message).
+
+        Raises
+        ------
+        MemoryError
+            If the budget would be exceeded.
+        '''
+        budget = brian_prefs.memory_budget
+        if budget and self.total_bytes + nbytes > budget:
+            description = '/'.join(str(part) for part in (owner, name)
+                                   if part is not None)
+            if description:
+                description = ' for ' + description
+            raise MemoryError(('Allocating %s%s would exceed the memory budget '
+                               'of %s (%s already in use).') %
+                              (_format_bytes(nbytes), description,
+                               _format_bytes(budget),
+                               _format_bytes(self.total_bytes)))
+
+    def register(self, obj, nbytes, owner=None, name=None, callback=None):
+        '''
+        Add an entry for the memory used by ``obj`` (or update the entry if
+        it already exists). The entry is removed when ``obj`` is deleted.
+
+        Parameters
+        ----------
+        obj : object
+            The object using the memory, has to support weak references.
+        nbytes : int
+            The number of bytes used.
+        owner : str, optional
+            The name of the owner of the memory.
+        name : str, optional
+            The name of the variable.
+        callback : callable, optional
+            A function that is called (without arguments) when ``obj`` is
+            deleted.
+        '''
+        key = id(obj)
+        if not key in self._references:
+            def remove(ref):
+                del self._entries[key]
+                del self._references[key]
+                if callback is not None:
+                    callback()
+            self._references[key] = weakref.ref(obj, remove)
+        self._entries[key] = (owner, name, nbytes)
+
+    def usage(self):
+        '''
+        Return the memory usage by owner and variable.
+
+        Returns
+        -------
+        usage : dict
+            A dictionary mapping ``(owner, name)`` tuples to numbers of bytes.
+        '''
+        usage = {}
+        for owner, name, nbytes in self._entries.itervalues():
+            usage[(owner, name)] = usage.get((owner, name), 0) + nbytes
+        return usage
+
+    def report(self):
+        '''
+        Return a description of the memory usage, listing the number of bytes
+        for each owner and variable.
+
+        Returns
+        -------
+        report : str
+            The formatted report.
+        '''
+        by_owner = {}
+        for (owner, name), nbytes in self.usage().iteritems():
+            by_owner.setdefault(owner, []).append((name, nbytes))
+        lines = []
+        for owner, entries in sorted(by_owner.iteritems(),
+                                     key=lambda item: -sum(n for _, n in item[1])):
+            lines.append('%s: %s' % (owner if owner is not None else '(unknown)',
+                                     _format_bytes(sum(n for _, n in entries))))
+            for name, nbytes in sorted(entries, key=lambda entry: -entry[1]):
+                lines.append('    %s: %s' % (name if name is not None else '(unnamed)',
+                                             _format_bytes(nbytes)))
+        lines.append('Total: %s' % _format_bytes(self.total_bytes))
+        budget = brian_prefs.memory_budget
+        if budget:
+            lines.append('Budget: %s' % _format_bytes(budget))
+        return '\n'.join(lines)
+
+
+#: The ledger used for all arrays allocated by Brian
+memory_ledger = MemoryLedger()
+
+
+def report():
+    '''
+    Return a description of the memory used by the arrays of all Brian
+    objects, listing the number of bytes by object (group, monitor, ...) and
+    variable.
+
+    Returns
+    -------
+    report : str
+        The formatted report.
+
+    Examples
+    --------
+    >>> print report() # doctest: +SKIP
+    neurongroup_0: 31.3 KiB
+        v: 7.8 KiB
+        ...
+    Total: 31.3 KiB
+    '''
+    return memory_ledger.report()
@@ -0,0 +1,315 @@
+'''
+Streaming of recorded values to disk.
+
+Values are collected in fixed-size chunks (allocated with `allocate_array`),
+full chunks are handed over to a `BackgroundWriter` thread that appends them
+to a file in the ``.npy`` format, so the simulation never waits for the
+disk. The files can be read back without copying via `numpy.memmap`.
+'''
+import os
+import json
+import struct
+import atexit
+import weakref
+import threading
+import Queue
+
+import numpy as np
+from numpy.lib.format import dtype_to_descr, read_magic, read_array_header_1_0
+
+from brian2.core.preferences import brian_prefs
+from brian2.memory.allocation import allocate_array
+from brian2.utils.logger import get_logger
+
+__all__ = ['BackgroundWriter', 'background_writer', 'ChunkedStream',
+           'load_stream']
+
+logger = get_logger(__name__)
+
+brian_prefs.define('stream_chunk_size', 65536,
+    '''
+    The number of rows (e.g. spikes or time steps) that are collected in
+    memory before they are written to disk, for monitors that stream their
+    values to disk.
+    ''')
+
+brian_prefs.define('stream_queue_size', 16,
+    '''
+    The maximal number of chunks that are waiting to be written to disk. If
+    the disk cannot keep up with the simulation, the simulation waits until
+    a chunk has been written instead of keeping more and more chunks in
+    memory. Use 0 for no limit.
+    ''')
+
+# The magic string of the .npy format (version 1.0)
+_MAGIC = '\x93NUMPY\x01\x00'
+# The size of the header (including the magic string), the header is
+# rewritten with the current shape after every chunk
+_HEADER_SIZE = 256
+
+# All streams that are not closed yet, flushed at exit
+_open_streams = weakref.WeakSet()
+
+
+def _write_header(f, dtype, shape):
+    '''
+    Write a ``.npy`` header of fixed size to the beginning of the file ``f``.
+    '''
+    header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+                                            dtype_to_descr(dtype), shape)
+    length = _HEADER_SIZE - len(_MAGIC) - 2
+    if len(header) >= length:
+        raise ValueError('Header too long for shape %s' % (shape, ))
+    f.seek(0)
+    f.write(_MAGIC + struct.pack('<H', length) + header.ljust(length - 1) +
+            '\n')
+
+
+class BackgroundWriter(object):
+    '''
+    A thread writing chunks of data to `ChunkedStream` files. The thread is
+    started when the first chunk is submitted. At most
+    :bpref:`stream_queue_size` chunks are waiting to be written, `submit`
+    blocks if this limit is reached. Errors during writing are raised (as an
+    `IOError`) in the simulation thread with the next call to `submit` or
+    `flush`.
+    '''
+    def __init__(self):
+        # Created with the thread, to use the current preference
+        self._queue = None
+        self._thread = None
+        self._error = None
+
+    def _run(self):
+        while True:
+            stream, data = self._queue.get()
+            try:
+                if self._error is None:
+                    stream._write(data)
+            except Exception as ex:
+                self._error = ex
+            finally:
+                self._queue.task_done()
+
+    def _check_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise IOError('Writing recorded values to disk failed: %s' % error)
+
+    def submit(self, stream, data):
+        '''
+        Hand over data to be appended to a stream, returns immediately unless
+        :bpref:`stream_queue_size` chunks are already waiting to be written.
+
+        Parameters
+        ----------
+        stream : `ChunkedStream`
+            The stream the data belongs to.
+        data : `ndarray`
+            The rows to append, must not be changed until they are written.
+        '''
+        self._check_error()
+        if self._thread is None or not self._thread.is_alive():
+            if self._queue is None:
+                self._queue = Queue.Queue(brian_prefs.stream_queue_size)
+            self._thread = threading.Thread(target=self._run,
+                                            name='brian2_writer')
+            self._thread.daemon = True
+            self._thread.start()
+        try:
+            self._queue.put_nowait((stream, data))
+        except Queue.Full:
+            logger.info(('Waiting for %d chunks to be written to disk before '
+                         'writing %s') % (self._queue.maxsize,
+                                          stream.filename))
+            self._queue.put((stream, data))
+
+    def flush(self):
+        '''
+        Wait until all submitted data has been written.
+        '''
+        if self._queue is not None:
+            self._queue.join()
+        self._check_error()
+
+
+#: The writer used by all streams
+background_writer = BackgroundWriter()
+
+
+class ChunkedStream(object):
+    '''
+    A sequence of rows, stored in a ``.npy`` file. Rows are added with
+    `reserve` or `append` into an in-memory chunk, full chunks are written by
+    the `background_writer`. The file is always a valid ``.npy`` file
+    containing all written rows, an index (stored as JSON in a file with the
+    extension ``.json`` instead of ``.npy``) describes the written chunks.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file, an existing file will be overwritten.
+    dtype : `dtype`
+        The data type of the values.
+    row_shape : tuple of int, optional
+        The shape of a single row, defaults to ``()`` (scalar values).
+    chunk_size : int, optional
+        The number of rows in a chunk, defaults to the
+        :bpref:`stream_chunk_size` preference.
+    owner : str, optional
+        The name of the owner of the stream (used for the memory ledger).
+    name : str, optional
+        The name of the stored variable (used for the memory ledger).
+    '''
+    def __init__(self, filename, dtype, row_shape=(), chunk_size=None,
+                 owner=None, name=None):
+        if chunk_size is None:
+            chunk_size = brian_prefs.stream_chunk_size
+        self.filename = filename
+        self.index_filename = os.path.splitext(filename)[0] + '.json'
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(row_shape)
+        self.chunk_size = int(chunk_size)
+        self.owner = owner
+        self.name = name
+        #: The number of rows in the stream (including rows not written yet)
+        self.num_rows = 0
+        # Only accessed by the writer thread (or after a flush)
+        self._rows_written = 0
+        self._chunks = []
+        self._file = open(filename, 'w+b')
+        _write_header(self._file, self.dtype, (0, ) + self.row_shape)
+        self._file.flush()
+        self._chunk = None
+        self._fill = 0
+        self._submitted = 0
+        self._memmap = None
+        _open_streams.add(self)
+
+    def _submit(self):
+        if self._chunk is not None and self._fill > self._submitted:
+            background_writer.submit(self,
+                                     self._chunk[self._submitted:self._fill])
+            self._submitted = self._fill
+
+    def reserve(self, num_rows):
+        '''
+        Add ``num_rows`` rows to the stream and return them, so that they can
+        be filled in. The rows have to be filled before the next call to
+        `flush`.
+
+        Parameters
+        ----------
+        num_rows : int
+            The number of rows.
+
+        Returns
+        -------
+        rows : `ndarray`
+            A view on the rows in the current chunk.
+        '''
+        if self._chunk is None or self._fill + num_rows > len(self._chunk):
+            # The chunk is full, hand it over to the writer
+            self._submit()
+            self._chunk = allocate_array((max(self.chunk_size, num_rows), ) +
+                                         self.row_shape, dtype=self.dtype,
+                                         owner=self.owner, name=self.name)
+            self._fill = self._submitted = 0
+        rows = self._chunk[self._fill:self._fill + num_rows]
+        self._fill += num_rows
+        self.num_rows += num_rows
+        return rows
+
+    def append(self, values):
+        '''
+        Append rows to the stream.
+
+        Parameters
+        ----------
+        values : `ndarray`
+            The rows, an array of shape ``(num_rows, ) + row_shape``.
+        '''
+        values = np.asarray(values)
+        self.reserve(len(values))[:] = values
+
+    def _write(self, data):
+        # Called in the writer thread
+        f = self._file
+        f.seek(0, os.SEEK_END)
+        data.tofile(f)
+        self._chunks.append((self._rows_written, len(data)))
+        self._rows_written += len(data)
+        _write_header(f, self.dtype, (self._rows_written, ) + self.row_shape)
+        f.flush()
+        with open(self.index_filename, 'w') as index_file:
+            json.dump({'dtype': dtype_to_descr(self.dtype),
+                       'row_shape': list(self.row_shape),
+                       'rows': self._rows_written,
+                       'chunks': self._chunks}, index_file)
+
+    def flush(self):
+        '''
+        Write all rows to the file and wait until they have been written.
+        '''
+        if self._file.closed:
+            return
+        self._submit()
+        background_writer.flush()
+
+    def read(self):
+        '''
+        Return all rows of the stream (after writing them to the file).
+
+        Returns
+        -------
+        values : `memmap`
+            A read-only memory map of the file.
+        '''
+        self.flush()
+        if self._memmap is None or len(self._memmap) != self._rows_written:
+            self._memmap = load_stream(self.filename)
+        return self._memmap
+
+    def close(self):
+        '''
+        Write all rows to the file and close it.
+        '''
+        self.flush()
+        self._file.close()
+        self._chunk = None
+        _open_streams.discard(self)
+
+
+def load_stream(filename):
+    '''
+    Load the values stored by a `ChunkedStream` without copying them.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file.
+
+    Returns
+    -------
+    values : `ndarray`
+        A read-only memory map of the file (or an empty read-only array if no
+        values have been written, since empty files cannot be mapped).
+    '''
+    with open(filename, 'rb') as f:
+        read_magic(f)
+        shape, _, dtype = read_array_header_1_0(f)
+    if shape[0] == 0:
+        values = np.zeros(shape, dtype=dtype)
+        values.flags.writeable = False
+        return values
+    return np.load(filename, mmap_mode='r')
+
+
+def _close_streams():
+    for stream in list(_open_streams):
+        try:
+            stream.close()
+        except Exception as ex:
+            logger.warn('Could not write %s: %s' % (stream.filename, ex))
+
+atexit.register(_close_streams)
@@ -1,2 +1,4 @@
 from spikemonitor import *
 from statemonitor import *
+from ratemonitor import *
+from statisticsmonitor import *
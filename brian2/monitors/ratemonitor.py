@@ -0,0 +1,222 @@
+import weakref
+from math import exp
+
+import numpy as np
+
+from brian2.core.base import BrianObject
+from brian2.core.scheduler import Scheduler
+from brian2.memory.dynamicarray import DynamicArray1D
+from brian2.units.allunits import second, hertz
+from brian2.units.fundamentalunits import Quantity, check_units
+
+__all__ = ['PopulationRateMonitor']
+
+class PopulationRateMonitor(BrianObject):
+    '''
+    Record the population rate of a `NeuronGroup` or other spike source
+
+    Parameters
+    ----------
+    source : (`NeuronGroup`, `SpikeSource`)
+        The source of spikes.
+    when : `Scheduler`, optional
+        When to record the spikes, by default uses the clock of the source
+        and records spikes in the slot 'end'.
+    smoothing : {``None``, ``'window'``, ``'exponential'``}, optional
+        Whether to additionally record a smoothed rate (`smooth_rate`),
+        averaged over a sliding window of the given ``width`` or filtered
+        with an exponential kernel with time constant ``width``. Defaults to
+        ``None`` (no smoothing).
+    width : `Quantity`, optional
+        The width of the window or the time constant of the exponential
+        kernel, needed if ``smoothing`` is set.
+    name : str, optional
+        A unique name for the object, otherwise will use
+        ``source.name+'_ratemonitor_0'``, etc.
+
+    Notes
+    -----
+    Only the number of spikes in each time step is stored (a single integer
+    per time step, the arrays are preallocated for all time steps of a run),
+    the rates and the recording times are calculated from these counts when
+    they are accessed. The smoothed rate is calculated incrementally in each
+    time step.
+
+    Examples
+    --------
+
+    Record the rate of a group, smoothed with a 5ms window::
+
+        G = PoissonGroup(10000, rates=10*Hz)
+        M = PopulationRateMonitor(G, smoothing='window', width=5*ms)
+        run(100*ms)
+        plot(M.t, M.smooth_rate)
+        show()
+    '''
+    basename = 'ratemonitor'
+    @check_units(width=second)
+    def __init__(self, source, when=None, smoothing=None, width=None,
+                 name=None):
+        self.source = weakref.proxy(source)
+        if not smoothing in (None, 'window', 'exponential'):
+            raise ValueError(('smoothing has to be None, "window" or '
+                              '"exponential", is %r') % (smoothing, ))
+        if smoothing is not None and (width is None or float(width) <= 0):
+            raise ValueError('Smoothing needs a positive width.')
+        #: The type of smoothing (``None``, ``'window'`` or ``'exponential'``)
+        self.smoothing = smoothing
+        #: The width of the smoothing window or kernel
+        self.width = width
+
+        # run by default on source clock at the end
+        scheduler = Scheduler(when)
+        if not scheduler.defined_clock:
+            scheduler.clock = source.clock
+        if not scheduler.defined_when:
+            scheduler.when = 'end'
+        BrianObject.__init__(self, when=scheduler, name=name)
+
+        # create data structures
+        self.reinit()
+
+    def reinit(self):
+        '''
+        Clears all recorded rates
+        '''
+        if len(self.source) <= np.iinfo(np.int32).max:
+            count_dtype = np.int32
+        else:
+            count_dtype = np.int64
+        self._count = DynamicArray1D(0, dtype=count_dtype, owner=self.name,
+                                     name='count')
+        if self.smoothing is not None:
+            self._smooth_rate = DynamicArray1D(0, dtype=np.float64,
+                                               owner=self.name,
+                                               name='smooth_rate')
+        #: The number of recorded time steps
+        self.num_recorded = 0
+        # Consecutive recorded time steps as (record index, clock step) pairs
+        self._segments = []
+        self._next_step = None
+        # The state of the smoothing filter (sum over the window or filtered
+        # rate)
+        self._smoothing_state = 0
+        # Cached read-only views of the recorded values
+        self._views = {}
+
+    def _allocate(self, num_steps):
+        '''
+        Enlarge the arrays so that they can store ``num_steps`` time steps.
+        '''
+        self._count.resize(num_steps)
+        if self.smoothing is not None:
+            self._smooth_rate.resize(num_steps)
+
+    def update(self):
+        n = self.num_recorded
+        if n == len(self._count):
+            # Make space for all remaining steps of the current run
+            self._allocate(n + max(1, self.clock.i_end - self.clock.i))
+        if self.clock.i != self._next_step:
+            self._segments.append((n, self.clock.i))
+        self._next_step = self.clock.i + 1
+        count = len(self.source.spikes)
+        counts = self._count.data
+        counts[n] = count
+        if self.smoothing == 'window':
+            window = max(1, int(round(float(self.width) / self.clock.dt_)))
+            self._smoothing_state += count
+            if n >= window:
+                self._smoothing_state -= counts[n - window]
+            self._smooth_rate.data[n] = (self._smoothing_state /
+                                         (len(self.source) *
+                                          min(n + 1, window) *
+                                          self.clock.dt_))
+        elif self.smoothing == 'exponential':
+            decay = exp(-self.clock.dt_ / float(self.width))
+            rate = count / (len(self.source) * self.clock.dt_)
+            if n == 0:
+                self._smoothing_state = rate
+            else:
+                self._smoothing_state = (decay * self._smoothing_state +
+                                         (1 - decay) * rate)
+            self._smooth_rate.data[n] = self._smoothing_state
+        self.num_recorded = n + 1
+
+    def _get_view(self, name, create):
+        '''
+        Return a read-only array returned by ``create()``, the array is cached
+        until new values are recorded.
+        '''
+        view = self._views.get(name, None)
+        if view is None or len(view) != self.num_recorded:
+            view = create()
+            view.flags.writeable = False
+            self._views[name] = view
+        return view
+
+    def _get_times(self):
+        steps = np.empty(self.num_recorded, dtype=np.int64)
+        ends = [start for start, _ in self._segments[1:]] + [self.num_recorded]
+        for (start, step), end in zip(self._segments, ends):
+            steps[start:end] = step + np.arange(end - start)
+        return steps * self.clock.dt_
+
+    @property
+    def count(self):
+        '''
+        Array of the number of spikes in each recorded time step.
+        '''
+        return self._get_view('count',
+                              lambda: self._count.data[:self.num_recorded])
+
+    @property
+    def t(self):
+        '''
+        Array of recording times.
+        '''
+        return self._get_view('t', lambda: Quantity(self.t_, dim=second.dim))
+
+    @property
+    def t_(self):
+        '''
+        Array of recording times (without units).
+        '''
+        return self._get_view('t_', self._get_times)
+
+    @property
+    def rate(self):
+        '''
+        Array of population rates.
+        '''
+        return self._get_view('rate', lambda: Quantity(self.rate_,
+                                                       dim=hertz.dim))
+
+    @property
+    def rate_(self):
+        '''
+        Array of population rates (without units).
+        '''
+        return self._get_view('rate_',
+                              lambda: (self.count /
+                                       (len(self.source) * self.clock.dt_)))
+
+    @property
+    def smooth_rate(self):
+        '''
+        Array of smoothed population rates.
+        '''
+        return self._get_view('smooth_rate',
+                              lambda: Quantity(self.smooth_rate_,
+                                               dim=hertz.dim))
+
+    @property
+    def smooth_rate_(self):
+        '''
+        Array of smoothed population rates (without units).
+        '''
+        if self.smoothing is None:
+            raise AttributeError(('No smoothed rate recorded, use the '
+                                  'smoothing argument.'))
+        return self._get_view('smooth_rate_',
+                              lambda: self._smooth_rate.data[:self.num_recorded])
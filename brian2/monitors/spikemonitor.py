@@ -1,12 +1,19 @@
+import os
 import weakref
 
-from numpy import zeros
+import numpy as np
 
 from brian2.core.base import BrianObject
 from brian2.core.preferences import brian_prefs
 from brian2.core.scheduler import Scheduler
-from brian2.memory.dynamicarray import DynamicArray1D
+from brian2.codegen.languages import PythonLanguage
+from brian2.codegen.specifiers import ArrayVariable, Index, Value
+from brian2.codegen.translation import translate
+from brian2.memory.allocation import allocate_array
+from brian2.memory.dynamicarray import DynamicArray1D, SegmentedDynamicArray
+from brian2.memory.streaming import ChunkedStream
 from brian2.units.allunits import second
+from brian2.units.fundamentalunits import Quantity
 
 __all__ = ['SpikeMonitor']
 
@@ -24,14 +31,61 @@ class SpikeMonitor(BrianObject):
     when : `Scheduler`, optional
         When to record the spikes, by default uses the clock of the source
         and records spikes in the slot 'end'.
+    compact : bool, optional
+        Whether to store the spikes in a compact form: the indices as 32 bit
+        integers and the times as integer time steps of the monitor's clock
+        (32 bit integers, or 64 bit integers if the spikes are streamed to
+        disk). Defaults to ``False``.
+    stream : str, optional
+        A directory to which the recorded spikes are streamed instead of
+        keeping them in memory. The indices and times are stored in the files
+        ``<name>_i.npy`` and ``<name>_t.npy`` (where ``<name>`` is the name of
+        the monitor), see `ChunkedStream`.
+    language : `Language`, optional
+        The language used for the generated recording code, `PythonLanguage`
+        if not specified.
     name : str, optional
         A unique name for the object, otherwise will use
         ``source.name+'_spikemonitor_0'``, etc.
+
+    Notes
+    -----
+    The spikes are recorded by generated code (using the
+    `Language.template_spike_monitor` template), i.e. with `CPPLanguage` the
+    recording is done in compiled code.
+
+    In compact mode, a spike uses 8 instead of 16 bytes and the times `t` are
+    calculated from the time steps when they are accessed (assuming that the
+    time step of the clock does not change). The time steps are stored
+    exactly (available as `steps`). If the time steps exceed the range of 32
+    bit integers, the stored time steps are converted to 64 bit integers.
+
+    If ``stream`` is set, only the current chunk of spikes is kept in memory,
+    full chunks are written to disk by a background thread. Accessing `i` or
+    `t` writes all spikes to disk and returns read-only memory maps of the
+    files.
+
+    If the :bpref:`monitor_segment_size` preference is set, the spikes are
+    stored in a `SegmentedDynamicArray`, i.e. they are never copied when
+    the arrays grow.
+
+    The recorded values (`i`, `t`, `t_`, etc.) are returned as read-only
+    views, i.e. they are not copied (`t` is a `Quantity` view of the same
+    data as `t_`). The views are cached until new spikes are recorded, so
+    repeated access is cheap. Note that these views refer to the spikes
+    recorded at the time they were accessed.
     '''
     basename = 'spikemonitor'
-    def __init__(self, source, record=True, when=None, name=None):
+    def __init__(self, source, record=True, when=None, compact=False,
+                 stream=None, language=None, name=None):
         self.source = weakref.proxy(source)
         self.record = bool(record)
+        #: Whether indices and time steps are stored as (32 bit) integers
+        self.compact = bool(compact)
+        #: The directory the spikes are streamed to (or ``None``)
+        self.stream = stream
+        if stream is not None and not os.path.isdir(stream):
+            os.makedirs(stream)
 
         # run by default on source clock at the end
         scheduler = Scheduler(when)
@@ -43,55 +97,208 @@ class SpikeMonitor(BrianObject):
         
         # create data structures
         self.reinit()
+
+        # create the code object doing the recording
+        if language is None:
+            language = PythonLanguage()
+        self.language = language
+        self.create_codeobj()
+
+    def create_codeobj(self):
+        '''
+        Create the code object increasing the spike count and copying the
+        indices and times of the spikes into the space reserved for them
+        (``_new_i`` and ``_new_t``).
+        '''
+        specifiers = {'_neuron_idx': Index(all=False),
+                      '_spike_idx': Index(all=True),
+                      'count': ArrayVariable('_array_count', '_neuron_idx',
+                                             self.count.dtype),
+                      't': Value(brian_prefs.default_scalar_dtype),
+                      '_step': Value(np.int64)}
+        lines = ['count += 1']
+        if self.record:
+            specifiers['_record_i'] = ArrayVariable('_new_i', '_spike_idx',
+                                                    self._i.dtype)
+            specifiers['_record_t'] = ArrayVariable('_new_t', '_spike_idx',
+                                                    self._t.dtype)
+            lines.append('_record_i = _neuron_idx')
+            if self.compact:
+                lines.append('_record_t = _step')
+            else:
+                lines.append('_record_t = t')
+        innercode = translate('\n'.join(lines), specifiers,
+                              brian_prefs.default_scalar_dtype, self.language)
+        code = self.language.apply_template(innercode,
+                                            self.language.template_spike_monitor())
+        self.codeobj = self.language.code_object(code, specifiers)
+        self.codeobj.compile({})
         
     def reinit(self):
         '''
         Clears all recorded spikes
         '''
-        self._i = DynamicArray1D(0, use_numpy_resize=True, dtype=int)
-        self._t = DynamicArray1D(0, use_numpy_resize=True,
-                                 dtype=brian_prefs.default_scalar_dtype)
-        
+        # The data types of the recorded indices and times (time steps in
+        # compact mode)
+        if self.compact:
+            index_dtype = np.int32
+            if self.stream is None:
+                time_dtype = np.int32
+            else:
+                time_dtype = np.int64
+        else:
+            index_dtype = int
+            time_dtype = brian_prefs.default_scalar_dtype
+        segment_size = brian_prefs.monitor_segment_size
+        # Whether the space for new spikes is reserved in a stream or a
+        # segmented array (instead of resizing a contiguous array)
+        self._reserve_spikes = self.stream is not None or segment_size > 0
+        if self.stream is None and segment_size:
+            self._i = SegmentedDynamicArray(0, dtype=index_dtype,
+                                            segment_size=segment_size,
+                                            owner=self.name, name='i')
+            self._t = SegmentedDynamicArray(0, dtype=time_dtype,
+                                            segment_size=segment_size,
+                                            owner=self.name, name='t')
+        elif self.stream is None:
+            # Note that the arrays are not resized in-place, since the views
+            # returned to the user may still refer to them
+            self._i = DynamicArray1D(0, dtype=index_dtype, owner=self.name,
+                                     name='i')
+            self._t = DynamicArray1D(0, dtype=time_dtype, owner=self.name,
+                                     name='t')
+        else:
+            if hasattr(self, '_i'):
+                self._i.close()
+                self._t.close()
+            filename = os.path.join(self.stream, self.name+'_%s.npy')
+            self._i = ChunkedStream(filename % 'i', index_dtype,
+                                    owner=self.name, name='i')
+            self._t = ChunkedStream(filename % 't', time_dtype,
+                                    owner=self.name, name='t')
+
         #: Array of the number of times each source neuron has spiked
-        self.count = zeros(len(self.source), dtype=int)
+        self.count = allocate_array(len(self.source), dtype=int,
+                                    owner=self.name, name='count')
+
+        # Cached read-only views of the recorded values
+        self._views = {}
+
+        # The index of the spikes by neuron (see `spike_train`): the spikes
+        # of neuron k are ``_train_order[_train_offsets[k]:_train_offsets[k+1]]``
+        # for the first ``_indexed_spikes`` spikes
+        self._train_offsets = np.zeros(len(self.source) + 1, dtype=int)
+        self._train_order = np.zeros(0, dtype=int)
+        self._indexed_spikes = 0
+        self._spike_trains = None
+
+        if hasattr(self, 'codeobj'):
+            # The data types may have changed
+            self.create_codeobj()
+
+    def _widen_steps(self):
+        '''
+        Convert the stored time steps to 64 bit integers.
+        '''
+        steps = self._t
+        if isinstance(steps, SegmentedDynamicArray):
+            self._t = SegmentedDynamicArray(0, dtype=np.int64,
+                                            segment_size=steps.segment_size,
+                                            owner=self.name, name='t')
+            self._t.append(steps.data)
+        else:
+            self._t = DynamicArray1D(len(steps), dtype=np.int64,
+                                     owner=self.name, name='t')
+            self._t.data[:] = steps.data
+        self.create_codeobj()
         
     def update(self):
         spikes = self.source.spikes
         nspikes = len(spikes)
         if nspikes:
-            if self.record:
-                # update i, t arrays
+            if (self.record and self._t.dtype == np.int32 and
+                    self.clock.i > np.iinfo(np.int32).max):
+                self._widen_steps()
+            namespace = {'_spikes': spikes,
+                         '_num_spikes': nspikes,
+                         '_array_count': self.count}
+            if self.record and self._reserve_spikes:
+                namespace['_new_i'] = self._i.reserve(nspikes)
+                namespace['_new_t'] = self._t.reserve(nspikes)
+            elif self.record:
+                # make space for the new spikes in the i, t arrays
                 i = self._i
                 t = self._t
                 oldsize = len(i)
                 newsize = oldsize+nspikes
                 i.resize(newsize)
                 t.resize(newsize)
-                i.data[oldsize:] = spikes
-                t.data[oldsize:] = self.clock.t_
-            # update count
-            self.count[spikes] += 1
-            
+                namespace['_new_i'] = i.data[oldsize:]
+                namespace['_new_t'] = t.data[oldsize:]
+            self.codeobj(t=self.clock.t_, _step=self.clock.i, **namespace)
+            if self.record:
+                # Do not keep references to the data of the dynamic arrays
+                self.codeobj.namespace['_new_i'] = None
+                self.codeobj.namespace['_new_t'] = None
+
+    def _get_view(self, name, create):
+        '''
+        Return a read-only array for the recorded spikes, returned by
+        ``create()``. The array is cached until new spikes are recorded.
+        '''
+        if self.stream is None:
+            num_recorded = len(self._i)
+        else:
+            num_recorded = self._i.num_rows
+        view = self._views.get(name, None)
+        if view is None or len(view) != num_recorded:
+            view = create()
+            view.flags.writeable = False
+            self._views[name] = view
+        return view
+
+    def _get_stored(self, values):
+        # A view of the stored values (a memory map if streaming to disk)
+        if self.stream is not None:
+            return values.read()
+        return values.data[:]
+
     @property
     def i(self):
         '''
         Array of recorded spike indices, with corresponding times `t`.
         '''
-        return self._i.data.copy()
+        return self._get_view('i', lambda: self._get_stored(self._i))
     
     @property
     def t(self):
         '''
         Array of recorded spike times, with corresponding indices `i`.
         '''
-        return self._t.data.copy()*second
+        return self._get_view('t', lambda: Quantity(self.t_,
+                                                    dim=second.dim))
 
     @property
     def t_(self):
         '''
         Array of recorded spike times without units, with corresponding indices `i`.
         '''
-        return self._t.data.copy()
+        if self.compact:
+            return self._get_view('t_', lambda: (self._get_stored(self._t) *
+                                                 self.clock.dt_))
+        return self._get_view('t_', lambda: self._get_stored(self._t))
+
+    @property
+    def steps(self):
+        '''
+        Array of recorded spike times as integer time steps of the clock, with
+        corresponding indices `i`.
+        '''
+        if self.compact:
+            return self._get_view('steps', lambda: self._get_stored(self._t))
+        return self._get_view('steps',
+                              lambda: np.round(self.t_ /
+                                               self.clock.dt_).astype(np.int64))
     
     @property
     def it(self):
@@ -107,12 +314,94 @@ class SpikeMonitor(BrianObject):
         '''
         return self.i, self.t_
     
+    def _update_spike_train_index(self):
+        '''
+        Add the spikes recorded since the last call to the index of spikes by
+        neuron. The offsets of the neurons are given by the `count`, the
+        already indexed spikes are moved to their new positions and only the
+        new spikes are sorted.
+        '''
+        if not self.record:
+            raise ValueError(('Spike trains are only available if the spikes '
+                              'are recorded (record=True).'))
+        i = self.i
+        num_old = self._indexed_spikes
+        if num_old == len(i):
+            return
+        old_offsets = self._train_offsets
+        old_counts = np.diff(old_offsets)
+        offsets = np.zeros(len(self.count) + 1, dtype=int)
+        np.cumsum(self.count, out=offsets[1:])
+        order = allocate_array(len(i), dtype=int, owner=self.name,
+                               name='spike_train_order')
+        # Move the already indexed spikes
+        shift = offsets[:-1] - old_offsets[:-1]
+        order[np.arange(num_old) + np.repeat(shift, old_counts)] = self._train_order
+        # Add the new spikes (in the order of their recording) after them
+        new_i = i[num_old:]
+        new_order = np.argsort(new_i, kind='mergesort')
+        sorted_i = new_i[new_order]
+        new_counts = np.diff(offsets) - old_counts
+        new_starts = np.cumsum(new_counts) - new_counts
+        rank = np.arange(len(new_i)) - new_starts[sorted_i]
+        order[offsets[sorted_i] + old_counts[sorted_i] + rank] = num_old + new_order
+        self._train_offsets = offsets
+        self._train_order = order
+        self._indexed_spikes = len(i)
+        self._spike_trains = None
+
+    def spike_train(self, k):
+        '''
+        Return the spike times of a single neuron.
+
+        Parameters
+        ----------
+        k : int
+            The index of the neuron.
+
+        Returns
+        -------
+        t : `Quantity`
+            The spike times of neuron ``k``, in the order of their recording.
+
+        Notes
+        -----
+        The spikes are indexed by neuron when this method (or `spike_trains`)
+        is called, only the spikes recorded since the last call are added to
+        the index. Extracting the spike train then only needs time
+        proportional to the number of spikes of the neuron.
+        '''
+        if k < 0 or k >= len(self.count):
+            raise IndexError('Neuron index %d out of range' % k)
+        self._update_spike_train_index()
+        start, end = self._train_offsets[k], self._train_offsets[k+1]
+        return self.t[self._train_order[start:end]]
+
+    def spike_trains(self):
+        '''
+        Return the spike times of all neurons.
+
+        Returns
+        -------
+        spike_trains : dict
+            A dictionary mapping neuron indices to the spike times (a
+            read-only `Quantity`) of the neuron, see `spike_train`.
+        '''
+        self._update_spike_train_index()
+        if self._spike_trains is None:
+            t = self.t[self._train_order]
+            t.flags.writeable = False
+            offsets = self._train_offsets
+            self._spike_trains = dict((k, t[offsets[k]:offsets[k+1]])
+                                      for k in xrange(len(self.count)))
+        return self._spike_trains
+
     @property
     def num_spikes(self):
         '''
         Returns the number of recorded spikes
         '''
-        return sum(self.count)  
+        return self.count.sum()
 
     
 if __name__=='__main__':
@@ -1,10 +1,21 @@
+import os
 import weakref
+from math import ceil
 
-from numpy import array
+import numpy as np
+from numpy import array, arange
 
 from brian2.core.base import BrianObject
+from brian2.core.preferences import brian_prefs
 from brian2.core.scheduler import Scheduler
+from brian2.codegen.languages import PythonLanguage
+from brian2.codegen.specifiers import ArrayVariable, Index
+from brian2.codegen.translation import translate
 from brian2.groups.group import Group
+from brian2.memory.allocation import allocate_array
+from brian2.memory.dynamicarray import (DynamicArray, DynamicArray1D,
+                                        SegmentedDynamicArray)
+from brian2.memory.streaming import ChunkedStream
 from brian2.units.allunits import second
 
 __all__ = ['StateMonitor']
@@ -16,7 +27,8 @@ class StateMonitor(BrianObject, Group):
     To extract recorded values after a run, use `t` attribute for the
     array of times at which values were recorded, and variable name attribute
     for the values. The values will have shape ``(len(t), len(indices))``,
-    where `indices` are the array indices which were recorded.
+    where `indices` are the array indices which were recorded, or shape
+    ``(len(t), )`` if a ``population`` aggregate is recorded.
 
     Parameters
     ----------
@@ -32,6 +44,25 @@ class StateMonitor(BrianObject, Group):
     when : `Scheduler`, optional
         When to record the spikes, by default uses the clock of the source
         and records spikes in the slot 'end'.
+    every : int, optional
+        Record only one value for each block of ``every`` time steps,
+        defaults to 1 (record every time step).
+    aggregate : {``None``, ``'mean'``, ``'min'``, ``'max'``}, optional
+        How the values of a block of ``every`` time steps are combined. For
+        ``None`` (the default), the value of the first time step of each
+        block is recorded, otherwise the mean, minimum or maximum over the
+        block.
+    population : {``None``, ``'mean'``, ``'sum'``}, optional
+        Whether to record the mean or the sum over all recorded indices
+        instead of the individual values, defaults to ``None``.
+    stream : str, optional
+        A directory to which the recorded values are streamed instead of
+        keeping them in memory. The values of a variable ``x`` are stored in
+        the file ``<name>_x.npy``, the times in ``<name>_t.npy`` (where
+        ``<name>`` is the name of the monitor), see `ChunkedStream`.
+    language : `Language`, optional
+        The language used for the generated recording code, `PythonLanguage`
+        if not specified.
     name : str, optional
         A unique name for the object, otherwise will use
         ``source.name+'statemonitor_0'``, etc.
@@ -52,18 +83,50 @@ class StateMonitor(BrianObject, Group):
         run(100*ms)
         plot(M.t, M.V)
         show()
+
+    Record the population mean of ``V``, averaged over 1ms::
+
+        M = StateMonitor(G, 'V', record=True, every=10, aggregate='mean',
+                         population='mean')
         
     Notes
     -----
 
-    TODO: multiple features, below:
+    The values are recorded into preallocated 2D arrays (time steps x
+    indices). When a run starts, the arrays are enlarged to hold the values
+    of all time steps of the run, so no memory is allocated during the run.
+    The arrays are only reallocated (and copied) if the recording is
+    continued in another run.
+    
+    The recorded values without units (e.g. ``M.V_`` and `t_`) are returned
+    as read-only views into these arrays, i.e. they are not copied. Note that
+    these views refer to the values recorded at the time they were
+    accessed.
+
+    With ``every > 1``, the time recorded for each block is the time of its
+    first time step. If ``aggregate`` is set, a block is only recorded when
+    it is complete, the values of an incomplete block at the end of a run
+    are combined with the values of the next run. Aggregates are computed
+    on the fly, only a single row of values per variable is stored in
+    addition to the recorded values.
+
+    If the :bpref:`monitor_segment_size` preference is set, the values are
+    stored in `SegmentedDynamicArray` objects instead, i.e. they are never
+    copied when the recording is continued in another run.
+
+    If ``stream`` is set, only the current chunk of values is kept in memory,
+    full chunks are written to disk by a background thread. Accessing the
+    recorded values writes all values to disk and returns read-only memory
+    maps of the files.
     
-    * Using Group.arrays and Group.state(name) for maximal efficiency
-    * Cacheing extracted values (t, V, etc.)
-    * Improve efficiency by using dynamic arrays instead of lists?
+    The values are copied by generated code (using the
+    `Language.template_state_monitor` template), i.e. with `CPPLanguage` the
+    recording is done in compiled code.
     '''
     basename = 'statemonitor'
-    def __init__(self, source, variables, record=None, when=None, name=None):
+    def __init__(self, source, variables, record=None, when=None,
+                 every=1, aggregate=None, population=None, stream=None,
+                 language=None, name=None):
         self.source = weakref.proxy(source)
 
         # run by default on source clock at the end
@@ -82,6 +145,7 @@ class StateMonitor(BrianObject, Group):
         self.variables = variables
         
         # record should always be an array of ints
+        self.record_all = record is True
         if record is None or record is False:
             record = array([], dtype=int)
         elif record is True:
@@ -91,44 +155,283 @@ class StateMonitor(BrianObject, Group):
             
         #: The array of recorded indices
         self.indices = record
+
+        every = int(every)
+        if every < 1:
+            raise ValueError('every has to be a positive integer, is %d' %
+                             every)
+        if not aggregate in (None, 'mean', 'min', 'max'):
+            raise ValueError(('aggregate has to be None, "mean", "min" or '
+                              '"max", is %r') % (aggregate, ))
+        if not population in (None, 'mean', 'sum'):
+            raise ValueError(('population has to be None, "mean" or "sum", '
+                              'is %r') % (population, ))
+        #: The number of time steps per recorded value
+        self.every = every
+        #: How the values of ``every`` time steps are combined
+        self.aggregate = aggregate
+        #: How the values of the recorded indices are combined
+        self.population = population
+        # Whether the generated code writes directly into the recorded values
+        self._direct = aggregate is None and population is None
+        #: The directory the values are streamed to (or ``None``)
+        self.stream = stream
+        if stream is not None and not os.path.isdir(stream):
+            os.makedirs(stream)
         
         # create data structures
         self.reinit()
         
+        # create the code object doing the recording
+        if language is None:
+            language = PythonLanguage()
+        self.language = language
+        self.create_codeobj()
+
         # initialise Group access
         self.units = dict((var, source.units[var]) for var in variables)
         self.arrays = {}
         Group.__init__(self)
+
+    def create_codeobj(self):
+        '''
+        Create the code object copying the values of the recorded indices
+        into the row of the current time step (``_row_x`` for the variable
+        ``x``).
+        '''
+        specifiers = {'_neuron_idx': Index(all=self.record_all),
+                      '_monitor_idx': Index(all=True)}
+        lines = []
+        for var in self.variables:
+            dtype = getattr(self.source, var+'_').dtype
+            specifiers[var] = ArrayVariable('_array_'+var, '_neuron_idx',
+                                            dtype)
+            specifiers['_record_'+var] = ArrayVariable('_row_'+var,
+                                                       '_monitor_idx', dtype)
+            lines.append('_record_%s = %s' % (var, var))
+        innercode = translate('\n'.join(lines), specifiers,
+                              brian_prefs.default_scalar_dtype, self.language)
+        code = self.language.apply_template(innercode,
+                                            self.language.template_state_monitor())
+        self.namespace = {'_indices': self.indices,
+                          '_num_indices': len(self.indices)}
+        self.codeobj = self.language.code_object(code, specifiers)
+        self.codeobj.compile(self.namespace)
         
     def reinit(self):
-        self._values = dict((var, []) for var in self.variables)
-        self._t = []
-    
-    def update(self):
+        if getattr(self, '_streams', None):
+            for stream in self._streams.itervalues():
+                stream.close()
+            self._t.close()
+        self._values = {}
+        # Streams of the variables (if streaming to disk)
+        self._streams = {}
+        segment_size = brian_prefs.monitor_segment_size
+        self._segmented = self.stream is None and segment_size > 0
+        # Values of the current time step (if not recorded directly)
+        self._buffers = {}
+        # Combined values of the current block (if aggregated)
+        self._accumulators = {}
         for var in self.variables:
-            self._values[var].append(getattr(self.source, var+'_')[self.indices])
-        self._t.append(self.clock.t_)
-        
+            source_dtype = getattr(self.source, var+'_').dtype
+            dtype = source_dtype
+            if ('mean' in (self.aggregate, self.population) and
+                    dtype.kind != 'f'):
+                dtype = np.dtype(brian_prefs.default_scalar_dtype)
+            if self._segmented:
+                self._values[var] = SegmentedDynamicArray((0,
+                                                           self._num_columns),
+                                                          dtype=dtype,
+                                                          segment_size=segment_size,
+                                                          owner=self.name,
+                                                          name=var)
+            elif self.stream is None:
+                self._values[var] = DynamicArray((0, self._num_columns),
+                                                 dtype=dtype,
+                                                 owner=self.name, name=var)
+            else:
+                self._streams[var] = self._create_stream(var, dtype,
+                                                         (self._num_columns, ))
+            if not self._direct:
+                self._buffers[var] = allocate_array(len(self.indices),
+                                                    dtype=source_dtype,
+                                                    owner=self.name,
+                                                    name=var+'_buffer')
+            if self.aggregate is not None:
+                if self.aggregate == 'mean':
+                    acc_dtype = np.float64
+                else:
+                    acc_dtype = source_dtype
+                self._accumulators[var] = allocate_array(len(self.indices),
+                                                         dtype=acc_dtype,
+                                                         owner=self.name,
+                                                         name=var+'_block')
+        if self._segmented:
+            self._t = SegmentedDynamicArray(0,
+                                            dtype=brian_prefs.default_scalar_dtype,
+                                            segment_size=segment_size,
+                                            owner=self.name, name='t')
+        elif self.stream is None:
+            self._t = DynamicArray1D(0, dtype=brian_prefs.default_scalar_dtype,
+                                     owner=self.name, name='t')
+        else:
+            self._t = self._create_stream('t',
+                                          brian_prefs.default_scalar_dtype)
+        #: The number of recorded time steps
+        self.num_recorded = 0
+        # The number of time steps since the start of the recording and the
+        # start time of the current block
+        self._step = 0
+        self._block_start = 0.0
+        # Cached read-only views of the recorded values
+        self._views = {}
+        self._prepared = False
+
+    @property
+    def _num_columns(self):
+        if self.population is None:
+            return len(self.indices)
+        else:
+            return 1
+
+    def prepare(self):
+        # The arrays of the source, recorded in every time step
+        for var in self.variables:
+            self.namespace['_array_'+var] = getattr(self.source, var+'_')
+            if not self._direct:
+                self.namespace['_row_'+var] = self._buffers[var]
+        self._prepared = True
+
+    def _allocate(self, num_steps):
+        '''
+        Enlarge the arrays so that they can store ``num_steps`` time steps.
+        '''
+        self._t.resize(num_steps)
+        for values in self._values.itervalues():
+            values.resize((num_steps, self._num_columns))
+
+    def _create_stream(self, var, dtype, row_shape=()):
+        filename = os.path.join(self.stream, '%s_%s.npy' % (self.name, var))
+        return ChunkedStream(filename, dtype, row_shape, owner=self.name,
+                             name=var)
+
+    def _next_rows(self):
+        '''
+        Return the next row for each of the recorded variables and for the
+        time (as an array of length 1), enlarging the arrays if necessary.
+        '''
+        n = self.num_recorded
+        self.num_recorded = n + 1
+        if self.stream is not None or self._segmented:
+            if self.stream is not None:
+                storage = self._streams
+            else:
+                storage = self._values
+            rows = dict((var, values.reserve(1)[0])
+                        for var, values in storage.iteritems())
+            return rows, self._t.reserve(1)
+        if n == len(self._t):
+            # Make space for all remaining blocks of the current run
+            remaining = self.clock.i_end - self.clock.i
+            self._allocate(n + max(1, int(ceil(float(remaining) /
+                                               self.every))))
+        rows = dict((var, values.data[n])
+                    for var, values in self._values.iteritems())
+        return rows, self._t.data[n:n+1]
+
+    def _store(self, row, values):
+        '''
+        Store the values for the recorded indices in ``row``, combining them
+        if a ``population`` aggregate is recorded.
+        '''
+        if self.population == 'mean':
+            row[0] = values.mean() if len(values) else np.nan
+        elif self.population == 'sum':
+            row[0] = values.sum()
+        else:
+            row[:] = values
+
+    def update(self):
+        if not self._prepared:
+            self.prepare()
+        position = self._step % self.every
+        self._step += 1
+        if self.aggregate is None:
+            # Only record the first time step of each block
+            if position != 0:
+                return
+            rows, t_row = self._next_rows()
+            if self._direct:
+                for var, row in rows.iteritems():
+                    self.namespace['_row_'+var] = row
+            self.codeobj(t=self.clock.t_)
+            if not self._direct:
+                for var, values in self._buffers.iteritems():
+                    self._store(rows[var], values)
+            t_row[0] = self.clock.t_
+            return
+
+        self.codeobj(t=self.clock.t_)
+        if position == 0:
+            self._block_start = self.clock.t_
+        for var, buffer in self._buffers.iteritems():
+            accumulator = self._accumulators[var]
+            if position == 0:
+                accumulator[:] = buffer
+            elif self.aggregate == 'mean':
+                np.add(accumulator, buffer, accumulator)
+            elif self.aggregate == 'min':
+                np.minimum(accumulator, buffer, accumulator)
+            else:
+                np.maximum(accumulator, buffer, accumulator)
+        if position == self.every - 1:
+            # The block is complete
+            rows, t_row = self._next_rows()
+            for var, accumulator in self._accumulators.iteritems():
+                if self.aggregate == 'mean':
+                    accumulator /= self.every
+                self._store(rows[var], accumulator)
+            t_row[0] = self._block_start
+
+    def _get_view(self, name, values):
+        '''
+        Return a read-only view of the recorded part of ``values``, the view
+        is cached until new values are recorded.
+        '''
+        view = self._views.get(name, None)
+        if view is None or len(view) != self.num_recorded:
+            if self.stream is None:
+                view = values.data[:self.num_recorded]
+            else:
+                view = values.read()
+            if name != 't' and self.population is not None:
+                view = view[:, 0]
+            view.flags.writeable = False
+            self._views[name] = view
+        return view
+
     @property
     def t(self):
         '''
         Array of record times.
         '''
-        return array(self._t)*second
+        return self.t_*second
     
     @property
     def t_(self):
         '''
         Array of record times (without units).
         '''
-        return array(self._t)
+        return self._get_view('t', self._t)
     
     def get_array(self, name):
         return self.get_array_(name)*self.units[name]
         
     def get_array_(self, name):
         if name in self._values:
-            return array(self._values[name])
+            return self._get_view(name, self._values[name])
+        elif name in self._streams:
+            return self._get_view(name, self._streams[name])
         else:
             raise KeyError        
 
@@ -0,0 +1,256 @@
+import weakref
+
+import numpy as np
+from numpy import array, arange
+
+from brian2.core.base import BrianObject
+from brian2.core.scheduler import Scheduler
+from brian2.codegen.languages import PythonLanguage
+from brian2.codegen.specifiers import ArrayVariable, Index, Value
+from brian2.codegen.translation import translate
+from brian2.groups.group import Group
+from brian2.memory.allocation import allocate_array
+from brian2.units.fundamentalunits import fail_for_dimension_mismatch
+
+__all__ = ['StatisticsMonitor']
+
+class StatisticsMonitor(BrianObject, Group):
+    '''
+    Record running statistics of state variables during a run
+
+    For each recorded variable ``x``, the mean (``mean_x``), variance
+    (``var_x``) and standard deviation (``std_x``) over time are available
+    for each recorded index, as well as histograms of the values
+    (``hist_x``) if requested. Only the current statistics are stored, i.e.
+    the memory use does not depend on the duration of the run.
+
+    Parameters
+    ----------
+    source : `NeuronGroup`, `Group`
+        Which object to record values from.
+    variables : str, sequence of str, True
+        Which variables to record, or ``True`` to record all variables.
+    record : True, sequence of ints
+        Which indices to record, everything is recorded for ``True`` (the
+        default), or a specified subset of indices.
+    when : `Scheduler`, optional
+        When to record the values, by default uses the clock of the source
+        and records values in the slot 'end'.
+    histograms : dict, optional
+        A dictionary mapping variable names to ``(low, high, num_bins)``
+        tuples, defining histograms with ``num_bins`` bins of equal width
+        between ``low`` and ``high`` (given in the units of the variable).
+        Values outside of this range are not counted. The counts are
+        available as ``hist_x`` (an array of shape
+        ``(len(indices), num_bins)``) and the edges of the bins as
+        ``bin_edges[x]``.
+    language : `Language`, optional
+        The language used for the generated code, `PythonLanguage` if not
+        specified.
+    name : str, optional
+        A unique name for the object, otherwise will use
+        ``source.name+'statisticsmonitor_0'``, etc.
+
+    Examples
+    --------
+
+    Record the mean and standard deviation of ``V`` for all neurons::
+
+        M = StatisticsMonitor(G, 'V')
+        run(1*second)
+        errorbar(arange(len(G)), M.mean_V, yerr=M.std_V)
+
+    Notes
+    -----
+    The mean and variance are updated in each time step with Welford's
+    algorithm, in generated code (i.e. with `CPPLanguage` the update is done
+    in compiled code). The variance is the population variance (i.e. the
+    sum of squared deviations divided by the number of samples).
+    '''
+    basename = 'statisticsmonitor'
+    def __init__(self, source, variables, record=True, when=None,
+                 histograms=None, language=None, name=None):
+        self.source = weakref.proxy(source)
+
+        # run by default on source clock at the end
+        scheduler = Scheduler(when)
+        if not scheduler.defined_clock:
+            scheduler.clock = source.clock
+        if not scheduler.defined_when:
+            scheduler.when = 'end'
+        BrianObject.__init__(self, when=scheduler, name=name)
+
+        # variables should always be a list of strings
+        if variables is True:
+            variables = source.units.keys()
+        elif isinstance(variables, str):
+            variables = [variables]
+        self.variables = variables
+        self.units = dict((var, source.units[var]) for var in variables)
+
+        # record should always be an array of ints
+        self.record_all = record is True
+        if record is True:
+            record = arange(len(source))
+        else:
+            record = array(record, dtype=int)
+        #: The array of recorded indices
+        self.indices = record
+
+        if histograms is None:
+            histograms = {}
+        #: The edges of the histogram bins (without units) for each variable
+        self.bin_edges = {}
+        for var, (low, high, num_bins) in histograms.iteritems():
+            if not var in variables:
+                raise ValueError(('Histograms can only be recorded for '
+                                  'recorded variables, %s is not '
+                                  'recorded.') % var)
+            unit = self.units[var]
+            for value in [low, high]:
+                fail_for_dimension_mismatch(value, unit,
+                                            ('Histogram range for %s has '
+                                             'to be given in units of '
+                                             '%r') % (var, unit))
+            self.bin_edges[var] = np.linspace(float(low / unit),
+                                              float(high / unit),
+                                              int(num_bins) + 1)
+
+        # create data structures
+        self.reinit()
+
+        # create the code object doing the update of the statistics
+        if language is None:
+            language = PythonLanguage()
+        self.language = language
+        self.create_codeobj()
+
+        # initialise Group access
+        self.arrays = {}
+        Group.__init__(self)
+
+    def create_codeobj(self):
+        '''
+        Create the code object updating the mean (``_mean_x`` for the
+        variable ``x``) and the sum of squared deviations (``_m2_x``) of the
+        recorded indices, and copying the values into ``_row_x`` for
+        variables with histograms.
+        '''
+        specifiers = {'_neuron_idx': Index(all=self.record_all),
+                      '_monitor_idx': Index(all=True),
+                      '_num_samples': Value(np.float64)}
+        lines = []
+        for var in self.variables:
+            dtype = getattr(self.source, var+'_').dtype
+            specifiers[var] = ArrayVariable('_array_'+var, '_neuron_idx',
+                                            dtype)
+            for stat in ['mean', 'm2']:
+                name = '_%s_%s' % (stat, var)
+                specifiers[name] = ArrayVariable('_array'+name,
+                                                 '_monitor_idx', np.float64)
+            lines.extend(line.format(var=var) for line in
+                         ['_delta_{var} = {var} - _mean_{var}',
+                          '_mean_{var} += _delta_{var} / _num_samples',
+                          '_m2_{var} += _delta_{var} * ({var} - _mean_{var})'])
+            if var in self.bin_edges:
+                specifiers['_record_'+var] = ArrayVariable('_row_'+var,
+                                                           '_monitor_idx',
+                                                           dtype)
+                lines.append('_record_%s = %s' % (var, var))
+        innercode = translate('\n'.join(lines), specifiers, np.float64,
+                              self.language)
+        code = self.language.apply_template(innercode,
+                                            self.language.template_state_monitor())
+        self.namespace = {'_indices': self.indices,
+                          '_num_indices': len(self.indices)}
+        self.codeobj = self.language.code_object(code, specifiers)
+        self.codeobj.compile(self.namespace)
+
+    def reinit(self):
+        '''
+        Clears all statistics
+        '''
+        #: The number of recorded time steps
+        self.num_samples = 0
+        self._means = {}
+        self._m2s = {}
+        # Values of the current time step (for histograms)
+        self._buffers = {}
+        self._histograms = {}
+        num_indices = len(self.indices)
+        for var in self.variables:
+            self._means[var] = allocate_array(num_indices, dtype=np.float64,
+                                              owner=self.name,
+                                              name='mean_'+var)
+            self._m2s[var] = allocate_array(num_indices, dtype=np.float64,
+                                            owner=self.name, name='m2_'+var)
+            if var in self.bin_edges:
+                dtype = getattr(self.source, var+'_').dtype
+                self._buffers[var] = allocate_array(num_indices, dtype=dtype,
+                                                    owner=self.name,
+                                                    name=var+'_buffer')
+                num_bins = len(self.bin_edges[var]) - 1
+                self._histograms[var] = allocate_array((num_indices,
+                                                        num_bins),
+                                                       dtype=int,
+                                                       owner=self.name,
+                                                       name='hist_'+var)
+        self._prepared = False
+
+    def prepare(self):
+        for var in self.variables:
+            self.namespace['_array_'+var] = getattr(self.source, var+'_')
+            self.namespace['_array_mean_'+var] = self._means[var]
+            self.namespace['_array_m2_'+var] = self._m2s[var]
+            if var in self._buffers:
+                self.namespace['_row_'+var] = self._buffers[var]
+        self._prepared = True
+
+    def update(self):
+        if not self._prepared:
+            self.prepare()
+        self.num_samples += 1
+        self.codeobj(_num_samples=float(self.num_samples))
+        for var, values in self._buffers.iteritems():
+            # Each recorded index adds one count to its row of the histogram
+            edges = self.bin_edges[var]
+            num_bins = len(edges) - 1
+            bins = np.floor((values - edges[0]) *
+                            (num_bins / (edges[-1] - edges[0]))).astype(int)
+            # The upper edge belongs to the last bin (as in numpy.histogram)
+            bins[values == edges[-1]] = num_bins - 1
+            valid = (bins >= 0) & (bins < num_bins)
+            flat_indices = np.flatnonzero(valid)*num_bins + bins[valid]
+            self._histograms[var].ravel()[flat_indices] += 1
+
+    def _split_name(self, name):
+        # Split e.g. 'mean_v' into ('mean', 'v')
+        stat, _, var = name.partition('_')
+        if not stat in ('mean', 'var', 'std', 'hist') or not var in self.units:
+            raise KeyError(name)
+        if stat == 'hist' and not var in self._histograms:
+            raise KeyError(name)
+        return stat, var
+
+    def get_array_(self, name):
+        stat, var = self._split_name(name)
+        if stat == 'mean':
+            values = self._means[var][:]
+        elif stat == 'hist':
+            values = self._histograms[var][:]
+        else:
+            values = self._m2s[var] / max(1, self.num_samples)
+            if stat == 'std':
+                values = np.sqrt(values)
+        values.flags.writeable = False
+        return values
+
+    def get_array(self, name):
+        stat, var = self._split_name(name)
+        values = self.get_array_(name)
+        if stat == 'hist':
+            return values
+        elif stat == 'var':
+            return values*self.units[var]**2
+        else:
+            return values*self.units[var]
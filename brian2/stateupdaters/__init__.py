@@ -2,4 +2,8 @@
 Module for transforming model equations into "abstract code" that can be then be further translated into executable code by the `codegen` module.
 '''  
 
-from .integration import *
\ No newline at end of file
+from .integration import *
+from .exact import *
+from .exponential_euler import *
+from .stochastic import *
+from .automatic import *
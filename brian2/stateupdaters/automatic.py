@@ -0,0 +1,187 @@
+'''
+Automatic selection of the numerical integration method.
+'''
+import numpy as np
+
+from brian2.utils.parsing import parse_to_sympy
+from brian2.utils.logger import get_logger
+from brian2.stateupdaters.integration import rk2, rk4
+from brian2.stateupdaters.exact import linear, _get_numerical_system
+from brian2.stateupdaters.exponential_euler import (exponential_euler,
+                                                    get_conditionally_linear_system)
+from brian2.stateupdaters.stochastic import euler_maruyama, milstein
+
+__all__ = ['estimate_stiffness', 'estimate_cost', 'AutoStateUpdater', 'auto']
+
+logger = get_logger(__name__)
+
+
+def estimate_stiffness(eqs):
+    '''
+    Estimate the stiffness of the equations, i.e. the spectral radius of
+    their Jacobian (in 1/second). For linear equations, this is the spectral
+    radius of the coefficient matrix, for non-linear equations the Jacobian is
+    evaluated with all state variables set to zero.
+
+    Parameters
+    ----------
+    eqs : `Equations`
+        The model equations.
+
+    Returns
+    -------
+    stiffness : float or ``None``
+        The estimated stiffness or ``None`` if it cannot be determined (e.g.
+        if the equations refer to parameters).
+    '''
+    from sympy import Symbol, diff
+    diff_eq_names = eqs.diff_eq_names
+    if not len(diff_eq_names):
+        return None
+    try:
+        _, M, _ = _get_numerical_system(eqs)
+    except (ValueError, KeyError, TypeError):
+        values = dict([(Symbol(name), 0) for name in diff_eq_names])
+        for name, value in eqs.resolve().iteritems():
+            if np.isscalar(value) or (isinstance(value, np.ndarray) and
+                                      value.shape == ()):
+                values[Symbol(name)] = float(value)
+        n = len(diff_eq_names)
+        M = np.zeros((n, n))
+        expressions = dict(eqs.substituted_expressions)
+        try:
+            for row, var in enumerate(diff_eq_names):
+                s_expr = parse_to_sympy(expressions[var].code)
+                for col, other_var in enumerate(diff_eq_names):
+                    derivative = diff(s_expr, Symbol(other_var))
+                    M[row, col] = float(derivative.subs(values))
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+    if not np.all(np.isfinite(M)):
+        return None
+    return float(np.max(np.abs(np.linalg.eigvals(M))))
+
+
+def estimate_cost(code):
+    '''
+    Estimate the cost of one integration step as the number of operations
+    (arithmetic operations and function calls) per neuron in the abstract
+    code.
+
+    Parameters
+    ----------
+    code : str
+        The abstract code, consisting of assignments.
+
+    Returns
+    -------
+    cost : int
+        The number of operations.
+    '''
+    cost = 0
+    for line in code.split('\n'):
+        if not '=' in line:
+            continue
+        _, expr = line.split('=', 1)
+        cost += parse_to_sympy(expr).count_ops()
+    return cost
+
+
+class AutoStateUpdater(object):
+    '''
+    Select the numerical integration method based on the model equations,
+    choosing the cheapest method that is stable for the given equations:
+
+    * `euler_maruyama` (additive noise) or `milstein` (multiplicative noise)
+      for stochastic equations
+    * `linear` (exact integration) for linear equations with constant
+      coefficients
+    * `exponential_euler` for conditionally linear equations where each
+      variable depends on itself (e.g. Hodgkin-Huxley type models). The
+      coefficient of a variable may still be zero at runtime (e.g. for
+      equations with the ``(active)`` flag during the refractory period),
+      the step is then a forward Euler step.
+    * `rk2` for non-linear equations that are not stiff with respect to the
+      time step, `rk4` otherwise (or if the stiffness cannot be estimated)
+
+    Selecting ``method='auto'`` for a `NeuronGroup` uses this mechanism, the
+    method is selected once when the group is created (taking into account
+    the time step of its clock).
+
+    Parameters
+    ----------
+    stiffness_threshold : float, optional
+        The maximal value of the estimated stiffness times the time step for
+        which `rk2` is used, defaults to 0.5 (the explicit Runge-Kutta methods
+        become unstable at values around 2 for `rk2` and 2.8 for `rk4`).
+    '''
+    def __init__(self, stiffness_threshold=0.5):
+        self.stiffness_threshold = stiffness_threshold
+
+    def select(self, eqs, dt=None):
+        '''
+        Select the state updater for the given equations.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+        dt : float, optional
+            The time step in seconds, used for the stiffness estimate of
+            non-linear equations. If not given, `rk4` will be used for
+            non-linear equations.
+
+        Returns
+        -------
+        method : callable
+            The state updater.
+        '''
+        stiffness = None
+        if eqs.is_stochastic:
+            if milstein(eqs) == euler_maruyama(eqs):
+                method, reason = euler_maruyama, 'stochastic, additive noise'
+            else:
+                method, reason = milstein, 'stochastic, multiplicative noise'
+        elif linear.can_integrate(eqs):
+            method, reason = linear, 'linear'
+        elif (exponential_euler.can_integrate(eqs) and
+              all(A != 0 for _, A, _ in get_conditionally_linear_system(eqs))):
+            method, reason = exponential_euler, 'conditionally linear'
+        else:
+            stiffness = estimate_stiffness(eqs)
+            if (stiffness is not None and dt is not None and
+                    stiffness * dt <= self.stiffness_threshold):
+                method, reason = rk2, 'non-linear, non-stiff'
+            else:
+                method, reason = rk4, 'non-linear'
+
+        cost = estimate_cost(method(eqs))
+        logger.info(('Integrating equations for variables %s with method %s '
+                     '(%s), estimated cost per step: %d operations '
+                     'per neuron') % (', '.join(eqs.diff_eq_names),
+                                      _method_name(method), reason, cost))
+        if stiffness is not None:
+            logger.debug('Estimated stiffness: %g/s' % stiffness)
+        return method
+
+    def __call__(self, eqs):
+        return self.select(eqs)(eqs)
+
+    def __repr__(self):
+        return '%s(stiffness_threshold=%r)' % (self.__class__.__name__,
+                                              self.stiffness_threshold)
+
+
+def _method_name(method):
+    '''
+    Return the name under which a standard state updater is known.
+    '''
+    for name in ['euler_maruyama', 'milstein', 'linear', 'exponential_euler',
+                 'rk2', 'rk4']:
+        if method is globals()[name]:
+            return name
+    return repr(method)
+
+
+#: Automatic selection of the integration method
+auto = AutoStateUpdater()
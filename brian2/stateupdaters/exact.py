@@ -1,72 +1,272 @@
+'''
+Exact integration for linear equations.
+'''
 import operator
 
-from sympy import Wild, Symbol, sympify
-import sympy as sp
+import numpy as np
+
+from brian2.utils.caching import LRUCache
+from brian2.utils.logger import get_logger
+from brian2.stateupdaters.integration import euler
+
+__all__ = ['get_linear_system', 'LinearStateUpdater', 'linear', 'exact']
+
+logger = get_logger(__name__)
+
+#: Cache for the symbolic linear systems, keyed by the substituted expressions
+linear_system_cache = LRUCache(100)
 
-from brian2.equations import Equations
 
 def get_linear_system(eqs):
+    '''
+    Convert equations into a linear system using sympy.
+
+    Parameters
+    ----------
+    eqs : `Equations`
+        The model equations.
+
+    Returns
+    -------
+    (diff_eq_names, coefficients, constants) : (list of str, `sympy.Matrix`, `sympy.Matrix`)
+        A tuple containing the variable names (`diff_eq_names`) corresponding
+        to the rows of the matrix `coefficients` and the vector `constants`,
+        representing the system of equations in the form M * X + B
+
+    Raises
+    ------
+    ValueError
+        If the equations cannot be converted into an M * X + B form.
+    '''
+    from sympy import Wild, Symbol, sympify
+    import sympy as sp
+
     diff_eqs = eqs.substituted_expressions
     diff_eq_names = eqs.diff_eq_names
-    
+
+    key = tuple([(name, expr.code) for name, expr in diff_eqs])
+    try:
+        return linear_system_cache[key]
+    except KeyError:
+        pass
+
     symbols = [Symbol(name) for name in diff_eq_names]
     # Coefficients
     wildcards = [Wild('c_' + name, exclude=symbols) for name in diff_eq_names]
-    
+
     #Additive constant
     constant_wildcard = Wild('c', exclude=symbols)
-    
+
     pattern = reduce(operator.add, [c * s for c, s in zip(wildcards, symbols)])
     pattern += constant_wildcard
-    
+
     coefficients = sp.zeros(len(diff_eq_names))
     constants = sp.zeros((len(diff_eq_names), 1))
-    
+
     for row_idx, (name, expr) in enumerate(diff_eqs):
-        s_expr = sympify(expr, locals=dict([(s.name, s) for s in symbols])).expand()
-        #print s_expr.expand()
+        s_expr = sympify(expr.code,
+                         locals=dict([(s.name, s) for s in symbols])).expand()
         pattern_matches = s_expr.match(pattern)
         if pattern_matches is None:
             raise ValueError(('The expression "%s", defining the variable %s, '
                              'could not be separated into linear components') %
                              (str(s_expr), name))
-        
+
         for col_idx in xrange(len(diff_eq_names)):
             coefficients[row_idx, col_idx] = pattern_matches[wildcards[col_idx]]
-        
+
         constants[row_idx] = pattern_matches[constant_wildcard]
 
+    linear_system_cache[key] = (diff_eq_names, coefficients, constants)
     return (diff_eq_names, coefficients, constants)
 
 
+def _get_numerical_system(eqs):
+    '''
+    Evaluate the linear system of the equations numerically, using the values
+    of the external constants they refer to.
+
+    Returns
+    -------
+    (diff_eq_names, M, b) : (list of str, `ndarray`, `ndarray`)
+        The variable names, the coefficient matrix and the constant vector.
+
+    Raises
+    ------
+    ValueError
+        If the equations are not linear or refer to values that are not
+        constant scalars (e.g. parameters, the time ``t`` or noise).
+    '''
+    from sympy import Symbol
+    diff_eq_names, coefficients, constants = get_linear_system(eqs)
+    values = {}
+    for name, value in eqs.resolve().iteritems():
+        if np.isscalar(value) or (isinstance(value, np.ndarray) and
+                                  value.shape == ()):
+            values[Symbol(name)] = float(value)
+
+    n = len(diff_eq_names)
+    M = np.zeros((n, n))
+    b = np.zeros(n)
+    try:
+        for row in xrange(n):
+            for col in xrange(n):
+                M[row, col] = float(coefficients[row, col].subs(values))
+            b[row] = float(constants[row].subs(values))
+    except TypeError:
+        raise ValueError('The equations refer to values that are not '
+                         'constant scalars.')
+
+    return diff_eq_names, M, b
+
+
+def _expm(M):
+    '''
+    Calculate the matrix exponential of `M` using a Pade approximation with
+    scaling and squaring (only uses numpy, scipy is an optional dependency).
+    '''
+    norm = np.abs(M).sum(axis=1).max() if M.size else 0.
+    squarings = max(0, int(np.ceil(np.log2(norm))) + 1) if norm > 0 else 0
+    M = M / 2.0**squarings
+    # Pade approximation of order (6, 6)
+    c = 1.
+    identity = np.eye(M.shape[0])
+    M_power = identity
+    numerator = identity.copy()
+    denominator = identity.copy()
+    q = 6
+    for k in xrange(1, q + 1):
+        c = c * (q - k + 1) / (k * (2 * q - k + 1))
+        M_power = np.dot(M_power, M)
+        numerator += c * M_power
+        denominator += (-1)**k * c * M_power
+    E = np.linalg.solve(denominator, numerator)
+    for _ in xrange(squarings):
+        E = np.dot(E, E)
+    return E
+
+
+def _reachability(M):
+    '''
+    Return a boolean matrix that is ``True`` for all entries (i, j) where the
+    variable j has an influence on the variable i (i.e. the non-zero pattern
+    of the matrix exponential of `M`).
+    '''
+    n = M.shape[0]
+    reachable = (M != 0) | np.eye(n, dtype=bool)
+    for _ in xrange(n):
+        reachable = np.dot(reachable.astype(int), reachable.astype(int)) > 0
+    return reachable
+
+
+class LinearStateUpdater(object):
+    '''
+    A state updater for linear equations with constant coefficients. The
+    equations ``dX/dt = M * X + b`` are integrated exactly by a propagator
+    matrix ``A = exp(M * dt)`` and a vector ``c``, both computed once when the
+    state updater code is created: ``X(t + dt) = A * X(t) + c``. The abstract
+    code refers to the entries of ``A`` and ``c`` as ``_A_i_j`` and ``_c_i``,
+    their values are provided by `get_namespace`.
+
+    Equations that cannot be integrated this way (non-linear equations or
+    equations with coefficients that are not constant scalars, e.g.
+    parameters) are handed over to the ``fallback`` state updater.
+
+    Parameters
+    ----------
+    fallback : callable, optional
+        The state updater used for equations that cannot be integrated
+        exactly, defaults to `euler`.
+    '''
+    def __init__(self, fallback=euler):
+        self.fallback = fallback
+
+    def can_integrate(self, eqs):
+        '''
+        Whether the given equations can be integrated exactly with this state
+        updater.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+
+        Returns
+        -------
+        can_integrate : bool
+            ``True`` if the equations are linear and only refer to constant
+            scalar values.
+        '''
+        if not len(eqs.diff_eq_names) or not eqs.is_linear:
+            return False
+        try:
+            _get_numerical_system(eqs)
+        except (ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def __call__(self, eqs):
+        if not self.can_integrate(eqs):
+            logger.debug(('Equations cannot be integrated exactly, using %r '
+                          'instead') % self.fallback)
+            return self.fallback(eqs)
+
+        diff_eq_names, M, _ = _get_numerical_system(eqs)
+        reachable = _reachability(M)
+        lines = []
+        for row, var in enumerate(diff_eq_names):
+            terms = ['_A_%d_%d*%s' % (row, col, other_var)
+                     for col, other_var in enumerate(diff_eq_names)
+                     if reachable[row, col]]
+            terms.append('_c_%d' % row)
+            lines.append('_%s = %s' % (var, ' + '.join(terms)))
+        lines.extend(['%s = _%s' % (var, var) for var in diff_eq_names])
+        return '\n'.join(lines)
+
+    def get_namespace(self, eqs, dt):
+        '''
+        Return the values of the propagator matrix and vector referred to by
+        the abstract code returned for the given equations.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+        dt : float
+            The time step in seconds.
+
+        Returns
+        -------
+        namespace : dict
+            A dictionary mapping the names ``_A_i_j`` and ``_c_i`` to their
+            values. If the equations cannot be integrated exactly, returns the
+            namespace of the fallback state updater (or an empty dictionary).
+        '''
+        if not self.can_integrate(eqs):
+            if hasattr(self.fallback, 'get_namespace'):
+                return self.fallback.get_namespace(eqs, dt)
+            return {}
+
+        diff_eq_names, M, b = _get_numerical_system(eqs)
+        n = len(diff_eq_names)
+        # The exponential of the augmented matrix [[M, b], [0, 0]] * dt
+        # contains the propagator matrix and the propagated constant term
+        augmented = np.zeros((n + 1, n + 1))
+        augmented[:n, :n] = M
+        augmented[:n, n] = b
+        propagator = _expm(augmented * dt)
+        namespace = {}
+        for row in xrange(n):
+            for col in xrange(n):
+                namespace['_A_%d_%d' % (row, col)] = propagator[row, col]
+            namespace['_c_%d' % row] = propagator[row, n]
+        return namespace
+
+    def __repr__(self):
+        return '%s(fallback=%r)' % (self.__class__.__name__, self.fallback)
+
 
-if __name__ == '__main__':
-    from brian2 import sin  
-    eqs = Equations('''
-    dv/dt = sin(2*3.141*t*freq+phase) / tau : 1
-    tau : second
-    freq : Hz 
-    phase : 1
-    ''' )
-    
-    variables, matrix, b = get_linear_system(eqs)
-    print 'variables: ', variables
-    print '\nCoefficient matrix:'
-    print matrix
-    print '\nVector b:'
-    print b
-    print '\n diagonalized:'
-    t = Symbol('t')    
-    A = (matrix * t).exp()
-    print 'A = :'
-    print A
-    C = sp.Matrix([A.dot(b)]) + b
-    print 'C = :'
-    print C
-#    x(t) = dot(A(t), S(0)) + C(t)
-#    x(t + dt) = dot(A(t + dt), S(0)) + C(t + dt)
-#    = dot(A(t), S(0)) + dot(A(dt), S(0)) + C(t) + C(dt)
-#    = S(t) + dot(A(dt), S(0)) + C(dt)
-#    
-#    C(0) = 0
-        
\ No newline at end of file
+#: Exact integration for linear equations, falls back to `euler`
+linear = LinearStateUpdater()
+#: Synonym for `linear`
+exact = linear
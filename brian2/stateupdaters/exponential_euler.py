@@ -0,0 +1,184 @@
+'''
+Exponential Euler integration for conditionally linear equations.
+'''
+import numpy as np
+
+from brian2.utils.parsing import parse_to_sympy
+from brian2.utils.logger import get_logger
+from brian2.stateupdaters.integration import euler
+
+__all__ = ['get_conditionally_linear_system', 'ExponentialEulerStateUpdater',
+           'exponential_euler']
+
+logger = get_logger(__name__)
+
+
+def get_conditionally_linear_system(eqs):
+    '''
+    Convert equations into a conditionally linear system, i.e. write every
+    differential equation as ``dx/dt = A * x + B``, where ``A`` and ``B`` may
+    depend on all variables except for ``x`` itself.
+
+    Parameters
+    ----------
+    eqs : `Equations`
+        The model equations.
+
+    Returns
+    -------
+    coefficients : list of (str, sympy expression, sympy expression)
+        A list of ``(varname, A, B)`` tuples, one for each differential
+        equation (in the update order of the equations).
+
+    Raises
+    ------
+    ValueError
+        If one of the equations is not linear in its own variable.
+    '''
+    from sympy import Symbol, diff
+
+    coefficients = []
+    for varname, expr in eqs.substituted_expressions:
+        var = Symbol(varname)
+        s_expr = parse_to_sympy(expr.code)
+        A = diff(s_expr, var)
+        if var in A.atoms(Symbol):
+            raise ValueError(('The expression "%s", defining the variable %s, '
+                              'is not linear in %s') % (expr.code, varname,
+                                                        varname))
+        B = s_expr.subs(var, 0)
+        coefficients.append((varname, A, B))
+
+    return coefficients
+
+
+class ExponentialEulerStateUpdater(object):
+    '''
+    A state updater for conditionally linear equations, e.g. Hodgkin-Huxley
+    type models. Each differential equation is written as ``dx/dt = A*x + B``
+    with ``A`` and ``B`` evaluated at the beginning of the time step, and then
+    integrated exactly for constant ``A`` and ``B``::
+
+        x(t + dt) = x(t) + (A*x(t) + B) * dt * expm1(A*dt)/(A*dt)
+
+    If ``A`` is not a constant, it may be zero at runtime (e.g. for equations
+    with the ``(active)`` flag during the refractory period). The division is
+    then guarded without a branch, using ``_zero = 1.0*(z*z <= 0)`` for
+    ``z = A*dt``, i.e. ``(expm1(z) + _zero)/(z + _zero)``, which is 1 for
+    ``z == 0`` (a forward Euler step). The code only uses arithmetic,
+    comparisons and ``expm1``, so it can be compiled for all languages.
+
+    Contrary to forward Euler, this step is stable for arbitrarily fast
+    linear dynamics (e.g. fast gating variables), allowing for a larger
+    time step. Equations that are not conditionally linear, or that are
+    stochastic, are handed over to the ``fallback`` state updater.
+
+    Parameters
+    ----------
+    fallback : callable, optional
+        The state updater used for equations that cannot be integrated with
+        this method, defaults to `euler`.
+    '''
+    def __init__(self, fallback=euler):
+        self.fallback = fallback
+
+    def can_integrate(self, eqs):
+        '''
+        Whether the given equations can be integrated with this state updater.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+
+        Returns
+        -------
+        can_integrate : bool
+            ``True`` if every differential equation is linear with respect to
+            its own variable and no equation is stochastic.
+        '''
+        if not len(eqs.diff_eq_names):
+            return False
+        for _, expr in eqs.substituted_expressions:
+            if 'xi' in expr.identifiers:
+                return False
+        try:
+            get_conditionally_linear_system(eqs)
+        except ValueError:
+            return False
+        return True
+
+    def __call__(self, eqs):
+        '''
+        Return "abstract code" for one integration step.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations that should be integrated.
+
+        Returns
+        -------
+        code : str
+            The "abstract code" for the integration step.
+        '''
+        if not self.can_integrate(eqs):
+            logger.debug(('Equations are not conditionally linear, using %r '
+                          'instead') % self.fallback)
+            return self.fallback(eqs)
+
+        statements = []
+        for varname, A, B in get_conditionally_linear_system(eqs):
+            if A == 0:
+                # No dependency on the variable itself: simple Euler step
+                statements.append('_%s = %s + dt*(%s)' % (varname, varname, B))
+            elif A.is_number:
+                statements.append(('_%s = %s + (%s*(%s) + %s)*'
+                                   'expm1((%s)*dt)/(%s)') % (varname, varname,
+                                                            varname, A, B, A,
+                                                            A))
+            else:
+                statements.append('_z_%s = (%s)*dt' % (varname, A))
+                statements.append('_zero_%s = 1.0*(_z_%s*_z_%s <= 0)' %
+                                  (varname, varname, varname))
+                statements.append(('_%s = %s + (%s*(%s) + %s)*dt*'
+                                   '(expm1(_z_%s) + _zero_%s)/'
+                                   '(_z_%s + _zero_%s)') % ((varname, )*2 +
+                                                            (varname, A, B) +
+                                                            (varname, )*4))
+
+        # Assign everything to the final variables
+        for varname in eqs.diff_eq_names:
+            statements.append('%s = _%s' % (varname, varname))
+
+        return '\n'.join(statements)
+
+    def get_namespace(self, eqs, dt):
+        '''
+        Return the values referred to by the abstract code that are not part
+        of the equations' namespace (the ``expm1`` function).
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+        dt : float
+            The time step in seconds.
+
+        Returns
+        -------
+        namespace : dict
+            A dictionary mapping names to values.
+        '''
+        if not self.can_integrate(eqs):
+            if hasattr(self.fallback, 'get_namespace'):
+                return self.fallback.get_namespace(eqs, dt)
+            return {}
+        return {'expm1': np.expm1}
+
+    def __repr__(self):
+        return '%s(fallback=%r)' % (self.__class__.__name__, self.fallback)
+
+
+#: Exponential Euler for conditionally linear equations, falls back to `euler`
+exponential_euler = ExponentialEulerStateUpdater()
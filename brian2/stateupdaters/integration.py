@@ -4,37 +4,57 @@ Numerical integration functions.
 
 import string
 
-from sympy import Symbol, Function
-from pyparsing import (Literal, Group, Word, ZeroOrMore, Suppress, restOfLine,
-                       ParseException)
-
 from brian2.utils.parsing import parse_to_sympy
+from brian2.utils.caching import LRUCache
 
 __all__ = ['euler', 'rk2', 'rk4', 'ExplicitStateUpdater']
 
+#: Cache for the generated abstract code, keyed by the state updater
+#: description and the equations
+abstract_code_cache = LRUCache(1000)
+
 #===============================================================================
 # Parsing definitions
 #===============================================================================
-TEMP_VAR = Word(string.ascii_letters + '_',
-                string.ascii_letters + string.digits + '_').setResultsName('identifier')
+# The grammar is only built (and pyparsing only imported) when the first
+# description is parsed
+_DESCRIPTION = []
+
+def _get_description_grammar():
+    '''
+    Return the pyparsing grammar for state updater descriptions, building it
+    on first use.
+    '''
+    if not _DESCRIPTION:
+        from pyparsing import (Literal, Group, Word, ZeroOrMore, Suppress,
+                               restOfLine)
+        TEMP_VAR = Word(string.ascii_letters + '_',
+                        string.ascii_letters + string.digits + '_').setResultsName('identifier')
 
-EXPRESSION = restOfLine.setResultsName('expression')
+        EXPRESSION = restOfLine.setResultsName('expression')
 
-STATEMENT = Group(TEMP_VAR + Suppress('=') + EXPRESSION).setResultsName('statement')
+        STATEMENT = Group(TEMP_VAR + Suppress('=') + EXPRESSION).setResultsName('statement')
 
-OUTPUT = Group(Suppress(Literal('return ')) + EXPRESSION).setResultsName('output')
+        OUTPUT = Group(Suppress(Literal('return ')) + EXPRESSION).setResultsName('output')
 
-DESCRIPTION = ZeroOrMore(STATEMENT) + OUTPUT 
+        _DESCRIPTION.append(ZeroOrMore(STATEMENT) + OUTPUT)
+
+    return _DESCRIPTION[0]
 
 #===============================================================================
 # Class for simple definition of explicit state updaters
 #===============================================================================
 
-# reserved standard symbols
-SYMBOLS = {'x' : Symbol('x'),
-           't' : Symbol('t'),
-           'dt': Symbol('dt'),
-           'f' : Function('f')}
+def _get_standard_symbols():
+    '''
+    Return a dictionary of the reserved standard symbols (sympy is only
+    imported when this function is called for the first time).
+    '''
+    from sympy import Symbol, Function
+    return {'x' : Symbol('x'),
+            't' : Symbol('t'),
+            'dt': Symbol('dt'),
+            'f' : Function('f')}
 
 class ExplicitStateUpdater(object):
     '''
@@ -65,6 +85,11 @@ class ExplicitStateUpdater(object):
     ----------
     description : str
         A state updater description (see above).
+    lazy : bool, optional
+        Whether to postpone the parsing of the description until the state
+        updater is used for the first time. Defaults to ``False``, it is only
+        set for the built-in state updaters, to avoid importing sympy and
+        pyparsing when Brian is imported.
     
     Raises
     ------
@@ -76,29 +101,65 @@ class ExplicitStateUpdater(object):
     euler, rk2, rk4
     ''' 
     
-    def __init__(self, description):        
+    def __init__(self, description, lazy=False):
+        self.description = description
+        self._parsed = False
+        if not lazy:
+            self._parse()
+
+    def _parse(self):
+        '''
+        Parse the description and set the `statements`, `output` and `symbols`
+        attributes. Does nothing if the description has already been parsed.
+        '''
+        if self._parsed:
+            return
+        from sympy import Symbol
+        from pyparsing import ParseException
         try:
-            parsed = DESCRIPTION.parseString(description, parseAll=True)
+            parsed = _get_description_grammar().parseString(self.description,
+                                                             parseAll=True)
         except ParseException as p_exc:
             raise SyntaxError('Parsing failed: \n' + str(p_exc.line) + '\n' +
                               ' '*(p_exc.column - 1) + '^\n' + str(p_exc))
  
-        self.statements = []
-        self.symbols = SYMBOLS.copy()
+        self._statements = []
+        self._symbols = _get_standard_symbols()
         for element in parsed:
             # Make sure to always re-use symbol objects for known symbols,
             # otherwise the replacements go wrong
             expression = parse_to_sympy(element.expression,
-                                        local_dict=self.symbols)
+                                        local_dict=self._symbols)
             symbols = list(expression.atoms(Symbol))
-            self.symbols.update(dict([(symbol.name, symbol)
-                                      for symbol in symbols]))
+            self._symbols.update(dict([(symbol.name, symbol)
+                                       for symbol in symbols]))
             if element.getName() == 'statement':
-                self.statements.append((element.identifier, expression))
+                self._statements.append((element.identifier, expression))
             elif element.getName() == 'output':
-                self.output = expression
+                self._output = expression
             else:
                 raise AssertionError('Unknown element name: %s' % element.getName())
+        self._parsed = True
+
+    def _get_statements(self):
+        self._parse()
+        return self._statements
+
+    def _get_output(self):
+        self._parse()
+        return self._output
+
+    def _get_symbols(self):
+        self._parse()
+        return self._symbols
+
+    statements = property(_get_statements,
+                          doc='List of ``(name, sympy expression)`` tuples '
+                              'for the intermediate statements.')
+    output = property(_get_output,
+                      doc='The sympy expression for the return line.')
+    symbols = property(_get_symbols,
+                       doc='Dictionary mapping names to sympy symbols.')
     
     def __str__(self):
         s = ''
@@ -114,7 +175,9 @@ class ExplicitStateUpdater(object):
     
     def __call__(self, eqs):
         '''
-        Return "abstract code" for one integration step.
+        Return "abstract code" for one integration step. The code is cached,
+        calling the state updater again for the same equations does not
+        repeat the symbolic manipulations.
         
         Parameters
         ----------
@@ -126,52 +189,77 @@ class ExplicitStateUpdater(object):
         code : str
             The "abstract code" for the integration step.
         '''
-                
-        def replace_func(x, t, expr, temp_vars):
-            '''
-            TODO
-            '''
-            s_expr = parse_to_sympy(expr, local_dict=self.symbols)
-            
-            for var in eqs.eq_names:
-                temp_vars_specific = dict([('_' + temp_var + '_' + var,
-                                            Symbol('_' + temp_var + '_' + var))
-                                           for temp_var in temp_vars])
-                self.symbols.update(temp_vars_specific)
-                temp_var_replacements = dict([(temp_var, temp_vars_specific['_' + temp_var + '_' + var])
-                                              for temp_var in temp_vars])
-                one_replacement = x.subs(SYMBOLS['x'], variables[var])
-                                
-                one_replacement = one_replacement.subs(temp_var_replacements)
-                
-                s_expr = s_expr.subs(variables[var], one_replacement)
-            
-            # replace time (important for time-dependent equations)
-            s_expr.subs(SYMBOLS['t'], t)
-            return s_expr
+        key = (self.description, _get_equations_key(eqs))
+        try:
+            return abstract_code_cache[key]
+        except KeyError:
+            pass
+        code = self._generate_code(eqs)
+        abstract_code_cache[key] = code
+        return code
+
+    def _generate_code(self, eqs):
+        '''
+        Generate the "abstract code" for one integration step (see
+        `ExplicitStateUpdater.__call__`).
+        '''
+        from sympy import Symbol
+        SYMBOLS = _get_standard_symbols()
 
         statements = []
         temp_vars = [var for var, expr in self.statements]
+        temp_var_symbols = dict([(temp_var, Symbol(temp_var))
+                                 for temp_var in temp_vars])
         variables = dict([(var, Symbol(var)) for var in eqs.names])
         self.symbols.update(variables)
+        # The variable-specific intermediate variables, e.g. _k_v for k
+        specific_symbols = {}
+        for var in eqs.eq_names:
+            specific_symbols[var] = dict([(temp_var,
+                                           Symbol('_' + temp_var + '_' + var))
+                                          for temp_var in temp_vars])
+            self.symbols.update(dict([(symbol.name, symbol) for symbol in
+                                      specific_symbols[var].itervalues()]))
+        # Parse every expression only once
+        s_expressions = dict([(var, parse_to_sympy(expr,
+                                                   local_dict=self.symbols))
+                              for var, expr in eqs.eq_expressions])
+
+        def replace_func(x, t, var):
+            '''
+            Replace a call ``f(x, t)`` in the description by the expression
+            for `var`, where every variable (e.g. ``v``) is replaced by the
+            argument ``x`` applied to this variable (e.g. ``v + _k_v/2``).
+            (Time is not replaced.)
+            '''
+            replacements = {}
+            for other_var in eqs.eq_names:
+                x_replacements = dict([(temp_var_symbols[temp_var], symbol)
+                                       for temp_var, symbol in
+                                       specific_symbols[other_var].iteritems()])
+                x_replacements[SYMBOLS['x']] = variables[other_var]
+                replacements[variables[other_var]] = x.xreplace(x_replacements)
+            # Replace all variables in a single pass
+            return s_expressions[var].xreplace(replacements)
+
         # Intermediate statements
         for temp_var, temp_expr in self.statements:
-            for var, expr in eqs.eq_expressions:                                
-
+            for var, expr in eqs.eq_expressions:
                 temp_result = temp_expr.replace(SYMBOLS['f'],
-                                                lambda x, t: replace_func(x, t, expr, temp_vars))                
+                                                lambda x, t: replace_func(x, t, var))
                 statements.append('_' + temp_var + '_' + var + ' = ' + str(temp_result))
                 
         # The "return" line        
         for var, expr in eqs.diff_eq_expressions:
             # Handle f(x, t) calls                                
             temp_result = self.output.replace(SYMBOLS['f'],
-                                              lambda x, t: replace_func(x, t, expr, temp_vars))
+                                              lambda x, t: replace_func(x, t, var))
             # Handle references to variables and intermediate variables
-            temp_result = temp_result.subs(SYMBOLS['x'], variables[var])
-            for temp_var in temp_vars:
-                temp_result = temp_result.subs(self.symbols[temp_var],
-                                               self.symbols['_' + temp_var + '_' + var])
+            replacements = dict([(temp_var_symbols[temp_var], symbol)
+                                 for temp_var, symbol in
+                                 specific_symbols[var].iteritems()])
+            replacements[SYMBOLS['x']] = variables[var]
+            temp_result = temp_result.xreplace(replacements)
             statements.append('_' + var + ' = ' + str(temp_result))
         
         # Assign everything to the final variables
@@ -180,18 +268,28 @@ class ExplicitStateUpdater(object):
 
         return '\n'.join(statements)
 
+
+def _get_equations_key(eqs):
+    '''
+    Return a hashable representation of the equations that determines the
+    abstract code generated for them.
+    '''
+    return tuple([(eq.varname, eq.eq_type,
+                   None if eq.expr is None else eq.expr.code)
+                  for eq in eqs.equations_ordered])
+
 #===============================================================================
 # Excplicit state updaters
 #===============================================================================
 
 # these objects can be used like functions because they are callable
 #: Forward Euler state updater     
-euler = ExplicitStateUpdater('return x + dt * f(x,t)')
+euler = ExplicitStateUpdater('return x + dt * f(x,t)', lazy=True)
 
 #: Second order Runge-Kutta method (midpoint method)
 rk2 = ExplicitStateUpdater('''
     k = dt * f(x,t)
-    return x + dt*f(x +  k/2, t + dt/2)''')
+    return x + dt*f(x +  k/2, t + dt/2)''', lazy=True)
 
 #: Classical Runge-Kutta method (RK4)
 rk4 = ExplicitStateUpdater('''
@@ -200,4 +298,4 @@ rk4 = ExplicitStateUpdater('''
     k3=dt*f(x+k2/2,t+dt/2)
     k4=dt*f(x+k3,t+dt)
     return x+(k1+2*k2+2*k3+k4)/6
-    ''')
+    ''', lazy=True)
@@ -0,0 +1,180 @@
+'''
+Numerical integration of stochastic differential equations.
+'''
+import numpy as np
+
+from brian2.core.preferences import brian_prefs
+from brian2.utils.parsing import parse_to_sympy
+from brian2.utils.logger import get_logger
+from brian2.stateupdaters.integration import euler
+
+__all__ = ['NoiseBuffer', 'StochasticStateUpdater', 'euler_maruyama',
+           'milstein']
+
+logger = get_logger(__name__)
+
+brian_prefs.define('noise_buffer_size', 1000000,
+    '''
+    The number of normally distributed random numbers that are drawn at once
+    for the noise term of stochastic equations. The noise for several time
+    steps is generated in a single call, but at least the values for one
+    time step (i.e. the number of neurons) are always drawn.
+    ''')
+
+#: The name of the variable that refers to the standard normal random numbers
+#: in the abstract code
+NOISE_VARIABLE = '_xi'
+
+
+class NoiseBuffer(object):
+    '''
+    Provides normally distributed random numbers (zero mean, unit variance)
+    for ``N`` neurons for each time step. The numbers are generated in large
+    blocks for many time steps and the values for a single time step are
+    returned as views into the block, avoiding the overhead of calling the
+    random number generator in each time step.
+
+    Parameters
+    ----------
+    N : int
+        The number of values per time step.
+    size : int, optional
+        The (approximate) number of values in one block, defaults to the
+        :bpref:`noise_buffer_size` preference.
+    '''
+    def __init__(self, N, size=None):
+        if size is None:
+            size = brian_prefs.noise_buffer_size
+        #: The number of values per time step
+        self.N = N
+        #: The number of time steps in one block
+        self.steps = max(1, size // max(1, N))
+        self._block = None
+        self._index = self.steps
+
+    def refill(self):
+        '''
+        Draw a new block of random numbers.
+        '''
+        self._block = np.random.standard_normal((self.steps, self.N))
+        self._index = 0
+
+    def next(self):
+        '''
+        Return the values for the next time step.
+
+        Returns
+        -------
+        values : `ndarray`
+            An array of length ``N`` (a view into the current block).
+        '''
+        if self._index >= self.steps:
+            self.refill()
+        values = self._block[self._index]
+        self._index += 1
+        return values
+
+
+class StochasticStateUpdater(object):
+    '''
+    A state updater for stochastic differential equations of the form
+    ``dx/dt = f(x, t) + g(x, t) * xi``, using the Euler-Maruyama method or,
+    if ``milstein`` is ``True``, the Milstein method (which differs only for
+    multiplicative noise). The standard normal random numbers are referred to
+    as ``_xi`` in the abstract code, the value for the time step is
+    provided by a `NoiseBuffer`. Deterministic equations are handed over to
+    the ``fallback`` state updater.
+
+    Parameters
+    ----------
+    milstein : bool, optional
+        Whether to include the Milstein correction term, defaults to
+        ``False``.
+    fallback : callable, optional
+        The state updater used for deterministic equations, defaults to
+        `euler`.
+    '''
+    def __init__(self, milstein=False, fallback=euler):
+        self.milstein = milstein
+        self.fallback = fallback
+
+    def can_integrate(self, eqs):
+        '''
+        Whether the given equations can be integrated with this state updater.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations.
+
+        Returns
+        -------
+        can_integrate : bool
+            ``True`` if the equations are stochastic and the noise term can be
+            separated.
+        '''
+        if not eqs.is_stochastic:
+            return False
+        try:
+            for _, expr in eqs.substituted_expressions:
+                expr.split_stochastic()
+        except ValueError:
+            return False
+        return True
+
+    def __call__(self, eqs):
+        '''
+        Return "abstract code" for one integration step.
+
+        Parameters
+        ----------
+        eqs : `Equations`
+            The model equations that should be integrated.
+
+        Returns
+        -------
+        code : str
+            The "abstract code" for the integration step.
+        '''
+        if not self.can_integrate(eqs):
+            logger.debug(('Equations are not stochastic, using %r '
+                          'instead') % self.fallback)
+            return self.fallback(eqs)
+
+        from sympy import Symbol, diff
+        xi = Symbol('xi')
+        statements = []
+        for varname, expr in eqs.substituted_expressions:
+            f, g = expr.split_stochastic()
+            if g is None:
+                statements.append('_%s = %s + dt*(%s)' % (varname, varname,
+                                                          f.code))
+                continue
+            g_expr = parse_to_sympy(g.code).subs(xi, 1)
+            # dW = sqrt(dt) * _xi
+            update = '_%s = %s + dt*(%s) + dt**0.5*(%s)*%s' % (varname, varname,
+                                                             f.code, g_expr,
+                                                             NOISE_VARIABLE)
+            if self.milstein:
+                dg_dx = diff(g_expr, Symbol(varname))
+                if dg_dx != 0:
+                    update += ' + 0.5*(%s)*(%s)*dt*(%s**2 - 1)' % (g_expr,
+                                                                  dg_dx,
+                                                                  NOISE_VARIABLE)
+            statements.append(update)
+
+        # Assign everything to the final variables
+        for varname in eqs.diff_eq_names:
+            statements.append('%s = _%s' % (varname, varname))
+
+        return '\n'.join(statements)
+
+    def __repr__(self):
+        return '%s(milstein=%r, fallback=%r)' % (self.__class__.__name__,
+                                                 self.milstein, self.fallback)
+
+
+#: The Euler-Maruyama method for stochastic equations
+euler_maruyama = StochasticStateUpdater()
+#: The Milstein method for stochastic equations
+milstein = StochasticStateUpdater(milstein=True)
@@ -79,6 +79,28 @@ def test_resolve():
     assert namespace['ohm'] is brian2.ohm and namespace['amp'] is brian2.amp
 
 
+def test_resolution_cache():
+    '''
+    Test the caching of identifier lookups.
+    '''
+    tau = 5 * ms
+    expr = Expression('-v / tau * fake_cached_unit')
+    # Expressions created with replace_code share the lookup
+    other_expr = expr.replace_code('v / tau')
+    assert other_expr.lookup is expr.lookup
+    assert_raises(ValueError, lambda: expr.resolve(['v']))
+    matches = expr.lookup.lookup('tau')
+    assert matches == [('locals', tau)]
+    assert expr.lookup.lookup('tau') is matches
+    
+    # Registering a new unit invalidates the cache
+    fake_unit = brian2.Unit.create(volt.dim, 'fake_cached_unit')
+    assert not expr.lookup.lookup('tau') is matches
+    namespace = expr.resolve(['v'])
+    assert namespace['fake_cached_unit'] is fake_unit
+    assert namespace['tau'] == tau
+
+
 def test_resolution_warnings():
     '''
     Test that certain calls to resolve generate a warning.
@@ -180,6 +202,7 @@ if __name__ == '__main__':
     test_expr_check_linearity()
     test_expr_units()
     test_resolve()
+    test_resolution_cache()
     test_resolution_warnings()
     test_split_stochastic()
     test_str_repr()
\ No newline at end of file
@@ -16,6 +16,7 @@ from brian2.equations.equations import (check_identifier,
                                         check_identifier_basic,
                                         check_identifier_reserved,
                                         parse_string_equations,
+                                        parsed_equations_cache,
                                         SingleEquation,
                                         DIFFERENTIAL_EQUATION, STATIC_EQUATION,
                                         PARAMETER)
@@ -34,6 +35,12 @@ def test_utility_functions():
     assert unit_namespace['ms'] is unit_namespace['msecond']
     for unit in unit_namespace.itervalues():
         assert isinstance(unit, Unit)
+    # The namespace is cached but takes into account newly registered units
+    assert get_default_unit_namespace() is unit_namespace
+    assert not 'fake_unit_for_namespace' in unit_namespace
+    # new units are registered automatically
+    fake_unit = Unit.create(volt.dim, 'fake_unit_for_namespace')
+    assert unit_namespace['fake_unit_for_namespace'] is fake_unit
     
     assert get_unit_from_string('second') == second
     assert get_unit_from_string('1') == Unit(1, DIMENSIONLESS)
@@ -144,6 +151,23 @@ def test_parse_equations():
         assert_raises((ValueError, SyntaxError), lambda: parse_string_equations(error_eqs,
                                                                                 {}, False, 0))
 
+def test_parse_equations_cache():
+    ''' Test the caching of parsed equation strings '''
+    eq_string = '''dv/dt = -v / tau_cache_test : volt
+                   x : 1 (constant)'''
+    hits, misses = parsed_equations_cache.hits, parsed_equations_cache.misses
+    eqs1 = parse_string_equations(eq_string, {}, False, 0)
+    assert parsed_equations_cache.misses == misses + 1
+    eqs2 = parse_string_equations(eq_string, {}, False, 0)
+    assert parsed_equations_cache.hits == hits + 1
+    # The equations are new objects, only the parsed structure is shared
+    assert not eqs1['v'] is eqs2['v']
+    assert eqs1['v'].expr.code == eqs2['v'].expr.code
+    assert eqs2['x'].flags == ['constant']
+    eqs2['x'].flags.append('test')
+    assert parse_string_equations(eq_string, {}, False, 0)['x'].flags == ['constant']
+
+
 def test_construction_errors():
     '''
     Test that the Equations constructor raises errors correctly
@@ -331,6 +355,7 @@ if __name__ == '__main__':
     test_utility_functions()
     test_identifier_checks()
     test_parse_equations()
+    test_parse_equations_cache()
     test_construction_errors()
     test_resolve()
     test_properties()
@@ -0,0 +1,53 @@
+import sys
+import subprocess
+
+from numpy.testing import assert_equal
+
+# Generous upper bound for the time "import brian2" is allowed to take (in
+# seconds), sympy on its own needs more than that
+IMPORT_TIME_BUDGET = 1.0
+
+IMPORT_CODE = '''
+import sys
+import time
+start = time.time()
+import brian2
+print time.time() - start
+print ','.join(sorted(module for module in ['sympy', 'pyparsing', 'scipy.weave']
+                      if sys.modules.get(module) is not None))
+'''
+
+def _run_import():
+    process = subprocess.Popen([sys.executable, '-c', IMPORT_CODE],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, _ = process.communicate()
+    assert process.returncode == 0
+    lines = stdout.splitlines()
+    import_time = float(lines[-2])
+    imported = [module for module in lines[-1].split(',') if module]
+    return import_time, imported
+
+
+def test_lazy_imports():
+    '''
+    Test that heavy dependencies are not imported by ``import brian2``.
+    '''
+    _, imported = _run_import()
+    assert_equal(imported, [])
+
+
+def test_import_time():
+    '''
+    Test that ``import brian2`` stays within the import time budget.
+    '''
+    # Take the best of several runs to be robust against a busy machine
+    import_time = min(_run_import()[0] for _ in xrange(3))
+    assert import_time < IMPORT_TIME_BUDGET, ('Importing brian2 took %.2fs '
+                                              '(budget: %.2fs)' %
+                                              (import_time,
+                                               IMPORT_TIME_BUDGET))
+
+
+if __name__ == '__main__':
+    test_lazy_imports()
+    test_import_time()
@@ -1,5 +1,16 @@
 from brian2 import *
-from brian2.memory.allocation import allocate_array
+from brian2.memory.allocation import allocate_array, allocate_state_matrix
+from brian2.memory.dynamicarray import DynamicArray1D, SegmentedDynamicArray
+from brian2.memory.ledger import memory_ledger
+from brian2.memory.streaming import (ChunkedStream, BackgroundWriter,
+                                     load_stream)
+import brian2.memory
+import os
+import json
+import time
+import shutil
+import tempfile
+import numpy as np
 from numpy.testing import assert_raises, assert_equal
 from nose import with_setup
 
@@ -11,7 +22,210 @@ def test_allocate_array():
     arr = allocate_array((100, 2), dtype=int)
     assert_equal(arr.shape, (100, 2))
     assert_equal(arr.dtype, int)
+    # arrays are aligned to 64 bytes by default
+    assert arr.ctypes.data % 64 == 0
+    brian_prefs.array_alignment = 4096
+    arr = allocate_array(10, dtype=np.float32)
+    assert arr.ctypes.data % 4096 == 0
+
+@with_setup(teardown=restore_initial_state)
+def test_memory_pool():
+    arr = allocate_array(1000)
+    address = arr.ctypes.data
+    arr[:] = 1
+    del arr
+    # the memory is re-used and initialised to zero
+    arr = allocate_array(1000)
+    assert arr.ctypes.data == address
+    assert_equal(arr, np.zeros(1000))
+    # the memory is not re-used as long as a view exists
+    view = arr[10:]
+    del arr
+    arr = allocate_array(1000)
+    assert arr.ctypes.data != address
+    # ... but after the last view has been deleted
+    del view
+    other_arr = allocate_array(1000)
+    assert other_arr.ctypes.data == address
+    # huge pages
+    brian_prefs.use_huge_pages = True
+    arr = allocate_array(1024*1024)
+    assert arr.ctypes.data % 64 == 0
+    arr[:] = 1
+    assert_equal(arr.sum(), 1024*1024)
+
+@with_setup(teardown=restore_initial_state)
+def test_memory_ledger():
+    G = NeuronGroup(10, 'dv/dt = -v / (10*ms) : 1', name='ledger_group')
+    usage = memory_ledger.usage()
+    assert usage[('ledger_group', 'v')] == 10*G.v_.itemsize
+    text = brian2.memory.report()
+    assert 'ledger_group' in text
+    assert 'Total' in text
+    # entries are removed when the memory is freed
+    arr = allocate_array(100, owner='ledger_test', name='x')
+    assert memory_ledger.usage()[('ledger_test', 'x')] == 100*arr.itemsize
+    del arr
+    assert not ('ledger_test', 'x') in memory_ledger.usage()
+    # the entry exists as long as the array or a view of it exists
+    arr = allocate_array((10, 10), dtype=np.float32, owner='ledger_test',
+                         name='z')
+    assert 'ledger_test' in brian2.memory.report()
+    assert memory_ledger.usage()[('ledger_test', 'z')] == 400
+    view = arr[5:]
+    del arr
+    assert memory_ledger.usage()[('ledger_test', 'z')] == 400
+    del view
+    assert not ('ledger_test', 'z') in memory_ledger.usage()
+    x = DynamicArray1D(10, owner='ledger_test', name='y')
+    x.resize(100)
+    assert (memory_ledger.usage()[('ledger_test', 'y')] ==
+            x._data.nbytes)
+    # the memory budget
+    total = memory_ledger.total_bytes
+    brian_prefs.memory_budget = total + 1000
+    allocate_array(100)
+    assert_raises(MemoryError, lambda: allocate_array(1000))
+    assert_raises(MemoryError, lambda: x.resize(1000))
+    assert_raises(MemoryError, lambda: NeuronGroup(1000, 'v:1'))
+    assert memory_ledger.total_bytes == total
+
+@with_setup(teardown=restore_initial_state)
+def test_segmented_dynamic_array():
+    x = SegmentedDynamicArray((0, 2), dtype=int, segment_size=4)
+    assert_equal(x.shape, (0, 2))
+    assert_equal(x.data.shape, (0, 2))
+    values = np.arange(20).reshape((10, 2))
+    x.append(values[:3])
+    rows = x.reserve(2)
+    rows[:] = values[3:5]
+    x.resize((8, 2))
+    x.data[5:8] = values[5:8]
+    assert len(x) == 8
+    # Growing the array does not copy the existing segments
+    segment = x._segments[-1]
+    x.reserve(1)[:] = values[8]
+    x.append(values[9:])
+    assert len(x._segments) == 2
+    assert x._segments[0] is segment
+    assert_equal(x.data, values)
+    # The concatenated data is cached
+    assert x.data is x.data
+    assert_equal(x[3], values[3])
+    # Reducing the size
+    x.resize((3, 2))
+    assert_equal(x.data, values[:3])
+    x.resize((5, 2))
+    assert_equal(x.data, np.vstack([values[:3], np.zeros((2, 2))]))
+    assert_raises(ValueError, lambda: x.resize((5, 3)))
+
+@with_setup(teardown=restore_initial_state)
+def test_chunked_stream():
+    directory = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(directory, 'values.npy')
+        stream = ChunkedStream(filename, np.int32, row_shape=(2, ),
+                               chunk_size=4)
+        assert_equal(stream.read().shape, (0, 2))
+        values = np.arange(20, dtype=np.int32).reshape((10, 2))
+        stream.append(values[:3])
+        stream.reserve(5)[:] = values[3:8]
+        stream.append(values[8:])
+        assert stream.num_rows == 10
+        # Zero-copy, read-only access
+        stored = stream.read()
+        assert isinstance(stored, np.memmap)
+        assert_equal(stored, values)
+        assert_raises((ValueError, RuntimeError), stored.__setitem__,
+                      (0, 0), 1)
+        # The file is a standard .npy file
+        stream.close()
+        assert_equal(np.load(filename), values)
+        assert_equal(load_stream(filename), values)
+        with open(os.path.join(directory, 'values.json')) as f:
+            index = json.load(f)
+        assert index['rows'] == 10
+        assert_equal(index['chunks'], [[0, 3], [3, 5], [8, 2]])
+    finally:
+        shutil.rmtree(directory)
+
+@with_setup(teardown=restore_initial_state)
+def test_background_writer():
+    class SlowStream(object):
+        filename = 'slow.npy'
+        def __init__(self):
+            self.written = []
+        def _write(self, data):
+            time.sleep(0.01)
+            self.written.append(data)
+    brian_prefs.stream_queue_size = 2
+    writer = BackgroundWriter()
+    stream = SlowStream()
+    # submit waits if two chunks are waiting, but everything is written
+    for idx in xrange(6):
+        writer.submit(stream, idx)
+    assert writer._queue.maxsize == 2
+    writer.flush()
+    assert_equal(stream.written, range(6))
+
+@with_setup(teardown=restore_initial_state)
+def test_allocate_state_matrix():
+    matrix, arrays = allocate_state_matrix(['v', 'w', 'x'], 10)
+    assert_equal(matrix.shape, (3, 10))
+    assert_equal(matrix.dtype, float)
+    assert_equal(sorted(arrays.keys()), ['v', 'w', 'x'])
+    for name in ['v', 'w', 'x']:
+        # rows are aligned to 64 bytes by default
+        assert arrays[name].ctypes.data % 64 == 0
+    # the arrays are views into the matrix
+    arrays['w'][:] = 3
+    assert_equal(matrix[0], np.zeros(10))
+    assert_equal(matrix[1], 3*np.ones(10))
+    assert_equal(matrix[2], np.zeros(10))
+    matrix[2, 5] = 1
+    assert arrays['x'][5] == 1
+    matrix, arrays = allocate_state_matrix(['v', 'w'], 16, dtype=np.float32,
+                                           alignment=16)
+    assert_equal(matrix.dtype, np.float32)
+    assert matrix.strides[0] == 64
+    assert_raises(ValueError, lambda: allocate_state_matrix(['v'], 10,
+                                                            alignment=12))
+
+@with_setup(teardown=restore_initial_state)
+def test_contiguous_state():
+    eqs = '''dv/dt = -v / (10*ms) : 1
+             dw/dt = -w / (10*ms) : 1
+             x : 1'''
+    G = NeuronGroup(10, eqs)
+    assert G.state_matrices == {}
+    G = NeuronGroup(10, eqs, contiguous=True)
+    names, matrix = G.state_matrices[np.dtype(float)]
+    assert set(['v', 'w', 'x']) <= set(names)
+    assert_equal(matrix.shape, (len(names), 10))
+    G.w = 2
+    assert_equal(matrix[names.index('w')], 2*np.ones(10))
+    matrix[names.index('v')] = np.arange(10)
+    assert_equal(G.v_, np.arange(10))
+    # single copy snapshot of all variables
+    snapshot = matrix.copy()
+    G.v = 0
+    matrix[:] = snapshot
+    assert_equal(G.v_, np.arange(10))
+    # Different dtypes are stored separately
+    G = NeuronGroup(10, eqs, contiguous=True, dtype={'v': np.float32,
+                                                     'w': float, 'x': float,
+                                                     'is_active': float,
+                                                     'refractory': float,
+                                                     'refractory_until': float})
+    assert_equal(G.state_matrices[np.dtype(np.float32)][0], ['v'])
 
 if __name__=='__main__':
     test_allocate_array()
+    test_memory_pool()
+    test_memory_ledger()
+    test_segmented_dynamic_array()
+    test_chunked_stream()
+    test_background_writer()
+    test_allocate_state_matrix()
+    test_contiguous_state()
     
\ No newline at end of file
@@ -0,0 +1,360 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_equal, assert_raises, assert_allclose
+from nose import with_setup
+
+from brian2 import *
+from brian2.codegen.languages import CPPLanguage, CUDALanguage
+from brian2.memory.dynamicarray import SegmentedDynamicArray
+
+
+def _create_network(N=5):
+    '''
+    Create a group with the parameters ``v`` (set to ``t + i`` in every time
+    step) and ``w``.
+    '''
+    G = NeuronGroup(N, '''v : 1
+                          w : 1''')
+    @network_operation(when='start')
+    def set_v():
+        G.v_[:] = G.clock.t_ + np.arange(N)
+    return G, set_v
+
+
+@with_setup(teardown=restore_initial_state)
+def test_state_monitor():
+    G, set_v = _create_network()
+    G.w = 2
+    M = StateMonitor(G, ['v', 'w'], record=[1, 3])
+    M_all = StateMonitor(G, 'v', record=True)
+    net = Network(G, set_v, M, M_all)
+    net.run(1*ms)
+    t = np.arange(10)*defaultclock.dt_
+    assert_equal(M.t_, t)
+    assert_equal(M.v_, t[:, None] + np.array([1, 3])[None, :])
+    assert_equal(M.w_, 2*np.ones((10, 2)))
+    assert_equal(M_all.v_, t[:, None] + np.arange(5)[None, :])
+    # The arrays are preallocated for the run
+    assert M._t._data.shape == (10, )
+    # Zero-copy, read-only views
+    v = M.v_
+    assert M.v_ is v
+    assert_raises((ValueError, RuntimeError), v.__setitem__, (0, 0), 1)
+    # Continuing the recording
+    net.run(0.5*ms)
+    t = np.arange(15)*defaultclock.dt_
+    assert_equal(M.t_, t)
+    assert_equal(M.v_, t[:, None] + np.array([1, 3])[None, :])
+    assert_equal(M.v, M.v_)
+    # The old view is unchanged
+    assert len(v) == 10
+    # Clearing the recorded values
+    M.reinit()
+    assert len(M.t_) == 0
+    assert M.v_.shape == (0, 2)
+
+
+@with_setup(teardown=restore_initial_state)
+def test_state_monitor_aggregation():
+    G, set_v = _create_network()
+    M_every = StateMonitor(G, 'v', record=[1, 3], every=3)
+    M_mean = StateMonitor(G, 'v', record=[1, 3], every=3, aggregate='mean')
+    M_max = StateMonitor(G, 'v', record=True, every=3, aggregate='max')
+    M_min = StateMonitor(G, 'v', record=True, every=3, aggregate='min')
+    M_pop = StateMonitor(G, 'v', record=True, population='sum')
+    M_both = StateMonitor(G, 'v', record=[1, 3], every=2, aggregate='mean',
+                          population='mean')
+    net = Network(G, set_v, M_every, M_mean, M_max, M_min, M_pop, M_both)
+    net.run(1*ms)
+    dt = defaultclock.dt_
+    t = np.arange(10)*dt
+    # Every third time step
+    assert_equal(M_every.t_, t[::3])
+    assert_equal(M_every.v_, t[::3, None] + np.array([1, 3])[None, :])
+    # Only complete blocks are recorded
+    assert_equal(M_mean.t_, t[:9:3])
+    assert_allclose(M_mean.v_, (t[:9:3] + dt)[:, None] +
+                               np.array([1, 3])[None, :])
+    assert_allclose(M_max.v_, (t[:9:3] + 2*dt)[:, None] +
+                              np.arange(5)[None, :])
+    assert_allclose(M_min.v_, t[:9:3, None] + np.arange(5)[None, :])
+    # Population aggregates
+    assert M_pop.v_.shape == (10, )
+    assert_allclose(M_pop.v_, 5*t + 10)
+    assert_allclose(M_both.v_, t[::2] + 0.5*dt + 2)
+    assert_equal(M_both.v.shape, (5, ))
+    # Incomplete blocks are continued in the next run
+    net.run(0.2*ms)
+    t = np.arange(12)*dt
+    assert_equal(M_mean.t_, t[::3])
+    assert_allclose(M_mean.v_, (t[::3] + dt)[:, None] +
+                               np.array([1, 3])[None, :])
+    # Invalid arguments
+    assert_raises(ValueError, lambda: StateMonitor(G, 'v', every=0))
+    assert_raises(ValueError, lambda: StateMonitor(G, 'v', aggregate='std'))
+    assert_raises(ValueError, lambda: StateMonitor(G, 'v', population='max'))
+
+
+@with_setup(teardown=restore_initial_state)
+def test_monitor_streaming():
+    directory = tempfile.mkdtemp()
+    try:
+        brian_prefs.stream_chunk_size = 4
+        G, set_v = _create_network()
+        M = StateMonitor(G, 'v', record=[1, 3], stream=directory, name='M')
+        M_pop = StateMonitor(G, 'v', record=True, population='sum',
+                             stream=directory)
+        P = PoissonGroup(10, rates=1000*Hz)
+        M_spikes = SpikeMonitor(P, stream=directory, name='M_spikes')
+        M_memory = SpikeMonitor(P)
+        net = Network(G, set_v, M, M_pop, P, M_spikes, M_memory)
+        net.run(1*ms)
+        t = np.arange(10)*defaultclock.dt_
+        assert_equal(M.t_, t)
+        assert_equal(M.v_, t[:, None] + np.array([1, 3])[None, :])
+        assert isinstance(M.v_, np.memmap)
+        assert_allclose(M_pop.v_, 5*t + 10)
+        assert_equal(np.load(os.path.join(directory, 'M_v.npy')), M.v_)
+        # Continuing the recording
+        net.run(0.5*ms)
+        t = np.arange(15)*defaultclock.dt_
+        assert_equal(M.t_, t)
+        assert_equal(M.v_, t[:, None] + np.array([1, 3])[None, :])
+        assert_equal(M_spikes.i, M_memory.i)
+        assert_equal(M_spikes.t_, M_memory.t_)
+        assert_equal(np.load(os.path.join(directory, 'M_spikes_i.npy')),
+                     M_memory.i)
+    finally:
+        shutil.rmtree(directory)
+
+
+@with_setup(teardown=restore_initial_state)
+def test_segmented_monitors():
+    brian_prefs.monitor_segment_size = 4
+    G, set_v = _create_network()
+    M = StateMonitor(G, 'v', record=[1, 3])
+    M_mean = StateMonitor(G, 'v', record=True, every=2, aggregate='mean')
+    P = PoissonGroup(10, rates=1000*Hz)
+    M_spikes = SpikeMonitor(P)
+    M_compact = SpikeMonitor(P, compact=True)
+    brian_prefs.monitor_segment_size = 0
+    M_contiguous = SpikeMonitor(P)
+    net = Network(G, set_v, M, M_mean, P, M_spikes, M_compact, M_contiguous)
+    for _ in range(2):
+        net.run(1*ms)
+    assert isinstance(M._values['v'], SegmentedDynamicArray)
+    assert isinstance(M_spikes._i, SegmentedDynamicArray)
+    t = np.arange(20)*defaultclock.dt_
+    assert_equal(M.t_, t)
+    assert_equal(M.v_, t[:, None] + np.array([1, 3])[None, :])
+    assert_allclose(M_mean.v_, (t[::2] + 0.5*defaultclock.dt_)[:, None] +
+                               np.arange(5)[None, :])
+    assert_equal(M_spikes.i, M_contiguous.i)
+    assert_equal(M_spikes.t_, M_contiguous.t_)
+    assert_equal(M_compact.steps, M_contiguous.steps)
+
+
+@with_setup(teardown=restore_initial_state)
+def test_compact_spike_monitor():
+    '''
+    Test the compact storage of spikes in `SpikeMonitor`.
+    '''
+    clock = Clock(dt=0.1*ms)
+    G = PoissonGroup(100, rates=np.linspace(0, 1000, 100)*Hz, when=clock)
+    M = SpikeMonitor(G)
+    M_compact = SpikeMonitor(G, compact=True)
+    net = Network(G, M, M_compact)
+    net.run(10*ms)
+    assert M.num_spikes > 0
+    assert M_compact._i.dtype == np.int32
+    assert M_compact._t.dtype == np.int32
+    assert M_compact._i.data.nbytes + M_compact._t.data.nbytes == 8*M.num_spikes
+    assert_equal(M_compact.i, M.i)
+    assert_equal(M_compact.steps, M.steps)
+    assert_equal(M_compact.steps, np.round(M.t_/clock.dt_))
+    assert_allclose(M_compact.t_, M.t_)
+    assert_equal(M_compact.count, M.count)
+    # Time steps that do not fit into 32 bit integers
+    M_compact._widen_steps()
+    assert M_compact._t.dtype == np.int64
+    net.run(1*ms)
+    assert_equal(M_compact.i, M.i)
+    assert_equal(M_compact.steps, M.steps)
+
+
+@with_setup(teardown=restore_initial_state)
+def test_spike_monitor_views():
+    '''
+    Test that the `SpikeMonitor` accessors return cached read-only views.
+    '''
+    clock = Clock(dt=0.1*ms)
+    G = PoissonGroup(100, rates=np.linspace(0, 1000, 100)*Hz, when=clock)
+    M = SpikeMonitor(G)
+    net = Network(G, M)
+    net.run(10*ms)
+    i, t, t_ = M.i, M.t, M.t_
+    assert M.i is i and M.t is t and M.t_ is t_
+    # No copies of the stored data
+    assert np.may_share_memory(i, M._i._data)
+    assert np.may_share_memory(t, M._t._data)
+    assert np.may_share_memory(t, t_)
+    assert_equal(np.asarray(t), t_)
+    for values in [i, t, t_]:
+        assert_raises((ValueError, RuntimeError), values.__setitem__, 0, 0)
+    # The views are renewed when new spikes are recorded
+    net.run(10*ms)
+    assert M.i is not i
+    assert len(M.i) > len(i)
+    assert_equal(M.i[:len(i)], i)
+    assert_equal(M.t_[:len(t_)], t_)
+
+
+@with_setup(teardown=restore_initial_state)
+def test_spike_trains():
+    '''
+    Test the per-neuron spike trains of `SpikeMonitor`.
+    '''
+    clock = Clock(dt=0.1*ms)
+    G = PoissonGroup(50, rates=np.linspace(0, 1000, 50)*Hz, when=clock)
+    M = SpikeMonitor(G)
+    M_compact = SpikeMonitor(G, compact=True)
+    net = Network(G, M, M_compact)
+    def check(monitor):
+        trains = monitor.spike_trains()
+        assert_equal(sorted(trains.keys()), range(50))
+        for k in xrange(50):
+            expected = monitor.t_[monitor.i == k]
+            assert_allclose(np.asarray(monitor.spike_train(k)), expected)
+            assert_allclose(np.asarray(trains[k]), expected)
+    for _ in range(3):
+        # The index is updated for the spikes of each run
+        net.run(5*ms)
+        check(M)
+        check(M_compact)
+    assert M.spike_trains() is M.spike_trains()
+    assert len(M.spike_train(0)) == 0
+    assert_raises(IndexError, lambda: M.spike_train(50))
+    M_count = SpikeMonitor(G, record=False)
+    assert_raises(ValueError, lambda: M_count.spike_train(0))
+
+
+@with_setup(teardown=restore_initial_state)
+def test_population_rate_monitor():
+    P = PoissonGroup(100, rates=np.linspace(0, 2000, 100)*Hz)
+    M_spikes = SpikeMonitor(P)
+    M = PopulationRateMonitor(P)
+    M_window = PopulationRateMonitor(P, smoothing='window', width=0.3*ms)
+    M_exp = PopulationRateMonitor(P, smoothing='exponential', width=1*ms)
+    net = Network(P, M_spikes, M, M_window, M_exp)
+    net.run(2*ms)
+    dt = defaultclock.dt_
+    steps = np.round(M_spikes.t_ / dt).astype(int)
+    counts = np.bincount(steps, minlength=20)
+    assert_equal(M.count, counts)
+    assert M.count.dtype == np.int32
+    assert_equal(M.t_, np.arange(20)*dt)
+    assert_allclose(M.rate_, counts / (100*dt))
+    assert_allclose(np.asarray(M.rate), M.rate_)
+    assert M.rate is M.rate
+    # Sliding window over 3 time steps
+    window = np.array([counts[max(0, n-2):n+1].mean() for n in range(20)])
+    assert_allclose(M_window.smooth_rate_, window / (100*dt))
+    # Exponential smoothing
+    decay = np.exp(-dt / 1e-3)
+    smoothed = [counts[0]]
+    for count in counts[1:]:
+        smoothed.append(decay*smoothed[-1] + (1 - decay)*count)
+    assert_allclose(M_exp.smooth_rate_, np.array(smoothed) / (100*dt))
+    assert_raises(AttributeError, lambda: M.smooth_rate)
+    # Continuing the recording
+    net.run(1*ms)
+    assert_equal(M.t_, np.arange(30)*dt)
+    assert_equal(M.count.sum(), M_spikes.num_spikes)
+    assert_raises(ValueError, lambda: PopulationRateMonitor(P,
+                                                            smoothing='window'))
+
+
+@with_setup(teardown=restore_initial_state)
+def test_statistics_monitor():
+    G = NeuronGroup(5, '''v : volt
+                          w : 1''')
+    values = np.random.randn(20, 5)
+    @network_operation(when='start')
+    def set_values():
+        G.v_[:] = values[G.clock.i]
+        G.w_[:] = 2*values[G.clock.i]
+    M = StatisticsMonitor(G, ['v', 'w'],
+                          histograms={'v': (-2*volt, 2*volt, 8)})
+    M_sub = StatisticsMonitor(G, 'v', record=[1, 3])
+    net = Network(G, set_values, M, M_sub)
+    net.run(2*ms)
+    assert M.num_samples == 20
+    assert_allclose(M.mean_v_, values.mean(axis=0))
+    assert_allclose(M.var_v_, values.var(axis=0))
+    assert_allclose(M.std_w_, 2*values.std(axis=0))
+    assert_allclose(np.asarray(M.mean_v), M.mean_v_)
+    assert have_same_dimensions(M.var_v, volt**2)
+    assert_allclose(M_sub.mean_v_, values[:, [1, 3]].mean(axis=0))
+    hist = np.array([np.histogram(values[:, i], bins=M.bin_edges['v'])[0]
+                     for i in range(5)])
+    assert_equal(M.hist_v, hist)
+    assert_equal(M.bin_edges['v'], np.linspace(-2, 2, 9))
+    assert_raises(AttributeError, lambda: M.hist_w)
+    M.reinit()
+    assert M.num_samples == 0
+    assert_equal(M.mean_v_, np.zeros(5))
+    assert_raises(ValueError, lambda: StatisticsMonitor(G, 'v',
+                                                        histograms={'w': (0, 1, 2)}))
+    assert_raises(DimensionMismatchError,
+                  lambda: StatisticsMonitor(G, 'v',
+                                            histograms={'v': (0, 1, 2)}))
+
+
+@with_setup(teardown=restore_initial_state)
+def test_monitor_code():
+    G, set_v = _create_network()
+    # Python code for the recording of a subset of neurons
+    M = StateMonitor(G, 'v', record=[1, 3])
+    lines = [line.strip() for line in M.codeobj.code.split('\n')]
+    assert '_neuron_idx = _indices' in lines
+    # copied into the preallocated row, without an indexed temporary array
+    assert '_array_v.take(_neuron_idx, out=_row_v)' in lines
+    assert not '_array_v[_neuron_idx]' in M.codeobj.code
+    # C++ code, copying the values in a loop over the recorded indices
+    M = StateMonitor(G, 'v', record=[1, 3], language=CPPLanguage())
+    code = M.codeobj.code['%MAIN%']
+    assert 'const int _neuron_idx = _indices[_monitor_idx];' in code
+    assert '_ptr_row_v[_monitor_idx] = _record_v;' in code
+    # CUDA kernels (the C++ and CUDA templates are only checked as strings)
+    language = CUDALanguage()
+    for template in [language.template_state_monitor(),
+                     language.template_spike_monitor()]:
+        assert '__global__ void ' in template
+    # Spike monitors
+    P = PoissonGroup(5, rates=100*Hz)
+    M_spikes = SpikeMonitor(P, language=CPPLanguage())
+    code = M_spikes.codeobj.code['%MAIN%']
+    assert 'const int _neuron_idx = _spikes[_spike_idx];' in code
+    assert '_ptr_new_i[_spike_idx] = _record_i;' in code
+    M_spikes = SpikeMonitor(P, record=False)
+    assert not '_new_i' in M_spikes.codeobj.code
+    net = Network(P, M_spikes)
+    net.run(10*ms)
+    assert M_spikes.num_spikes > 0
+    assert len(M_spikes.i) == 0
+
+
+if __name__ == '__main__':
+    test_state_monitor()
+    test_state_monitor_aggregation()
+    test_monitor_streaming()
+    test_segmented_monitors()
+    test_compact_spike_monitor()
+    test_spike_monitor_views()
+    test_spike_trains()
+    test_population_rate_monitor()
+    test_statistics_monitor()
+    test_monitor_code()
@@ -0,0 +1,200 @@
+import numpy as np
+from numpy.testing import assert_equal, assert_allclose
+from nose import with_setup
+
+from brian2 import *
+from brian2.codegen.specifiers import (Value, ArrayVariable, Index,
+                                       OutputVariable)
+from brian2.codegen.translation import translate
+from brian2.stateupdaters.integration import euler
+from brian2.stateupdaters.exponential_euler import exponential_euler
+from brian2.codegen.languages import PythonLanguage, CPPLanguage
+
+
+@with_setup(teardown=restore_initial_state)
+def test_scalar_parameters():
+    '''
+    Test the treatment of homogeneous parameters as scalar values.
+    '''
+    G = NeuronGroup(10, '''dv/dt = (x - v)/(10*ms) : 1
+                           x : 1
+                           c : 1 (constant)''')
+    # constant parameters are scalars from the start
+    assert G.scalar_parameters == set(['c'])
+    assert isinstance(G.specifiers['c'], Value)
+    assert isinstance(G.specifiers['x'], ArrayVariable)
+    # all homogeneous parameters that are not written by the code are
+    # scalars after preparing the group
+    G.x = 3
+    G.prepare()
+    assert 'x' in G.scalar_parameters
+    assert not 'is_active' in G.scalar_parameters
+    assert not 'refractory_until' in G.scalar_parameters
+    assert isinstance(G.specifiers['x'], Value)
+    assert G.namespace['x'] == 3
+    assert not '_array_x' in G.state_update_codeobj.code
+    # setting a single value keeps the specialization
+    G.x = 5
+    assert 'x' in G.scalar_parameters
+    assert G.namespace['x'] == 5
+    # different values lead to a de-specialization
+    G.x = np.arange(10)
+    assert not 'x' in G.scalar_parameters
+    assert isinstance(G.specifiers['x'], ArrayVariable)
+    assert_equal(G.x_, np.arange(10))
+    # accessing the array de-specializes as well
+    G.c_[:] = 2
+    assert not 'c' in G.scalar_parameters
+    G.prepare()
+    assert 'c' in G.scalar_parameters
+    assert G.namespace['c'] == 2
+    assert not 'x' in G.scalar_parameters
+    # switch off the specialization
+    brian_prefs.specialize_scalar_parameters = False
+    G = NeuronGroup(10, '''dv/dt = (x - v)/(10*ms) : 1
+                           x : 1 (constant)''')
+    G.prepare()
+    assert G.scalar_parameters == set()
+
+
+@with_setup(teardown=restore_initial_state)
+def test_mixed_precision():
+    '''
+    Test storing state variables in single precision while calculating in
+    double precision.
+    '''
+    eqs = '''dv/dt = -v/(10*ms) : 1
+             x : 1'''
+    G = NeuronGroup(10, eqs)
+    assert G.v_.dtype == np.float64
+    brian_prefs.mixed_precision = True
+    G = NeuronGroup(10, eqs, dtype={'x': np.float64})
+    assert G.v_.dtype == np.float32
+    assert G.x_.dtype == np.float64
+    assert G.refractory_until_.dtype == np.float64
+    # single precision values are converted when read
+    assert "_array_v.astype('float64')" in G.state_update_codeobj.code
+
+    specifiers = {'v': ArrayVariable('_array_v', '_neuron_idx', np.float32),
+                  'w': ArrayVariable('_array_w', '_neuron_idx', np.float64),
+                  'dt': Value(np.float64),
+                  '_neuron_idx': Index(all=True)}
+    code = '''v += dt
+              w += dt'''
+    python_code = translate(code, specifiers, np.float64, PythonLanguage())
+    assert "v = _array_v.astype('float64')" in python_code
+    assert 'w = _array_w\n' in python_code
+    # the converted value has to be written back
+    assert '_array_v[:] = v' in python_code
+    namespace = {'_array_v': np.ones(3, dtype=np.float32),
+                 '_array_w': np.ones(3), 'dt': 1e-8}
+    exec python_code in namespace
+    assert namespace['v'].dtype == np.float64
+    assert_equal(namespace['_array_v'], np.float32(1 + 1e-8))
+    assert_equal(namespace['_array_w'], 1 + 1e-8)
+    cpp_code = translate(code, specifiers, np.float64, CPPLanguage())['%CODE%']
+    assert 'double v = _ptr_array_v[_neuron_idx];' in cpp_code
+    assert 'float * __restrict__ _ptr_array_v' in translate(code, specifiers,
+                                                           np.float64,
+                                                           CPPLanguage())['%POINTERS%']
+    # without mixed precision, the values are used as they are
+    python_code = translate(code, specifiers, np.float32, PythonLanguage())
+    assert not 'astype' in python_code
+
+
+@with_setup(teardown=restore_initial_state)
+def test_active_flag():
+    '''
+    Test that equations with the (active) flag are not integrated during the
+    refractory period.
+    '''
+    G = NeuronGroup(2, '''dv/dt = -k*v : 1 (active)
+                           k : Hz''', method=euler)
+    G.k = 100*Hz
+    G.v = 1
+    G.refractory_until_ = [0, 0.001]
+    net = Network(G)
+    net.run(1*ms)
+    assert_allclose(G.v_, [0.99**10, 1])
+    assert_equal(G.is_active_, [1, 0])
+    # is_active is a number in the generated code (i.e. it can be negated)
+    is_active = G.state_update_codeobj.namespace['is_active']
+    assert_equal(-is_active, [-1, 0])
+
+@with_setup(teardown=restore_initial_state)
+def test_active_flag_auto():
+    '''
+    Test the automatically selected integration method for conditionally
+    linear equations with the (active) flag, where the coefficient of the
+    variable is zero during the refractory period.
+    '''
+    G = NeuronGroup(2, '''dv/dt = k*(2 - v) : 1 (active)
+                           k : Hz''', method='auto')
+    assert G.method is exponential_euler
+    G.k = 100*Hz
+    G.refractory_until_ = [0, 0.0005]
+    net = Network(G)
+    net.run(1*ms)
+    assert_allclose(G.v_, 2 * (1 - np.exp(-100 * np.array([0.001, 0.0005]))))
+
+
+def test_threshold_template():
+    '''
+    Test the threshold templates, which also start the refractory period of
+    the spiking neurons.
+    '''
+    specifiers = {'v': ArrayVariable('_array_v', '_neuron_idx', np.float64),
+                  'refractory_until': ArrayVariable('_array_refractory_until',
+                                                    '_neuron_idx', np.float64),
+                  't': Value(np.float64),
+                  '_cond': OutputVariable(bool),
+                  '_neuron_idx': Index(all=True)}
+    # The abstract code generated by NeuronGroup.create_thresholder
+    abstract_code = '_cond = (v > 1) * (t >= refractory_until)'
+    language = PythonLanguage()
+    innercode = translate(abstract_code, specifiers, np.float64, language)
+    code = language.apply_template(innercode, language.template_threshold())
+    codeobj = language.code_object(code, specifiers)
+    refractory_until = np.array([0, 0, 0.002, 0, 0])
+    spike_space = np.zeros(5, dtype=int)
+    num_spikes = np.zeros(1, dtype=int)
+    namespace = {'_array_v': np.array([0, 2, 2, 2, 0.5]),
+                 '_array_refractory_until': refractory_until,
+                 '_array_refractory': np.array([0.001, 0.001, 0.001, 0.002,
+                                                0.001]),
+                 '_spikes_space': spike_space,
+                 '_refractory_space': np.zeros(5),
+                 '_refractory_until_space': np.zeros(5),
+                 '_array_num_spikes': num_spikes,
+                 '_indices': np.arange(5)}
+    # the refractory times are copied into scratch space, not indexed
+    assert not '[_spikes_space' in code
+    codeobj.compile(namespace)
+    codeobj(t=0.001)
+    # neuron 2 is refractory
+    assert num_spikes[0] == 2
+    assert_equal(spike_space[:2], [1, 3])
+    assert_allclose(refractory_until, [0, 0.002, 0.002, 0.003, 0])
+    # all neurons above threshold are now refractory
+    codeobj(t=0.0015)
+    assert num_spikes[0] == 0
+    codeobj(t=0.002)
+    assert num_spikes[0] == 2
+    assert_equal(spike_space[:2], [1, 2])
+    assert_allclose(refractory_until, [0, 0.003, 0.003, 0.003, 0])
+
+    # The C++ template can only be checked as a string
+    language = CPPLanguage()
+    innercode = translate(abstract_code, specifiers, np.float64, language)
+    code = language.apply_template(innercode, language.template_threshold())
+    assert ('_array_refractory_until[_neuron_idx] = t + '
+            '_array_refractory[_neuron_idx];') in code['%MAIN%']
+    assert 'const bool _cond' in code['%MAIN%']
+
+
+if __name__ == '__main__':
+    test_scalar_parameters()
+    test_mixed_precision()
+    test_active_flag()
+    test_active_flag_auto()
+    test_threshold_template()
@@ -0,0 +1,71 @@
+import numpy as np
+from numpy.testing import assert_equal
+from nose.tools import assert_raises
+
+from brian2 import (PoissonGroup, Subgroup, SpikeMonitor, Network, Hz, ms,
+                    Clock)
+from brian2.core.spikesource import SpikeSource
+
+
+class FakeSpikeSource(SpikeSource):
+    def __init__(self, N):
+        self.init_spike_buffer(N)
+
+    def __len__(self):
+        return len(self.spike_space)
+
+
+def test_spike_buffer():
+    '''
+    Test the preallocated spike buffer of `SpikeSource`.
+    '''
+    source = FakeSpikeSource(10)
+    assert len(source.spikes) == 0
+    space = source.spike_space
+    source.set_spikes_from_condition(np.arange(10) % 3 == 0)
+    assert_equal(source.spikes, [0, 3, 6, 9])
+    # The spikes are a read-only view on the buffer
+    assert source.spikes.base is space
+    assert source.spike_space is space
+    def write_spikes():
+        source.spikes[0] = 1
+    assert_raises((ValueError, RuntimeError), write_spikes)
+    # The view is re-used if the number of spikes does not change
+    spikes = source.spikes
+    condition = np.zeros(10, dtype=bool)
+    condition[[1, 2, 5, 8]] = True
+    source.set_spikes_from_condition(condition)
+    assert source.spikes is spikes
+    assert_equal(spikes, [1, 2, 5, 8])
+    source.set_spikes_from_condition(np.arange(10) % 3 == 1)
+    assert_equal(source.spikes, [1, 4, 7])
+    # Setting the spikes copies them into the buffer
+    source.spikes = np.array([2, 5])
+    assert_equal(source.spikes, [2, 5])
+    assert source.spike_count[0] == 2
+    source.set_spikes_from_condition(np.zeros(10, dtype=bool))
+    assert len(source.spikes) == 0
+
+
+def test_subgroup_spikes():
+    '''
+    Test that `Subgroup` and `SpikeMonitor` work with the spike buffers.
+    '''
+    clock = Clock(dt=0.1*ms)
+    G = PoissonGroup(100, rates=np.linspace(0, 1000, 100)*Hz, when=clock)
+    subgroup = Subgroup(G, 20, 50)
+    M = SpikeMonitor(G)
+    M_sub = SpikeMonitor(subgroup)
+    net = Network(G, subgroup, M, M_sub)
+    net.run(50*ms)
+    assert M.num_spikes > 0
+    # The subgroup has recorded the same spikes (shifted)
+    in_subgroup = (M.i >= 20) & (M.i < 50)
+    assert_equal(M_sub.i, M.i[in_subgroup] - 20)
+    assert_equal(M_sub.t_, M.t_[in_subgroup])
+    assert_equal(M_sub.count, M.count[20:50])
+
+
+if __name__ == '__main__':
+    test_spike_buffer()
+    test_subgroup_spikes()
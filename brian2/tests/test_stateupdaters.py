@@ -1,7 +1,23 @@
+import re
+
 from nose.tools import assert_raises
+from numpy.testing import assert_allclose
+import numpy as np
 
+from brian2.units.stdunits import ms
+from brian2.codegen.specifiers import ArrayVariable, Value, Index
+from brian2.codegen.translation import translate
+from brian2.codegen.languages import CPPLanguage
+from brian2.utils.stringtools import get_identifiers
 from brian2.equations.equations import Equations
-from brian2.stateupdaters.integration import ExplicitStateUpdater, euler, rk2, rk4
+from brian2.stateupdaters.integration import (ExplicitStateUpdater, euler,
+                                              rk2, rk4, abstract_code_cache)
+from brian2.stateupdaters.exact import linear, LinearStateUpdater
+from brian2.stateupdaters.exponential_euler import exponential_euler
+from brian2.stateupdaters.stochastic import (NoiseBuffer, euler_maruyama,
+                                             milstein)
+from brian2.stateupdaters.automatic import (auto, estimate_stiffness,
+                                            estimate_cost)
 
 def test_explicit_stateupdater_parsing():
     '''
@@ -42,10 +58,202 @@ def test_integrator_code():
         assert code_lines[-1] == 'v = _v'
 
 
+def test_abstract_code_cache():
+    '''
+    Check that the abstract code is cached and does not depend on the
+    object identity of the equations.
+    '''
+    eqs = Equations('''dv/dt = (w - v) / (10 * ms) : 1
+                       dw/dt = -w / (5 * ms) : 1''')
+    code = rk4(eqs)
+    hits = abstract_code_cache.hits
+    assert rk4(eqs) == code
+    assert rk4(Equations('''dv/dt = (w - v) / (10 * ms) : 1
+                             dw/dt = -w / (5 * ms) : 1''')) == code
+    assert abstract_code_cache.hits == hits + 2
+    # Different state updaters or equations do not share cache entries
+    assert rk2(eqs) != code
+    assert rk4(Equations('''dv/dt = (w - v) / (10 * ms) : 1
+                             dw/dt = -w / (6 * ms) : 1''')) != code
+    assert abstract_code_cache.hits == hits + 2
+
+
+def test_linear_stateupdater():
+    '''
+    Check the code and the propagator values of the linear state updater.
+    '''
+    tau = 10*ms
+    eqs = Equations('''dv/dt = (ge - v) / tau : 1
+                       dge/dt = -ge / (5*ms) : 1''')
+    assert linear.can_integrate(eqs)
+    code_lines = linear(eqs).split('\n')
+    # Variables are sorted (ge, v), ge does not depend on v
+    assert code_lines == ['_ge = _A_0_0*ge + _c_0',
+                          '_v = _A_1_0*ge + _A_1_1*v + _c_1',
+                          'ge = _ge',
+                          'v = _v']
+    dt = 0.1e-3
+    namespace = linear.get_namespace(eqs, dt)
+    assert_allclose(namespace['_A_0_0'], np.exp(-dt / 5e-3))
+    assert_allclose(namespace['_A_1_1'], np.exp(-dt / float(tau)))
+    assert_allclose(namespace['_A_0_1'], 0)
+    assert_allclose(namespace['_c_1'], 0)
+    # Compare to the analytical solution with ge(0) = 1, v(0) = 0
+    a, b = 1 / float(tau), 1 / 5e-3
+    v_exact = a / (a - b) * (np.exp(-b * dt) - np.exp(-a * dt))
+    assert_allclose(namespace['_A_1_0'], v_exact)
+
+    # A constant term
+    eqs = Equations('dv/dt = (1 - v) / tau : 1')
+    namespace = linear.get_namespace(eqs, dt)
+    assert_allclose(namespace['_c_0'], 1 - np.exp(-dt / float(tau)))
+
+    # Non-linear equations and parameters use the fallback
+    for eqs in [Equations('dv/dt = -v**2 / tau : 1'),
+                Equations('''dv/dt = -v / tau_v : 1
+                             tau_v : second''')]:
+        assert not linear.can_integrate(eqs)
+        assert linear(eqs) == euler(eqs)
+        assert linear.get_namespace(eqs, dt) == {}
+    assert LinearStateUpdater(fallback=rk2)(eqs) == rk2(eqs)
+    assert len(repr(linear))
+
+
+def test_exponential_euler():
+    '''
+    Check the code of the exponential Euler state updater and its accuracy for
+    a simple conditionally linear system.
+    '''
+    tau = 10*ms
+    eqs = Equations('''dv/dt = (m - v) / tau : 1
+                       dm/dt = (1 - m) * v / tau - m / tau : 1''')
+    assert exponential_euler.can_integrate(eqs)
+    code = exponential_euler(eqs)
+    code_lines = code.split('\n')
+    assert len(code_lines) == 8
+    assert code_lines[-2:] == ['m = _m', 'v = _v']
+
+    # The step is exact for constant A and B
+    dt = 0.5e-3
+    namespace = {'v': 1., 'm': 0., 'tau': float(tau), 'dt': dt}
+    namespace.update(exponential_euler.get_namespace(eqs, dt))
+    exec code in namespace
+    assert_allclose(namespace['v'], np.exp(-dt / float(tau)))
+    assert_allclose(namespace['m'], 0.5 * (1 - np.exp(-2 * dt / float(tau))))
+
+    # A can be zero at runtime, e.g. during the refractory period for
+    # equations with the (active) flag: this is a forward Euler step
+    eqs = Equations('''dv/dt = active*(2 - v) / tau : 1
+                       active : 1''')
+    namespace = {'v': np.zeros(2), 'active': np.array([0., 1.]),
+                 'tau': float(tau), 'dt': dt}
+    namespace.update(exponential_euler.get_namespace(eqs, dt))
+    exec exponential_euler(eqs) in namespace
+    assert_allclose(namespace['v'], [0, 2 * (1 - np.exp(-dt / float(tau)))])
+
+    # The code can be compiled for C++, i.e. it only uses C functions
+    eqs = Equations('''dv/dt = (m - v) / tau : 1
+                       dm/dt = (1 - m) * v / tau - m / tau : 1''')
+    specifiers = {'v': ArrayVariable('_array_v', '_neuron_idx', np.float64),
+                  'm': ArrayVariable('_array_m', '_neuron_idx', np.float64),
+                  'tau': Value(np.float64),
+                  'dt': Value(np.float64),
+                  '_neuron_idx': Index(all=True)}
+    code = translate(exponential_euler(eqs), specifiers, np.float64,
+                     CPPLanguage())['%CODE%']
+    declared = set(re.findall(r'double (\w+)', code))
+    allowed = (set(specifiers) | declared | set(['_ptr_array_v', '_ptr_array_m',
+                                                 'const', 'double', 'pow',
+                                                 'expm1']))
+    assert set(get_identifiers(code)) <= allowed
+
+    # Non-linearity in a variable itself uses the fallback
+    eqs = Equations('dv/dt = -v**2 / tau : 1')
+    assert not exponential_euler.can_integrate(eqs)
+    assert exponential_euler(eqs) == euler(eqs)
+
+
+def test_stochastic_stateupdaters():
+    '''
+    Check the code of the stochastic state updaters and the noise buffer.
+    '''
+    tau = 10*ms
+    sigma = 0.5
+    additive = Equations('dv/dt = -v / tau + sigma * xi / tau**0.5 : 1')
+    multiplicative = Equations('dv/dt = -v / tau + sigma * v * xi / tau**0.5 : 1')
+    assert additive.is_stochastic and additive.stochastic_variable == 'v'
+    for eqs in [additive, multiplicative]:
+        code_lines = euler_maruyama(eqs).split('\n')
+        assert len(code_lines) == 2
+        assert '_xi' in code_lines[0] and code_lines[-1] == 'v = _v'
+    # The Milstein correction only exists for multiplicative noise
+    assert milstein(additive) == euler_maruyama(additive)
+    assert milstein(multiplicative) != euler_maruyama(multiplicative)
+    assert '_xi**2' in milstein(multiplicative)
+
+    # Zero noise and v=0 in the multiplicative case leave the variable at 0
+    dt = 0.1e-3
+    namespace = {'v': 0., 'tau': float(tau), 'sigma': sigma, 'dt': dt,
+                 '_xi': 1.}
+    exec milstein(multiplicative) in namespace
+    assert namespace['v'] == 0
+
+    # Deterministic equations use the fallback
+    eqs = Equations('dv/dt = -v / tau : 1')
+    assert not eqs.is_stochastic and eqs.stochastic_variable is None
+    assert euler_maruyama(eqs) == euler(eqs)
+
+    # The noise buffer returns views into blocks for several time steps
+    buffer = NoiseBuffer(10, size=35)
+    assert buffer.steps == 3
+    values = [buffer.next() for _ in xrange(6)]
+    assert all(v.shape == (10, ) for v in values)
+    assert values[0].base is values[2].base
+    assert values[0].base is not values[3].base
+    assert len(set(tuple(v) for v in values)) == 6
+    # At least one time step is always drawn
+    assert NoiseBuffer(100, size=10).steps == 1
+
+
+def test_auto_stateupdater():
+    '''
+    Check the automatic selection of the integration method.
+    '''
+    tau = 10*ms
+    sigma = 0.5
+    I = 1
+    dt = 0.1e-3
+    eqs = Equations('dv/dt = -v / tau : 1')
+    assert auto.select(eqs, dt) is linear
+    assert_allclose(estimate_stiffness(eqs), 100)
+    eqs = Equations('''dv/dt = (m - v) / tau : 1
+                       dm/dt = (1 - m) * v / tau - m / tau : 1''')
+    assert auto.select(eqs, dt) is exponential_euler
+    eqs = Equations('dv/dt = -v / tau + sigma * xi / tau**0.5 : 1')
+    assert auto.select(eqs, dt) is euler_maruyama
+    eqs = Equations('dv/dt = -v / tau + sigma * v * xi / tau**0.5 : 1')
+    assert auto.select(eqs, dt) is milstein
+    # Non-linear equations, rk2 if not stiff with respect to dt
+    eqs = Equations('dv/dt = (I - v**3) / tau : 1')
+    assert auto.select(eqs, dt) is rk2
+    assert auto.select(eqs) is rk4
+    eqs = Equations('dv/dt = (I - 1e4*v - v**3) / tau : 1')
+    assert auto.select(eqs, dt) is rk4
+    assert auto(eqs) == rk4(eqs)
+
+    assert estimate_cost('_v = v + dt*v\nv = _v') == 2
+    assert len(repr(auto))
+
+
 if __name__ == '__main__':
     test_explicit_stateupdater_parsing()
     test_str_repr()
     test_integrator_code()
+    test_abstract_code_cache()
+    test_linear_stateupdater()
+    test_exponential_euler()
+    test_stochastic_stateupdaters()
+    test_auto_stateupdater()
 
 
     
@@ -20,7 +20,8 @@ from brian2.units.fundamentalunits import (UFUNCS_DIMENSIONLESS,
                                            get_unit, get_unit_fast,
                                            get_or_create_dimension,
                                            DIMENSIONLESS,
-                                           fail_for_dimension_mismatch)
+                                           fail_for_dimension_mismatch,
+                                           UnitRegistry)
 from brian2.units.allunits import *
 from brian2.units.stdunits import ms, mV, kHz, nS, cm
 
@@ -811,6 +812,36 @@ def test_get_unit():
         assert_quantity(get_unit_fast(value), 1, volt)
 
 
+def test_deferred_units():
+    '''
+    Test units that are only created on demand.
+    '''
+    import brian2.units.allunits as allunits
+    # Units are created on attribute access and created only once
+    assert allunits.Gkatal3 is allunits.Gkatal3
+    assert allunits.Gkatal3.name == 'Gkatal3'
+    assert_quantity(allunits.Gkatal3, 1e27, katal ** 3)
+    assert_raises(AttributeError, lambda: allunits.nonexisting_unit)
+
+    # Units in a registry are only created when needed
+    created = []
+    def create_unit():
+        created.append(mvolt)
+        return mvolt
+    registry = UnitRegistry()
+    registry.add(volt)
+    registry.add_deferred(volt.dim, create_unit)
+    registry.add_deferred(second.dim, lambda: msecond)
+    assert len(created) == 0
+    assert registry[3 * mV] is mvolt
+    assert registry[3 * volt] is volt
+    assert len(created) == 1
+    assert len(registry.units) == 2
+    registry.create_deferred_units()
+    assert registry[3 * ms] is msecond
+    assert len(registry.units) == 3
+
+
 def test_switching_off_unit_checks():
     '''
     Check switching off unit checks (used for external functions).
@@ -865,5 +896,6 @@ if __name__ == '__main__':
     test_list()
     test_check_units()
     test_get_unit()
+    test_deferred_units()
     test_switching_off_unit_checks()
     test_fail_for_dimension_mismatch()
\ No newline at end of file
@@ -1,4 +1,8 @@
+from numpy.testing import assert_raises
+
 from brian2.utils.environment import running_from_ipython
+from brian2.utils.caching import LRUCache
+from brian2.utils.parsing import parse_to_sympy, sympy_expression_cache
 
 def test_environment():
     '''
@@ -20,7 +24,55 @@ def test_environment():
         del __builtin__.__IPYTHON__
 
 
+def test_lru_cache():
+    '''
+    Test the bounded cache.
+    '''
+    cache = LRUCache(maxsize=3)
+    for key in ['a', 'b', 'c']:
+        cache[key] = key.upper()
+    assert cache['a'] == 'A'
+    # 'b' is the least recently used entry now
+    cache['d'] = 'D'
+    assert len(cache) == 3
+    assert not 'b' in cache
+    assert_raises(KeyError, lambda: cache['b'])
+    assert cache['c'] == 'C' and cache['d'] == 'D'
+    assert cache.hits == 3 and cache.misses == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0 and cache.misses == 0
+
+
+def test_parse_to_sympy_cache():
+    '''
+    Test the cache for sympy expressions.
+    '''
+    import sympy
+    expr = 'x_cache_test + 2*y_cache_test'
+    misses = sympy_expression_cache.misses
+    s_expr = parse_to_sympy(expr)
+    assert sympy_expression_cache.misses == misses + 1
+    hits = sympy_expression_cache.hits
+    assert parse_to_sympy(expr) is s_expr
+    assert sympy_expression_cache.hits == hits + 1
+    # A different local dictionary leads to a different result
+    x = sympy.Function('x_cache_test')
+    other_expr = parse_to_sympy('x_cache_test(y_cache_test)',
+                                local_dict={'x_cache_test': x})
+    assert other_expr == x(sympy.Symbol('y_cache_test'))
+    # Unhashable objects in the local dictionary disable caching
+    hits, misses = sympy_expression_cache.hits, sympy_expression_cache.misses
+    parse_to_sympy('y_cache_test', local_dict={'z': []})
+    assert sympy_expression_cache.hits == hits
+    assert sympy_expression_cache.misses == misses
+    # Caching can be switched off
+    assert parse_to_sympy(expr, use_cache=False) == s_expr
+    assert sympy_expression_cache.hits == hits
+
+
 if __name__ == '__main__':
     test_environment()
+    test_lru_cache()
+    test_parse_to_sympy_cache()
 
     
\ No newline at end of file
@@ -6,6 +6,10 @@ Instead edit the template:
 
     dev/tools/static_codegen/units_template.py
 '''
+import sys
+import types
+from functools import partial
+
 from .fundamentalunits import (Unit, get_or_create_dimension,
                                standard_unit_register,
                                additional_unit_register)
@@ -2074,3338 +2078,6 @@ sievert = Unit.create(get_or_create_dimension(m=2, s=-2), "sievert", "Sv")
 katal = Unit.create(get_or_create_dimension(s=-1, mol=1), "katal", "kat")
 
 
-######### SCALED BASE UNITS ###########
-ametre = Unit.create_scaled_unit(metre, "a")
-cmetre = Unit.create_scaled_unit(metre, "c")
-Zmetre = Unit.create_scaled_unit(metre, "Z")
-Pmetre = Unit.create_scaled_unit(metre, "P")
-dmetre = Unit.create_scaled_unit(metre, "d")
-Gmetre = Unit.create_scaled_unit(metre, "G")
-fmetre = Unit.create_scaled_unit(metre, "f")
-hmetre = Unit.create_scaled_unit(metre, "h")
-dametre = Unit.create_scaled_unit(metre, "da")
-mmetre = Unit.create_scaled_unit(metre, "m")
-nmetre = Unit.create_scaled_unit(metre, "n")
-pmetre = Unit.create_scaled_unit(metre, "p")
-umetre = Unit.create_scaled_unit(metre, "u")
-Tmetre = Unit.create_scaled_unit(metre, "T")
-ymetre = Unit.create_scaled_unit(metre, "y")
-Emetre = Unit.create_scaled_unit(metre, "E")
-zmetre = Unit.create_scaled_unit(metre, "z")
-Mmetre = Unit.create_scaled_unit(metre, "M")
-kmetre = Unit.create_scaled_unit(metre, "k")
-Ymetre = Unit.create_scaled_unit(metre, "Y")
-ameter = Unit.create_scaled_unit(meter, "a")
-cmeter = Unit.create_scaled_unit(meter, "c")
-Zmeter = Unit.create_scaled_unit(meter, "Z")
-Pmeter = Unit.create_scaled_unit(meter, "P")
-dmeter = Unit.create_scaled_unit(meter, "d")
-Gmeter = Unit.create_scaled_unit(meter, "G")
-fmeter = Unit.create_scaled_unit(meter, "f")
-hmeter = Unit.create_scaled_unit(meter, "h")
-dameter = Unit.create_scaled_unit(meter, "da")
-mmeter = Unit.create_scaled_unit(meter, "m")
-nmeter = Unit.create_scaled_unit(meter, "n")
-pmeter = Unit.create_scaled_unit(meter, "p")
-umeter = Unit.create_scaled_unit(meter, "u")
-Tmeter = Unit.create_scaled_unit(meter, "T")
-ymeter = Unit.create_scaled_unit(meter, "y")
-Emeter = Unit.create_scaled_unit(meter, "E")
-zmeter = Unit.create_scaled_unit(meter, "z")
-Mmeter = Unit.create_scaled_unit(meter, "M")
-kmeter = Unit.create_scaled_unit(meter, "k")
-Ymeter = Unit.create_scaled_unit(meter, "Y")
-agram = Unit.create_scaled_unit(gram, "a")
-cgram = Unit.create_scaled_unit(gram, "c")
-Zgram = Unit.create_scaled_unit(gram, "Z")
-Pgram = Unit.create_scaled_unit(gram, "P")
-dgram = Unit.create_scaled_unit(gram, "d")
-Ggram = Unit.create_scaled_unit(gram, "G")
-fgram = Unit.create_scaled_unit(gram, "f")
-hgram = Unit.create_scaled_unit(gram, "h")
-dagram = Unit.create_scaled_unit(gram, "da")
-mgram = Unit.create_scaled_unit(gram, "m")
-ngram = Unit.create_scaled_unit(gram, "n")
-pgram = Unit.create_scaled_unit(gram, "p")
-ugram = Unit.create_scaled_unit(gram, "u")
-Tgram = Unit.create_scaled_unit(gram, "T")
-ygram = Unit.create_scaled_unit(gram, "y")
-Egram = Unit.create_scaled_unit(gram, "E")
-zgram = Unit.create_scaled_unit(gram, "z")
-Mgram = Unit.create_scaled_unit(gram, "M")
-kgram = Unit.create_scaled_unit(gram, "k")
-Ygram = Unit.create_scaled_unit(gram, "Y")
-asecond = Unit.create_scaled_unit(second, "a")
-csecond = Unit.create_scaled_unit(second, "c")
-Zsecond = Unit.create_scaled_unit(second, "Z")
-Psecond = Unit.create_scaled_unit(second, "P")
-dsecond = Unit.create_scaled_unit(second, "d")
-Gsecond = Unit.create_scaled_unit(second, "G")
-fsecond = Unit.create_scaled_unit(second, "f")
-hsecond = Unit.create_scaled_unit(second, "h")
-dasecond = Unit.create_scaled_unit(second, "da")
-msecond = Unit.create_scaled_unit(second, "m")
-nsecond = Unit.create_scaled_unit(second, "n")
-psecond = Unit.create_scaled_unit(second, "p")
-usecond = Unit.create_scaled_unit(second, "u")
-Tsecond = Unit.create_scaled_unit(second, "T")
-ysecond = Unit.create_scaled_unit(second, "y")
-Esecond = Unit.create_scaled_unit(second, "E")
-zsecond = Unit.create_scaled_unit(second, "z")
-Msecond = Unit.create_scaled_unit(second, "M")
-ksecond = Unit.create_scaled_unit(second, "k")
-Ysecond = Unit.create_scaled_unit(second, "Y")
-aamp = Unit.create_scaled_unit(amp, "a")
-camp = Unit.create_scaled_unit(amp, "c")
-Zamp = Unit.create_scaled_unit(amp, "Z")
-Pamp = Unit.create_scaled_unit(amp, "P")
-damp = Unit.create_scaled_unit(amp, "d")
-Gamp = Unit.create_scaled_unit(amp, "G")
-famp = Unit.create_scaled_unit(amp, "f")
-hamp = Unit.create_scaled_unit(amp, "h")
-daamp = Unit.create_scaled_unit(amp, "da")
-mamp = Unit.create_scaled_unit(amp, "m")
-namp = Unit.create_scaled_unit(amp, "n")
-pamp = Unit.create_scaled_unit(amp, "p")
-uamp = Unit.create_scaled_unit(amp, "u")
-Tamp = Unit.create_scaled_unit(amp, "T")
-yamp = Unit.create_scaled_unit(amp, "y")
-Eamp = Unit.create_scaled_unit(amp, "E")
-zamp = Unit.create_scaled_unit(amp, "z")
-Mamp = Unit.create_scaled_unit(amp, "M")
-kamp = Unit.create_scaled_unit(amp, "k")
-Yamp = Unit.create_scaled_unit(amp, "Y")
-akelvin = Unit.create_scaled_unit(kelvin, "a")
-ckelvin = Unit.create_scaled_unit(kelvin, "c")
-Zkelvin = Unit.create_scaled_unit(kelvin, "Z")
-Pkelvin = Unit.create_scaled_unit(kelvin, "P")
-dkelvin = Unit.create_scaled_unit(kelvin, "d")
-Gkelvin = Unit.create_scaled_unit(kelvin, "G")
-fkelvin = Unit.create_scaled_unit(kelvin, "f")
-hkelvin = Unit.create_scaled_unit(kelvin, "h")
-dakelvin = Unit.create_scaled_unit(kelvin, "da")
-mkelvin = Unit.create_scaled_unit(kelvin, "m")
-nkelvin = Unit.create_scaled_unit(kelvin, "n")
-pkelvin = Unit.create_scaled_unit(kelvin, "p")
-ukelvin = Unit.create_scaled_unit(kelvin, "u")
-Tkelvin = Unit.create_scaled_unit(kelvin, "T")
-ykelvin = Unit.create_scaled_unit(kelvin, "y")
-Ekelvin = Unit.create_scaled_unit(kelvin, "E")
-zkelvin = Unit.create_scaled_unit(kelvin, "z")
-Mkelvin = Unit.create_scaled_unit(kelvin, "M")
-kkelvin = Unit.create_scaled_unit(kelvin, "k")
-Ykelvin = Unit.create_scaled_unit(kelvin, "Y")
-amole = Unit.create_scaled_unit(mole, "a")
-cmole = Unit.create_scaled_unit(mole, "c")
-Zmole = Unit.create_scaled_unit(mole, "Z")
-Pmole = Unit.create_scaled_unit(mole, "P")
-dmole = Unit.create_scaled_unit(mole, "d")
-Gmole = Unit.create_scaled_unit(mole, "G")
-fmole = Unit.create_scaled_unit(mole, "f")
-hmole = Unit.create_scaled_unit(mole, "h")
-damole = Unit.create_scaled_unit(mole, "da")
-mmole = Unit.create_scaled_unit(mole, "m")
-nmole = Unit.create_scaled_unit(mole, "n")
-pmole = Unit.create_scaled_unit(mole, "p")
-umole = Unit.create_scaled_unit(mole, "u")
-Tmole = Unit.create_scaled_unit(mole, "T")
-ymole = Unit.create_scaled_unit(mole, "y")
-Emole = Unit.create_scaled_unit(mole, "E")
-zmole = Unit.create_scaled_unit(mole, "z")
-Mmole = Unit.create_scaled_unit(mole, "M")
-kmole = Unit.create_scaled_unit(mole, "k")
-Ymole = Unit.create_scaled_unit(mole, "Y")
-acandle = Unit.create_scaled_unit(candle, "a")
-ccandle = Unit.create_scaled_unit(candle, "c")
-Zcandle = Unit.create_scaled_unit(candle, "Z")
-Pcandle = Unit.create_scaled_unit(candle, "P")
-dcandle = Unit.create_scaled_unit(candle, "d")
-Gcandle = Unit.create_scaled_unit(candle, "G")
-fcandle = Unit.create_scaled_unit(candle, "f")
-hcandle = Unit.create_scaled_unit(candle, "h")
-dacandle = Unit.create_scaled_unit(candle, "da")
-mcandle = Unit.create_scaled_unit(candle, "m")
-ncandle = Unit.create_scaled_unit(candle, "n")
-pcandle = Unit.create_scaled_unit(candle, "p")
-ucandle = Unit.create_scaled_unit(candle, "u")
-Tcandle = Unit.create_scaled_unit(candle, "T")
-ycandle = Unit.create_scaled_unit(candle, "y")
-Ecandle = Unit.create_scaled_unit(candle, "E")
-zcandle = Unit.create_scaled_unit(candle, "z")
-Mcandle = Unit.create_scaled_unit(candle, "M")
-kcandle = Unit.create_scaled_unit(candle, "k")
-Ycandle = Unit.create_scaled_unit(candle, "Y")
-agramme = Unit.create_scaled_unit(gramme, "a")
-cgramme = Unit.create_scaled_unit(gramme, "c")
-Zgramme = Unit.create_scaled_unit(gramme, "Z")
-Pgramme = Unit.create_scaled_unit(gramme, "P")
-dgramme = Unit.create_scaled_unit(gramme, "d")
-Ggramme = Unit.create_scaled_unit(gramme, "G")
-fgramme = Unit.create_scaled_unit(gramme, "f")
-hgramme = Unit.create_scaled_unit(gramme, "h")
-dagramme = Unit.create_scaled_unit(gramme, "da")
-mgramme = Unit.create_scaled_unit(gramme, "m")
-ngramme = Unit.create_scaled_unit(gramme, "n")
-pgramme = Unit.create_scaled_unit(gramme, "p")
-ugramme = Unit.create_scaled_unit(gramme, "u")
-Tgramme = Unit.create_scaled_unit(gramme, "T")
-ygramme = Unit.create_scaled_unit(gramme, "y")
-Egramme = Unit.create_scaled_unit(gramme, "E")
-zgramme = Unit.create_scaled_unit(gramme, "z")
-Mgramme = Unit.create_scaled_unit(gramme, "M")
-kgramme = Unit.create_scaled_unit(gramme, "k")
-Ygramme = Unit.create_scaled_unit(gramme, "Y")
-akilogram = Unit.create_scaled_unit(kilogram, "a")
-ckilogram = Unit.create_scaled_unit(kilogram, "c")
-Zkilogram = Unit.create_scaled_unit(kilogram, "Z")
-Pkilogram = Unit.create_scaled_unit(kilogram, "P")
-dkilogram = Unit.create_scaled_unit(kilogram, "d")
-Gkilogram = Unit.create_scaled_unit(kilogram, "G")
-fkilogram = Unit.create_scaled_unit(kilogram, "f")
-hkilogram = Unit.create_scaled_unit(kilogram, "h")
-dakilogram = Unit.create_scaled_unit(kilogram, "da")
-mkilogram = Unit.create_scaled_unit(kilogram, "m")
-nkilogram = Unit.create_scaled_unit(kilogram, "n")
-pkilogram = Unit.create_scaled_unit(kilogram, "p")
-ukilogram = Unit.create_scaled_unit(kilogram, "u")
-Tkilogram = Unit.create_scaled_unit(kilogram, "T")
-ykilogram = Unit.create_scaled_unit(kilogram, "y")
-Ekilogram = Unit.create_scaled_unit(kilogram, "E")
-zkilogram = Unit.create_scaled_unit(kilogram, "z")
-Mkilogram = Unit.create_scaled_unit(kilogram, "M")
-kkilogram = Unit.create_scaled_unit(kilogram, "k")
-Ykilogram = Unit.create_scaled_unit(kilogram, "Y")
-aradian = Unit.create_scaled_unit(radian, "a")
-cradian = Unit.create_scaled_unit(radian, "c")
-Zradian = Unit.create_scaled_unit(radian, "Z")
-Pradian = Unit.create_scaled_unit(radian, "P")
-dradian = Unit.create_scaled_unit(radian, "d")
-Gradian = Unit.create_scaled_unit(radian, "G")
-fradian = Unit.create_scaled_unit(radian, "f")
-hradian = Unit.create_scaled_unit(radian, "h")
-daradian = Unit.create_scaled_unit(radian, "da")
-mradian = Unit.create_scaled_unit(radian, "m")
-nradian = Unit.create_scaled_unit(radian, "n")
-pradian = Unit.create_scaled_unit(radian, "p")
-uradian = Unit.create_scaled_unit(radian, "u")
-Tradian = Unit.create_scaled_unit(radian, "T")
-yradian = Unit.create_scaled_unit(radian, "y")
-Eradian = Unit.create_scaled_unit(radian, "E")
-zradian = Unit.create_scaled_unit(radian, "z")
-Mradian = Unit.create_scaled_unit(radian, "M")
-kradian = Unit.create_scaled_unit(radian, "k")
-Yradian = Unit.create_scaled_unit(radian, "Y")
-asteradian = Unit.create_scaled_unit(steradian, "a")
-csteradian = Unit.create_scaled_unit(steradian, "c")
-Zsteradian = Unit.create_scaled_unit(steradian, "Z")
-Psteradian = Unit.create_scaled_unit(steradian, "P")
-dsteradian = Unit.create_scaled_unit(steradian, "d")
-Gsteradian = Unit.create_scaled_unit(steradian, "G")
-fsteradian = Unit.create_scaled_unit(steradian, "f")
-hsteradian = Unit.create_scaled_unit(steradian, "h")
-dasteradian = Unit.create_scaled_unit(steradian, "da")
-msteradian = Unit.create_scaled_unit(steradian, "m")
-nsteradian = Unit.create_scaled_unit(steradian, "n")
-psteradian = Unit.create_scaled_unit(steradian, "p")
-usteradian = Unit.create_scaled_unit(steradian, "u")
-Tsteradian = Unit.create_scaled_unit(steradian, "T")
-ysteradian = Unit.create_scaled_unit(steradian, "y")
-Esteradian = Unit.create_scaled_unit(steradian, "E")
-zsteradian = Unit.create_scaled_unit(steradian, "z")
-Msteradian = Unit.create_scaled_unit(steradian, "M")
-ksteradian = Unit.create_scaled_unit(steradian, "k")
-Ysteradian = Unit.create_scaled_unit(steradian, "Y")
-ahertz = Unit.create_scaled_unit(hertz, "a")
-chertz = Unit.create_scaled_unit(hertz, "c")
-Zhertz = Unit.create_scaled_unit(hertz, "Z")
-Phertz = Unit.create_scaled_unit(hertz, "P")
-dhertz = Unit.create_scaled_unit(hertz, "d")
-Ghertz = Unit.create_scaled_unit(hertz, "G")
-fhertz = Unit.create_scaled_unit(hertz, "f")
-hhertz = Unit.create_scaled_unit(hertz, "h")
-dahertz = Unit.create_scaled_unit(hertz, "da")
-mhertz = Unit.create_scaled_unit(hertz, "m")
-nhertz = Unit.create_scaled_unit(hertz, "n")
-phertz = Unit.create_scaled_unit(hertz, "p")
-uhertz = Unit.create_scaled_unit(hertz, "u")
-Thertz = Unit.create_scaled_unit(hertz, "T")
-yhertz = Unit.create_scaled_unit(hertz, "y")
-Ehertz = Unit.create_scaled_unit(hertz, "E")
-zhertz = Unit.create_scaled_unit(hertz, "z")
-Mhertz = Unit.create_scaled_unit(hertz, "M")
-khertz = Unit.create_scaled_unit(hertz, "k")
-Yhertz = Unit.create_scaled_unit(hertz, "Y")
-anewton = Unit.create_scaled_unit(newton, "a")
-cnewton = Unit.create_scaled_unit(newton, "c")
-Znewton = Unit.create_scaled_unit(newton, "Z")
-Pnewton = Unit.create_scaled_unit(newton, "P")
-dnewton = Unit.create_scaled_unit(newton, "d")
-Gnewton = Unit.create_scaled_unit(newton, "G")
-fnewton = Unit.create_scaled_unit(newton, "f")
-hnewton = Unit.create_scaled_unit(newton, "h")
-danewton = Unit.create_scaled_unit(newton, "da")
-mnewton = Unit.create_scaled_unit(newton, "m")
-nnewton = Unit.create_scaled_unit(newton, "n")
-pnewton = Unit.create_scaled_unit(newton, "p")
-unewton = Unit.create_scaled_unit(newton, "u")
-Tnewton = Unit.create_scaled_unit(newton, "T")
-ynewton = Unit.create_scaled_unit(newton, "y")
-Enewton = Unit.create_scaled_unit(newton, "E")
-znewton = Unit.create_scaled_unit(newton, "z")
-Mnewton = Unit.create_scaled_unit(newton, "M")
-knewton = Unit.create_scaled_unit(newton, "k")
-Ynewton = Unit.create_scaled_unit(newton, "Y")
-apascal = Unit.create_scaled_unit(pascal, "a")
-cpascal = Unit.create_scaled_unit(pascal, "c")
-Zpascal = Unit.create_scaled_unit(pascal, "Z")
-Ppascal = Unit.create_scaled_unit(pascal, "P")
-dpascal = Unit.create_scaled_unit(pascal, "d")
-Gpascal = Unit.create_scaled_unit(pascal, "G")
-fpascal = Unit.create_scaled_unit(pascal, "f")
-hpascal = Unit.create_scaled_unit(pascal, "h")
-dapascal = Unit.create_scaled_unit(pascal, "da")
-mpascal = Unit.create_scaled_unit(pascal, "m")
-npascal = Unit.create_scaled_unit(pascal, "n")
-ppascal = Unit.create_scaled_unit(pascal, "p")
-upascal = Unit.create_scaled_unit(pascal, "u")
-Tpascal = Unit.create_scaled_unit(pascal, "T")
-ypascal = Unit.create_scaled_unit(pascal, "y")
-Epascal = Unit.create_scaled_unit(pascal, "E")
-zpascal = Unit.create_scaled_unit(pascal, "z")
-Mpascal = Unit.create_scaled_unit(pascal, "M")
-kpascal = Unit.create_scaled_unit(pascal, "k")
-Ypascal = Unit.create_scaled_unit(pascal, "Y")
-ajoule = Unit.create_scaled_unit(joule, "a")
-cjoule = Unit.create_scaled_unit(joule, "c")
-Zjoule = Unit.create_scaled_unit(joule, "Z")
-Pjoule = Unit.create_scaled_unit(joule, "P")
-djoule = Unit.create_scaled_unit(joule, "d")
-Gjoule = Unit.create_scaled_unit(joule, "G")
-fjoule = Unit.create_scaled_unit(joule, "f")
-hjoule = Unit.create_scaled_unit(joule, "h")
-dajoule = Unit.create_scaled_unit(joule, "da")
-mjoule = Unit.create_scaled_unit(joule, "m")
-njoule = Unit.create_scaled_unit(joule, "n")
-pjoule = Unit.create_scaled_unit(joule, "p")
-ujoule = Unit.create_scaled_unit(joule, "u")
-Tjoule = Unit.create_scaled_unit(joule, "T")
-yjoule = Unit.create_scaled_unit(joule, "y")
-Ejoule = Unit.create_scaled_unit(joule, "E")
-zjoule = Unit.create_scaled_unit(joule, "z")
-Mjoule = Unit.create_scaled_unit(joule, "M")
-kjoule = Unit.create_scaled_unit(joule, "k")
-Yjoule = Unit.create_scaled_unit(joule, "Y")
-awatt = Unit.create_scaled_unit(watt, "a")
-cwatt = Unit.create_scaled_unit(watt, "c")
-Zwatt = Unit.create_scaled_unit(watt, "Z")
-Pwatt = Unit.create_scaled_unit(watt, "P")
-dwatt = Unit.create_scaled_unit(watt, "d")
-Gwatt = Unit.create_scaled_unit(watt, "G")
-fwatt = Unit.create_scaled_unit(watt, "f")
-hwatt = Unit.create_scaled_unit(watt, "h")
-dawatt = Unit.create_scaled_unit(watt, "da")
-mwatt = Unit.create_scaled_unit(watt, "m")
-nwatt = Unit.create_scaled_unit(watt, "n")
-pwatt = Unit.create_scaled_unit(watt, "p")
-uwatt = Unit.create_scaled_unit(watt, "u")
-Twatt = Unit.create_scaled_unit(watt, "T")
-ywatt = Unit.create_scaled_unit(watt, "y")
-Ewatt = Unit.create_scaled_unit(watt, "E")
-zwatt = Unit.create_scaled_unit(watt, "z")
-Mwatt = Unit.create_scaled_unit(watt, "M")
-kwatt = Unit.create_scaled_unit(watt, "k")
-Ywatt = Unit.create_scaled_unit(watt, "Y")
-acoulomb = Unit.create_scaled_unit(coulomb, "a")
-ccoulomb = Unit.create_scaled_unit(coulomb, "c")
-Zcoulomb = Unit.create_scaled_unit(coulomb, "Z")
-Pcoulomb = Unit.create_scaled_unit(coulomb, "P")
-dcoulomb = Unit.create_scaled_unit(coulomb, "d")
-Gcoulomb = Unit.create_scaled_unit(coulomb, "G")
-fcoulomb = Unit.create_scaled_unit(coulomb, "f")
-hcoulomb = Unit.create_scaled_unit(coulomb, "h")
-dacoulomb = Unit.create_scaled_unit(coulomb, "da")
-mcoulomb = Unit.create_scaled_unit(coulomb, "m")
-ncoulomb = Unit.create_scaled_unit(coulomb, "n")
-pcoulomb = Unit.create_scaled_unit(coulomb, "p")
-ucoulomb = Unit.create_scaled_unit(coulomb, "u")
-Tcoulomb = Unit.create_scaled_unit(coulomb, "T")
-ycoulomb = Unit.create_scaled_unit(coulomb, "y")
-Ecoulomb = Unit.create_scaled_unit(coulomb, "E")
-zcoulomb = Unit.create_scaled_unit(coulomb, "z")
-Mcoulomb = Unit.create_scaled_unit(coulomb, "M")
-kcoulomb = Unit.create_scaled_unit(coulomb, "k")
-Ycoulomb = Unit.create_scaled_unit(coulomb, "Y")
-avolt = Unit.create_scaled_unit(volt, "a")
-cvolt = Unit.create_scaled_unit(volt, "c")
-Zvolt = Unit.create_scaled_unit(volt, "Z")
-Pvolt = Unit.create_scaled_unit(volt, "P")
-dvolt = Unit.create_scaled_unit(volt, "d")
-Gvolt = Unit.create_scaled_unit(volt, "G")
-fvolt = Unit.create_scaled_unit(volt, "f")
-hvolt = Unit.create_scaled_unit(volt, "h")
-davolt = Unit.create_scaled_unit(volt, "da")
-mvolt = Unit.create_scaled_unit(volt, "m")
-nvolt = Unit.create_scaled_unit(volt, "n")
-pvolt = Unit.create_scaled_unit(volt, "p")
-uvolt = Unit.create_scaled_unit(volt, "u")
-Tvolt = Unit.create_scaled_unit(volt, "T")
-yvolt = Unit.create_scaled_unit(volt, "y")
-Evolt = Unit.create_scaled_unit(volt, "E")
-zvolt = Unit.create_scaled_unit(volt, "z")
-Mvolt = Unit.create_scaled_unit(volt, "M")
-kvolt = Unit.create_scaled_unit(volt, "k")
-Yvolt = Unit.create_scaled_unit(volt, "Y")
-afarad = Unit.create_scaled_unit(farad, "a")
-cfarad = Unit.create_scaled_unit(farad, "c")
-Zfarad = Unit.create_scaled_unit(farad, "Z")
-Pfarad = Unit.create_scaled_unit(farad, "P")
-dfarad = Unit.create_scaled_unit(farad, "d")
-Gfarad = Unit.create_scaled_unit(farad, "G")
-ffarad = Unit.create_scaled_unit(farad, "f")
-hfarad = Unit.create_scaled_unit(farad, "h")
-dafarad = Unit.create_scaled_unit(farad, "da")
-mfarad = Unit.create_scaled_unit(farad, "m")
-nfarad = Unit.create_scaled_unit(farad, "n")
-pfarad = Unit.create_scaled_unit(farad, "p")
-ufarad = Unit.create_scaled_unit(farad, "u")
-Tfarad = Unit.create_scaled_unit(farad, "T")
-yfarad = Unit.create_scaled_unit(farad, "y")
-Efarad = Unit.create_scaled_unit(farad, "E")
-zfarad = Unit.create_scaled_unit(farad, "z")
-Mfarad = Unit.create_scaled_unit(farad, "M")
-kfarad = Unit.create_scaled_unit(farad, "k")
-Yfarad = Unit.create_scaled_unit(farad, "Y")
-aohm = Unit.create_scaled_unit(ohm, "a")
-cohm = Unit.create_scaled_unit(ohm, "c")
-Zohm = Unit.create_scaled_unit(ohm, "Z")
-Pohm = Unit.create_scaled_unit(ohm, "P")
-dohm = Unit.create_scaled_unit(ohm, "d")
-Gohm = Unit.create_scaled_unit(ohm, "G")
-fohm = Unit.create_scaled_unit(ohm, "f")
-hohm = Unit.create_scaled_unit(ohm, "h")
-daohm = Unit.create_scaled_unit(ohm, "da")
-mohm = Unit.create_scaled_unit(ohm, "m")
-nohm = Unit.create_scaled_unit(ohm, "n")
-pohm = Unit.create_scaled_unit(ohm, "p")
-uohm = Unit.create_scaled_unit(ohm, "u")
-Tohm = Unit.create_scaled_unit(ohm, "T")
-yohm = Unit.create_scaled_unit(ohm, "y")
-Eohm = Unit.create_scaled_unit(ohm, "E")
-zohm = Unit.create_scaled_unit(ohm, "z")
-Mohm = Unit.create_scaled_unit(ohm, "M")
-kohm = Unit.create_scaled_unit(ohm, "k")
-Yohm = Unit.create_scaled_unit(ohm, "Y")
-asiemens = Unit.create_scaled_unit(siemens, "a")
-csiemens = Unit.create_scaled_unit(siemens, "c")
-Zsiemens = Unit.create_scaled_unit(siemens, "Z")
-Psiemens = Unit.create_scaled_unit(siemens, "P")
-dsiemens = Unit.create_scaled_unit(siemens, "d")
-Gsiemens = Unit.create_scaled_unit(siemens, "G")
-fsiemens = Unit.create_scaled_unit(siemens, "f")
-hsiemens = Unit.create_scaled_unit(siemens, "h")
-dasiemens = Unit.create_scaled_unit(siemens, "da")
-msiemens = Unit.create_scaled_unit(siemens, "m")
-nsiemens = Unit.create_scaled_unit(siemens, "n")
-psiemens = Unit.create_scaled_unit(siemens, "p")
-usiemens = Unit.create_scaled_unit(siemens, "u")
-Tsiemens = Unit.create_scaled_unit(siemens, "T")
-ysiemens = Unit.create_scaled_unit(siemens, "y")
-Esiemens = Unit.create_scaled_unit(siemens, "E")
-zsiemens = Unit.create_scaled_unit(siemens, "z")
-Msiemens = Unit.create_scaled_unit(siemens, "M")
-ksiemens = Unit.create_scaled_unit(siemens, "k")
-Ysiemens = Unit.create_scaled_unit(siemens, "Y")
-aweber = Unit.create_scaled_unit(weber, "a")
-cweber = Unit.create_scaled_unit(weber, "c")
-Zweber = Unit.create_scaled_unit(weber, "Z")
-Pweber = Unit.create_scaled_unit(weber, "P")
-dweber = Unit.create_scaled_unit(weber, "d")
-Gweber = Unit.create_scaled_unit(weber, "G")
-fweber = Unit.create_scaled_unit(weber, "f")
-hweber = Unit.create_scaled_unit(weber, "h")
-daweber = Unit.create_scaled_unit(weber, "da")
-mweber = Unit.create_scaled_unit(weber, "m")
-nweber = Unit.create_scaled_unit(weber, "n")
-pweber = Unit.create_scaled_unit(weber, "p")
-uweber = Unit.create_scaled_unit(weber, "u")
-Tweber = Unit.create_scaled_unit(weber, "T")
-yweber = Unit.create_scaled_unit(weber, "y")
-Eweber = Unit.create_scaled_unit(weber, "E")
-zweber = Unit.create_scaled_unit(weber, "z")
-Mweber = Unit.create_scaled_unit(weber, "M")
-kweber = Unit.create_scaled_unit(weber, "k")
-Yweber = Unit.create_scaled_unit(weber, "Y")
-atesla = Unit.create_scaled_unit(tesla, "a")
-ctesla = Unit.create_scaled_unit(tesla, "c")
-Ztesla = Unit.create_scaled_unit(tesla, "Z")
-Ptesla = Unit.create_scaled_unit(tesla, "P")
-dtesla = Unit.create_scaled_unit(tesla, "d")
-Gtesla = Unit.create_scaled_unit(tesla, "G")
-ftesla = Unit.create_scaled_unit(tesla, "f")
-htesla = Unit.create_scaled_unit(tesla, "h")
-datesla = Unit.create_scaled_unit(tesla, "da")
-mtesla = Unit.create_scaled_unit(tesla, "m")
-ntesla = Unit.create_scaled_unit(tesla, "n")
-ptesla = Unit.create_scaled_unit(tesla, "p")
-utesla = Unit.create_scaled_unit(tesla, "u")
-Ttesla = Unit.create_scaled_unit(tesla, "T")
-ytesla = Unit.create_scaled_unit(tesla, "y")
-Etesla = Unit.create_scaled_unit(tesla, "E")
-ztesla = Unit.create_scaled_unit(tesla, "z")
-Mtesla = Unit.create_scaled_unit(tesla, "M")
-ktesla = Unit.create_scaled_unit(tesla, "k")
-Ytesla = Unit.create_scaled_unit(tesla, "Y")
-ahenry = Unit.create_scaled_unit(henry, "a")
-chenry = Unit.create_scaled_unit(henry, "c")
-Zhenry = Unit.create_scaled_unit(henry, "Z")
-Phenry = Unit.create_scaled_unit(henry, "P")
-dhenry = Unit.create_scaled_unit(henry, "d")
-Ghenry = Unit.create_scaled_unit(henry, "G")
-fhenry = Unit.create_scaled_unit(henry, "f")
-hhenry = Unit.create_scaled_unit(henry, "h")
-dahenry = Unit.create_scaled_unit(henry, "da")
-mhenry = Unit.create_scaled_unit(henry, "m")
-nhenry = Unit.create_scaled_unit(henry, "n")
-phenry = Unit.create_scaled_unit(henry, "p")
-uhenry = Unit.create_scaled_unit(henry, "u")
-Thenry = Unit.create_scaled_unit(henry, "T")
-yhenry = Unit.create_scaled_unit(henry, "y")
-Ehenry = Unit.create_scaled_unit(henry, "E")
-zhenry = Unit.create_scaled_unit(henry, "z")
-Mhenry = Unit.create_scaled_unit(henry, "M")
-khenry = Unit.create_scaled_unit(henry, "k")
-Yhenry = Unit.create_scaled_unit(henry, "Y")
-acelsius = Unit.create_scaled_unit(celsius, "a")
-ccelsius = Unit.create_scaled_unit(celsius, "c")
-Zcelsius = Unit.create_scaled_unit(celsius, "Z")
-Pcelsius = Unit.create_scaled_unit(celsius, "P")
-dcelsius = Unit.create_scaled_unit(celsius, "d")
-Gcelsius = Unit.create_scaled_unit(celsius, "G")
-fcelsius = Unit.create_scaled_unit(celsius, "f")
-hcelsius = Unit.create_scaled_unit(celsius, "h")
-dacelsius = Unit.create_scaled_unit(celsius, "da")
-mcelsius = Unit.create_scaled_unit(celsius, "m")
-ncelsius = Unit.create_scaled_unit(celsius, "n")
-pcelsius = Unit.create_scaled_unit(celsius, "p")
-ucelsius = Unit.create_scaled_unit(celsius, "u")
-Tcelsius = Unit.create_scaled_unit(celsius, "T")
-ycelsius = Unit.create_scaled_unit(celsius, "y")
-Ecelsius = Unit.create_scaled_unit(celsius, "E")
-zcelsius = Unit.create_scaled_unit(celsius, "z")
-Mcelsius = Unit.create_scaled_unit(celsius, "M")
-kcelsius = Unit.create_scaled_unit(celsius, "k")
-Ycelsius = Unit.create_scaled_unit(celsius, "Y")
-alumen = Unit.create_scaled_unit(lumen, "a")
-clumen = Unit.create_scaled_unit(lumen, "c")
-Zlumen = Unit.create_scaled_unit(lumen, "Z")
-Plumen = Unit.create_scaled_unit(lumen, "P")
-dlumen = Unit.create_scaled_unit(lumen, "d")
-Glumen = Unit.create_scaled_unit(lumen, "G")
-flumen = Unit.create_scaled_unit(lumen, "f")
-hlumen = Unit.create_scaled_unit(lumen, "h")
-dalumen = Unit.create_scaled_unit(lumen, "da")
-mlumen = Unit.create_scaled_unit(lumen, "m")
-nlumen = Unit.create_scaled_unit(lumen, "n")
-plumen = Unit.create_scaled_unit(lumen, "p")
-ulumen = Unit.create_scaled_unit(lumen, "u")
-Tlumen = Unit.create_scaled_unit(lumen, "T")
-ylumen = Unit.create_scaled_unit(lumen, "y")
-Elumen = Unit.create_scaled_unit(lumen, "E")
-zlumen = Unit.create_scaled_unit(lumen, "z")
-Mlumen = Unit.create_scaled_unit(lumen, "M")
-klumen = Unit.create_scaled_unit(lumen, "k")
-Ylumen = Unit.create_scaled_unit(lumen, "Y")
-alux = Unit.create_scaled_unit(lux, "a")
-clux = Unit.create_scaled_unit(lux, "c")
-Zlux = Unit.create_scaled_unit(lux, "Z")
-Plux = Unit.create_scaled_unit(lux, "P")
-dlux = Unit.create_scaled_unit(lux, "d")
-Glux = Unit.create_scaled_unit(lux, "G")
-flux = Unit.create_scaled_unit(lux, "f")
-hlux = Unit.create_scaled_unit(lux, "h")
-dalux = Unit.create_scaled_unit(lux, "da")
-mlux = Unit.create_scaled_unit(lux, "m")
-nlux = Unit.create_scaled_unit(lux, "n")
-plux = Unit.create_scaled_unit(lux, "p")
-ulux = Unit.create_scaled_unit(lux, "u")
-Tlux = Unit.create_scaled_unit(lux, "T")
-ylux = Unit.create_scaled_unit(lux, "y")
-Elux = Unit.create_scaled_unit(lux, "E")
-zlux = Unit.create_scaled_unit(lux, "z")
-Mlux = Unit.create_scaled_unit(lux, "M")
-klux = Unit.create_scaled_unit(lux, "k")
-Ylux = Unit.create_scaled_unit(lux, "Y")
-abecquerel = Unit.create_scaled_unit(becquerel, "a")
-cbecquerel = Unit.create_scaled_unit(becquerel, "c")
-Zbecquerel = Unit.create_scaled_unit(becquerel, "Z")
-Pbecquerel = Unit.create_scaled_unit(becquerel, "P")
-dbecquerel = Unit.create_scaled_unit(becquerel, "d")
-Gbecquerel = Unit.create_scaled_unit(becquerel, "G")
-fbecquerel = Unit.create_scaled_unit(becquerel, "f")
-hbecquerel = Unit.create_scaled_unit(becquerel, "h")
-dabecquerel = Unit.create_scaled_unit(becquerel, "da")
-mbecquerel = Unit.create_scaled_unit(becquerel, "m")
-nbecquerel = Unit.create_scaled_unit(becquerel, "n")
-pbecquerel = Unit.create_scaled_unit(becquerel, "p")
-ubecquerel = Unit.create_scaled_unit(becquerel, "u")
-Tbecquerel = Unit.create_scaled_unit(becquerel, "T")
-ybecquerel = Unit.create_scaled_unit(becquerel, "y")
-Ebecquerel = Unit.create_scaled_unit(becquerel, "E")
-zbecquerel = Unit.create_scaled_unit(becquerel, "z")
-Mbecquerel = Unit.create_scaled_unit(becquerel, "M")
-kbecquerel = Unit.create_scaled_unit(becquerel, "k")
-Ybecquerel = Unit.create_scaled_unit(becquerel, "Y")
-agray = Unit.create_scaled_unit(gray, "a")
-cgray = Unit.create_scaled_unit(gray, "c")
-Zgray = Unit.create_scaled_unit(gray, "Z")
-Pgray = Unit.create_scaled_unit(gray, "P")
-dgray = Unit.create_scaled_unit(gray, "d")
-Ggray = Unit.create_scaled_unit(gray, "G")
-fgray = Unit.create_scaled_unit(gray, "f")
-hgray = Unit.create_scaled_unit(gray, "h")
-dagray = Unit.create_scaled_unit(gray, "da")
-mgray = Unit.create_scaled_unit(gray, "m")
-ngray = Unit.create_scaled_unit(gray, "n")
-pgray = Unit.create_scaled_unit(gray, "p")
-ugray = Unit.create_scaled_unit(gray, "u")
-Tgray = Unit.create_scaled_unit(gray, "T")
-ygray = Unit.create_scaled_unit(gray, "y")
-Egray = Unit.create_scaled_unit(gray, "E")
-zgray = Unit.create_scaled_unit(gray, "z")
-Mgray = Unit.create_scaled_unit(gray, "M")
-kgray = Unit.create_scaled_unit(gray, "k")
-Ygray = Unit.create_scaled_unit(gray, "Y")
-asievert = Unit.create_scaled_unit(sievert, "a")
-csievert = Unit.create_scaled_unit(sievert, "c")
-Zsievert = Unit.create_scaled_unit(sievert, "Z")
-Psievert = Unit.create_scaled_unit(sievert, "P")
-dsievert = Unit.create_scaled_unit(sievert, "d")
-Gsievert = Unit.create_scaled_unit(sievert, "G")
-fsievert = Unit.create_scaled_unit(sievert, "f")
-hsievert = Unit.create_scaled_unit(sievert, "h")
-dasievert = Unit.create_scaled_unit(sievert, "da")
-msievert = Unit.create_scaled_unit(sievert, "m")
-nsievert = Unit.create_scaled_unit(sievert, "n")
-psievert = Unit.create_scaled_unit(sievert, "p")
-usievert = Unit.create_scaled_unit(sievert, "u")
-Tsievert = Unit.create_scaled_unit(sievert, "T")
-ysievert = Unit.create_scaled_unit(sievert, "y")
-Esievert = Unit.create_scaled_unit(sievert, "E")
-zsievert = Unit.create_scaled_unit(sievert, "z")
-Msievert = Unit.create_scaled_unit(sievert, "M")
-ksievert = Unit.create_scaled_unit(sievert, "k")
-Ysievert = Unit.create_scaled_unit(sievert, "Y")
-akatal = Unit.create_scaled_unit(katal, "a")
-ckatal = Unit.create_scaled_unit(katal, "c")
-Zkatal = Unit.create_scaled_unit(katal, "Z")
-Pkatal = Unit.create_scaled_unit(katal, "P")
-dkatal = Unit.create_scaled_unit(katal, "d")
-Gkatal = Unit.create_scaled_unit(katal, "G")
-fkatal = Unit.create_scaled_unit(katal, "f")
-hkatal = Unit.create_scaled_unit(katal, "h")
-dakatal = Unit.create_scaled_unit(katal, "da")
-mkatal = Unit.create_scaled_unit(katal, "m")
-nkatal = Unit.create_scaled_unit(katal, "n")
-pkatal = Unit.create_scaled_unit(katal, "p")
-ukatal = Unit.create_scaled_unit(katal, "u")
-Tkatal = Unit.create_scaled_unit(katal, "T")
-ykatal = Unit.create_scaled_unit(katal, "y")
-Ekatal = Unit.create_scaled_unit(katal, "E")
-zkatal = Unit.create_scaled_unit(katal, "z")
-Mkatal = Unit.create_scaled_unit(katal, "M")
-kkatal = Unit.create_scaled_unit(katal, "k")
-Ykatal = Unit.create_scaled_unit(katal, "Y")
-######### SCALED BASE UNITS TO POWERS ###########
-metre2 = metre**2
-metre2.name = "metre2"
-metre3 = metre**3
-metre3.name = "metre3"
-meter2 = meter**2
-meter2.name = "meter2"
-meter3 = meter**3
-meter3.name = "meter3"
-gram2 = gram**2
-gram2.name = "gram2"
-gram3 = gram**3
-gram3.name = "gram3"
-second2 = second**2
-second2.name = "second2"
-second3 = second**3
-second3.name = "second3"
-amp2 = amp**2
-amp2.name = "amp2"
-amp3 = amp**3
-amp3.name = "amp3"
-kelvin2 = kelvin**2
-kelvin2.name = "kelvin2"
-kelvin3 = kelvin**3
-kelvin3.name = "kelvin3"
-mole2 = mole**2
-mole2.name = "mole2"
-mole3 = mole**3
-mole3.name = "mole3"
-candle2 = candle**2
-candle2.name = "candle2"
-candle3 = candle**3
-candle3.name = "candle3"
-gramme2 = gramme**2
-gramme2.name = "gramme2"
-gramme3 = gramme**3
-gramme3.name = "gramme3"
-kilogram2 = kilogram**2
-kilogram2.name = "kilogram2"
-kilogram3 = kilogram**3
-kilogram3.name = "kilogram3"
-radian2 = radian**2
-radian2.name = "radian2"
-radian3 = radian**3
-radian3.name = "radian3"
-steradian2 = steradian**2
-steradian2.name = "steradian2"
-steradian3 = steradian**3
-steradian3.name = "steradian3"
-hertz2 = hertz**2
-hertz2.name = "hertz2"
-hertz3 = hertz**3
-hertz3.name = "hertz3"
-newton2 = newton**2
-newton2.name = "newton2"
-newton3 = newton**3
-newton3.name = "newton3"
-pascal2 = pascal**2
-pascal2.name = "pascal2"
-pascal3 = pascal**3
-pascal3.name = "pascal3"
-joule2 = joule**2
-joule2.name = "joule2"
-joule3 = joule**3
-joule3.name = "joule3"
-watt2 = watt**2
-watt2.name = "watt2"
-watt3 = watt**3
-watt3.name = "watt3"
-coulomb2 = coulomb**2
-coulomb2.name = "coulomb2"
-coulomb3 = coulomb**3
-coulomb3.name = "coulomb3"
-volt2 = volt**2
-volt2.name = "volt2"
-volt3 = volt**3
-volt3.name = "volt3"
-farad2 = farad**2
-farad2.name = "farad2"
-farad3 = farad**3
-farad3.name = "farad3"
-ohm2 = ohm**2
-ohm2.name = "ohm2"
-ohm3 = ohm**3
-ohm3.name = "ohm3"
-siemens2 = siemens**2
-siemens2.name = "siemens2"
-siemens3 = siemens**3
-siemens3.name = "siemens3"
-weber2 = weber**2
-weber2.name = "weber2"
-weber3 = weber**3
-weber3.name = "weber3"
-tesla2 = tesla**2
-tesla2.name = "tesla2"
-tesla3 = tesla**3
-tesla3.name = "tesla3"
-henry2 = henry**2
-henry2.name = "henry2"
-henry3 = henry**3
-henry3.name = "henry3"
-celsius2 = celsius**2
-celsius2.name = "celsius2"
-celsius3 = celsius**3
-celsius3.name = "celsius3"
-lumen2 = lumen**2
-lumen2.name = "lumen2"
-lumen3 = lumen**3
-lumen3.name = "lumen3"
-lux2 = lux**2
-lux2.name = "lux2"
-lux3 = lux**3
-lux3.name = "lux3"
-becquerel2 = becquerel**2
-becquerel2.name = "becquerel2"
-becquerel3 = becquerel**3
-becquerel3.name = "becquerel3"
-gray2 = gray**2
-gray2.name = "gray2"
-gray3 = gray**3
-gray3.name = "gray3"
-sievert2 = sievert**2
-sievert2.name = "sievert2"
-sievert3 = sievert**3
-sievert3.name = "sievert3"
-katal2 = katal**2
-katal2.name = "katal2"
-katal3 = katal**3
-katal3.name = "katal3"
-ametre2 = ametre**2
-ametre2.name = "ametre2"
-ametre3 = ametre**3
-ametre3.name = "ametre3"
-cmetre2 = cmetre**2
-cmetre2.name = "cmetre2"
-cmetre3 = cmetre**3
-cmetre3.name = "cmetre3"
-Zmetre2 = Zmetre**2
-Zmetre2.name = "Zmetre2"
-Zmetre3 = Zmetre**3
-Zmetre3.name = "Zmetre3"
-Pmetre2 = Pmetre**2
-Pmetre2.name = "Pmetre2"
-Pmetre3 = Pmetre**3
-Pmetre3.name = "Pmetre3"
-dmetre2 = dmetre**2
-dmetre2.name = "dmetre2"
-dmetre3 = dmetre**3
-dmetre3.name = "dmetre3"
-Gmetre2 = Gmetre**2
-Gmetre2.name = "Gmetre2"
-Gmetre3 = Gmetre**3
-Gmetre3.name = "Gmetre3"
-fmetre2 = fmetre**2
-fmetre2.name = "fmetre2"
-fmetre3 = fmetre**3
-fmetre3.name = "fmetre3"
-hmetre2 = hmetre**2
-hmetre2.name = "hmetre2"
-hmetre3 = hmetre**3
-hmetre3.name = "hmetre3"
-dametre2 = dametre**2
-dametre2.name = "dametre2"
-dametre3 = dametre**3
-dametre3.name = "dametre3"
-mmetre2 = mmetre**2
-mmetre2.name = "mmetre2"
-mmetre3 = mmetre**3
-mmetre3.name = "mmetre3"
-nmetre2 = nmetre**2
-nmetre2.name = "nmetre2"
-nmetre3 = nmetre**3
-nmetre3.name = "nmetre3"
-pmetre2 = pmetre**2
-pmetre2.name = "pmetre2"
-pmetre3 = pmetre**3
-pmetre3.name = "pmetre3"
-umetre2 = umetre**2
-umetre2.name = "umetre2"
-umetre3 = umetre**3
-umetre3.name = "umetre3"
-Tmetre2 = Tmetre**2
-Tmetre2.name = "Tmetre2"
-Tmetre3 = Tmetre**3
-Tmetre3.name = "Tmetre3"
-ymetre2 = ymetre**2
-ymetre2.name = "ymetre2"
-ymetre3 = ymetre**3
-ymetre3.name = "ymetre3"
-Emetre2 = Emetre**2
-Emetre2.name = "Emetre2"
-Emetre3 = Emetre**3
-Emetre3.name = "Emetre3"
-zmetre2 = zmetre**2
-zmetre2.name = "zmetre2"
-zmetre3 = zmetre**3
-zmetre3.name = "zmetre3"
-Mmetre2 = Mmetre**2
-Mmetre2.name = "Mmetre2"
-Mmetre3 = Mmetre**3
-Mmetre3.name = "Mmetre3"
-kmetre2 = kmetre**2
-kmetre2.name = "kmetre2"
-kmetre3 = kmetre**3
-kmetre3.name = "kmetre3"
-Ymetre2 = Ymetre**2
-Ymetre2.name = "Ymetre2"
-Ymetre3 = Ymetre**3
-Ymetre3.name = "Ymetre3"
-ameter2 = ameter**2
-ameter2.name = "ameter2"
-ameter3 = ameter**3
-ameter3.name = "ameter3"
-cmeter2 = cmeter**2
-cmeter2.name = "cmeter2"
-cmeter3 = cmeter**3
-cmeter3.name = "cmeter3"
-Zmeter2 = Zmeter**2
-Zmeter2.name = "Zmeter2"
-Zmeter3 = Zmeter**3
-Zmeter3.name = "Zmeter3"
-Pmeter2 = Pmeter**2
-Pmeter2.name = "Pmeter2"
-Pmeter3 = Pmeter**3
-Pmeter3.name = "Pmeter3"
-dmeter2 = dmeter**2
-dmeter2.name = "dmeter2"
-dmeter3 = dmeter**3
-dmeter3.name = "dmeter3"
-Gmeter2 = Gmeter**2
-Gmeter2.name = "Gmeter2"
-Gmeter3 = Gmeter**3
-Gmeter3.name = "Gmeter3"
-fmeter2 = fmeter**2
-fmeter2.name = "fmeter2"
-fmeter3 = fmeter**3
-fmeter3.name = "fmeter3"
-hmeter2 = hmeter**2
-hmeter2.name = "hmeter2"
-hmeter3 = hmeter**3
-hmeter3.name = "hmeter3"
-dameter2 = dameter**2
-dameter2.name = "dameter2"
-dameter3 = dameter**3
-dameter3.name = "dameter3"
-mmeter2 = mmeter**2
-mmeter2.name = "mmeter2"
-mmeter3 = mmeter**3
-mmeter3.name = "mmeter3"
-nmeter2 = nmeter**2
-nmeter2.name = "nmeter2"
-nmeter3 = nmeter**3
-nmeter3.name = "nmeter3"
-pmeter2 = pmeter**2
-pmeter2.name = "pmeter2"
-pmeter3 = pmeter**3
-pmeter3.name = "pmeter3"
-umeter2 = umeter**2
-umeter2.name = "umeter2"
-umeter3 = umeter**3
-umeter3.name = "umeter3"
-Tmeter2 = Tmeter**2
-Tmeter2.name = "Tmeter2"
-Tmeter3 = Tmeter**3
-Tmeter3.name = "Tmeter3"
-ymeter2 = ymeter**2
-ymeter2.name = "ymeter2"
-ymeter3 = ymeter**3
-ymeter3.name = "ymeter3"
-Emeter2 = Emeter**2
-Emeter2.name = "Emeter2"
-Emeter3 = Emeter**3
-Emeter3.name = "Emeter3"
-zmeter2 = zmeter**2
-zmeter2.name = "zmeter2"
-zmeter3 = zmeter**3
-zmeter3.name = "zmeter3"
-Mmeter2 = Mmeter**2
-Mmeter2.name = "Mmeter2"
-Mmeter3 = Mmeter**3
-Mmeter3.name = "Mmeter3"
-kmeter2 = kmeter**2
-kmeter2.name = "kmeter2"
-kmeter3 = kmeter**3
-kmeter3.name = "kmeter3"
-Ymeter2 = Ymeter**2
-Ymeter2.name = "Ymeter2"
-Ymeter3 = Ymeter**3
-Ymeter3.name = "Ymeter3"
-agram2 = agram**2
-agram2.name = "agram2"
-agram3 = agram**3
-agram3.name = "agram3"
-cgram2 = cgram**2
-cgram2.name = "cgram2"
-cgram3 = cgram**3
-cgram3.name = "cgram3"
-Zgram2 = Zgram**2
-Zgram2.name = "Zgram2"
-Zgram3 = Zgram**3
-Zgram3.name = "Zgram3"
-Pgram2 = Pgram**2
-Pgram2.name = "Pgram2"
-Pgram3 = Pgram**3
-Pgram3.name = "Pgram3"
-dgram2 = dgram**2
-dgram2.name = "dgram2"
-dgram3 = dgram**3
-dgram3.name = "dgram3"
-Ggram2 = Ggram**2
-Ggram2.name = "Ggram2"
-Ggram3 = Ggram**3
-Ggram3.name = "Ggram3"
-fgram2 = fgram**2
-fgram2.name = "fgram2"
-fgram3 = fgram**3
-fgram3.name = "fgram3"
-hgram2 = hgram**2
-hgram2.name = "hgram2"
-hgram3 = hgram**3
-hgram3.name = "hgram3"
-dagram2 = dagram**2
-dagram2.name = "dagram2"
-dagram3 = dagram**3
-dagram3.name = "dagram3"
-mgram2 = mgram**2
-mgram2.name = "mgram2"
-mgram3 = mgram**3
-mgram3.name = "mgram3"
-ngram2 = ngram**2
-ngram2.name = "ngram2"
-ngram3 = ngram**3
-ngram3.name = "ngram3"
-pgram2 = pgram**2
-pgram2.name = "pgram2"
-pgram3 = pgram**3
-pgram3.name = "pgram3"
-ugram2 = ugram**2
-ugram2.name = "ugram2"
-ugram3 = ugram**3
-ugram3.name = "ugram3"
-Tgram2 = Tgram**2
-Tgram2.name = "Tgram2"
-Tgram3 = Tgram**3
-Tgram3.name = "Tgram3"
-ygram2 = ygram**2
-ygram2.name = "ygram2"
-ygram3 = ygram**3
-ygram3.name = "ygram3"
-Egram2 = Egram**2
-Egram2.name = "Egram2"
-Egram3 = Egram**3
-Egram3.name = "Egram3"
-zgram2 = zgram**2
-zgram2.name = "zgram2"
-zgram3 = zgram**3
-zgram3.name = "zgram3"
-Mgram2 = Mgram**2
-Mgram2.name = "Mgram2"
-Mgram3 = Mgram**3
-Mgram3.name = "Mgram3"
-kgram2 = kgram**2
-kgram2.name = "kgram2"
-kgram3 = kgram**3
-kgram3.name = "kgram3"
-Ygram2 = Ygram**2
-Ygram2.name = "Ygram2"
-Ygram3 = Ygram**3
-Ygram3.name = "Ygram3"
-asecond2 = asecond**2
-asecond2.name = "asecond2"
-asecond3 = asecond**3
-asecond3.name = "asecond3"
-csecond2 = csecond**2
-csecond2.name = "csecond2"
-csecond3 = csecond**3
-csecond3.name = "csecond3"
-Zsecond2 = Zsecond**2
-Zsecond2.name = "Zsecond2"
-Zsecond3 = Zsecond**3
-Zsecond3.name = "Zsecond3"
-Psecond2 = Psecond**2
-Psecond2.name = "Psecond2"
-Psecond3 = Psecond**3
-Psecond3.name = "Psecond3"
-dsecond2 = dsecond**2
-dsecond2.name = "dsecond2"
-dsecond3 = dsecond**3
-dsecond3.name = "dsecond3"
-Gsecond2 = Gsecond**2
-Gsecond2.name = "Gsecond2"
-Gsecond3 = Gsecond**3
-Gsecond3.name = "Gsecond3"
-fsecond2 = fsecond**2
-fsecond2.name = "fsecond2"
-fsecond3 = fsecond**3
-fsecond3.name = "fsecond3"
-hsecond2 = hsecond**2
-hsecond2.name = "hsecond2"
-hsecond3 = hsecond**3
-hsecond3.name = "hsecond3"
-dasecond2 = dasecond**2
-dasecond2.name = "dasecond2"
-dasecond3 = dasecond**3
-dasecond3.name = "dasecond3"
-msecond2 = msecond**2
-msecond2.name = "msecond2"
-msecond3 = msecond**3
-msecond3.name = "msecond3"
-nsecond2 = nsecond**2
-nsecond2.name = "nsecond2"
-nsecond3 = nsecond**3
-nsecond3.name = "nsecond3"
-psecond2 = psecond**2
-psecond2.name = "psecond2"
-psecond3 = psecond**3
-psecond3.name = "psecond3"
-usecond2 = usecond**2
-usecond2.name = "usecond2"
-usecond3 = usecond**3
-usecond3.name = "usecond3"
-Tsecond2 = Tsecond**2
-Tsecond2.name = "Tsecond2"
-Tsecond3 = Tsecond**3
-Tsecond3.name = "Tsecond3"
-ysecond2 = ysecond**2
-ysecond2.name = "ysecond2"
-ysecond3 = ysecond**3
-ysecond3.name = "ysecond3"
-Esecond2 = Esecond**2
-Esecond2.name = "Esecond2"
-Esecond3 = Esecond**3
-Esecond3.name = "Esecond3"
-zsecond2 = zsecond**2
-zsecond2.name = "zsecond2"
-zsecond3 = zsecond**3
-zsecond3.name = "zsecond3"
-Msecond2 = Msecond**2
-Msecond2.name = "Msecond2"
-Msecond3 = Msecond**3
-Msecond3.name = "Msecond3"
-ksecond2 = ksecond**2
-ksecond2.name = "ksecond2"
-ksecond3 = ksecond**3
-ksecond3.name = "ksecond3"
-Ysecond2 = Ysecond**2
-Ysecond2.name = "Ysecond2"
-Ysecond3 = Ysecond**3
-Ysecond3.name = "Ysecond3"
-aamp2 = aamp**2
-aamp2.name = "aamp2"
-aamp3 = aamp**3
-aamp3.name = "aamp3"
-camp2 = camp**2
-camp2.name = "camp2"
-camp3 = camp**3
-camp3.name = "camp3"
-Zamp2 = Zamp**2
-Zamp2.name = "Zamp2"
-Zamp3 = Zamp**3
-Zamp3.name = "Zamp3"
-Pamp2 = Pamp**2
-Pamp2.name = "Pamp2"
-Pamp3 = Pamp**3
-Pamp3.name = "Pamp3"
-damp2 = damp**2
-damp2.name = "damp2"
-damp3 = damp**3
-damp3.name = "damp3"
-Gamp2 = Gamp**2
-Gamp2.name = "Gamp2"
-Gamp3 = Gamp**3
-Gamp3.name = "Gamp3"
-famp2 = famp**2
-famp2.name = "famp2"
-famp3 = famp**3
-famp3.name = "famp3"
-hamp2 = hamp**2
-hamp2.name = "hamp2"
-hamp3 = hamp**3
-hamp3.name = "hamp3"
-daamp2 = daamp**2
-daamp2.name = "daamp2"
-daamp3 = daamp**3
-daamp3.name = "daamp3"
-mamp2 = mamp**2
-mamp2.name = "mamp2"
-mamp3 = mamp**3
-mamp3.name = "mamp3"
-namp2 = namp**2
-namp2.name = "namp2"
-namp3 = namp**3
-namp3.name = "namp3"
-pamp2 = pamp**2
-pamp2.name = "pamp2"
-pamp3 = pamp**3
-pamp3.name = "pamp3"
-uamp2 = uamp**2
-uamp2.name = "uamp2"
-uamp3 = uamp**3
-uamp3.name = "uamp3"
-Tamp2 = Tamp**2
-Tamp2.name = "Tamp2"
-Tamp3 = Tamp**3
-Tamp3.name = "Tamp3"
-yamp2 = yamp**2
-yamp2.name = "yamp2"
-yamp3 = yamp**3
-yamp3.name = "yamp3"
-Eamp2 = Eamp**2
-Eamp2.name = "Eamp2"
-Eamp3 = Eamp**3
-Eamp3.name = "Eamp3"
-zamp2 = zamp**2
-zamp2.name = "zamp2"
-zamp3 = zamp**3
-zamp3.name = "zamp3"
-Mamp2 = Mamp**2
-Mamp2.name = "Mamp2"
-Mamp3 = Mamp**3
-Mamp3.name = "Mamp3"
-kamp2 = kamp**2
-kamp2.name = "kamp2"
-kamp3 = kamp**3
-kamp3.name = "kamp3"
-Yamp2 = Yamp**2
-Yamp2.name = "Yamp2"
-Yamp3 = Yamp**3
-Yamp3.name = "Yamp3"
-akelvin2 = akelvin**2
-akelvin2.name = "akelvin2"
-akelvin3 = akelvin**3
-akelvin3.name = "akelvin3"
-ckelvin2 = ckelvin**2
-ckelvin2.name = "ckelvin2"
-ckelvin3 = ckelvin**3
-ckelvin3.name = "ckelvin3"
-Zkelvin2 = Zkelvin**2
-Zkelvin2.name = "Zkelvin2"
-Zkelvin3 = Zkelvin**3
-Zkelvin3.name = "Zkelvin3"
-Pkelvin2 = Pkelvin**2
-Pkelvin2.name = "Pkelvin2"
-Pkelvin3 = Pkelvin**3
-Pkelvin3.name = "Pkelvin3"
-dkelvin2 = dkelvin**2
-dkelvin2.name = "dkelvin2"
-dkelvin3 = dkelvin**3
-dkelvin3.name = "dkelvin3"
-Gkelvin2 = Gkelvin**2
-Gkelvin2.name = "Gkelvin2"
-Gkelvin3 = Gkelvin**3
-Gkelvin3.name = "Gkelvin3"
-fkelvin2 = fkelvin**2
-fkelvin2.name = "fkelvin2"
-fkelvin3 = fkelvin**3
-fkelvin3.name = "fkelvin3"
-hkelvin2 = hkelvin**2
-hkelvin2.name = "hkelvin2"
-hkelvin3 = hkelvin**3
-hkelvin3.name = "hkelvin3"
-dakelvin2 = dakelvin**2
-dakelvin2.name = "dakelvin2"
-dakelvin3 = dakelvin**3
-dakelvin3.name = "dakelvin3"
-mkelvin2 = mkelvin**2
-mkelvin2.name = "mkelvin2"
-mkelvin3 = mkelvin**3
-mkelvin3.name = "mkelvin3"
-nkelvin2 = nkelvin**2
-nkelvin2.name = "nkelvin2"
-nkelvin3 = nkelvin**3
-nkelvin3.name = "nkelvin3"
-pkelvin2 = pkelvin**2
-pkelvin2.name = "pkelvin2"
-pkelvin3 = pkelvin**3
-pkelvin3.name = "pkelvin3"
-ukelvin2 = ukelvin**2
-ukelvin2.name = "ukelvin2"
-ukelvin3 = ukelvin**3
-ukelvin3.name = "ukelvin3"
-Tkelvin2 = Tkelvin**2
-Tkelvin2.name = "Tkelvin2"
-Tkelvin3 = Tkelvin**3
-Tkelvin3.name = "Tkelvin3"
-ykelvin2 = ykelvin**2
-ykelvin2.name = "ykelvin2"
-ykelvin3 = ykelvin**3
-ykelvin3.name = "ykelvin3"
-Ekelvin2 = Ekelvin**2
-Ekelvin2.name = "Ekelvin2"
-Ekelvin3 = Ekelvin**3
-Ekelvin3.name = "Ekelvin3"
-zkelvin2 = zkelvin**2
-zkelvin2.name = "zkelvin2"
-zkelvin3 = zkelvin**3
-zkelvin3.name = "zkelvin3"
-Mkelvin2 = Mkelvin**2
-Mkelvin2.name = "Mkelvin2"
-Mkelvin3 = Mkelvin**3
-Mkelvin3.name = "Mkelvin3"
-kkelvin2 = kkelvin**2
-kkelvin2.name = "kkelvin2"
-kkelvin3 = kkelvin**3
-kkelvin3.name = "kkelvin3"
-Ykelvin2 = Ykelvin**2
-Ykelvin2.name = "Ykelvin2"
-Ykelvin3 = Ykelvin**3
-Ykelvin3.name = "Ykelvin3"
-amole2 = amole**2
-amole2.name = "amole2"
-amole3 = amole**3
-amole3.name = "amole3"
-cmole2 = cmole**2
-cmole2.name = "cmole2"
-cmole3 = cmole**3
-cmole3.name = "cmole3"
-Zmole2 = Zmole**2
-Zmole2.name = "Zmole2"
-Zmole3 = Zmole**3
-Zmole3.name = "Zmole3"
-Pmole2 = Pmole**2
-Pmole2.name = "Pmole2"
-Pmole3 = Pmole**3
-Pmole3.name = "Pmole3"
-dmole2 = dmole**2
-dmole2.name = "dmole2"
-dmole3 = dmole**3
-dmole3.name = "dmole3"
-Gmole2 = Gmole**2
-Gmole2.name = "Gmole2"
-Gmole3 = Gmole**3
-Gmole3.name = "Gmole3"
-fmole2 = fmole**2
-fmole2.name = "fmole2"
-fmole3 = fmole**3
-fmole3.name = "fmole3"
-hmole2 = hmole**2
-hmole2.name = "hmole2"
-hmole3 = hmole**3
-hmole3.name = "hmole3"
-damole2 = damole**2
-damole2.name = "damole2"
-damole3 = damole**3
-damole3.name = "damole3"
-mmole2 = mmole**2
-mmole2.name = "mmole2"
-mmole3 = mmole**3
-mmole3.name = "mmole3"
-nmole2 = nmole**2
-nmole2.name = "nmole2"
-nmole3 = nmole**3
-nmole3.name = "nmole3"
-pmole2 = pmole**2
-pmole2.name = "pmole2"
-pmole3 = pmole**3
-pmole3.name = "pmole3"
-umole2 = umole**2
-umole2.name = "umole2"
-umole3 = umole**3
-umole3.name = "umole3"
-Tmole2 = Tmole**2
-Tmole2.name = "Tmole2"
-Tmole3 = Tmole**3
-Tmole3.name = "Tmole3"
-ymole2 = ymole**2
-ymole2.name = "ymole2"
-ymole3 = ymole**3
-ymole3.name = "ymole3"
-Emole2 = Emole**2
-Emole2.name = "Emole2"
-Emole3 = Emole**3
-Emole3.name = "Emole3"
-zmole2 = zmole**2
-zmole2.name = "zmole2"
-zmole3 = zmole**3
-zmole3.name = "zmole3"
-Mmole2 = Mmole**2
-Mmole2.name = "Mmole2"
-Mmole3 = Mmole**3
-Mmole3.name = "Mmole3"
-kmole2 = kmole**2
-kmole2.name = "kmole2"
-kmole3 = kmole**3
-kmole3.name = "kmole3"
-Ymole2 = Ymole**2
-Ymole2.name = "Ymole2"
-Ymole3 = Ymole**3
-Ymole3.name = "Ymole3"
-acandle2 = acandle**2
-acandle2.name = "acandle2"
-acandle3 = acandle**3
-acandle3.name = "acandle3"
-ccandle2 = ccandle**2
-ccandle2.name = "ccandle2"
-ccandle3 = ccandle**3
-ccandle3.name = "ccandle3"
-Zcandle2 = Zcandle**2
-Zcandle2.name = "Zcandle2"
-Zcandle3 = Zcandle**3
-Zcandle3.name = "Zcandle3"
-Pcandle2 = Pcandle**2
-Pcandle2.name = "Pcandle2"
-Pcandle3 = Pcandle**3
-Pcandle3.name = "Pcandle3"
-dcandle2 = dcandle**2
-dcandle2.name = "dcandle2"
-dcandle3 = dcandle**3
-dcandle3.name = "dcandle3"
-Gcandle2 = Gcandle**2
-Gcandle2.name = "Gcandle2"
-Gcandle3 = Gcandle**3
-Gcandle3.name = "Gcandle3"
-fcandle2 = fcandle**2
-fcandle2.name = "fcandle2"
-fcandle3 = fcandle**3
-fcandle3.name = "fcandle3"
-hcandle2 = hcandle**2
-hcandle2.name = "hcandle2"
-hcandle3 = hcandle**3
-hcandle3.name = "hcandle3"
-dacandle2 = dacandle**2
-dacandle2.name = "dacandle2"
-dacandle3 = dacandle**3
-dacandle3.name = "dacandle3"
-mcandle2 = mcandle**2
-mcandle2.name = "mcandle2"
-mcandle3 = mcandle**3
-mcandle3.name = "mcandle3"
-ncandle2 = ncandle**2
-ncandle2.name = "ncandle2"
-ncandle3 = ncandle**3
-ncandle3.name = "ncandle3"
-pcandle2 = pcandle**2
-pcandle2.name = "pcandle2"
-pcandle3 = pcandle**3
-pcandle3.name = "pcandle3"
-ucandle2 = ucandle**2
-ucandle2.name = "ucandle2"
-ucandle3 = ucandle**3
-ucandle3.name = "ucandle3"
-Tcandle2 = Tcandle**2
-Tcandle2.name = "Tcandle2"
-Tcandle3 = Tcandle**3
-Tcandle3.name = "Tcandle3"
-ycandle2 = ycandle**2
-ycandle2.name = "ycandle2"
-ycandle3 = ycandle**3
-ycandle3.name = "ycandle3"
-Ecandle2 = Ecandle**2
-Ecandle2.name = "Ecandle2"
-Ecandle3 = Ecandle**3
-Ecandle3.name = "Ecandle3"
-zcandle2 = zcandle**2
-zcandle2.name = "zcandle2"
-zcandle3 = zcandle**3
-zcandle3.name = "zcandle3"
-Mcandle2 = Mcandle**2
-Mcandle2.name = "Mcandle2"
-Mcandle3 = Mcandle**3
-Mcandle3.name = "Mcandle3"
-kcandle2 = kcandle**2
-kcandle2.name = "kcandle2"
-kcandle3 = kcandle**3
-kcandle3.name = "kcandle3"
-Ycandle2 = Ycandle**2
-Ycandle2.name = "Ycandle2"
-Ycandle3 = Ycandle**3
-Ycandle3.name = "Ycandle3"
-agramme2 = agramme**2
-agramme2.name = "agramme2"
-agramme3 = agramme**3
-agramme3.name = "agramme3"
-cgramme2 = cgramme**2
-cgramme2.name = "cgramme2"
-cgramme3 = cgramme**3
-cgramme3.name = "cgramme3"
-Zgramme2 = Zgramme**2
-Zgramme2.name = "Zgramme2"
-Zgramme3 = Zgramme**3
-Zgramme3.name = "Zgramme3"
-Pgramme2 = Pgramme**2
-Pgramme2.name = "Pgramme2"
-Pgramme3 = Pgramme**3
-Pgramme3.name = "Pgramme3"
-dgramme2 = dgramme**2
-dgramme2.name = "dgramme2"
-dgramme3 = dgramme**3
-dgramme3.name = "dgramme3"
-Ggramme2 = Ggramme**2
-Ggramme2.name = "Ggramme2"
-Ggramme3 = Ggramme**3
-Ggramme3.name = "Ggramme3"
-fgramme2 = fgramme**2
-fgramme2.name = "fgramme2"
-fgramme3 = fgramme**3
-fgramme3.name = "fgramme3"
-hgramme2 = hgramme**2
-hgramme2.name = "hgramme2"
-hgramme3 = hgramme**3
-hgramme3.name = "hgramme3"
-dagramme2 = dagramme**2
-dagramme2.name = "dagramme2"
-dagramme3 = dagramme**3
-dagramme3.name = "dagramme3"
-mgramme2 = mgramme**2
-mgramme2.name = "mgramme2"
-mgramme3 = mgramme**3
-mgramme3.name = "mgramme3"
-ngramme2 = ngramme**2
-ngramme2.name = "ngramme2"
-ngramme3 = ngramme**3
-ngramme3.name = "ngramme3"
-pgramme2 = pgramme**2
-pgramme2.name = "pgramme2"
-pgramme3 = pgramme**3
-pgramme3.name = "pgramme3"
-ugramme2 = ugramme**2
-ugramme2.name = "ugramme2"
-ugramme3 = ugramme**3
-ugramme3.name = "ugramme3"
-Tgramme2 = Tgramme**2
-Tgramme2.name = "Tgramme2"
-Tgramme3 = Tgramme**3
-Tgramme3.name = "Tgramme3"
-ygramme2 = ygramme**2
-ygramme2.name = "ygramme2"
-ygramme3 = ygramme**3
-ygramme3.name = "ygramme3"
-Egramme2 = Egramme**2
-Egramme2.name = "Egramme2"
-Egramme3 = Egramme**3
-Egramme3.name = "Egramme3"
-zgramme2 = zgramme**2
-zgramme2.name = "zgramme2"
-zgramme3 = zgramme**3
-zgramme3.name = "zgramme3"
-Mgramme2 = Mgramme**2
-Mgramme2.name = "Mgramme2"
-Mgramme3 = Mgramme**3
-Mgramme3.name = "Mgramme3"
-kgramme2 = kgramme**2
-kgramme2.name = "kgramme2"
-kgramme3 = kgramme**3
-kgramme3.name = "kgramme3"
-Ygramme2 = Ygramme**2
-Ygramme2.name = "Ygramme2"
-Ygramme3 = Ygramme**3
-Ygramme3.name = "Ygramme3"
-akilogram2 = akilogram**2
-akilogram2.name = "akilogram2"
-akilogram3 = akilogram**3
-akilogram3.name = "akilogram3"
-ckilogram2 = ckilogram**2
-ckilogram2.name = "ckilogram2"
-ckilogram3 = ckilogram**3
-ckilogram3.name = "ckilogram3"
-Zkilogram2 = Zkilogram**2
-Zkilogram2.name = "Zkilogram2"
-Zkilogram3 = Zkilogram**3
-Zkilogram3.name = "Zkilogram3"
-Pkilogram2 = Pkilogram**2
-Pkilogram2.name = "Pkilogram2"
-Pkilogram3 = Pkilogram**3
-Pkilogram3.name = "Pkilogram3"
-dkilogram2 = dkilogram**2
-dkilogram2.name = "dkilogram2"
-dkilogram3 = dkilogram**3
-dkilogram3.name = "dkilogram3"
-Gkilogram2 = Gkilogram**2
-Gkilogram2.name = "Gkilogram2"
-Gkilogram3 = Gkilogram**3
-Gkilogram3.name = "Gkilogram3"
-fkilogram2 = fkilogram**2
-fkilogram2.name = "fkilogram2"
-fkilogram3 = fkilogram**3
-fkilogram3.name = "fkilogram3"
-hkilogram2 = hkilogram**2
-hkilogram2.name = "hkilogram2"
-hkilogram3 = hkilogram**3
-hkilogram3.name = "hkilogram3"
-dakilogram2 = dakilogram**2
-dakilogram2.name = "dakilogram2"
-dakilogram3 = dakilogram**3
-dakilogram3.name = "dakilogram3"
-mkilogram2 = mkilogram**2
-mkilogram2.name = "mkilogram2"
-mkilogram3 = mkilogram**3
-mkilogram3.name = "mkilogram3"
-nkilogram2 = nkilogram**2
-nkilogram2.name = "nkilogram2"
-nkilogram3 = nkilogram**3
-nkilogram3.name = "nkilogram3"
-pkilogram2 = pkilogram**2
-pkilogram2.name = "pkilogram2"
-pkilogram3 = pkilogram**3
-pkilogram3.name = "pkilogram3"
-ukilogram2 = ukilogram**2
-ukilogram2.name = "ukilogram2"
-ukilogram3 = ukilogram**3
-ukilogram3.name = "ukilogram3"
-Tkilogram2 = Tkilogram**2
-Tkilogram2.name = "Tkilogram2"
-Tkilogram3 = Tkilogram**3
-Tkilogram3.name = "Tkilogram3"
-ykilogram2 = ykilogram**2
-ykilogram2.name = "ykilogram2"
-ykilogram3 = ykilogram**3
-ykilogram3.name = "ykilogram3"
-Ekilogram2 = Ekilogram**2
-Ekilogram2.name = "Ekilogram2"
-Ekilogram3 = Ekilogram**3
-Ekilogram3.name = "Ekilogram3"
-zkilogram2 = zkilogram**2
-zkilogram2.name = "zkilogram2"
-zkilogram3 = zkilogram**3
-zkilogram3.name = "zkilogram3"
-Mkilogram2 = Mkilogram**2
-Mkilogram2.name = "Mkilogram2"
-Mkilogram3 = Mkilogram**3
-Mkilogram3.name = "Mkilogram3"
-kkilogram2 = kkilogram**2
-kkilogram2.name = "kkilogram2"
-kkilogram3 = kkilogram**3
-kkilogram3.name = "kkilogram3"
-Ykilogram2 = Ykilogram**2
-Ykilogram2.name = "Ykilogram2"
-Ykilogram3 = Ykilogram**3
-Ykilogram3.name = "Ykilogram3"
-aradian2 = aradian**2
-aradian2.name = "aradian2"
-aradian3 = aradian**3
-aradian3.name = "aradian3"
-cradian2 = cradian**2
-cradian2.name = "cradian2"
-cradian3 = cradian**3
-cradian3.name = "cradian3"
-Zradian2 = Zradian**2
-Zradian2.name = "Zradian2"
-Zradian3 = Zradian**3
-Zradian3.name = "Zradian3"
-Pradian2 = Pradian**2
-Pradian2.name = "Pradian2"
-Pradian3 = Pradian**3
-Pradian3.name = "Pradian3"
-dradian2 = dradian**2
-dradian2.name = "dradian2"
-dradian3 = dradian**3
-dradian3.name = "dradian3"
-Gradian2 = Gradian**2
-Gradian2.name = "Gradian2"
-Gradian3 = Gradian**3
-Gradian3.name = "Gradian3"
-fradian2 = fradian**2
-fradian2.name = "fradian2"
-fradian3 = fradian**3
-fradian3.name = "fradian3"
-hradian2 = hradian**2
-hradian2.name = "hradian2"
-hradian3 = hradian**3
-hradian3.name = "hradian3"
-daradian2 = daradian**2
-daradian2.name = "daradian2"
-daradian3 = daradian**3
-daradian3.name = "daradian3"
-mradian2 = mradian**2
-mradian2.name = "mradian2"
-mradian3 = mradian**3
-mradian3.name = "mradian3"
-nradian2 = nradian**2
-nradian2.name = "nradian2"
-nradian3 = nradian**3
-nradian3.name = "nradian3"
-pradian2 = pradian**2
-pradian2.name = "pradian2"
-pradian3 = pradian**3
-pradian3.name = "pradian3"
-uradian2 = uradian**2
-uradian2.name = "uradian2"
-uradian3 = uradian**3
-uradian3.name = "uradian3"
-Tradian2 = Tradian**2
-Tradian2.name = "Tradian2"
-Tradian3 = Tradian**3
-Tradian3.name = "Tradian3"
-yradian2 = yradian**2
-yradian2.name = "yradian2"
-yradian3 = yradian**3
-yradian3.name = "yradian3"
-Eradian2 = Eradian**2
-Eradian2.name = "Eradian2"
-Eradian3 = Eradian**3
-Eradian3.name = "Eradian3"
-zradian2 = zradian**2
-zradian2.name = "zradian2"
-zradian3 = zradian**3
-zradian3.name = "zradian3"
-Mradian2 = Mradian**2
-Mradian2.name = "Mradian2"
-Mradian3 = Mradian**3
-Mradian3.name = "Mradian3"
-kradian2 = kradian**2
-kradian2.name = "kradian2"
-kradian3 = kradian**3
-kradian3.name = "kradian3"
-Yradian2 = Yradian**2
-Yradian2.name = "Yradian2"
-Yradian3 = Yradian**3
-Yradian3.name = "Yradian3"
-asteradian2 = asteradian**2
-asteradian2.name = "asteradian2"
-asteradian3 = asteradian**3
-asteradian3.name = "asteradian3"
-csteradian2 = csteradian**2
-csteradian2.name = "csteradian2"
-csteradian3 = csteradian**3
-csteradian3.name = "csteradian3"
-Zsteradian2 = Zsteradian**2
-Zsteradian2.name = "Zsteradian2"
-Zsteradian3 = Zsteradian**3
-Zsteradian3.name = "Zsteradian3"
-Psteradian2 = Psteradian**2
-Psteradian2.name = "Psteradian2"
-Psteradian3 = Psteradian**3
-Psteradian3.name = "Psteradian3"
-dsteradian2 = dsteradian**2
-dsteradian2.name = "dsteradian2"
-dsteradian3 = dsteradian**3
-dsteradian3.name = "dsteradian3"
-Gsteradian2 = Gsteradian**2
-Gsteradian2.name = "Gsteradian2"
-Gsteradian3 = Gsteradian**3
-Gsteradian3.name = "Gsteradian3"
-fsteradian2 = fsteradian**2
-fsteradian2.name = "fsteradian2"
-fsteradian3 = fsteradian**3
-fsteradian3.name = "fsteradian3"
-hsteradian2 = hsteradian**2
-hsteradian2.name = "hsteradian2"
-hsteradian3 = hsteradian**3
-hsteradian3.name = "hsteradian3"
-dasteradian2 = dasteradian**2
-dasteradian2.name = "dasteradian2"
-dasteradian3 = dasteradian**3
-dasteradian3.name = "dasteradian3"
-msteradian2 = msteradian**2
-msteradian2.name = "msteradian2"
-msteradian3 = msteradian**3
-msteradian3.name = "msteradian3"
-nsteradian2 = nsteradian**2
-nsteradian2.name = "nsteradian2"
-nsteradian3 = nsteradian**3
-nsteradian3.name = "nsteradian3"
-psteradian2 = psteradian**2
-psteradian2.name = "psteradian2"
-psteradian3 = psteradian**3
-psteradian3.name = "psteradian3"
-usteradian2 = usteradian**2
-usteradian2.name = "usteradian2"
-usteradian3 = usteradian**3
-usteradian3.name = "usteradian3"
-Tsteradian2 = Tsteradian**2
-Tsteradian2.name = "Tsteradian2"
-Tsteradian3 = Tsteradian**3
-Tsteradian3.name = "Tsteradian3"
-ysteradian2 = ysteradian**2
-ysteradian2.name = "ysteradian2"
-ysteradian3 = ysteradian**3
-ysteradian3.name = "ysteradian3"
-Esteradian2 = Esteradian**2
-Esteradian2.name = "Esteradian2"
-Esteradian3 = Esteradian**3
-Esteradian3.name = "Esteradian3"
-zsteradian2 = zsteradian**2
-zsteradian2.name = "zsteradian2"
-zsteradian3 = zsteradian**3
-zsteradian3.name = "zsteradian3"
-Msteradian2 = Msteradian**2
-Msteradian2.name = "Msteradian2"
-Msteradian3 = Msteradian**3
-Msteradian3.name = "Msteradian3"
-ksteradian2 = ksteradian**2
-ksteradian2.name = "ksteradian2"
-ksteradian3 = ksteradian**3
-ksteradian3.name = "ksteradian3"
-Ysteradian2 = Ysteradian**2
-Ysteradian2.name = "Ysteradian2"
-Ysteradian3 = Ysteradian**3
-Ysteradian3.name = "Ysteradian3"
-ahertz2 = ahertz**2
-ahertz2.name = "ahertz2"
-ahertz3 = ahertz**3
-ahertz3.name = "ahertz3"
-chertz2 = chertz**2
-chertz2.name = "chertz2"
-chertz3 = chertz**3
-chertz3.name = "chertz3"
-Zhertz2 = Zhertz**2
-Zhertz2.name = "Zhertz2"
-Zhertz3 = Zhertz**3
-Zhertz3.name = "Zhertz3"
-Phertz2 = Phertz**2
-Phertz2.name = "Phertz2"
-Phertz3 = Phertz**3
-Phertz3.name = "Phertz3"
-dhertz2 = dhertz**2
-dhertz2.name = "dhertz2"
-dhertz3 = dhertz**3
-dhertz3.name = "dhertz3"
-Ghertz2 = Ghertz**2
-Ghertz2.name = "Ghertz2"
-Ghertz3 = Ghertz**3
-Ghertz3.name = "Ghertz3"
-fhertz2 = fhertz**2
-fhertz2.name = "fhertz2"
-fhertz3 = fhertz**3
-fhertz3.name = "fhertz3"
-hhertz2 = hhertz**2
-hhertz2.name = "hhertz2"
-hhertz3 = hhertz**3
-hhertz3.name = "hhertz3"
-dahertz2 = dahertz**2
-dahertz2.name = "dahertz2"
-dahertz3 = dahertz**3
-dahertz3.name = "dahertz3"
-mhertz2 = mhertz**2
-mhertz2.name = "mhertz2"
-mhertz3 = mhertz**3
-mhertz3.name = "mhertz3"
-nhertz2 = nhertz**2
-nhertz2.name = "nhertz2"
-nhertz3 = nhertz**3
-nhertz3.name = "nhertz3"
-phertz2 = phertz**2
-phertz2.name = "phertz2"
-phertz3 = phertz**3
-phertz3.name = "phertz3"
-uhertz2 = uhertz**2
-uhertz2.name = "uhertz2"
-uhertz3 = uhertz**3
-uhertz3.name = "uhertz3"
-Thertz2 = Thertz**2
-Thertz2.name = "Thertz2"
-Thertz3 = Thertz**3
-Thertz3.name = "Thertz3"
-yhertz2 = yhertz**2
-yhertz2.name = "yhertz2"
-yhertz3 = yhertz**3
-yhertz3.name = "yhertz3"
-Ehertz2 = Ehertz**2
-Ehertz2.name = "Ehertz2"
-Ehertz3 = Ehertz**3
-Ehertz3.name = "Ehertz3"
-zhertz2 = zhertz**2
-zhertz2.name = "zhertz2"
-zhertz3 = zhertz**3
-zhertz3.name = "zhertz3"
-Mhertz2 = Mhertz**2
-Mhertz2.name = "Mhertz2"
-Mhertz3 = Mhertz**3
-Mhertz3.name = "Mhertz3"
-khertz2 = khertz**2
-khertz2.name = "khertz2"
-khertz3 = khertz**3
-khertz3.name = "khertz3"
-Yhertz2 = Yhertz**2
-Yhertz2.name = "Yhertz2"
-Yhertz3 = Yhertz**3
-Yhertz3.name = "Yhertz3"
-anewton2 = anewton**2
-anewton2.name = "anewton2"
-anewton3 = anewton**3
-anewton3.name = "anewton3"
-cnewton2 = cnewton**2
-cnewton2.name = "cnewton2"
-cnewton3 = cnewton**3
-cnewton3.name = "cnewton3"
-Znewton2 = Znewton**2
-Znewton2.name = "Znewton2"
-Znewton3 = Znewton**3
-Znewton3.name = "Znewton3"
-Pnewton2 = Pnewton**2
-Pnewton2.name = "Pnewton2"
-Pnewton3 = Pnewton**3
-Pnewton3.name = "Pnewton3"
-dnewton2 = dnewton**2
-dnewton2.name = "dnewton2"
-dnewton3 = dnewton**3
-dnewton3.name = "dnewton3"
-Gnewton2 = Gnewton**2
-Gnewton2.name = "Gnewton2"
-Gnewton3 = Gnewton**3
-Gnewton3.name = "Gnewton3"
-fnewton2 = fnewton**2
-fnewton2.name = "fnewton2"
-fnewton3 = fnewton**3
-fnewton3.name = "fnewton3"
-hnewton2 = hnewton**2
-hnewton2.name = "hnewton2"
-hnewton3 = hnewton**3
-hnewton3.name = "hnewton3"
-danewton2 = danewton**2
-danewton2.name = "danewton2"
-danewton3 = danewton**3
-danewton3.name = "danewton3"
-mnewton2 = mnewton**2
-mnewton2.name = "mnewton2"
-mnewton3 = mnewton**3
-mnewton3.name = "mnewton3"
-nnewton2 = nnewton**2
-nnewton2.name = "nnewton2"
-nnewton3 = nnewton**3
-nnewton3.name = "nnewton3"
-pnewton2 = pnewton**2
-pnewton2.name = "pnewton2"
-pnewton3 = pnewton**3
-pnewton3.name = "pnewton3"
-unewton2 = unewton**2
-unewton2.name = "unewton2"
-unewton3 = unewton**3
-unewton3.name = "unewton3"
-Tnewton2 = Tnewton**2
-Tnewton2.name = "Tnewton2"
-Tnewton3 = Tnewton**3
-Tnewton3.name = "Tnewton3"
-ynewton2 = ynewton**2
-ynewton2.name = "ynewton2"
-ynewton3 = ynewton**3
-ynewton3.name = "ynewton3"
-Enewton2 = Enewton**2
-Enewton2.name = "Enewton2"
-Enewton3 = Enewton**3
-Enewton3.name = "Enewton3"
-znewton2 = znewton**2
-znewton2.name = "znewton2"
-znewton3 = znewton**3
-znewton3.name = "znewton3"
-Mnewton2 = Mnewton**2
-Mnewton2.name = "Mnewton2"
-Mnewton3 = Mnewton**3
-Mnewton3.name = "Mnewton3"
-knewton2 = knewton**2
-knewton2.name = "knewton2"
-knewton3 = knewton**3
-knewton3.name = "knewton3"
-Ynewton2 = Ynewton**2
-Ynewton2.name = "Ynewton2"
-Ynewton3 = Ynewton**3
-Ynewton3.name = "Ynewton3"
-apascal2 = apascal**2
-apascal2.name = "apascal2"
-apascal3 = apascal**3
-apascal3.name = "apascal3"
-cpascal2 = cpascal**2
-cpascal2.name = "cpascal2"
-cpascal3 = cpascal**3
-cpascal3.name = "cpascal3"
-Zpascal2 = Zpascal**2
-Zpascal2.name = "Zpascal2"
-Zpascal3 = Zpascal**3
-Zpascal3.name = "Zpascal3"
-Ppascal2 = Ppascal**2
-Ppascal2.name = "Ppascal2"
-Ppascal3 = Ppascal**3
-Ppascal3.name = "Ppascal3"
-dpascal2 = dpascal**2
-dpascal2.name = "dpascal2"
-dpascal3 = dpascal**3
-dpascal3.name = "dpascal3"
-Gpascal2 = Gpascal**2
-Gpascal2.name = "Gpascal2"
-Gpascal3 = Gpascal**3
-Gpascal3.name = "Gpascal3"
-fpascal2 = fpascal**2
-fpascal2.name = "fpascal2"
-fpascal3 = fpascal**3
-fpascal3.name = "fpascal3"
-hpascal2 = hpascal**2
-hpascal2.name = "hpascal2"
-hpascal3 = hpascal**3
-hpascal3.name = "hpascal3"
-dapascal2 = dapascal**2
-dapascal2.name = "dapascal2"
-dapascal3 = dapascal**3
-dapascal3.name = "dapascal3"
-mpascal2 = mpascal**2
-mpascal2.name = "mpascal2"
-mpascal3 = mpascal**3
-mpascal3.name = "mpascal3"
-npascal2 = npascal**2
-npascal2.name = "npascal2"
-npascal3 = npascal**3
-npascal3.name = "npascal3"
-ppascal2 = ppascal**2
-ppascal2.name = "ppascal2"
-ppascal3 = ppascal**3
-ppascal3.name = "ppascal3"
-upascal2 = upascal**2
-upascal2.name = "upascal2"
-upascal3 = upascal**3
-upascal3.name = "upascal3"
-Tpascal2 = Tpascal**2
-Tpascal2.name = "Tpascal2"
-Tpascal3 = Tpascal**3
-Tpascal3.name = "Tpascal3"
-ypascal2 = ypascal**2
-ypascal2.name = "ypascal2"
-ypascal3 = ypascal**3
-ypascal3.name = "ypascal3"
-Epascal2 = Epascal**2
-Epascal2.name = "Epascal2"
-Epascal3 = Epascal**3
-Epascal3.name = "Epascal3"
-zpascal2 = zpascal**2
-zpascal2.name = "zpascal2"
-zpascal3 = zpascal**3
-zpascal3.name = "zpascal3"
-Mpascal2 = Mpascal**2
-Mpascal2.name = "Mpascal2"
-Mpascal3 = Mpascal**3
-Mpascal3.name = "Mpascal3"
-kpascal2 = kpascal**2
-kpascal2.name = "kpascal2"
-kpascal3 = kpascal**3
-kpascal3.name = "kpascal3"
-Ypascal2 = Ypascal**2
-Ypascal2.name = "Ypascal2"
-Ypascal3 = Ypascal**3
-Ypascal3.name = "Ypascal3"
-ajoule2 = ajoule**2
-ajoule2.name = "ajoule2"
-ajoule3 = ajoule**3
-ajoule3.name = "ajoule3"
-cjoule2 = cjoule**2
-cjoule2.name = "cjoule2"
-cjoule3 = cjoule**3
-cjoule3.name = "cjoule3"
-Zjoule2 = Zjoule**2
-Zjoule2.name = "Zjoule2"
-Zjoule3 = Zjoule**3
-Zjoule3.name = "Zjoule3"
-Pjoule2 = Pjoule**2
-Pjoule2.name = "Pjoule2"
-Pjoule3 = Pjoule**3
-Pjoule3.name = "Pjoule3"
-djoule2 = djoule**2
-djoule2.name = "djoule2"
-djoule3 = djoule**3
-djoule3.name = "djoule3"
-Gjoule2 = Gjoule**2
-Gjoule2.name = "Gjoule2"
-Gjoule3 = Gjoule**3
-Gjoule3.name = "Gjoule3"
-fjoule2 = fjoule**2
-fjoule2.name = "fjoule2"
-fjoule3 = fjoule**3
-fjoule3.name = "fjoule3"
-hjoule2 = hjoule**2
-hjoule2.name = "hjoule2"
-hjoule3 = hjoule**3
-hjoule3.name = "hjoule3"
-dajoule2 = dajoule**2
-dajoule2.name = "dajoule2"
-dajoule3 = dajoule**3
-dajoule3.name = "dajoule3"
-mjoule2 = mjoule**2
-mjoule2.name = "mjoule2"
-mjoule3 = mjoule**3
-mjoule3.name = "mjoule3"
-njoule2 = njoule**2
-njoule2.name = "njoule2"
-njoule3 = njoule**3
-njoule3.name = "njoule3"
-pjoule2 = pjoule**2
-pjoule2.name = "pjoule2"
-pjoule3 = pjoule**3
-pjoule3.name = "pjoule3"
-ujoule2 = ujoule**2
-ujoule2.name = "ujoule2"
-ujoule3 = ujoule**3
-ujoule3.name = "ujoule3"
-Tjoule2 = Tjoule**2
-Tjoule2.name = "Tjoule2"
-Tjoule3 = Tjoule**3
-Tjoule3.name = "Tjoule3"
-yjoule2 = yjoule**2
-yjoule2.name = "yjoule2"
-yjoule3 = yjoule**3
-yjoule3.name = "yjoule3"
-Ejoule2 = Ejoule**2
-Ejoule2.name = "Ejoule2"
-Ejoule3 = Ejoule**3
-Ejoule3.name = "Ejoule3"
-zjoule2 = zjoule**2
-zjoule2.name = "zjoule2"
-zjoule3 = zjoule**3
-zjoule3.name = "zjoule3"
-Mjoule2 = Mjoule**2
-Mjoule2.name = "Mjoule2"
-Mjoule3 = Mjoule**3
-Mjoule3.name = "Mjoule3"
-kjoule2 = kjoule**2
-kjoule2.name = "kjoule2"
-kjoule3 = kjoule**3
-kjoule3.name = "kjoule3"
-Yjoule2 = Yjoule**2
-Yjoule2.name = "Yjoule2"
-Yjoule3 = Yjoule**3
-Yjoule3.name = "Yjoule3"
-awatt2 = awatt**2
-awatt2.name = "awatt2"
-awatt3 = awatt**3
-awatt3.name = "awatt3"
-cwatt2 = cwatt**2
-cwatt2.name = "cwatt2"
-cwatt3 = cwatt**3
-cwatt3.name = "cwatt3"
-Zwatt2 = Zwatt**2
-Zwatt2.name = "Zwatt2"
-Zwatt3 = Zwatt**3
-Zwatt3.name = "Zwatt3"
-Pwatt2 = Pwatt**2
-Pwatt2.name = "Pwatt2"
-Pwatt3 = Pwatt**3
-Pwatt3.name = "Pwatt3"
-dwatt2 = dwatt**2
-dwatt2.name = "dwatt2"
-dwatt3 = dwatt**3
-dwatt3.name = "dwatt3"
-Gwatt2 = Gwatt**2
-Gwatt2.name = "Gwatt2"
-Gwatt3 = Gwatt**3
-Gwatt3.name = "Gwatt3"
-fwatt2 = fwatt**2
-fwatt2.name = "fwatt2"
-fwatt3 = fwatt**3
-fwatt3.name = "fwatt3"
-hwatt2 = hwatt**2
-hwatt2.name = "hwatt2"
-hwatt3 = hwatt**3
-hwatt3.name = "hwatt3"
-dawatt2 = dawatt**2
-dawatt2.name = "dawatt2"
-dawatt3 = dawatt**3
-dawatt3.name = "dawatt3"
-mwatt2 = mwatt**2
-mwatt2.name = "mwatt2"
-mwatt3 = mwatt**3
-mwatt3.name = "mwatt3"
-nwatt2 = nwatt**2
-nwatt2.name = "nwatt2"
-nwatt3 = nwatt**3
-nwatt3.name = "nwatt3"
-pwatt2 = pwatt**2
-pwatt2.name = "pwatt2"
-pwatt3 = pwatt**3
-pwatt3.name = "pwatt3"
-uwatt2 = uwatt**2
-uwatt2.name = "uwatt2"
-uwatt3 = uwatt**3
-uwatt3.name = "uwatt3"
-Twatt2 = Twatt**2
-Twatt2.name = "Twatt2"
-Twatt3 = Twatt**3
-Twatt3.name = "Twatt3"
-ywatt2 = ywatt**2
-ywatt2.name = "ywatt2"
-ywatt3 = ywatt**3
-ywatt3.name = "ywatt3"
-Ewatt2 = Ewatt**2
-Ewatt2.name = "Ewatt2"
-Ewatt3 = Ewatt**3
-Ewatt3.name = "Ewatt3"
-zwatt2 = zwatt**2
-zwatt2.name = "zwatt2"
-zwatt3 = zwatt**3
-zwatt3.name = "zwatt3"
-Mwatt2 = Mwatt**2
-Mwatt2.name = "Mwatt2"
-Mwatt3 = Mwatt**3
-Mwatt3.name = "Mwatt3"
-kwatt2 = kwatt**2
-kwatt2.name = "kwatt2"
-kwatt3 = kwatt**3
-kwatt3.name = "kwatt3"
-Ywatt2 = Ywatt**2
-Ywatt2.name = "Ywatt2"
-Ywatt3 = Ywatt**3
-Ywatt3.name = "Ywatt3"
-acoulomb2 = acoulomb**2
-acoulomb2.name = "acoulomb2"
-acoulomb3 = acoulomb**3
-acoulomb3.name = "acoulomb3"
-ccoulomb2 = ccoulomb**2
-ccoulomb2.name = "ccoulomb2"
-ccoulomb3 = ccoulomb**3
-ccoulomb3.name = "ccoulomb3"
-Zcoulomb2 = Zcoulomb**2
-Zcoulomb2.name = "Zcoulomb2"
-Zcoulomb3 = Zcoulomb**3
-Zcoulomb3.name = "Zcoulomb3"
-Pcoulomb2 = Pcoulomb**2
-Pcoulomb2.name = "Pcoulomb2"
-Pcoulomb3 = Pcoulomb**3
-Pcoulomb3.name = "Pcoulomb3"
-dcoulomb2 = dcoulomb**2
-dcoulomb2.name = "dcoulomb2"
-dcoulomb3 = dcoulomb**3
-dcoulomb3.name = "dcoulomb3"
-Gcoulomb2 = Gcoulomb**2
-Gcoulomb2.name = "Gcoulomb2"
-Gcoulomb3 = Gcoulomb**3
-Gcoulomb3.name = "Gcoulomb3"
-fcoulomb2 = fcoulomb**2
-fcoulomb2.name = "fcoulomb2"
-fcoulomb3 = fcoulomb**3
-fcoulomb3.name = "fcoulomb3"
-hcoulomb2 = hcoulomb**2
-hcoulomb2.name = "hcoulomb2"
-hcoulomb3 = hcoulomb**3
-hcoulomb3.name = "hcoulomb3"
-dacoulomb2 = dacoulomb**2
-dacoulomb2.name = "dacoulomb2"
-dacoulomb3 = dacoulomb**3
-dacoulomb3.name = "dacoulomb3"
-mcoulomb2 = mcoulomb**2
-mcoulomb2.name = "mcoulomb2"
-mcoulomb3 = mcoulomb**3
-mcoulomb3.name = "mcoulomb3"
-ncoulomb2 = ncoulomb**2
-ncoulomb2.name = "ncoulomb2"
-ncoulomb3 = ncoulomb**3
-ncoulomb3.name = "ncoulomb3"
-pcoulomb2 = pcoulomb**2
-pcoulomb2.name = "pcoulomb2"
-pcoulomb3 = pcoulomb**3
-pcoulomb3.name = "pcoulomb3"
-ucoulomb2 = ucoulomb**2
-ucoulomb2.name = "ucoulomb2"
-ucoulomb3 = ucoulomb**3
-ucoulomb3.name = "ucoulomb3"
-Tcoulomb2 = Tcoulomb**2
-Tcoulomb2.name = "Tcoulomb2"
-Tcoulomb3 = Tcoulomb**3
-Tcoulomb3.name = "Tcoulomb3"
-ycoulomb2 = ycoulomb**2
-ycoulomb2.name = "ycoulomb2"
-ycoulomb3 = ycoulomb**3
-ycoulomb3.name = "ycoulomb3"
-Ecoulomb2 = Ecoulomb**2
-Ecoulomb2.name = "Ecoulomb2"
-Ecoulomb3 = Ecoulomb**3
-Ecoulomb3.name = "Ecoulomb3"
-zcoulomb2 = zcoulomb**2
-zcoulomb2.name = "zcoulomb2"
-zcoulomb3 = zcoulomb**3
-zcoulomb3.name = "zcoulomb3"
-Mcoulomb2 = Mcoulomb**2
-Mcoulomb2.name = "Mcoulomb2"
-Mcoulomb3 = Mcoulomb**3
-Mcoulomb3.name = "Mcoulomb3"
-kcoulomb2 = kcoulomb**2
-kcoulomb2.name = "kcoulomb2"
-kcoulomb3 = kcoulomb**3
-kcoulomb3.name = "kcoulomb3"
-Ycoulomb2 = Ycoulomb**2
-Ycoulomb2.name = "Ycoulomb2"
-Ycoulomb3 = Ycoulomb**3
-Ycoulomb3.name = "Ycoulomb3"
-avolt2 = avolt**2
-avolt2.name = "avolt2"
-avolt3 = avolt**3
-avolt3.name = "avolt3"
-cvolt2 = cvolt**2
-cvolt2.name = "cvolt2"
-cvolt3 = cvolt**3
-cvolt3.name = "cvolt3"
-Zvolt2 = Zvolt**2
-Zvolt2.name = "Zvolt2"
-Zvolt3 = Zvolt**3
-Zvolt3.name = "Zvolt3"
-Pvolt2 = Pvolt**2
-Pvolt2.name = "Pvolt2"
-Pvolt3 = Pvolt**3
-Pvolt3.name = "Pvolt3"
-dvolt2 = dvolt**2
-dvolt2.name = "dvolt2"
-dvolt3 = dvolt**3
-dvolt3.name = "dvolt3"
-Gvolt2 = Gvolt**2
-Gvolt2.name = "Gvolt2"
-Gvolt3 = Gvolt**3
-Gvolt3.name = "Gvolt3"
-fvolt2 = fvolt**2
-fvolt2.name = "fvolt2"
-fvolt3 = fvolt**3
-fvolt3.name = "fvolt3"
-hvolt2 = hvolt**2
-hvolt2.name = "hvolt2"
-hvolt3 = hvolt**3
-hvolt3.name = "hvolt3"
-davolt2 = davolt**2
-davolt2.name = "davolt2"
-davolt3 = davolt**3
-davolt3.name = "davolt3"
-mvolt2 = mvolt**2
-mvolt2.name = "mvolt2"
-mvolt3 = mvolt**3
-mvolt3.name = "mvolt3"
-nvolt2 = nvolt**2
-nvolt2.name = "nvolt2"
-nvolt3 = nvolt**3
-nvolt3.name = "nvolt3"
-pvolt2 = pvolt**2
-pvolt2.name = "pvolt2"
-pvolt3 = pvolt**3
-pvolt3.name = "pvolt3"
-uvolt2 = uvolt**2
-uvolt2.name = "uvolt2"
-uvolt3 = uvolt**3
-uvolt3.name = "uvolt3"
-Tvolt2 = Tvolt**2
-Tvolt2.name = "Tvolt2"
-Tvolt3 = Tvolt**3
-Tvolt3.name = "Tvolt3"
-yvolt2 = yvolt**2
-yvolt2.name = "yvolt2"
-yvolt3 = yvolt**3
-yvolt3.name = "yvolt3"
-Evolt2 = Evolt**2
-Evolt2.name = "Evolt2"
-Evolt3 = Evolt**3
-Evolt3.name = "Evolt3"
-zvolt2 = zvolt**2
-zvolt2.name = "zvolt2"
-zvolt3 = zvolt**3
-zvolt3.name = "zvolt3"
-Mvolt2 = Mvolt**2
-Mvolt2.name = "Mvolt2"
-Mvolt3 = Mvolt**3
-Mvolt3.name = "Mvolt3"
-kvolt2 = kvolt**2
-kvolt2.name = "kvolt2"
-kvolt3 = kvolt**3
-kvolt3.name = "kvolt3"
-Yvolt2 = Yvolt**2
-Yvolt2.name = "Yvolt2"
-Yvolt3 = Yvolt**3
-Yvolt3.name = "Yvolt3"
-afarad2 = afarad**2
-afarad2.name = "afarad2"
-afarad3 = afarad**3
-afarad3.name = "afarad3"
-cfarad2 = cfarad**2
-cfarad2.name = "cfarad2"
-cfarad3 = cfarad**3
-cfarad3.name = "cfarad3"
-Zfarad2 = Zfarad**2
-Zfarad2.name = "Zfarad2"
-Zfarad3 = Zfarad**3
-Zfarad3.name = "Zfarad3"
-Pfarad2 = Pfarad**2
-Pfarad2.name = "Pfarad2"
-Pfarad3 = Pfarad**3
-Pfarad3.name = "Pfarad3"
-dfarad2 = dfarad**2
-dfarad2.name = "dfarad2"
-dfarad3 = dfarad**3
-dfarad3.name = "dfarad3"
-Gfarad2 = Gfarad**2
-Gfarad2.name = "Gfarad2"
-Gfarad3 = Gfarad**3
-Gfarad3.name = "Gfarad3"
-ffarad2 = ffarad**2
-ffarad2.name = "ffarad2"
-ffarad3 = ffarad**3
-ffarad3.name = "ffarad3"
-hfarad2 = hfarad**2
-hfarad2.name = "hfarad2"
-hfarad3 = hfarad**3
-hfarad3.name = "hfarad3"
-dafarad2 = dafarad**2
-dafarad2.name = "dafarad2"
-dafarad3 = dafarad**3
-dafarad3.name = "dafarad3"
-mfarad2 = mfarad**2
-mfarad2.name = "mfarad2"
-mfarad3 = mfarad**3
-mfarad3.name = "mfarad3"
-nfarad2 = nfarad**2
-nfarad2.name = "nfarad2"
-nfarad3 = nfarad**3
-nfarad3.name = "nfarad3"
-pfarad2 = pfarad**2
-pfarad2.name = "pfarad2"
-pfarad3 = pfarad**3
-pfarad3.name = "pfarad3"
-ufarad2 = ufarad**2
-ufarad2.name = "ufarad2"
-ufarad3 = ufarad**3
-ufarad3.name = "ufarad3"
-Tfarad2 = Tfarad**2
-Tfarad2.name = "Tfarad2"
-Tfarad3 = Tfarad**3
-Tfarad3.name = "Tfarad3"
-yfarad2 = yfarad**2
-yfarad2.name = "yfarad2"
-yfarad3 = yfarad**3
-yfarad3.name = "yfarad3"
-Efarad2 = Efarad**2
-Efarad2.name = "Efarad2"
-Efarad3 = Efarad**3
-Efarad3.name = "Efarad3"
-zfarad2 = zfarad**2
-zfarad2.name = "zfarad2"
-zfarad3 = zfarad**3
-zfarad3.name = "zfarad3"
-Mfarad2 = Mfarad**2
-Mfarad2.name = "Mfarad2"
-Mfarad3 = Mfarad**3
-Mfarad3.name = "Mfarad3"
-kfarad2 = kfarad**2
-kfarad2.name = "kfarad2"
-kfarad3 = kfarad**3
-kfarad3.name = "kfarad3"
-Yfarad2 = Yfarad**2
-Yfarad2.name = "Yfarad2"
-Yfarad3 = Yfarad**3
-Yfarad3.name = "Yfarad3"
-aohm2 = aohm**2
-aohm2.name = "aohm2"
-aohm3 = aohm**3
-aohm3.name = "aohm3"
-cohm2 = cohm**2
-cohm2.name = "cohm2"
-cohm3 = cohm**3
-cohm3.name = "cohm3"
-Zohm2 = Zohm**2
-Zohm2.name = "Zohm2"
-Zohm3 = Zohm**3
-Zohm3.name = "Zohm3"
-Pohm2 = Pohm**2
-Pohm2.name = "Pohm2"
-Pohm3 = Pohm**3
-Pohm3.name = "Pohm3"
-dohm2 = dohm**2
-dohm2.name = "dohm2"
-dohm3 = dohm**3
-dohm3.name = "dohm3"
-Gohm2 = Gohm**2
-Gohm2.name = "Gohm2"
-Gohm3 = Gohm**3
-Gohm3.name = "Gohm3"
-fohm2 = fohm**2
-fohm2.name = "fohm2"
-fohm3 = fohm**3
-fohm3.name = "fohm3"
-hohm2 = hohm**2
-hohm2.name = "hohm2"
-hohm3 = hohm**3
-hohm3.name = "hohm3"
-daohm2 = daohm**2
-daohm2.name = "daohm2"
-daohm3 = daohm**3
-daohm3.name = "daohm3"
-mohm2 = mohm**2
-mohm2.name = "mohm2"
-mohm3 = mohm**3
-mohm3.name = "mohm3"
-nohm2 = nohm**2
-nohm2.name = "nohm2"
-nohm3 = nohm**3
-nohm3.name = "nohm3"
-pohm2 = pohm**2
-pohm2.name = "pohm2"
-pohm3 = pohm**3
-pohm3.name = "pohm3"
-uohm2 = uohm**2
-uohm2.name = "uohm2"
-uohm3 = uohm**3
-uohm3.name = "uohm3"
-Tohm2 = Tohm**2
-Tohm2.name = "Tohm2"
-Tohm3 = Tohm**3
-Tohm3.name = "Tohm3"
-yohm2 = yohm**2
-yohm2.name = "yohm2"
-yohm3 = yohm**3
-yohm3.name = "yohm3"
-Eohm2 = Eohm**2
-Eohm2.name = "Eohm2"
-Eohm3 = Eohm**3
-Eohm3.name = "Eohm3"
-zohm2 = zohm**2
-zohm2.name = "zohm2"
-zohm3 = zohm**3
-zohm3.name = "zohm3"
-Mohm2 = Mohm**2
-Mohm2.name = "Mohm2"
-Mohm3 = Mohm**3
-Mohm3.name = "Mohm3"
-kohm2 = kohm**2
-kohm2.name = "kohm2"
-kohm3 = kohm**3
-kohm3.name = "kohm3"
-Yohm2 = Yohm**2
-Yohm2.name = "Yohm2"
-Yohm3 = Yohm**3
-Yohm3.name = "Yohm3"
-asiemens2 = asiemens**2
-asiemens2.name = "asiemens2"
-asiemens3 = asiemens**3
-asiemens3.name = "asiemens3"
-csiemens2 = csiemens**2
-csiemens2.name = "csiemens2"
-csiemens3 = csiemens**3
-csiemens3.name = "csiemens3"
-Zsiemens2 = Zsiemens**2
-Zsiemens2.name = "Zsiemens2"
-Zsiemens3 = Zsiemens**3
-Zsiemens3.name = "Zsiemens3"
-Psiemens2 = Psiemens**2
-Psiemens2.name = "Psiemens2"
-Psiemens3 = Psiemens**3
-Psiemens3.name = "Psiemens3"
-dsiemens2 = dsiemens**2
-dsiemens2.name = "dsiemens2"
-dsiemens3 = dsiemens**3
-dsiemens3.name = "dsiemens3"
-Gsiemens2 = Gsiemens**2
-Gsiemens2.name = "Gsiemens2"
-Gsiemens3 = Gsiemens**3
-Gsiemens3.name = "Gsiemens3"
-fsiemens2 = fsiemens**2
-fsiemens2.name = "fsiemens2"
-fsiemens3 = fsiemens**3
-fsiemens3.name = "fsiemens3"
-hsiemens2 = hsiemens**2
-hsiemens2.name = "hsiemens2"
-hsiemens3 = hsiemens**3
-hsiemens3.name = "hsiemens3"
-dasiemens2 = dasiemens**2
-dasiemens2.name = "dasiemens2"
-dasiemens3 = dasiemens**3
-dasiemens3.name = "dasiemens3"
-msiemens2 = msiemens**2
-msiemens2.name = "msiemens2"
-msiemens3 = msiemens**3
-msiemens3.name = "msiemens3"
-nsiemens2 = nsiemens**2
-nsiemens2.name = "nsiemens2"
-nsiemens3 = nsiemens**3
-nsiemens3.name = "nsiemens3"
-psiemens2 = psiemens**2
-psiemens2.name = "psiemens2"
-psiemens3 = psiemens**3
-psiemens3.name = "psiemens3"
-usiemens2 = usiemens**2
-usiemens2.name = "usiemens2"
-usiemens3 = usiemens**3
-usiemens3.name = "usiemens3"
-Tsiemens2 = Tsiemens**2
-Tsiemens2.name = "Tsiemens2"
-Tsiemens3 = Tsiemens**3
-Tsiemens3.name = "Tsiemens3"
-ysiemens2 = ysiemens**2
-ysiemens2.name = "ysiemens2"
-ysiemens3 = ysiemens**3
-ysiemens3.name = "ysiemens3"
-Esiemens2 = Esiemens**2
-Esiemens2.name = "Esiemens2"
-Esiemens3 = Esiemens**3
-Esiemens3.name = "Esiemens3"
-zsiemens2 = zsiemens**2
-zsiemens2.name = "zsiemens2"
-zsiemens3 = zsiemens**3
-zsiemens3.name = "zsiemens3"
-Msiemens2 = Msiemens**2
-Msiemens2.name = "Msiemens2"
-Msiemens3 = Msiemens**3
-Msiemens3.name = "Msiemens3"
-ksiemens2 = ksiemens**2
-ksiemens2.name = "ksiemens2"
-ksiemens3 = ksiemens**3
-ksiemens3.name = "ksiemens3"
-Ysiemens2 = Ysiemens**2
-Ysiemens2.name = "Ysiemens2"
-Ysiemens3 = Ysiemens**3
-Ysiemens3.name = "Ysiemens3"
-aweber2 = aweber**2
-aweber2.name = "aweber2"
-aweber3 = aweber**3
-aweber3.name = "aweber3"
-cweber2 = cweber**2
-cweber2.name = "cweber2"
-cweber3 = cweber**3
-cweber3.name = "cweber3"
-Zweber2 = Zweber**2
-Zweber2.name = "Zweber2"
-Zweber3 = Zweber**3
-Zweber3.name = "Zweber3"
-Pweber2 = Pweber**2
-Pweber2.name = "Pweber2"
-Pweber3 = Pweber**3
-Pweber3.name = "Pweber3"
-dweber2 = dweber**2
-dweber2.name = "dweber2"
-dweber3 = dweber**3
-dweber3.name = "dweber3"
-Gweber2 = Gweber**2
-Gweber2.name = "Gweber2"
-Gweber3 = Gweber**3
-Gweber3.name = "Gweber3"
-fweber2 = fweber**2
-fweber2.name = "fweber2"
-fweber3 = fweber**3
-fweber3.name = "fweber3"
-hweber2 = hweber**2
-hweber2.name = "hweber2"
-hweber3 = hweber**3
-hweber3.name = "hweber3"
-daweber2 = daweber**2
-daweber2.name = "daweber2"
-daweber3 = daweber**3
-daweber3.name = "daweber3"
-mweber2 = mweber**2
-mweber2.name = "mweber2"
-mweber3 = mweber**3
-mweber3.name = "mweber3"
-nweber2 = nweber**2
-nweber2.name = "nweber2"
-nweber3 = nweber**3
-nweber3.name = "nweber3"
-pweber2 = pweber**2
-pweber2.name = "pweber2"
-pweber3 = pweber**3
-pweber3.name = "pweber3"
-uweber2 = uweber**2
-uweber2.name = "uweber2"
-uweber3 = uweber**3
-uweber3.name = "uweber3"
-Tweber2 = Tweber**2
-Tweber2.name = "Tweber2"
-Tweber3 = Tweber**3
-Tweber3.name = "Tweber3"
-yweber2 = yweber**2
-yweber2.name = "yweber2"
-yweber3 = yweber**3
-yweber3.name = "yweber3"
-Eweber2 = Eweber**2
-Eweber2.name = "Eweber2"
-Eweber3 = Eweber**3
-Eweber3.name = "Eweber3"
-zweber2 = zweber**2
-zweber2.name = "zweber2"
-zweber3 = zweber**3
-zweber3.name = "zweber3"
-Mweber2 = Mweber**2
-Mweber2.name = "Mweber2"
-Mweber3 = Mweber**3
-Mweber3.name = "Mweber3"
-kweber2 = kweber**2
-kweber2.name = "kweber2"
-kweber3 = kweber**3
-kweber3.name = "kweber3"
-Yweber2 = Yweber**2
-Yweber2.name = "Yweber2"
-Yweber3 = Yweber**3
-Yweber3.name = "Yweber3"
-atesla2 = atesla**2
-atesla2.name = "atesla2"
-atesla3 = atesla**3
-atesla3.name = "atesla3"
-ctesla2 = ctesla**2
-ctesla2.name = "ctesla2"
-ctesla3 = ctesla**3
-ctesla3.name = "ctesla3"
-Ztesla2 = Ztesla**2
-Ztesla2.name = "Ztesla2"
-Ztesla3 = Ztesla**3
-Ztesla3.name = "Ztesla3"
-Ptesla2 = Ptesla**2
-Ptesla2.name = "Ptesla2"
-Ptesla3 = Ptesla**3
-Ptesla3.name = "Ptesla3"
-dtesla2 = dtesla**2
-dtesla2.name = "dtesla2"
-dtesla3 = dtesla**3
-dtesla3.name = "dtesla3"
-Gtesla2 = Gtesla**2
-Gtesla2.name = "Gtesla2"
-Gtesla3 = Gtesla**3
-Gtesla3.name = "Gtesla3"
-ftesla2 = ftesla**2
-ftesla2.name = "ftesla2"
-ftesla3 = ftesla**3
-ftesla3.name = "ftesla3"
-htesla2 = htesla**2
-htesla2.name = "htesla2"
-htesla3 = htesla**3
-htesla3.name = "htesla3"
-datesla2 = datesla**2
-datesla2.name = "datesla2"
-datesla3 = datesla**3
-datesla3.name = "datesla3"
-mtesla2 = mtesla**2
-mtesla2.name = "mtesla2"
-mtesla3 = mtesla**3
-mtesla3.name = "mtesla3"
-ntesla2 = ntesla**2
-ntesla2.name = "ntesla2"
-ntesla3 = ntesla**3
-ntesla3.name = "ntesla3"
-ptesla2 = ptesla**2
-ptesla2.name = "ptesla2"
-ptesla3 = ptesla**3
-ptesla3.name = "ptesla3"
-utesla2 = utesla**2
-utesla2.name = "utesla2"
-utesla3 = utesla**3
-utesla3.name = "utesla3"
-Ttesla2 = Ttesla**2
-Ttesla2.name = "Ttesla2"
-Ttesla3 = Ttesla**3
-Ttesla3.name = "Ttesla3"
-ytesla2 = ytesla**2
-ytesla2.name = "ytesla2"
-ytesla3 = ytesla**3
-ytesla3.name = "ytesla3"
-Etesla2 = Etesla**2
-Etesla2.name = "Etesla2"
-Etesla3 = Etesla**3
-Etesla3.name = "Etesla3"
-ztesla2 = ztesla**2
-ztesla2.name = "ztesla2"
-ztesla3 = ztesla**3
-ztesla3.name = "ztesla3"
-Mtesla2 = Mtesla**2
-Mtesla2.name = "Mtesla2"
-Mtesla3 = Mtesla**3
-Mtesla3.name = "Mtesla3"
-ktesla2 = ktesla**2
-ktesla2.name = "ktesla2"
-ktesla3 = ktesla**3
-ktesla3.name = "ktesla3"
-Ytesla2 = Ytesla**2
-Ytesla2.name = "Ytesla2"
-Ytesla3 = Ytesla**3
-Ytesla3.name = "Ytesla3"
-ahenry2 = ahenry**2
-ahenry2.name = "ahenry2"
-ahenry3 = ahenry**3
-ahenry3.name = "ahenry3"
-chenry2 = chenry**2
-chenry2.name = "chenry2"
-chenry3 = chenry**3
-chenry3.name = "chenry3"
-Zhenry2 = Zhenry**2
-Zhenry2.name = "Zhenry2"
-Zhenry3 = Zhenry**3
-Zhenry3.name = "Zhenry3"
-Phenry2 = Phenry**2
-Phenry2.name = "Phenry2"
-Phenry3 = Phenry**3
-Phenry3.name = "Phenry3"
-dhenry2 = dhenry**2
-dhenry2.name = "dhenry2"
-dhenry3 = dhenry**3
-dhenry3.name = "dhenry3"
-Ghenry2 = Ghenry**2
-Ghenry2.name = "Ghenry2"
-Ghenry3 = Ghenry**3
-Ghenry3.name = "Ghenry3"
-fhenry2 = fhenry**2
-fhenry2.name = "fhenry2"
-fhenry3 = fhenry**3
-fhenry3.name = "fhenry3"
-hhenry2 = hhenry**2
-hhenry2.name = "hhenry2"
-hhenry3 = hhenry**3
-hhenry3.name = "hhenry3"
-dahenry2 = dahenry**2
-dahenry2.name = "dahenry2"
-dahenry3 = dahenry**3
-dahenry3.name = "dahenry3"
-mhenry2 = mhenry**2
-mhenry2.name = "mhenry2"
-mhenry3 = mhenry**3
-mhenry3.name = "mhenry3"
-nhenry2 = nhenry**2
-nhenry2.name = "nhenry2"
-nhenry3 = nhenry**3
-nhenry3.name = "nhenry3"
-phenry2 = phenry**2
-phenry2.name = "phenry2"
-phenry3 = phenry**3
-phenry3.name = "phenry3"
-uhenry2 = uhenry**2
-uhenry2.name = "uhenry2"
-uhenry3 = uhenry**3
-uhenry3.name = "uhenry3"
-Thenry2 = Thenry**2
-Thenry2.name = "Thenry2"
-Thenry3 = Thenry**3
-Thenry3.name = "Thenry3"
-yhenry2 = yhenry**2
-yhenry2.name = "yhenry2"
-yhenry3 = yhenry**3
-yhenry3.name = "yhenry3"
-Ehenry2 = Ehenry**2
-Ehenry2.name = "Ehenry2"
-Ehenry3 = Ehenry**3
-Ehenry3.name = "Ehenry3"
-zhenry2 = zhenry**2
-zhenry2.name = "zhenry2"
-zhenry3 = zhenry**3
-zhenry3.name = "zhenry3"
-Mhenry2 = Mhenry**2
-Mhenry2.name = "Mhenry2"
-Mhenry3 = Mhenry**3
-Mhenry3.name = "Mhenry3"
-khenry2 = khenry**2
-khenry2.name = "khenry2"
-khenry3 = khenry**3
-khenry3.name = "khenry3"
-Yhenry2 = Yhenry**2
-Yhenry2.name = "Yhenry2"
-Yhenry3 = Yhenry**3
-Yhenry3.name = "Yhenry3"
-acelsius2 = acelsius**2
-acelsius2.name = "acelsius2"
-acelsius3 = acelsius**3
-acelsius3.name = "acelsius3"
-ccelsius2 = ccelsius**2
-ccelsius2.name = "ccelsius2"
-ccelsius3 = ccelsius**3
-ccelsius3.name = "ccelsius3"
-Zcelsius2 = Zcelsius**2
-Zcelsius2.name = "Zcelsius2"
-Zcelsius3 = Zcelsius**3
-Zcelsius3.name = "Zcelsius3"
-Pcelsius2 = Pcelsius**2
-Pcelsius2.name = "Pcelsius2"
-Pcelsius3 = Pcelsius**3
-Pcelsius3.name = "Pcelsius3"
-dcelsius2 = dcelsius**2
-dcelsius2.name = "dcelsius2"
-dcelsius3 = dcelsius**3
-dcelsius3.name = "dcelsius3"
-Gcelsius2 = Gcelsius**2
-Gcelsius2.name = "Gcelsius2"
-Gcelsius3 = Gcelsius**3
-Gcelsius3.name = "Gcelsius3"
-fcelsius2 = fcelsius**2
-fcelsius2.name = "fcelsius2"
-fcelsius3 = fcelsius**3
-fcelsius3.name = "fcelsius3"
-hcelsius2 = hcelsius**2
-hcelsius2.name = "hcelsius2"
-hcelsius3 = hcelsius**3
-hcelsius3.name = "hcelsius3"
-dacelsius2 = dacelsius**2
-dacelsius2.name = "dacelsius2"
-dacelsius3 = dacelsius**3
-dacelsius3.name = "dacelsius3"
-mcelsius2 = mcelsius**2
-mcelsius2.name = "mcelsius2"
-mcelsius3 = mcelsius**3
-mcelsius3.name = "mcelsius3"
-ncelsius2 = ncelsius**2
-ncelsius2.name = "ncelsius2"
-ncelsius3 = ncelsius**3
-ncelsius3.name = "ncelsius3"
-pcelsius2 = pcelsius**2
-pcelsius2.name = "pcelsius2"
-pcelsius3 = pcelsius**3
-pcelsius3.name = "pcelsius3"
-ucelsius2 = ucelsius**2
-ucelsius2.name = "ucelsius2"
-ucelsius3 = ucelsius**3
-ucelsius3.name = "ucelsius3"
-Tcelsius2 = Tcelsius**2
-Tcelsius2.name = "Tcelsius2"
-Tcelsius3 = Tcelsius**3
-Tcelsius3.name = "Tcelsius3"
-ycelsius2 = ycelsius**2
-ycelsius2.name = "ycelsius2"
-ycelsius3 = ycelsius**3
-ycelsius3.name = "ycelsius3"
-Ecelsius2 = Ecelsius**2
-Ecelsius2.name = "Ecelsius2"
-Ecelsius3 = Ecelsius**3
-Ecelsius3.name = "Ecelsius3"
-zcelsius2 = zcelsius**2
-zcelsius2.name = "zcelsius2"
-zcelsius3 = zcelsius**3
-zcelsius3.name = "zcelsius3"
-Mcelsius2 = Mcelsius**2
-Mcelsius2.name = "Mcelsius2"
-Mcelsius3 = Mcelsius**3
-Mcelsius3.name = "Mcelsius3"
-kcelsius2 = kcelsius**2
-kcelsius2.name = "kcelsius2"
-kcelsius3 = kcelsius**3
-kcelsius3.name = "kcelsius3"
-Ycelsius2 = Ycelsius**2
-Ycelsius2.name = "Ycelsius2"
-Ycelsius3 = Ycelsius**3
-Ycelsius3.name = "Ycelsius3"
-alumen2 = alumen**2
-alumen2.name = "alumen2"
-alumen3 = alumen**3
-alumen3.name = "alumen3"
-clumen2 = clumen**2
-clumen2.name = "clumen2"
-clumen3 = clumen**3
-clumen3.name = "clumen3"
-Zlumen2 = Zlumen**2
-Zlumen2.name = "Zlumen2"
-Zlumen3 = Zlumen**3
-Zlumen3.name = "Zlumen3"
-Plumen2 = Plumen**2
-Plumen2.name = "Plumen2"
-Plumen3 = Plumen**3
-Plumen3.name = "Plumen3"
-dlumen2 = dlumen**2
-dlumen2.name = "dlumen2"
-dlumen3 = dlumen**3
-dlumen3.name = "dlumen3"
-Glumen2 = Glumen**2
-Glumen2.name = "Glumen2"
-Glumen3 = Glumen**3
-Glumen3.name = "Glumen3"
-flumen2 = flumen**2
-flumen2.name = "flumen2"
-flumen3 = flumen**3
-flumen3.name = "flumen3"
-hlumen2 = hlumen**2
-hlumen2.name = "hlumen2"
-hlumen3 = hlumen**3
-hlumen3.name = "hlumen3"
-dalumen2 = dalumen**2
-dalumen2.name = "dalumen2"
-dalumen3 = dalumen**3
-dalumen3.name = "dalumen3"
-mlumen2 = mlumen**2
-mlumen2.name = "mlumen2"
-mlumen3 = mlumen**3
-mlumen3.name = "mlumen3"
-nlumen2 = nlumen**2
-nlumen2.name = "nlumen2"
-nlumen3 = nlumen**3
-nlumen3.name = "nlumen3"
-plumen2 = plumen**2
-plumen2.name = "plumen2"
-plumen3 = plumen**3
-plumen3.name = "plumen3"
-ulumen2 = ulumen**2
-ulumen2.name = "ulumen2"
-ulumen3 = ulumen**3
-ulumen3.name = "ulumen3"
-Tlumen2 = Tlumen**2
-Tlumen2.name = "Tlumen2"
-Tlumen3 = Tlumen**3
-Tlumen3.name = "Tlumen3"
-ylumen2 = ylumen**2
-ylumen2.name = "ylumen2"
-ylumen3 = ylumen**3
-ylumen3.name = "ylumen3"
-Elumen2 = Elumen**2
-Elumen2.name = "Elumen2"
-Elumen3 = Elumen**3
-Elumen3.name = "Elumen3"
-zlumen2 = zlumen**2
-zlumen2.name = "zlumen2"
-zlumen3 = zlumen**3
-zlumen3.name = "zlumen3"
-Mlumen2 = Mlumen**2
-Mlumen2.name = "Mlumen2"
-Mlumen3 = Mlumen**3
-Mlumen3.name = "Mlumen3"
-klumen2 = klumen**2
-klumen2.name = "klumen2"
-klumen3 = klumen**3
-klumen3.name = "klumen3"
-Ylumen2 = Ylumen**2
-Ylumen2.name = "Ylumen2"
-Ylumen3 = Ylumen**3
-Ylumen3.name = "Ylumen3"
-alux2 = alux**2
-alux2.name = "alux2"
-alux3 = alux**3
-alux3.name = "alux3"
-clux2 = clux**2
-clux2.name = "clux2"
-clux3 = clux**3
-clux3.name = "clux3"
-Zlux2 = Zlux**2
-Zlux2.name = "Zlux2"
-Zlux3 = Zlux**3
-Zlux3.name = "Zlux3"
-Plux2 = Plux**2
-Plux2.name = "Plux2"
-Plux3 = Plux**3
-Plux3.name = "Plux3"
-dlux2 = dlux**2
-dlux2.name = "dlux2"
-dlux3 = dlux**3
-dlux3.name = "dlux3"
-Glux2 = Glux**2
-Glux2.name = "Glux2"
-Glux3 = Glux**3
-Glux3.name = "Glux3"
-flux2 = flux**2
-flux2.name = "flux2"
-flux3 = flux**3
-flux3.name = "flux3"
-hlux2 = hlux**2
-hlux2.name = "hlux2"
-hlux3 = hlux**3
-hlux3.name = "hlux3"
-dalux2 = dalux**2
-dalux2.name = "dalux2"
-dalux3 = dalux**3
-dalux3.name = "dalux3"
-mlux2 = mlux**2
-mlux2.name = "mlux2"
-mlux3 = mlux**3
-mlux3.name = "mlux3"
-nlux2 = nlux**2
-nlux2.name = "nlux2"
-nlux3 = nlux**3
-nlux3.name = "nlux3"
-plux2 = plux**2
-plux2.name = "plux2"
-plux3 = plux**3
-plux3.name = "plux3"
-ulux2 = ulux**2
-ulux2.name = "ulux2"
-ulux3 = ulux**3
-ulux3.name = "ulux3"
-Tlux2 = Tlux**2
-Tlux2.name = "Tlux2"
-Tlux3 = Tlux**3
-Tlux3.name = "Tlux3"
-ylux2 = ylux**2
-ylux2.name = "ylux2"
-ylux3 = ylux**3
-ylux3.name = "ylux3"
-Elux2 = Elux**2
-Elux2.name = "Elux2"
-Elux3 = Elux**3
-Elux3.name = "Elux3"
-zlux2 = zlux**2
-zlux2.name = "zlux2"
-zlux3 = zlux**3
-zlux3.name = "zlux3"
-Mlux2 = Mlux**2
-Mlux2.name = "Mlux2"
-Mlux3 = Mlux**3
-Mlux3.name = "Mlux3"
-klux2 = klux**2
-klux2.name = "klux2"
-klux3 = klux**3
-klux3.name = "klux3"
-Ylux2 = Ylux**2
-Ylux2.name = "Ylux2"
-Ylux3 = Ylux**3
-Ylux3.name = "Ylux3"
-abecquerel2 = abecquerel**2
-abecquerel2.name = "abecquerel2"
-abecquerel3 = abecquerel**3
-abecquerel3.name = "abecquerel3"
-cbecquerel2 = cbecquerel**2
-cbecquerel2.name = "cbecquerel2"
-cbecquerel3 = cbecquerel**3
-cbecquerel3.name = "cbecquerel3"
-Zbecquerel2 = Zbecquerel**2
-Zbecquerel2.name = "Zbecquerel2"
-Zbecquerel3 = Zbecquerel**3
-Zbecquerel3.name = "Zbecquerel3"
-Pbecquerel2 = Pbecquerel**2
-Pbecquerel2.name = "Pbecquerel2"
-Pbecquerel3 = Pbecquerel**3
-Pbecquerel3.name = "Pbecquerel3"
-dbecquerel2 = dbecquerel**2
-dbecquerel2.name = "dbecquerel2"
-dbecquerel3 = dbecquerel**3
-dbecquerel3.name = "dbecquerel3"
-Gbecquerel2 = Gbecquerel**2
-Gbecquerel2.name = "Gbecquerel2"
-Gbecquerel3 = Gbecquerel**3
-Gbecquerel3.name = "Gbecquerel3"
-fbecquerel2 = fbecquerel**2
-fbecquerel2.name = "fbecquerel2"
-fbecquerel3 = fbecquerel**3
-fbecquerel3.name = "fbecquerel3"
-hbecquerel2 = hbecquerel**2
-hbecquerel2.name = "hbecquerel2"
-hbecquerel3 = hbecquerel**3
-hbecquerel3.name = "hbecquerel3"
-dabecquerel2 = dabecquerel**2
-dabecquerel2.name = "dabecquerel2"
-dabecquerel3 = dabecquerel**3
-dabecquerel3.name = "dabecquerel3"
-mbecquerel2 = mbecquerel**2
-mbecquerel2.name = "mbecquerel2"
-mbecquerel3 = mbecquerel**3
-mbecquerel3.name = "mbecquerel3"
-nbecquerel2 = nbecquerel**2
-nbecquerel2.name = "nbecquerel2"
-nbecquerel3 = nbecquerel**3
-nbecquerel3.name = "nbecquerel3"
-pbecquerel2 = pbecquerel**2
-pbecquerel2.name = "pbecquerel2"
-pbecquerel3 = pbecquerel**3
-pbecquerel3.name = "pbecquerel3"
-ubecquerel2 = ubecquerel**2
-ubecquerel2.name = "ubecquerel2"
-ubecquerel3 = ubecquerel**3
-ubecquerel3.name = "ubecquerel3"
-Tbecquerel2 = Tbecquerel**2
-Tbecquerel2.name = "Tbecquerel2"
-Tbecquerel3 = Tbecquerel**3
-Tbecquerel3.name = "Tbecquerel3"
-ybecquerel2 = ybecquerel**2
-ybecquerel2.name = "ybecquerel2"
-ybecquerel3 = ybecquerel**3
-ybecquerel3.name = "ybecquerel3"
-Ebecquerel2 = Ebecquerel**2
-Ebecquerel2.name = "Ebecquerel2"
-Ebecquerel3 = Ebecquerel**3
-Ebecquerel3.name = "Ebecquerel3"
-zbecquerel2 = zbecquerel**2
-zbecquerel2.name = "zbecquerel2"
-zbecquerel3 = zbecquerel**3
-zbecquerel3.name = "zbecquerel3"
-Mbecquerel2 = Mbecquerel**2
-Mbecquerel2.name = "Mbecquerel2"
-Mbecquerel3 = Mbecquerel**3
-Mbecquerel3.name = "Mbecquerel3"
-kbecquerel2 = kbecquerel**2
-kbecquerel2.name = "kbecquerel2"
-kbecquerel3 = kbecquerel**3
-kbecquerel3.name = "kbecquerel3"
-Ybecquerel2 = Ybecquerel**2
-Ybecquerel2.name = "Ybecquerel2"
-Ybecquerel3 = Ybecquerel**3
-Ybecquerel3.name = "Ybecquerel3"
-agray2 = agray**2
-agray2.name = "agray2"
-agray3 = agray**3
-agray3.name = "agray3"
-cgray2 = cgray**2
-cgray2.name = "cgray2"
-cgray3 = cgray**3
-cgray3.name = "cgray3"
-Zgray2 = Zgray**2
-Zgray2.name = "Zgray2"
-Zgray3 = Zgray**3
-Zgray3.name = "Zgray3"
-Pgray2 = Pgray**2
-Pgray2.name = "Pgray2"
-Pgray3 = Pgray**3
-Pgray3.name = "Pgray3"
-dgray2 = dgray**2
-dgray2.name = "dgray2"
-dgray3 = dgray**3
-dgray3.name = "dgray3"
-Ggray2 = Ggray**2
-Ggray2.name = "Ggray2"
-Ggray3 = Ggray**3
-Ggray3.name = "Ggray3"
-fgray2 = fgray**2
-fgray2.name = "fgray2"
-fgray3 = fgray**3
-fgray3.name = "fgray3"
-hgray2 = hgray**2
-hgray2.name = "hgray2"
-hgray3 = hgray**3
-hgray3.name = "hgray3"
-dagray2 = dagray**2
-dagray2.name = "dagray2"
-dagray3 = dagray**3
-dagray3.name = "dagray3"
-mgray2 = mgray**2
-mgray2.name = "mgray2"
-mgray3 = mgray**3
-mgray3.name = "mgray3"
-ngray2 = ngray**2
-ngray2.name = "ngray2"
-ngray3 = ngray**3
-ngray3.name = "ngray3"
-pgray2 = pgray**2
-pgray2.name = "pgray2"
-pgray3 = pgray**3
-pgray3.name = "pgray3"
-ugray2 = ugray**2
-ugray2.name = "ugray2"
-ugray3 = ugray**3
-ugray3.name = "ugray3"
-Tgray2 = Tgray**2
-Tgray2.name = "Tgray2"
-Tgray3 = Tgray**3
-Tgray3.name = "Tgray3"
-ygray2 = ygray**2
-ygray2.name = "ygray2"
-ygray3 = ygray**3
-ygray3.name = "ygray3"
-Egray2 = Egray**2
-Egray2.name = "Egray2"
-Egray3 = Egray**3
-Egray3.name = "Egray3"
-zgray2 = zgray**2
-zgray2.name = "zgray2"
-zgray3 = zgray**3
-zgray3.name = "zgray3"
-Mgray2 = Mgray**2
-Mgray2.name = "Mgray2"
-Mgray3 = Mgray**3
-Mgray3.name = "Mgray3"
-kgray2 = kgray**2
-kgray2.name = "kgray2"
-kgray3 = kgray**3
-kgray3.name = "kgray3"
-Ygray2 = Ygray**2
-Ygray2.name = "Ygray2"
-Ygray3 = Ygray**3
-Ygray3.name = "Ygray3"
-asievert2 = asievert**2
-asievert2.name = "asievert2"
-asievert3 = asievert**3
-asievert3.name = "asievert3"
-csievert2 = csievert**2
-csievert2.name = "csievert2"
-csievert3 = csievert**3
-csievert3.name = "csievert3"
-Zsievert2 = Zsievert**2
-Zsievert2.name = "Zsievert2"
-Zsievert3 = Zsievert**3
-Zsievert3.name = "Zsievert3"
-Psievert2 = Psievert**2
-Psievert2.name = "Psievert2"
-Psievert3 = Psievert**3
-Psievert3.name = "Psievert3"
-dsievert2 = dsievert**2
-dsievert2.name = "dsievert2"
-dsievert3 = dsievert**3
-dsievert3.name = "dsievert3"
-Gsievert2 = Gsievert**2
-Gsievert2.name = "Gsievert2"
-Gsievert3 = Gsievert**3
-Gsievert3.name = "Gsievert3"
-fsievert2 = fsievert**2
-fsievert2.name = "fsievert2"
-fsievert3 = fsievert**3
-fsievert3.name = "fsievert3"
-hsievert2 = hsievert**2
-hsievert2.name = "hsievert2"
-hsievert3 = hsievert**3
-hsievert3.name = "hsievert3"
-dasievert2 = dasievert**2
-dasievert2.name = "dasievert2"
-dasievert3 = dasievert**3
-dasievert3.name = "dasievert3"
-msievert2 = msievert**2
-msievert2.name = "msievert2"
-msievert3 = msievert**3
-msievert3.name = "msievert3"
-nsievert2 = nsievert**2
-nsievert2.name = "nsievert2"
-nsievert3 = nsievert**3
-nsievert3.name = "nsievert3"
-psievert2 = psievert**2
-psievert2.name = "psievert2"
-psievert3 = psievert**3
-psievert3.name = "psievert3"
-usievert2 = usievert**2
-usievert2.name = "usievert2"
-usievert3 = usievert**3
-usievert3.name = "usievert3"
-Tsievert2 = Tsievert**2
-Tsievert2.name = "Tsievert2"
-Tsievert3 = Tsievert**3
-Tsievert3.name = "Tsievert3"
-ysievert2 = ysievert**2
-ysievert2.name = "ysievert2"
-ysievert3 = ysievert**3
-ysievert3.name = "ysievert3"
-Esievert2 = Esievert**2
-Esievert2.name = "Esievert2"
-Esievert3 = Esievert**3
-Esievert3.name = "Esievert3"
-zsievert2 = zsievert**2
-zsievert2.name = "zsievert2"
-zsievert3 = zsievert**3
-zsievert3.name = "zsievert3"
-Msievert2 = Msievert**2
-Msievert2.name = "Msievert2"
-Msievert3 = Msievert**3
-Msievert3.name = "Msievert3"
-ksievert2 = ksievert**2
-ksievert2.name = "ksievert2"
-ksievert3 = ksievert**3
-ksievert3.name = "ksievert3"
-Ysievert2 = Ysievert**2
-Ysievert2.name = "Ysievert2"
-Ysievert3 = Ysievert**3
-Ysievert3.name = "Ysievert3"
-akatal2 = akatal**2
-akatal2.name = "akatal2"
-akatal3 = akatal**3
-akatal3.name = "akatal3"
-ckatal2 = ckatal**2
-ckatal2.name = "ckatal2"
-ckatal3 = ckatal**3
-ckatal3.name = "ckatal3"
-Zkatal2 = Zkatal**2
-Zkatal2.name = "Zkatal2"
-Zkatal3 = Zkatal**3
-Zkatal3.name = "Zkatal3"
-Pkatal2 = Pkatal**2
-Pkatal2.name = "Pkatal2"
-Pkatal3 = Pkatal**3
-Pkatal3.name = "Pkatal3"
-dkatal2 = dkatal**2
-dkatal2.name = "dkatal2"
-dkatal3 = dkatal**3
-dkatal3.name = "dkatal3"
-Gkatal2 = Gkatal**2
-Gkatal2.name = "Gkatal2"
-Gkatal3 = Gkatal**3
-Gkatal3.name = "Gkatal3"
-fkatal2 = fkatal**2
-fkatal2.name = "fkatal2"
-fkatal3 = fkatal**3
-fkatal3.name = "fkatal3"
-hkatal2 = hkatal**2
-hkatal2.name = "hkatal2"
-hkatal3 = hkatal**3
-hkatal3.name = "hkatal3"
-dakatal2 = dakatal**2
-dakatal2.name = "dakatal2"
-dakatal3 = dakatal**3
-dakatal3.name = "dakatal3"
-mkatal2 = mkatal**2
-mkatal2.name = "mkatal2"
-mkatal3 = mkatal**3
-mkatal3.name = "mkatal3"
-nkatal2 = nkatal**2
-nkatal2.name = "nkatal2"
-nkatal3 = nkatal**3
-nkatal3.name = "nkatal3"
-pkatal2 = pkatal**2
-pkatal2.name = "pkatal2"
-pkatal3 = pkatal**3
-pkatal3.name = "pkatal3"
-ukatal2 = ukatal**2
-ukatal2.name = "ukatal2"
-ukatal3 = ukatal**3
-ukatal3.name = "ukatal3"
-Tkatal2 = Tkatal**2
-Tkatal2.name = "Tkatal2"
-Tkatal3 = Tkatal**3
-Tkatal3.name = "Tkatal3"
-ykatal2 = ykatal**2
-ykatal2.name = "ykatal2"
-ykatal3 = ykatal**3
-ykatal3.name = "ykatal3"
-Ekatal2 = Ekatal**2
-Ekatal2.name = "Ekatal2"
-Ekatal3 = Ekatal**3
-Ekatal3.name = "Ekatal3"
-zkatal2 = zkatal**2
-zkatal2.name = "zkatal2"
-zkatal3 = zkatal**3
-zkatal3.name = "zkatal3"
-Mkatal2 = Mkatal**2
-Mkatal2.name = "Mkatal2"
-Mkatal3 = Mkatal**3
-Mkatal3.name = "Mkatal3"
-kkatal2 = kkatal**2
-kkatal2.name = "kkatal2"
-kkatal3 = kkatal**3
-kkatal3.name = "kkatal3"
-Ykatal2 = Ykatal**2
-Ykatal2.name = "Ykatal2"
-Ykatal3 = Ykatal**3
-Ykatal3.name = "Ykatal3"
-
-
 
 base_units = [
     metre,
@@ -5443,1614 +2115,6 @@ base_units = [
     ]
 
 
-scaled_units = [
-    ametre,
-    Zmetre,
-    Pmetre,
-    Gmetre,
-    fmetre,
-    mmetre,
-    nmetre,
-    pmetre,
-    umetre,
-    Tmetre,
-    ymetre,
-    Emetre,
-    zmetre,
-    Mmetre,
-    kmetre,
-    Ymetre,
-    ameter,
-    Zmeter,
-    Pmeter,
-    Gmeter,
-    fmeter,
-    mmeter,
-    nmeter,
-    pmeter,
-    umeter,
-    Tmeter,
-    ymeter,
-    Emeter,
-    zmeter,
-    Mmeter,
-    kmeter,
-    Ymeter,
-    agram,
-    Zgram,
-    Pgram,
-    Ggram,
-    fgram,
-    mgram,
-    ngram,
-    pgram,
-    ugram,
-    Tgram,
-    ygram,
-    Egram,
-    zgram,
-    Mgram,
-    kgram,
-    Ygram,
-    asecond,
-    Zsecond,
-    Psecond,
-    Gsecond,
-    fsecond,
-    msecond,
-    nsecond,
-    psecond,
-    usecond,
-    Tsecond,
-    ysecond,
-    Esecond,
-    zsecond,
-    Msecond,
-    ksecond,
-    Ysecond,
-    aamp,
-    Zamp,
-    Pamp,
-    Gamp,
-    famp,
-    mamp,
-    namp,
-    pamp,
-    uamp,
-    Tamp,
-    yamp,
-    Eamp,
-    zamp,
-    Mamp,
-    kamp,
-    Yamp,
-    akelvin,
-    Zkelvin,
-    Pkelvin,
-    Gkelvin,
-    fkelvin,
-    mkelvin,
-    nkelvin,
-    pkelvin,
-    ukelvin,
-    Tkelvin,
-    ykelvin,
-    Ekelvin,
-    zkelvin,
-    Mkelvin,
-    kkelvin,
-    Ykelvin,
-    amole,
-    Zmole,
-    Pmole,
-    Gmole,
-    fmole,
-    mmole,
-    nmole,
-    pmole,
-    umole,
-    Tmole,
-    ymole,
-    Emole,
-    zmole,
-    Mmole,
-    kmole,
-    Ymole,
-    acandle,
-    Zcandle,
-    Pcandle,
-    Gcandle,
-    fcandle,
-    mcandle,
-    ncandle,
-    pcandle,
-    ucandle,
-    Tcandle,
-    ycandle,
-    Ecandle,
-    zcandle,
-    Mcandle,
-    kcandle,
-    Ycandle,
-    agramme,
-    Zgramme,
-    Pgramme,
-    Ggramme,
-    fgramme,
-    mgramme,
-    ngramme,
-    pgramme,
-    ugramme,
-    Tgramme,
-    ygramme,
-    Egramme,
-    zgramme,
-    Mgramme,
-    kgramme,
-    Ygramme,
-    akilogram,
-    Zkilogram,
-    Pkilogram,
-    Gkilogram,
-    fkilogram,
-    mkilogram,
-    nkilogram,
-    pkilogram,
-    ukilogram,
-    Tkilogram,
-    ykilogram,
-    Ekilogram,
-    zkilogram,
-    Mkilogram,
-    kkilogram,
-    Ykilogram,
-    aradian,
-    Zradian,
-    Pradian,
-    Gradian,
-    fradian,
-    mradian,
-    nradian,
-    pradian,
-    uradian,
-    Tradian,
-    yradian,
-    Eradian,
-    zradian,
-    Mradian,
-    kradian,
-    Yradian,
-    asteradian,
-    Zsteradian,
-    Psteradian,
-    Gsteradian,
-    fsteradian,
-    msteradian,
-    nsteradian,
-    psteradian,
-    usteradian,
-    Tsteradian,
-    ysteradian,
-    Esteradian,
-    zsteradian,
-    Msteradian,
-    ksteradian,
-    Ysteradian,
-    ahertz,
-    Zhertz,
-    Phertz,
-    Ghertz,
-    fhertz,
-    mhertz,
-    nhertz,
-    phertz,
-    uhertz,
-    Thertz,
-    yhertz,
-    Ehertz,
-    zhertz,
-    Mhertz,
-    khertz,
-    Yhertz,
-    anewton,
-    Znewton,
-    Pnewton,
-    Gnewton,
-    fnewton,
-    mnewton,
-    nnewton,
-    pnewton,
-    unewton,
-    Tnewton,
-    ynewton,
-    Enewton,
-    znewton,
-    Mnewton,
-    knewton,
-    Ynewton,
-    apascal,
-    Zpascal,
-    Ppascal,
-    Gpascal,
-    fpascal,
-    mpascal,
-    npascal,
-    ppascal,
-    upascal,
-    Tpascal,
-    ypascal,
-    Epascal,
-    zpascal,
-    Mpascal,
-    kpascal,
-    Ypascal,
-    ajoule,
-    Zjoule,
-    Pjoule,
-    Gjoule,
-    fjoule,
-    mjoule,
-    njoule,
-    pjoule,
-    ujoule,
-    Tjoule,
-    yjoule,
-    Ejoule,
-    zjoule,
-    Mjoule,
-    kjoule,
-    Yjoule,
-    awatt,
-    Zwatt,
-    Pwatt,
-    Gwatt,
-    fwatt,
-    mwatt,
-    nwatt,
-    pwatt,
-    uwatt,
-    Twatt,
-    ywatt,
-    Ewatt,
-    zwatt,
-    Mwatt,
-    kwatt,
-    Ywatt,
-    acoulomb,
-    Zcoulomb,
-    Pcoulomb,
-    Gcoulomb,
-    fcoulomb,
-    mcoulomb,
-    ncoulomb,
-    pcoulomb,
-    ucoulomb,
-    Tcoulomb,
-    ycoulomb,
-    Ecoulomb,
-    zcoulomb,
-    Mcoulomb,
-    kcoulomb,
-    Ycoulomb,
-    avolt,
-    Zvolt,
-    Pvolt,
-    Gvolt,
-    fvolt,
-    mvolt,
-    nvolt,
-    pvolt,
-    uvolt,
-    Tvolt,
-    yvolt,
-    Evolt,
-    zvolt,
-    Mvolt,
-    kvolt,
-    Yvolt,
-    afarad,
-    Zfarad,
-    Pfarad,
-    Gfarad,
-    ffarad,
-    mfarad,
-    nfarad,
-    pfarad,
-    ufarad,
-    Tfarad,
-    yfarad,
-    Efarad,
-    zfarad,
-    Mfarad,
-    kfarad,
-    Yfarad,
-    aohm,
-    Zohm,
-    Pohm,
-    Gohm,
-    fohm,
-    mohm,
-    nohm,
-    pohm,
-    uohm,
-    Tohm,
-    yohm,
-    Eohm,
-    zohm,
-    Mohm,
-    kohm,
-    Yohm,
-    asiemens,
-    Zsiemens,
-    Psiemens,
-    Gsiemens,
-    fsiemens,
-    msiemens,
-    nsiemens,
-    psiemens,
-    usiemens,
-    Tsiemens,
-    ysiemens,
-    Esiemens,
-    zsiemens,
-    Msiemens,
-    ksiemens,
-    Ysiemens,
-    aweber,
-    Zweber,
-    Pweber,
-    Gweber,
-    fweber,
-    mweber,
-    nweber,
-    pweber,
-    uweber,
-    Tweber,
-    yweber,
-    Eweber,
-    zweber,
-    Mweber,
-    kweber,
-    Yweber,
-    atesla,
-    Ztesla,
-    Ptesla,
-    Gtesla,
-    ftesla,
-    mtesla,
-    ntesla,
-    ptesla,
-    utesla,
-    Ttesla,
-    ytesla,
-    Etesla,
-    ztesla,
-    Mtesla,
-    ktesla,
-    Ytesla,
-    ahenry,
-    Zhenry,
-    Phenry,
-    Ghenry,
-    fhenry,
-    mhenry,
-    nhenry,
-    phenry,
-    uhenry,
-    Thenry,
-    yhenry,
-    Ehenry,
-    zhenry,
-    Mhenry,
-    khenry,
-    Yhenry,
-    acelsius,
-    Zcelsius,
-    Pcelsius,
-    Gcelsius,
-    fcelsius,
-    mcelsius,
-    ncelsius,
-    pcelsius,
-    ucelsius,
-    Tcelsius,
-    ycelsius,
-    Ecelsius,
-    zcelsius,
-    Mcelsius,
-    kcelsius,
-    Ycelsius,
-    alumen,
-    Zlumen,
-    Plumen,
-    Glumen,
-    flumen,
-    mlumen,
-    nlumen,
-    plumen,
-    ulumen,
-    Tlumen,
-    ylumen,
-    Elumen,
-    zlumen,
-    Mlumen,
-    klumen,
-    Ylumen,
-    alux,
-    Zlux,
-    Plux,
-    Glux,
-    flux,
-    mlux,
-    nlux,
-    plux,
-    ulux,
-    Tlux,
-    ylux,
-    Elux,
-    zlux,
-    Mlux,
-    klux,
-    Ylux,
-    abecquerel,
-    Zbecquerel,
-    Pbecquerel,
-    Gbecquerel,
-    fbecquerel,
-    mbecquerel,
-    nbecquerel,
-    pbecquerel,
-    ubecquerel,
-    Tbecquerel,
-    ybecquerel,
-    Ebecquerel,
-    zbecquerel,
-    Mbecquerel,
-    kbecquerel,
-    Ybecquerel,
-    agray,
-    Zgray,
-    Pgray,
-    Ggray,
-    fgray,
-    mgray,
-    ngray,
-    pgray,
-    ugray,
-    Tgray,
-    ygray,
-    Egray,
-    zgray,
-    Mgray,
-    kgray,
-    Ygray,
-    asievert,
-    Zsievert,
-    Psievert,
-    Gsievert,
-    fsievert,
-    msievert,
-    nsievert,
-    psievert,
-    usievert,
-    Tsievert,
-    ysievert,
-    Esievert,
-    zsievert,
-    Msievert,
-    ksievert,
-    Ysievert,
-    akatal,
-    Zkatal,
-    Pkatal,
-    Gkatal,
-    fkatal,
-    mkatal,
-    nkatal,
-    pkatal,
-    ukatal,
-    Tkatal,
-    ykatal,
-    Ekatal,
-    zkatal,
-    Mkatal,
-    kkatal,
-    Ykatal,
-    ]
-
-
-powered_units = [
-    metre2,
-    metre3,
-    meter2,
-    meter3,
-    gram2,
-    gram3,
-    second2,
-    second3,
-    amp2,
-    amp3,
-    kelvin2,
-    kelvin3,
-    mole2,
-    mole3,
-    candle2,
-    candle3,
-    gramme2,
-    gramme3,
-    kilogram2,
-    kilogram3,
-    radian2,
-    radian3,
-    steradian2,
-    steradian3,
-    hertz2,
-    hertz3,
-    newton2,
-    newton3,
-    pascal2,
-    pascal3,
-    joule2,
-    joule3,
-    watt2,
-    watt3,
-    coulomb2,
-    coulomb3,
-    volt2,
-    volt3,
-    farad2,
-    farad3,
-    ohm2,
-    ohm3,
-    siemens2,
-    siemens3,
-    weber2,
-    weber3,
-    tesla2,
-    tesla3,
-    henry2,
-    henry3,
-    celsius2,
-    celsius3,
-    lumen2,
-    lumen3,
-    lux2,
-    lux3,
-    becquerel2,
-    becquerel3,
-    gray2,
-    gray3,
-    sievert2,
-    sievert3,
-    katal2,
-    katal3,
-    ametre2,
-    ametre3,
-    Zmetre2,
-    Zmetre3,
-    Pmetre2,
-    Pmetre3,
-    Gmetre2,
-    Gmetre3,
-    fmetre2,
-    fmetre3,
-    mmetre2,
-    mmetre3,
-    nmetre2,
-    nmetre3,
-    pmetre2,
-    pmetre3,
-    umetre2,
-    umetre3,
-    Tmetre2,
-    Tmetre3,
-    ymetre2,
-    ymetre3,
-    Emetre2,
-    Emetre3,
-    zmetre2,
-    zmetre3,
-    Mmetre2,
-    Mmetre3,
-    kmetre2,
-    kmetre3,
-    Ymetre2,
-    Ymetre3,
-    ameter2,
-    ameter3,
-    Zmeter2,
-    Zmeter3,
-    Pmeter2,
-    Pmeter3,
-    Gmeter2,
-    Gmeter3,
-    fmeter2,
-    fmeter3,
-    mmeter2,
-    mmeter3,
-    nmeter2,
-    nmeter3,
-    pmeter2,
-    pmeter3,
-    umeter2,
-    umeter3,
-    Tmeter2,
-    Tmeter3,
-    ymeter2,
-    ymeter3,
-    Emeter2,
-    Emeter3,
-    zmeter2,
-    zmeter3,
-    Mmeter2,
-    Mmeter3,
-    kmeter2,
-    kmeter3,
-    Ymeter2,
-    Ymeter3,
-    agram2,
-    agram3,
-    Zgram2,
-    Zgram3,
-    Pgram2,
-    Pgram3,
-    Ggram2,
-    Ggram3,
-    fgram2,
-    fgram3,
-    mgram2,
-    mgram3,
-    ngram2,
-    ngram3,
-    pgram2,
-    pgram3,
-    ugram2,
-    ugram3,
-    Tgram2,
-    Tgram3,
-    ygram2,
-    ygram3,
-    Egram2,
-    Egram3,
-    zgram2,
-    zgram3,
-    Mgram2,
-    Mgram3,
-    kgram2,
-    kgram3,
-    Ygram2,
-    Ygram3,
-    asecond2,
-    asecond3,
-    Zsecond2,
-    Zsecond3,
-    Psecond2,
-    Psecond3,
-    Gsecond2,
-    Gsecond3,
-    fsecond2,
-    fsecond3,
-    msecond2,
-    msecond3,
-    nsecond2,
-    nsecond3,
-    psecond2,
-    psecond3,
-    usecond2,
-    usecond3,
-    Tsecond2,
-    Tsecond3,
-    ysecond2,
-    ysecond3,
-    Esecond2,
-    Esecond3,
-    zsecond2,
-    zsecond3,
-    Msecond2,
-    Msecond3,
-    ksecond2,
-    ksecond3,
-    Ysecond2,
-    Ysecond3,
-    aamp2,
-    aamp3,
-    Zamp2,
-    Zamp3,
-    Pamp2,
-    Pamp3,
-    Gamp2,
-    Gamp3,
-    famp2,
-    famp3,
-    mamp2,
-    mamp3,
-    namp2,
-    namp3,
-    pamp2,
-    pamp3,
-    uamp2,
-    uamp3,
-    Tamp2,
-    Tamp3,
-    yamp2,
-    yamp3,
-    Eamp2,
-    Eamp3,
-    zamp2,
-    zamp3,
-    Mamp2,
-    Mamp3,
-    kamp2,
-    kamp3,
-    Yamp2,
-    Yamp3,
-    akelvin2,
-    akelvin3,
-    Zkelvin2,
-    Zkelvin3,
-    Pkelvin2,
-    Pkelvin3,
-    Gkelvin2,
-    Gkelvin3,
-    fkelvin2,
-    fkelvin3,
-    mkelvin2,
-    mkelvin3,
-    nkelvin2,
-    nkelvin3,
-    pkelvin2,
-    pkelvin3,
-    ukelvin2,
-    ukelvin3,
-    Tkelvin2,
-    Tkelvin3,
-    ykelvin2,
-    ykelvin3,
-    Ekelvin2,
-    Ekelvin3,
-    zkelvin2,
-    zkelvin3,
-    Mkelvin2,
-    Mkelvin3,
-    kkelvin2,
-    kkelvin3,
-    Ykelvin2,
-    Ykelvin3,
-    amole2,
-    amole3,
-    Zmole2,
-    Zmole3,
-    Pmole2,
-    Pmole3,
-    Gmole2,
-    Gmole3,
-    fmole2,
-    fmole3,
-    mmole2,
-    mmole3,
-    nmole2,
-    nmole3,
-    pmole2,
-    pmole3,
-    umole2,
-    umole3,
-    Tmole2,
-    Tmole3,
-    ymole2,
-    ymole3,
-    Emole2,
-    Emole3,
-    zmole2,
-    zmole3,
-    Mmole2,
-    Mmole3,
-    kmole2,
-    kmole3,
-    Ymole2,
-    Ymole3,
-    acandle2,
-    acandle3,
-    Zcandle2,
-    Zcandle3,
-    Pcandle2,
-    Pcandle3,
-    Gcandle2,
-    Gcandle3,
-    fcandle2,
-    fcandle3,
-    mcandle2,
-    mcandle3,
-    ncandle2,
-    ncandle3,
-    pcandle2,
-    pcandle3,
-    ucandle2,
-    ucandle3,
-    Tcandle2,
-    Tcandle3,
-    ycandle2,
-    ycandle3,
-    Ecandle2,
-    Ecandle3,
-    zcandle2,
-    zcandle3,
-    Mcandle2,
-    Mcandle3,
-    kcandle2,
-    kcandle3,
-    Ycandle2,
-    Ycandle3,
-    agramme2,
-    agramme3,
-    Zgramme2,
-    Zgramme3,
-    Pgramme2,
-    Pgramme3,
-    Ggramme2,
-    Ggramme3,
-    fgramme2,
-    fgramme3,
-    mgramme2,
-    mgramme3,
-    ngramme2,
-    ngramme3,
-    pgramme2,
-    pgramme3,
-    ugramme2,
-    ugramme3,
-    Tgramme2,
-    Tgramme3,
-    ygramme2,
-    ygramme3,
-    Egramme2,
-    Egramme3,
-    zgramme2,
-    zgramme3,
-    Mgramme2,
-    Mgramme3,
-    kgramme2,
-    kgramme3,
-    Ygramme2,
-    Ygramme3,
-    akilogram2,
-    akilogram3,
-    Zkilogram2,
-    Zkilogram3,
-    Pkilogram2,
-    Pkilogram3,
-    Gkilogram2,
-    Gkilogram3,
-    fkilogram2,
-    fkilogram3,
-    mkilogram2,
-    mkilogram3,
-    nkilogram2,
-    nkilogram3,
-    pkilogram2,
-    pkilogram3,
-    ukilogram2,
-    ukilogram3,
-    Tkilogram2,
-    Tkilogram3,
-    ykilogram2,
-    ykilogram3,
-    Ekilogram2,
-    Ekilogram3,
-    zkilogram2,
-    zkilogram3,
-    Mkilogram2,
-    Mkilogram3,
-    kkilogram2,
-    kkilogram3,
-    Ykilogram2,
-    Ykilogram3,
-    aradian2,
-    aradian3,
-    Zradian2,
-    Zradian3,
-    Pradian2,
-    Pradian3,
-    Gradian2,
-    Gradian3,
-    fradian2,
-    fradian3,
-    mradian2,
-    mradian3,
-    nradian2,
-    nradian3,
-    pradian2,
-    pradian3,
-    uradian2,
-    uradian3,
-    Tradian2,
-    Tradian3,
-    yradian2,
-    yradian3,
-    Eradian2,
-    Eradian3,
-    zradian2,
-    zradian3,
-    Mradian2,
-    Mradian3,
-    kradian2,
-    kradian3,
-    Yradian2,
-    Yradian3,
-    asteradian2,
-    asteradian3,
-    Zsteradian2,
-    Zsteradian3,
-    Psteradian2,
-    Psteradian3,
-    Gsteradian2,
-    Gsteradian3,
-    fsteradian2,
-    fsteradian3,
-    msteradian2,
-    msteradian3,
-    nsteradian2,
-    nsteradian3,
-    psteradian2,
-    psteradian3,
-    usteradian2,
-    usteradian3,
-    Tsteradian2,
-    Tsteradian3,
-    ysteradian2,
-    ysteradian3,
-    Esteradian2,
-    Esteradian3,
-    zsteradian2,
-    zsteradian3,
-    Msteradian2,
-    Msteradian3,
-    ksteradian2,
-    ksteradian3,
-    Ysteradian2,
-    Ysteradian3,
-    ahertz2,
-    ahertz3,
-    Zhertz2,
-    Zhertz3,
-    Phertz2,
-    Phertz3,
-    Ghertz2,
-    Ghertz3,
-    fhertz2,
-    fhertz3,
-    mhertz2,
-    mhertz3,
-    nhertz2,
-    nhertz3,
-    phertz2,
-    phertz3,
-    uhertz2,
-    uhertz3,
-    Thertz2,
-    Thertz3,
-    yhertz2,
-    yhertz3,
-    Ehertz2,
-    Ehertz3,
-    zhertz2,
-    zhertz3,
-    Mhertz2,
-    Mhertz3,
-    khertz2,
-    khertz3,
-    Yhertz2,
-    Yhertz3,
-    anewton2,
-    anewton3,
-    Znewton2,
-    Znewton3,
-    Pnewton2,
-    Pnewton3,
-    Gnewton2,
-    Gnewton3,
-    fnewton2,
-    fnewton3,
-    mnewton2,
-    mnewton3,
-    nnewton2,
-    nnewton3,
-    pnewton2,
-    pnewton3,
-    unewton2,
-    unewton3,
-    Tnewton2,
-    Tnewton3,
-    ynewton2,
-    ynewton3,
-    Enewton2,
-    Enewton3,
-    znewton2,
-    znewton3,
-    Mnewton2,
-    Mnewton3,
-    knewton2,
-    knewton3,
-    Ynewton2,
-    Ynewton3,
-    apascal2,
-    apascal3,
-    Zpascal2,
-    Zpascal3,
-    Ppascal2,
-    Ppascal3,
-    Gpascal2,
-    Gpascal3,
-    fpascal2,
-    fpascal3,
-    mpascal2,
-    mpascal3,
-    npascal2,
-    npascal3,
-    ppascal2,
-    ppascal3,
-    upascal2,
-    upascal3,
-    Tpascal2,
-    Tpascal3,
-    ypascal2,
-    ypascal3,
-    Epascal2,
-    Epascal3,
-    zpascal2,
-    zpascal3,
-    Mpascal2,
-    Mpascal3,
-    kpascal2,
-    kpascal3,
-    Ypascal2,
-    Ypascal3,
-    ajoule2,
-    ajoule3,
-    Zjoule2,
-    Zjoule3,
-    Pjoule2,
-    Pjoule3,
-    Gjoule2,
-    Gjoule3,
-    fjoule2,
-    fjoule3,
-    mjoule2,
-    mjoule3,
-    njoule2,
-    njoule3,
-    pjoule2,
-    pjoule3,
-    ujoule2,
-    ujoule3,
-    Tjoule2,
-    Tjoule3,
-    yjoule2,
-    yjoule3,
-    Ejoule2,
-    Ejoule3,
-    zjoule2,
-    zjoule3,
-    Mjoule2,
-    Mjoule3,
-    kjoule2,
-    kjoule3,
-    Yjoule2,
-    Yjoule3,
-    awatt2,
-    awatt3,
-    Zwatt2,
-    Zwatt3,
-    Pwatt2,
-    Pwatt3,
-    Gwatt2,
-    Gwatt3,
-    fwatt2,
-    fwatt3,
-    mwatt2,
-    mwatt3,
-    nwatt2,
-    nwatt3,
-    pwatt2,
-    pwatt3,
-    uwatt2,
-    uwatt3,
-    Twatt2,
-    Twatt3,
-    ywatt2,
-    ywatt3,
-    Ewatt2,
-    Ewatt3,
-    zwatt2,
-    zwatt3,
-    Mwatt2,
-    Mwatt3,
-    kwatt2,
-    kwatt3,
-    Ywatt2,
-    Ywatt3,
-    acoulomb2,
-    acoulomb3,
-    Zcoulomb2,
-    Zcoulomb3,
-    Pcoulomb2,
-    Pcoulomb3,
-    Gcoulomb2,
-    Gcoulomb3,
-    fcoulomb2,
-    fcoulomb3,
-    mcoulomb2,
-    mcoulomb3,
-    ncoulomb2,
-    ncoulomb3,
-    pcoulomb2,
-    pcoulomb3,
-    ucoulomb2,
-    ucoulomb3,
-    Tcoulomb2,
-    Tcoulomb3,
-    ycoulomb2,
-    ycoulomb3,
-    Ecoulomb2,
-    Ecoulomb3,
-    zcoulomb2,
-    zcoulomb3,
-    Mcoulomb2,
-    Mcoulomb3,
-    kcoulomb2,
-    kcoulomb3,
-    Ycoulomb2,
-    Ycoulomb3,
-    avolt2,
-    avolt3,
-    Zvolt2,
-    Zvolt3,
-    Pvolt2,
-    Pvolt3,
-    Gvolt2,
-    Gvolt3,
-    fvolt2,
-    fvolt3,
-    mvolt2,
-    mvolt3,
-    nvolt2,
-    nvolt3,
-    pvolt2,
-    pvolt3,
-    uvolt2,
-    uvolt3,
-    Tvolt2,
-    Tvolt3,
-    yvolt2,
-    yvolt3,
-    Evolt2,
-    Evolt3,
-    zvolt2,
-    zvolt3,
-    Mvolt2,
-    Mvolt3,
-    kvolt2,
-    kvolt3,
-    Yvolt2,
-    Yvolt3,
-    afarad2,
-    afarad3,
-    Zfarad2,
-    Zfarad3,
-    Pfarad2,
-    Pfarad3,
-    Gfarad2,
-    Gfarad3,
-    ffarad2,
-    ffarad3,
-    mfarad2,
-    mfarad3,
-    nfarad2,
-    nfarad3,
-    pfarad2,
-    pfarad3,
-    ufarad2,
-    ufarad3,
-    Tfarad2,
-    Tfarad3,
-    yfarad2,
-    yfarad3,
-    Efarad2,
-    Efarad3,
-    zfarad2,
-    zfarad3,
-    Mfarad2,
-    Mfarad3,
-    kfarad2,
-    kfarad3,
-    Yfarad2,
-    Yfarad3,
-    aohm2,
-    aohm3,
-    Zohm2,
-    Zohm3,
-    Pohm2,
-    Pohm3,
-    Gohm2,
-    Gohm3,
-    fohm2,
-    fohm3,
-    mohm2,
-    mohm3,
-    nohm2,
-    nohm3,
-    pohm2,
-    pohm3,
-    uohm2,
-    uohm3,
-    Tohm2,
-    Tohm3,
-    yohm2,
-    yohm3,
-    Eohm2,
-    Eohm3,
-    zohm2,
-    zohm3,
-    Mohm2,
-    Mohm3,
-    kohm2,
-    kohm3,
-    Yohm2,
-    Yohm3,
-    asiemens2,
-    asiemens3,
-    Zsiemens2,
-    Zsiemens3,
-    Psiemens2,
-    Psiemens3,
-    Gsiemens2,
-    Gsiemens3,
-    fsiemens2,
-    fsiemens3,
-    msiemens2,
-    msiemens3,
-    nsiemens2,
-    nsiemens3,
-    psiemens2,
-    psiemens3,
-    usiemens2,
-    usiemens3,
-    Tsiemens2,
-    Tsiemens3,
-    ysiemens2,
-    ysiemens3,
-    Esiemens2,
-    Esiemens3,
-    zsiemens2,
-    zsiemens3,
-    Msiemens2,
-    Msiemens3,
-    ksiemens2,
-    ksiemens3,
-    Ysiemens2,
-    Ysiemens3,
-    aweber2,
-    aweber3,
-    Zweber2,
-    Zweber3,
-    Pweber2,
-    Pweber3,
-    Gweber2,
-    Gweber3,
-    fweber2,
-    fweber3,
-    mweber2,
-    mweber3,
-    nweber2,
-    nweber3,
-    pweber2,
-    pweber3,
-    uweber2,
-    uweber3,
-    Tweber2,
-    Tweber3,
-    yweber2,
-    yweber3,
-    Eweber2,
-    Eweber3,
-    zweber2,
-    zweber3,
-    Mweber2,
-    Mweber3,
-    kweber2,
-    kweber3,
-    Yweber2,
-    Yweber3,
-    atesla2,
-    atesla3,
-    Ztesla2,
-    Ztesla3,
-    Ptesla2,
-    Ptesla3,
-    Gtesla2,
-    Gtesla3,
-    ftesla2,
-    ftesla3,
-    mtesla2,
-    mtesla3,
-    ntesla2,
-    ntesla3,
-    ptesla2,
-    ptesla3,
-    utesla2,
-    utesla3,
-    Ttesla2,
-    Ttesla3,
-    ytesla2,
-    ytesla3,
-    Etesla2,
-    Etesla3,
-    ztesla2,
-    ztesla3,
-    Mtesla2,
-    Mtesla3,
-    ktesla2,
-    ktesla3,
-    Ytesla2,
-    Ytesla3,
-    ahenry2,
-    ahenry3,
-    Zhenry2,
-    Zhenry3,
-    Phenry2,
-    Phenry3,
-    Ghenry2,
-    Ghenry3,
-    fhenry2,
-    fhenry3,
-    mhenry2,
-    mhenry3,
-    nhenry2,
-    nhenry3,
-    phenry2,
-    phenry3,
-    uhenry2,
-    uhenry3,
-    Thenry2,
-    Thenry3,
-    yhenry2,
-    yhenry3,
-    Ehenry2,
-    Ehenry3,
-    zhenry2,
-    zhenry3,
-    Mhenry2,
-    Mhenry3,
-    khenry2,
-    khenry3,
-    Yhenry2,
-    Yhenry3,
-    acelsius2,
-    acelsius3,
-    Zcelsius2,
-    Zcelsius3,
-    Pcelsius2,
-    Pcelsius3,
-    Gcelsius2,
-    Gcelsius3,
-    fcelsius2,
-    fcelsius3,
-    mcelsius2,
-    mcelsius3,
-    ncelsius2,
-    ncelsius3,
-    pcelsius2,
-    pcelsius3,
-    ucelsius2,
-    ucelsius3,
-    Tcelsius2,
-    Tcelsius3,
-    ycelsius2,
-    ycelsius3,
-    Ecelsius2,
-    Ecelsius3,
-    zcelsius2,
-    zcelsius3,
-    Mcelsius2,
-    Mcelsius3,
-    kcelsius2,
-    kcelsius3,
-    Ycelsius2,
-    Ycelsius3,
-    alumen2,
-    alumen3,
-    Zlumen2,
-    Zlumen3,
-    Plumen2,
-    Plumen3,
-    Glumen2,
-    Glumen3,
-    flumen2,
-    flumen3,
-    mlumen2,
-    mlumen3,
-    nlumen2,
-    nlumen3,
-    plumen2,
-    plumen3,
-    ulumen2,
-    ulumen3,
-    Tlumen2,
-    Tlumen3,
-    ylumen2,
-    ylumen3,
-    Elumen2,
-    Elumen3,
-    zlumen2,
-    zlumen3,
-    Mlumen2,
-    Mlumen3,
-    klumen2,
-    klumen3,
-    Ylumen2,
-    Ylumen3,
-    alux2,
-    alux3,
-    Zlux2,
-    Zlux3,
-    Plux2,
-    Plux3,
-    Glux2,
-    Glux3,
-    flux2,
-    flux3,
-    mlux2,
-    mlux3,
-    nlux2,
-    nlux3,
-    plux2,
-    plux3,
-    ulux2,
-    ulux3,
-    Tlux2,
-    Tlux3,
-    ylux2,
-    ylux3,
-    Elux2,
-    Elux3,
-    zlux2,
-    zlux3,
-    Mlux2,
-    Mlux3,
-    klux2,
-    klux3,
-    Ylux2,
-    Ylux3,
-    abecquerel2,
-    abecquerel3,
-    Zbecquerel2,
-    Zbecquerel3,
-    Pbecquerel2,
-    Pbecquerel3,
-    Gbecquerel2,
-    Gbecquerel3,
-    fbecquerel2,
-    fbecquerel3,
-    mbecquerel2,
-    mbecquerel3,
-    nbecquerel2,
-    nbecquerel3,
-    pbecquerel2,
-    pbecquerel3,
-    ubecquerel2,
-    ubecquerel3,
-    Tbecquerel2,
-    Tbecquerel3,
-    ybecquerel2,
-    ybecquerel3,
-    Ebecquerel2,
-    Ebecquerel3,
-    zbecquerel2,
-    zbecquerel3,
-    Mbecquerel2,
-    Mbecquerel3,
-    kbecquerel2,
-    kbecquerel3,
-    Ybecquerel2,
-    Ybecquerel3,
-    agray2,
-    agray3,
-    Zgray2,
-    Zgray3,
-    Pgray2,
-    Pgray3,
-    Ggray2,
-    Ggray3,
-    fgray2,
-    fgray3,
-    mgray2,
-    mgray3,
-    ngray2,
-    ngray3,
-    pgray2,
-    pgray3,
-    ugray2,
-    ugray3,
-    Tgray2,
-    Tgray3,
-    ygray2,
-    ygray3,
-    Egray2,
-    Egray3,
-    zgray2,
-    zgray3,
-    Mgray2,
-    Mgray3,
-    kgray2,
-    kgray3,
-    Ygray2,
-    Ygray3,
-    asievert2,
-    asievert3,
-    Zsievert2,
-    Zsievert3,
-    Psievert2,
-    Psievert3,
-    Gsievert2,
-    Gsievert3,
-    fsievert2,
-    fsievert3,
-    msievert2,
-    msievert3,
-    nsievert2,
-    nsievert3,
-    psievert2,
-    psievert3,
-    usievert2,
-    usievert3,
-    Tsievert2,
-    Tsievert3,
-    ysievert2,
-    ysievert3,
-    Esievert2,
-    Esievert3,
-    zsievert2,
-    zsievert3,
-    Msievert2,
-    Msievert3,
-    ksievert2,
-    ksievert3,
-    Ysievert2,
-    Ysievert3,
-    akatal2,
-    akatal3,
-    Zkatal2,
-    Zkatal3,
-    Pkatal2,
-    Pkatal3,
-    Gkatal2,
-    Gkatal3,
-    fkatal2,
-    fkatal3,
-    mkatal2,
-    mkatal3,
-    nkatal2,
-    nkatal3,
-    pkatal2,
-    pkatal3,
-    ukatal2,
-    ukatal3,
-    Tkatal2,
-    Tkatal3,
-    ykatal2,
-    ykatal3,
-    Ekatal2,
-    Ekatal3,
-    zkatal2,
-    zkatal3,
-    Mkatal2,
-    Mkatal3,
-    kkatal2,
-    kkatal3,
-    Ykatal2,
-    Ykatal3,
-    ]
-
-
 # Current list from http://physics.nist.gov/cuu/Units/units.html, far from complete
 additional_units = [
     pascal * second, newton * metre, watt / metre ** 2, joule / kelvin,
@@ -7059,2028 +2123,4112 @@ additional_units = [
     farad / metre, henry / metre, joule / mole, joule / (mole * kelvin),
     coulomb / kilogram, gray / second, katal / metre ** 3 ]
 
+
+Unit.automatically_register_units = True
+
+# Scaled units (e.g. mvolt) and powers of units (e.g. metre2, mvolt2) are not
+# created when this module is imported, but when they are accessed for the
+# first time -- either as an attribute of this module or when the standard
+# unit registry is asked for a unit with their dimensions.
+# Each entry is a tuple (name, base unit name, scale factor, power, standard)
+# where "standard" states whether the unit is part of the standard registry.
 
-all_units = [
-    metre,
-    meter,
-    gram,
-    second,
-    amp,
-    kelvin,
-    mole,
-    candle,
-    gramme,
-    kilogram,
-    radian,
-    steradian,
-    hertz,
-    newton,
-    pascal,
-    joule,
-    watt,
-    coulomb,
-    volt,
-    farad,
-    ohm,
-    siemens,
-    weber,
-    tesla,
-    henry,
-    celsius,
-    lumen,
-    lux,
-    becquerel,
-    gray,
-    sievert,
-    katal,
-    ametre,
-    cmetre,
-    Zmetre,
-    Pmetre,
-    dmetre,
-    Gmetre,
-    fmetre,
-    hmetre,
-    dametre,
-    mmetre,
-    nmetre,
-    pmetre,
-    umetre,
-    Tmetre,
-    ymetre,
-    Emetre,
-    zmetre,
-    Mmetre,
-    kmetre,
-    Ymetre,
-    ameter,
-    cmeter,
-    Zmeter,
-    Pmeter,
-    dmeter,
-    Gmeter,
-    fmeter,
-    hmeter,
-    dameter,
-    mmeter,
-    nmeter,
-    pmeter,
-    umeter,
-    Tmeter,
-    ymeter,
-    Emeter,
-    zmeter,
-    Mmeter,
-    kmeter,
-    Ymeter,
-    agram,
-    cgram,
-    Zgram,
-    Pgram,
-    dgram,
-    Ggram,
-    fgram,
-    hgram,
-    dagram,
-    mgram,
-    ngram,
-    pgram,
-    ugram,
-    Tgram,
-    ygram,
-    Egram,
-    zgram,
-    Mgram,
-    kgram,
-    Ygram,
-    asecond,
-    csecond,
-    Zsecond,
-    Psecond,
-    dsecond,
-    Gsecond,
-    fsecond,
-    hsecond,
-    dasecond,
-    msecond,
-    nsecond,
-    psecond,
-    usecond,
-    Tsecond,
-    ysecond,
-    Esecond,
-    zsecond,
-    Msecond,
-    ksecond,
-    Ysecond,
-    aamp,
-    camp,
-    Zamp,
-    Pamp,
-    damp,
-    Gamp,
-    famp,
-    hamp,
-    daamp,
-    mamp,
-    namp,
-    pamp,
-    uamp,
-    Tamp,
-    yamp,
-    Eamp,
-    zamp,
-    Mamp,
-    kamp,
-    Yamp,
-    akelvin,
-    ckelvin,
-    Zkelvin,
-    Pkelvin,
-    dkelvin,
-    Gkelvin,
-    fkelvin,
-    hkelvin,
-    dakelvin,
-    mkelvin,
-    nkelvin,
-    pkelvin,
-    ukelvin,
-    Tkelvin,
-    ykelvin,
-    Ekelvin,
-    zkelvin,
-    Mkelvin,
-    kkelvin,
-    Ykelvin,
-    amole,
-    cmole,
-    Zmole,
-    Pmole,
-    dmole,
-    Gmole,
-    fmole,
-    hmole,
-    damole,
-    mmole,
-    nmole,
-    pmole,
-    umole,
-    Tmole,
-    ymole,
-    Emole,
-    zmole,
-    Mmole,
-    kmole,
-    Ymole,
-    acandle,
-    ccandle,
-    Zcandle,
-    Pcandle,
-    dcandle,
-    Gcandle,
-    fcandle,
-    hcandle,
-    dacandle,
-    mcandle,
-    ncandle,
-    pcandle,
-    ucandle,
-    Tcandle,
-    ycandle,
-    Ecandle,
-    zcandle,
-    Mcandle,
-    kcandle,
-    Ycandle,
-    agramme,
-    cgramme,
-    Zgramme,
-    Pgramme,
-    dgramme,
-    Ggramme,
-    fgramme,
-    hgramme,
-    dagramme,
-    mgramme,
-    ngramme,
-    pgramme,
-    ugramme,
-    Tgramme,
-    ygramme,
-    Egramme,
-    zgramme,
-    Mgramme,
-    kgramme,
-    Ygramme,
-    akilogram,
-    ckilogram,
-    Zkilogram,
-    Pkilogram,
-    dkilogram,
-    Gkilogram,
-    fkilogram,
-    hkilogram,
-    dakilogram,
-    mkilogram,
-    nkilogram,
-    pkilogram,
-    ukilogram,
-    Tkilogram,
-    ykilogram,
-    Ekilogram,
-    zkilogram,
-    Mkilogram,
-    kkilogram,
-    Ykilogram,
-    aradian,
-    cradian,
-    Zradian,
-    Pradian,
-    dradian,
-    Gradian,
-    fradian,
-    hradian,
-    daradian,
-    mradian,
-    nradian,
-    pradian,
-    uradian,
-    Tradian,
-    yradian,
-    Eradian,
-    zradian,
-    Mradian,
-    kradian,
-    Yradian,
-    asteradian,
-    csteradian,
-    Zsteradian,
-    Psteradian,
-    dsteradian,
-    Gsteradian,
-    fsteradian,
-    hsteradian,
-    dasteradian,
-    msteradian,
-    nsteradian,
-    psteradian,
-    usteradian,
-    Tsteradian,
-    ysteradian,
-    Esteradian,
-    zsteradian,
-    Msteradian,
-    ksteradian,
-    Ysteradian,
-    ahertz,
-    chertz,
-    Zhertz,
-    Phertz,
-    dhertz,
-    Ghertz,
-    fhertz,
-    hhertz,
-    dahertz,
-    mhertz,
-    nhertz,
-    phertz,
-    uhertz,
-    Thertz,
-    yhertz,
-    Ehertz,
-    zhertz,
-    Mhertz,
-    khertz,
-    Yhertz,
-    anewton,
-    cnewton,
-    Znewton,
-    Pnewton,
-    dnewton,
-    Gnewton,
-    fnewton,
-    hnewton,
-    danewton,
-    mnewton,
-    nnewton,
-    pnewton,
-    unewton,
-    Tnewton,
-    ynewton,
-    Enewton,
-    znewton,
-    Mnewton,
-    knewton,
-    Ynewton,
-    apascal,
-    cpascal,
-    Zpascal,
-    Ppascal,
-    dpascal,
-    Gpascal,
-    fpascal,
-    hpascal,
-    dapascal,
-    mpascal,
-    npascal,
-    ppascal,
-    upascal,
-    Tpascal,
-    ypascal,
-    Epascal,
-    zpascal,
-    Mpascal,
-    kpascal,
-    Ypascal,
-    ajoule,
-    cjoule,
-    Zjoule,
-    Pjoule,
-    djoule,
-    Gjoule,
-    fjoule,
-    hjoule,
-    dajoule,
-    mjoule,
-    njoule,
-    pjoule,
-    ujoule,
-    Tjoule,
-    yjoule,
-    Ejoule,
-    zjoule,
-    Mjoule,
-    kjoule,
-    Yjoule,
-    awatt,
-    cwatt,
-    Zwatt,
-    Pwatt,
-    dwatt,
-    Gwatt,
-    fwatt,
-    hwatt,
-    dawatt,
-    mwatt,
-    nwatt,
-    pwatt,
-    uwatt,
-    Twatt,
-    ywatt,
-    Ewatt,
-    zwatt,
-    Mwatt,
-    kwatt,
-    Ywatt,
-    acoulomb,
-    ccoulomb,
-    Zcoulomb,
-    Pcoulomb,
-    dcoulomb,
-    Gcoulomb,
-    fcoulomb,
-    hcoulomb,
-    dacoulomb,
-    mcoulomb,
-    ncoulomb,
-    pcoulomb,
-    ucoulomb,
-    Tcoulomb,
-    ycoulomb,
-    Ecoulomb,
-    zcoulomb,
-    Mcoulomb,
-    kcoulomb,
-    Ycoulomb,
-    avolt,
-    cvolt,
-    Zvolt,
-    Pvolt,
-    dvolt,
-    Gvolt,
-    fvolt,
-    hvolt,
-    davolt,
-    mvolt,
-    nvolt,
-    pvolt,
-    uvolt,
-    Tvolt,
-    yvolt,
-    Evolt,
-    zvolt,
-    Mvolt,
-    kvolt,
-    Yvolt,
-    afarad,
-    cfarad,
-    Zfarad,
-    Pfarad,
-    dfarad,
-    Gfarad,
-    ffarad,
-    hfarad,
-    dafarad,
-    mfarad,
-    nfarad,
-    pfarad,
-    ufarad,
-    Tfarad,
-    yfarad,
-    Efarad,
-    zfarad,
-    Mfarad,
-    kfarad,
-    Yfarad,
-    aohm,
-    cohm,
-    Zohm,
-    Pohm,
-    dohm,
-    Gohm,
-    fohm,
-    hohm,
-    daohm,
-    mohm,
-    nohm,
-    pohm,
-    uohm,
-    Tohm,
-    yohm,
-    Eohm,
-    zohm,
-    Mohm,
-    kohm,
-    Yohm,
-    asiemens,
-    csiemens,
-    Zsiemens,
-    Psiemens,
-    dsiemens,
-    Gsiemens,
-    fsiemens,
-    hsiemens,
-    dasiemens,
-    msiemens,
-    nsiemens,
-    psiemens,
-    usiemens,
-    Tsiemens,
-    ysiemens,
-    Esiemens,
-    zsiemens,
-    Msiemens,
-    ksiemens,
-    Ysiemens,
-    aweber,
-    cweber,
-    Zweber,
-    Pweber,
-    dweber,
-    Gweber,
-    fweber,
-    hweber,
-    daweber,
-    mweber,
-    nweber,
-    pweber,
-    uweber,
-    Tweber,
-    yweber,
-    Eweber,
-    zweber,
-    Mweber,
-    kweber,
-    Yweber,
-    atesla,
-    ctesla,
-    Ztesla,
-    Ptesla,
-    dtesla,
-    Gtesla,
-    ftesla,
-    htesla,
-    datesla,
-    mtesla,
-    ntesla,
-    ptesla,
-    utesla,
-    Ttesla,
-    ytesla,
-    Etesla,
-    ztesla,
-    Mtesla,
-    ktesla,
-    Ytesla,
-    ahenry,
-    chenry,
-    Zhenry,
-    Phenry,
-    dhenry,
-    Ghenry,
-    fhenry,
-    hhenry,
-    dahenry,
-    mhenry,
-    nhenry,
-    phenry,
-    uhenry,
-    Thenry,
-    yhenry,
-    Ehenry,
-    zhenry,
-    Mhenry,
-    khenry,
-    Yhenry,
-    acelsius,
-    ccelsius,
-    Zcelsius,
-    Pcelsius,
-    dcelsius,
-    Gcelsius,
-    fcelsius,
-    hcelsius,
-    dacelsius,
-    mcelsius,
-    ncelsius,
-    pcelsius,
-    ucelsius,
-    Tcelsius,
-    ycelsius,
-    Ecelsius,
-    zcelsius,
-    Mcelsius,
-    kcelsius,
-    Ycelsius,
-    alumen,
-    clumen,
-    Zlumen,
-    Plumen,
-    dlumen,
-    Glumen,
-    flumen,
-    hlumen,
-    dalumen,
-    mlumen,
-    nlumen,
-    plumen,
-    ulumen,
-    Tlumen,
-    ylumen,
-    Elumen,
-    zlumen,
-    Mlumen,
-    klumen,
-    Ylumen,
-    alux,
-    clux,
-    Zlux,
-    Plux,
-    dlux,
-    Glux,
-    flux,
-    hlux,
-    dalux,
-    mlux,
-    nlux,
-    plux,
-    ulux,
-    Tlux,
-    ylux,
-    Elux,
-    zlux,
-    Mlux,
-    klux,
-    Ylux,
-    abecquerel,
-    cbecquerel,
-    Zbecquerel,
-    Pbecquerel,
-    dbecquerel,
-    Gbecquerel,
-    fbecquerel,
-    hbecquerel,
-    dabecquerel,
-    mbecquerel,
-    nbecquerel,
-    pbecquerel,
-    ubecquerel,
-    Tbecquerel,
-    ybecquerel,
-    Ebecquerel,
-    zbecquerel,
-    Mbecquerel,
-    kbecquerel,
-    Ybecquerel,
-    agray,
-    cgray,
-    Zgray,
-    Pgray,
-    dgray,
-    Ggray,
-    fgray,
-    hgray,
-    dagray,
-    mgray,
-    ngray,
-    pgray,
-    ugray,
-    Tgray,
-    ygray,
-    Egray,
-    zgray,
-    Mgray,
-    kgray,
-    Ygray,
-    asievert,
-    csievert,
-    Zsievert,
-    Psievert,
-    dsievert,
-    Gsievert,
-    fsievert,
-    hsievert,
-    dasievert,
-    msievert,
-    nsievert,
-    psievert,
-    usievert,
-    Tsievert,
-    ysievert,
-    Esievert,
-    zsievert,
-    Msievert,
-    ksievert,
-    Ysievert,
-    akatal,
-    ckatal,
-    Zkatal,
-    Pkatal,
-    dkatal,
-    Gkatal,
-    fkatal,
-    hkatal,
-    dakatal,
-    mkatal,
-    nkatal,
-    pkatal,
-    ukatal,
-    Tkatal,
-    ykatal,
-    Ekatal,
-    zkatal,
-    Mkatal,
-    kkatal,
-    Ykatal,
-    metre2,
-    metre3,
-    meter2,
-    meter3,
-    gram2,
-    gram3,
-    second2,
-    second3,
-    amp2,
-    amp3,
-    kelvin2,
-    kelvin3,
-    mole2,
-    mole3,
-    candle2,
-    candle3,
-    gramme2,
-    gramme3,
-    kilogram2,
-    kilogram3,
-    radian2,
-    radian3,
-    steradian2,
-    steradian3,
-    hertz2,
-    hertz3,
-    newton2,
-    newton3,
-    pascal2,
-    pascal3,
-    joule2,
-    joule3,
-    watt2,
-    watt3,
-    coulomb2,
-    coulomb3,
-    volt2,
-    volt3,
-    farad2,
-    farad3,
-    ohm2,
-    ohm3,
-    siemens2,
-    siemens3,
-    weber2,
-    weber3,
-    tesla2,
-    tesla3,
-    henry2,
-    henry3,
-    celsius2,
-    celsius3,
-    lumen2,
-    lumen3,
-    lux2,
-    lux3,
-    becquerel2,
-    becquerel3,
-    gray2,
-    gray3,
-    sievert2,
-    sievert3,
-    katal2,
-    katal3,
-    ametre2,
-    ametre3,
-    cmetre2,
-    cmetre3,
-    Zmetre2,
-    Zmetre3,
-    Pmetre2,
-    Pmetre3,
-    dmetre2,
-    dmetre3,
-    Gmetre2,
-    Gmetre3,
-    fmetre2,
-    fmetre3,
-    hmetre2,
-    hmetre3,
-    dametre2,
-    dametre3,
-    mmetre2,
-    mmetre3,
-    nmetre2,
-    nmetre3,
-    pmetre2,
-    pmetre3,
-    umetre2,
-    umetre3,
-    Tmetre2,
-    Tmetre3,
-    ymetre2,
-    ymetre3,
-    Emetre2,
-    Emetre3,
-    zmetre2,
-    zmetre3,
-    Mmetre2,
-    Mmetre3,
-    kmetre2,
-    kmetre3,
-    Ymetre2,
-    Ymetre3,
-    ameter2,
-    ameter3,
-    cmeter2,
-    cmeter3,
-    Zmeter2,
-    Zmeter3,
-    Pmeter2,
-    Pmeter3,
-    dmeter2,
-    dmeter3,
-    Gmeter2,
-    Gmeter3,
-    fmeter2,
-    fmeter3,
-    hmeter2,
-    hmeter3,
-    dameter2,
-    dameter3,
-    mmeter2,
-    mmeter3,
-    nmeter2,
-    nmeter3,
-    pmeter2,
-    pmeter3,
-    umeter2,
-    umeter3,
-    Tmeter2,
-    Tmeter3,
-    ymeter2,
-    ymeter3,
-    Emeter2,
-    Emeter3,
-    zmeter2,
-    zmeter3,
-    Mmeter2,
-    Mmeter3,
-    kmeter2,
-    kmeter3,
-    Ymeter2,
-    Ymeter3,
-    agram2,
-    agram3,
-    cgram2,
-    cgram3,
-    Zgram2,
-    Zgram3,
-    Pgram2,
-    Pgram3,
-    dgram2,
-    dgram3,
-    Ggram2,
-    Ggram3,
-    fgram2,
-    fgram3,
-    hgram2,
-    hgram3,
-    dagram2,
-    dagram3,
-    mgram2,
-    mgram3,
-    ngram2,
-    ngram3,
-    pgram2,
-    pgram3,
-    ugram2,
-    ugram3,
-    Tgram2,
-    Tgram3,
-    ygram2,
-    ygram3,
-    Egram2,
-    Egram3,
-    zgram2,
-    zgram3,
-    Mgram2,
-    Mgram3,
-    kgram2,
-    kgram3,
-    Ygram2,
-    Ygram3,
-    asecond2,
-    asecond3,
-    csecond2,
-    csecond3,
-    Zsecond2,
-    Zsecond3,
-    Psecond2,
-    Psecond3,
-    dsecond2,
-    dsecond3,
-    Gsecond2,
-    Gsecond3,
-    fsecond2,
-    fsecond3,
-    hsecond2,
-    hsecond3,
-    dasecond2,
-    dasecond3,
-    msecond2,
-    msecond3,
-    nsecond2,
-    nsecond3,
-    psecond2,
-    psecond3,
-    usecond2,
-    usecond3,
-    Tsecond2,
-    Tsecond3,
-    ysecond2,
-    ysecond3,
-    Esecond2,
-    Esecond3,
-    zsecond2,
-    zsecond3,
-    Msecond2,
-    Msecond3,
-    ksecond2,
-    ksecond3,
-    Ysecond2,
-    Ysecond3,
-    aamp2,
-    aamp3,
-    camp2,
-    camp3,
-    Zamp2,
-    Zamp3,
-    Pamp2,
-    Pamp3,
-    damp2,
-    damp3,
-    Gamp2,
-    Gamp3,
-    famp2,
-    famp3,
-    hamp2,
-    hamp3,
-    daamp2,
-    daamp3,
-    mamp2,
-    mamp3,
-    namp2,
-    namp3,
-    pamp2,
-    pamp3,
-    uamp2,
-    uamp3,
-    Tamp2,
-    Tamp3,
-    yamp2,
-    yamp3,
-    Eamp2,
-    Eamp3,
-    zamp2,
-    zamp3,
-    Mamp2,
-    Mamp3,
-    kamp2,
-    kamp3,
-    Yamp2,
-    Yamp3,
-    akelvin2,
-    akelvin3,
-    ckelvin2,
-    ckelvin3,
-    Zkelvin2,
-    Zkelvin3,
-    Pkelvin2,
-    Pkelvin3,
-    dkelvin2,
-    dkelvin3,
-    Gkelvin2,
-    Gkelvin3,
-    fkelvin2,
-    fkelvin3,
-    hkelvin2,
-    hkelvin3,
-    dakelvin2,
-    dakelvin3,
-    mkelvin2,
-    mkelvin3,
-    nkelvin2,
-    nkelvin3,
-    pkelvin2,
-    pkelvin3,
-    ukelvin2,
-    ukelvin3,
-    Tkelvin2,
-    Tkelvin3,
-    ykelvin2,
-    ykelvin3,
-    Ekelvin2,
-    Ekelvin3,
-    zkelvin2,
-    zkelvin3,
-    Mkelvin2,
-    Mkelvin3,
-    kkelvin2,
-    kkelvin3,
-    Ykelvin2,
-    Ykelvin3,
-    amole2,
-    amole3,
-    cmole2,
-    cmole3,
-    Zmole2,
-    Zmole3,
-    Pmole2,
-    Pmole3,
-    dmole2,
-    dmole3,
-    Gmole2,
-    Gmole3,
-    fmole2,
-    fmole3,
-    hmole2,
-    hmole3,
-    damole2,
-    damole3,
-    mmole2,
-    mmole3,
-    nmole2,
-    nmole3,
-    pmole2,
-    pmole3,
-    umole2,
-    umole3,
-    Tmole2,
-    Tmole3,
-    ymole2,
-    ymole3,
-    Emole2,
-    Emole3,
-    zmole2,
-    zmole3,
-    Mmole2,
-    Mmole3,
-    kmole2,
-    kmole3,
-    Ymole2,
-    Ymole3,
-    acandle2,
-    acandle3,
-    ccandle2,
-    ccandle3,
-    Zcandle2,
-    Zcandle3,
-    Pcandle2,
-    Pcandle3,
-    dcandle2,
-    dcandle3,
-    Gcandle2,
-    Gcandle3,
-    fcandle2,
-    fcandle3,
-    hcandle2,
-    hcandle3,
-    dacandle2,
-    dacandle3,
-    mcandle2,
-    mcandle3,
-    ncandle2,
-    ncandle3,
-    pcandle2,
-    pcandle3,
-    ucandle2,
-    ucandle3,
-    Tcandle2,
-    Tcandle3,
-    ycandle2,
-    ycandle3,
-    Ecandle2,
-    Ecandle3,
-    zcandle2,
-    zcandle3,
-    Mcandle2,
-    Mcandle3,
-    kcandle2,
-    kcandle3,
-    Ycandle2,
-    Ycandle3,
-    agramme2,
-    agramme3,
-    cgramme2,
-    cgramme3,
-    Zgramme2,
-    Zgramme3,
-    Pgramme2,
-    Pgramme3,
-    dgramme2,
-    dgramme3,
-    Ggramme2,
-    Ggramme3,
-    fgramme2,
-    fgramme3,
-    hgramme2,
-    hgramme3,
-    dagramme2,
-    dagramme3,
-    mgramme2,
-    mgramme3,
-    ngramme2,
-    ngramme3,
-    pgramme2,
-    pgramme3,
-    ugramme2,
-    ugramme3,
-    Tgramme2,
-    Tgramme3,
-    ygramme2,
-    ygramme3,
-    Egramme2,
-    Egramme3,
-    zgramme2,
-    zgramme3,
-    Mgramme2,
-    Mgramme3,
-    kgramme2,
-    kgramme3,
-    Ygramme2,
-    Ygramme3,
-    akilogram2,
-    akilogram3,
-    ckilogram2,
-    ckilogram3,
-    Zkilogram2,
-    Zkilogram3,
-    Pkilogram2,
-    Pkilogram3,
-    dkilogram2,
-    dkilogram3,
-    Gkilogram2,
-    Gkilogram3,
-    fkilogram2,
-    fkilogram3,
-    hkilogram2,
-    hkilogram3,
-    dakilogram2,
-    dakilogram3,
-    mkilogram2,
-    mkilogram3,
-    nkilogram2,
-    nkilogram3,
-    pkilogram2,
-    pkilogram3,
-    ukilogram2,
-    ukilogram3,
-    Tkilogram2,
-    Tkilogram3,
-    ykilogram2,
-    ykilogram3,
-    Ekilogram2,
-    Ekilogram3,
-    zkilogram2,
-    zkilogram3,
-    Mkilogram2,
-    Mkilogram3,
-    kkilogram2,
-    kkilogram3,
-    Ykilogram2,
-    Ykilogram3,
-    aradian2,
-    aradian3,
-    cradian2,
-    cradian3,
-    Zradian2,
-    Zradian3,
-    Pradian2,
-    Pradian3,
-    dradian2,
-    dradian3,
-    Gradian2,
-    Gradian3,
-    fradian2,
-    fradian3,
-    hradian2,
-    hradian3,
-    daradian2,
-    daradian3,
-    mradian2,
-    mradian3,
-    nradian2,
-    nradian3,
-    pradian2,
-    pradian3,
-    uradian2,
-    uradian3,
-    Tradian2,
-    Tradian3,
-    yradian2,
-    yradian3,
-    Eradian2,
-    Eradian3,
-    zradian2,
-    zradian3,
-    Mradian2,
-    Mradian3,
-    kradian2,
-    kradian3,
-    Yradian2,
-    Yradian3,
-    asteradian2,
-    asteradian3,
-    csteradian2,
-    csteradian3,
-    Zsteradian2,
-    Zsteradian3,
-    Psteradian2,
-    Psteradian3,
-    dsteradian2,
-    dsteradian3,
-    Gsteradian2,
-    Gsteradian3,
-    fsteradian2,
-    fsteradian3,
-    hsteradian2,
-    hsteradian3,
-    dasteradian2,
-    dasteradian3,
-    msteradian2,
-    msteradian3,
-    nsteradian2,
-    nsteradian3,
-    psteradian2,
-    psteradian3,
-    usteradian2,
-    usteradian3,
-    Tsteradian2,
-    Tsteradian3,
-    ysteradian2,
-    ysteradian3,
-    Esteradian2,
-    Esteradian3,
-    zsteradian2,
-    zsteradian3,
-    Msteradian2,
-    Msteradian3,
-    ksteradian2,
-    ksteradian3,
-    Ysteradian2,
-    Ysteradian3,
-    ahertz2,
-    ahertz3,
-    chertz2,
-    chertz3,
-    Zhertz2,
-    Zhertz3,
-    Phertz2,
-    Phertz3,
-    dhertz2,
-    dhertz3,
-    Ghertz2,
-    Ghertz3,
-    fhertz2,
-    fhertz3,
-    hhertz2,
-    hhertz3,
-    dahertz2,
-    dahertz3,
-    mhertz2,
-    mhertz3,
-    nhertz2,
-    nhertz3,
-    phertz2,
-    phertz3,
-    uhertz2,
-    uhertz3,
-    Thertz2,
-    Thertz3,
-    yhertz2,
-    yhertz3,
-    Ehertz2,
-    Ehertz3,
-    zhertz2,
-    zhertz3,
-    Mhertz2,
-    Mhertz3,
-    khertz2,
-    khertz3,
-    Yhertz2,
-    Yhertz3,
-    anewton2,
-    anewton3,
-    cnewton2,
-    cnewton3,
-    Znewton2,
-    Znewton3,
-    Pnewton2,
-    Pnewton3,
-    dnewton2,
-    dnewton3,
-    Gnewton2,
-    Gnewton3,
-    fnewton2,
-    fnewton3,
-    hnewton2,
-    hnewton3,
-    danewton2,
-    danewton3,
-    mnewton2,
-    mnewton3,
-    nnewton2,
-    nnewton3,
-    pnewton2,
-    pnewton3,
-    unewton2,
-    unewton3,
-    Tnewton2,
-    Tnewton3,
-    ynewton2,
-    ynewton3,
-    Enewton2,
-    Enewton3,
-    znewton2,
-    znewton3,
-    Mnewton2,
-    Mnewton3,
-    knewton2,
-    knewton3,
-    Ynewton2,
-    Ynewton3,
-    apascal2,
-    apascal3,
-    cpascal2,
-    cpascal3,
-    Zpascal2,
-    Zpascal3,
-    Ppascal2,
-    Ppascal3,
-    dpascal2,
-    dpascal3,
-    Gpascal2,
-    Gpascal3,
-    fpascal2,
-    fpascal3,
-    hpascal2,
-    hpascal3,
-    dapascal2,
-    dapascal3,
-    mpascal2,
-    mpascal3,
-    npascal2,
-    npascal3,
-    ppascal2,
-    ppascal3,
-    upascal2,
-    upascal3,
-    Tpascal2,
-    Tpascal3,
-    ypascal2,
-    ypascal3,
-    Epascal2,
-    Epascal3,
-    zpascal2,
-    zpascal3,
-    Mpascal2,
-    Mpascal3,
-    kpascal2,
-    kpascal3,
-    Ypascal2,
-    Ypascal3,
-    ajoule2,
-    ajoule3,
-    cjoule2,
-    cjoule3,
-    Zjoule2,
-    Zjoule3,
-    Pjoule2,
-    Pjoule3,
-    djoule2,
-    djoule3,
-    Gjoule2,
-    Gjoule3,
-    fjoule2,
-    fjoule3,
-    hjoule2,
-    hjoule3,
-    dajoule2,
-    dajoule3,
-    mjoule2,
-    mjoule3,
-    njoule2,
-    njoule3,
-    pjoule2,
-    pjoule3,
-    ujoule2,
-    ujoule3,
-    Tjoule2,
-    Tjoule3,
-    yjoule2,
-    yjoule3,
-    Ejoule2,
-    Ejoule3,
-    zjoule2,
-    zjoule3,
-    Mjoule2,
-    Mjoule3,
-    kjoule2,
-    kjoule3,
-    Yjoule2,
-    Yjoule3,
-    awatt2,
-    awatt3,
-    cwatt2,
-    cwatt3,
-    Zwatt2,
-    Zwatt3,
-    Pwatt2,
-    Pwatt3,
-    dwatt2,
-    dwatt3,
-    Gwatt2,
-    Gwatt3,
-    fwatt2,
-    fwatt3,
-    hwatt2,
-    hwatt3,
-    dawatt2,
-    dawatt3,
-    mwatt2,
-    mwatt3,
-    nwatt2,
-    nwatt3,
-    pwatt2,
-    pwatt3,
-    uwatt2,
-    uwatt3,
-    Twatt2,
-    Twatt3,
-    ywatt2,
-    ywatt3,
-    Ewatt2,
-    Ewatt3,
-    zwatt2,
-    zwatt3,
-    Mwatt2,
-    Mwatt3,
-    kwatt2,
-    kwatt3,
-    Ywatt2,
-    Ywatt3,
-    acoulomb2,
-    acoulomb3,
-    ccoulomb2,
-    ccoulomb3,
-    Zcoulomb2,
-    Zcoulomb3,
-    Pcoulomb2,
-    Pcoulomb3,
-    dcoulomb2,
-    dcoulomb3,
-    Gcoulomb2,
-    Gcoulomb3,
-    fcoulomb2,
-    fcoulomb3,
-    hcoulomb2,
-    hcoulomb3,
-    dacoulomb2,
-    dacoulomb3,
-    mcoulomb2,
-    mcoulomb3,
-    ncoulomb2,
-    ncoulomb3,
-    pcoulomb2,
-    pcoulomb3,
-    ucoulomb2,
-    ucoulomb3,
-    Tcoulomb2,
-    Tcoulomb3,
-    ycoulomb2,
-    ycoulomb3,
-    Ecoulomb2,
-    Ecoulomb3,
-    zcoulomb2,
-    zcoulomb3,
-    Mcoulomb2,
-    Mcoulomb3,
-    kcoulomb2,
-    kcoulomb3,
-    Ycoulomb2,
-    Ycoulomb3,
-    avolt2,
-    avolt3,
-    cvolt2,
-    cvolt3,
-    Zvolt2,
-    Zvolt3,
-    Pvolt2,
-    Pvolt3,
-    dvolt2,
-    dvolt3,
-    Gvolt2,
-    Gvolt3,
-    fvolt2,
-    fvolt3,
-    hvolt2,
-    hvolt3,
-    davolt2,
-    davolt3,
-    mvolt2,
-    mvolt3,
-    nvolt2,
-    nvolt3,
-    pvolt2,
-    pvolt3,
-    uvolt2,
-    uvolt3,
-    Tvolt2,
-    Tvolt3,
-    yvolt2,
-    yvolt3,
-    Evolt2,
-    Evolt3,
-    zvolt2,
-    zvolt3,
-    Mvolt2,
-    Mvolt3,
-    kvolt2,
-    kvolt3,
-    Yvolt2,
-    Yvolt3,
-    afarad2,
-    afarad3,
-    cfarad2,
-    cfarad3,
-    Zfarad2,
-    Zfarad3,
-    Pfarad2,
-    Pfarad3,
-    dfarad2,
-    dfarad3,
-    Gfarad2,
-    Gfarad3,
-    ffarad2,
-    ffarad3,
-    hfarad2,
-    hfarad3,
-    dafarad2,
-    dafarad3,
-    mfarad2,
-    mfarad3,
-    nfarad2,
-    nfarad3,
-    pfarad2,
-    pfarad3,
-    ufarad2,
-    ufarad3,
-    Tfarad2,
-    Tfarad3,
-    yfarad2,
-    yfarad3,
-    Efarad2,
-    Efarad3,
-    zfarad2,
-    zfarad3,
-    Mfarad2,
-    Mfarad3,
-    kfarad2,
-    kfarad3,
-    Yfarad2,
-    Yfarad3,
-    aohm2,
-    aohm3,
-    cohm2,
-    cohm3,
-    Zohm2,
-    Zohm3,
-    Pohm2,
-    Pohm3,
-    dohm2,
-    dohm3,
-    Gohm2,
-    Gohm3,
-    fohm2,
-    fohm3,
-    hohm2,
-    hohm3,
-    daohm2,
-    daohm3,
-    mohm2,
-    mohm3,
-    nohm2,
-    nohm3,
-    pohm2,
-    pohm3,
-    uohm2,
-    uohm3,
-    Tohm2,
-    Tohm3,
-    yohm2,
-    yohm3,
-    Eohm2,
-    Eohm3,
-    zohm2,
-    zohm3,
-    Mohm2,
-    Mohm3,
-    kohm2,
-    kohm3,
-    Yohm2,
-    Yohm3,
-    asiemens2,
-    asiemens3,
-    csiemens2,
-    csiemens3,
-    Zsiemens2,
-    Zsiemens3,
-    Psiemens2,
-    Psiemens3,
-    dsiemens2,
-    dsiemens3,
-    Gsiemens2,
-    Gsiemens3,
-    fsiemens2,
-    fsiemens3,
-    hsiemens2,
-    hsiemens3,
-    dasiemens2,
-    dasiemens3,
-    msiemens2,
-    msiemens3,
-    nsiemens2,
-    nsiemens3,
-    psiemens2,
-    psiemens3,
-    usiemens2,
-    usiemens3,
-    Tsiemens2,
-    Tsiemens3,
-    ysiemens2,
-    ysiemens3,
-    Esiemens2,
-    Esiemens3,
-    zsiemens2,
-    zsiemens3,
-    Msiemens2,
-    Msiemens3,
-    ksiemens2,
-    ksiemens3,
-    Ysiemens2,
-    Ysiemens3,
-    aweber2,
-    aweber3,
-    cweber2,
-    cweber3,
-    Zweber2,
-    Zweber3,
-    Pweber2,
-    Pweber3,
-    dweber2,
-    dweber3,
-    Gweber2,
-    Gweber3,
-    fweber2,
-    fweber3,
-    hweber2,
-    hweber3,
-    daweber2,
-    daweber3,
-    mweber2,
-    mweber3,
-    nweber2,
-    nweber3,
-    pweber2,
-    pweber3,
-    uweber2,
-    uweber3,
-    Tweber2,
-    Tweber3,
-    yweber2,
-    yweber3,
-    Eweber2,
-    Eweber3,
-    zweber2,
-    zweber3,
-    Mweber2,
-    Mweber3,
-    kweber2,
-    kweber3,
-    Yweber2,
-    Yweber3,
-    atesla2,
-    atesla3,
-    ctesla2,
-    ctesla3,
-    Ztesla2,
-    Ztesla3,
-    Ptesla2,
-    Ptesla3,
-    dtesla2,
-    dtesla3,
-    Gtesla2,
-    Gtesla3,
-    ftesla2,
-    ftesla3,
-    htesla2,
-    htesla3,
-    datesla2,
-    datesla3,
-    mtesla2,
-    mtesla3,
-    ntesla2,
-    ntesla3,
-    ptesla2,
-    ptesla3,
-    utesla2,
-    utesla3,
-    Ttesla2,
-    Ttesla3,
-    ytesla2,
-    ytesla3,
-    Etesla2,
-    Etesla3,
-    ztesla2,
-    ztesla3,
-    Mtesla2,
-    Mtesla3,
-    ktesla2,
-    ktesla3,
-    Ytesla2,
-    Ytesla3,
-    ahenry2,
-    ahenry3,
-    chenry2,
-    chenry3,
-    Zhenry2,
-    Zhenry3,
-    Phenry2,
-    Phenry3,
-    dhenry2,
-    dhenry3,
-    Ghenry2,
-    Ghenry3,
-    fhenry2,
-    fhenry3,
-    hhenry2,
-    hhenry3,
-    dahenry2,
-    dahenry3,
-    mhenry2,
-    mhenry3,
-    nhenry2,
-    nhenry3,
-    phenry2,
-    phenry3,
-    uhenry2,
-    uhenry3,
-    Thenry2,
-    Thenry3,
-    yhenry2,
-    yhenry3,
-    Ehenry2,
-    Ehenry3,
-    zhenry2,
-    zhenry3,
-    Mhenry2,
-    Mhenry3,
-    khenry2,
-    khenry3,
-    Yhenry2,
-    Yhenry3,
-    acelsius2,
-    acelsius3,
-    ccelsius2,
-    ccelsius3,
-    Zcelsius2,
-    Zcelsius3,
-    Pcelsius2,
-    Pcelsius3,
-    dcelsius2,
-    dcelsius3,
-    Gcelsius2,
-    Gcelsius3,
-    fcelsius2,
-    fcelsius3,
-    hcelsius2,
-    hcelsius3,
-    dacelsius2,
-    dacelsius3,
-    mcelsius2,
-    mcelsius3,
-    ncelsius2,
-    ncelsius3,
-    pcelsius2,
-    pcelsius3,
-    ucelsius2,
-    ucelsius3,
-    Tcelsius2,
-    Tcelsius3,
-    ycelsius2,
-    ycelsius3,
-    Ecelsius2,
-    Ecelsius3,
-    zcelsius2,
-    zcelsius3,
-    Mcelsius2,
-    Mcelsius3,
-    kcelsius2,
-    kcelsius3,
-    Ycelsius2,
-    Ycelsius3,
-    alumen2,
-    alumen3,
-    clumen2,
-    clumen3,
-    Zlumen2,
-    Zlumen3,
-    Plumen2,
-    Plumen3,
-    dlumen2,
-    dlumen3,
-    Glumen2,
-    Glumen3,
-    flumen2,
-    flumen3,
-    hlumen2,
-    hlumen3,
-    dalumen2,
-    dalumen3,
-    mlumen2,
-    mlumen3,
-    nlumen2,
-    nlumen3,
-    plumen2,
-    plumen3,
-    ulumen2,
-    ulumen3,
-    Tlumen2,
-    Tlumen3,
-    ylumen2,
-    ylumen3,
-    Elumen2,
-    Elumen3,
-    zlumen2,
-    zlumen3,
-    Mlumen2,
-    Mlumen3,
-    klumen2,
-    klumen3,
-    Ylumen2,
-    Ylumen3,
-    alux2,
-    alux3,
-    clux2,
-    clux3,
-    Zlux2,
-    Zlux3,
-    Plux2,
-    Plux3,
-    dlux2,
-    dlux3,
-    Glux2,
-    Glux3,
-    flux2,
-    flux3,
-    hlux2,
-    hlux3,
-    dalux2,
-    dalux3,
-    mlux2,
-    mlux3,
-    nlux2,
-    nlux3,
-    plux2,
-    plux3,
-    ulux2,
-    ulux3,
-    Tlux2,
-    Tlux3,
-    ylux2,
-    ylux3,
-    Elux2,
-    Elux3,
-    zlux2,
-    zlux3,
-    Mlux2,
-    Mlux3,
-    klux2,
-    klux3,
-    Ylux2,
-    Ylux3,
-    abecquerel2,
-    abecquerel3,
-    cbecquerel2,
-    cbecquerel3,
-    Zbecquerel2,
-    Zbecquerel3,
-    Pbecquerel2,
-    Pbecquerel3,
-    dbecquerel2,
-    dbecquerel3,
-    Gbecquerel2,
-    Gbecquerel3,
-    fbecquerel2,
-    fbecquerel3,
-    hbecquerel2,
-    hbecquerel3,
-    dabecquerel2,
-    dabecquerel3,
-    mbecquerel2,
-    mbecquerel3,
-    nbecquerel2,
-    nbecquerel3,
-    pbecquerel2,
-    pbecquerel3,
-    ubecquerel2,
-    ubecquerel3,
-    Tbecquerel2,
-    Tbecquerel3,
-    ybecquerel2,
-    ybecquerel3,
-    Ebecquerel2,
-    Ebecquerel3,
-    zbecquerel2,
-    zbecquerel3,
-    Mbecquerel2,
-    Mbecquerel3,
-    kbecquerel2,
-    kbecquerel3,
-    Ybecquerel2,
-    Ybecquerel3,
-    agray2,
-    agray3,
-    cgray2,
-    cgray3,
-    Zgray2,
-    Zgray3,
-    Pgray2,
-    Pgray3,
-    dgray2,
-    dgray3,
-    Ggray2,
-    Ggray3,
-    fgray2,
-    fgray3,
-    hgray2,
-    hgray3,
-    dagray2,
-    dagray3,
-    mgray2,
-    mgray3,
-    ngray2,
-    ngray3,
-    pgray2,
-    pgray3,
-    ugray2,
-    ugray3,
-    Tgray2,
-    Tgray3,
-    ygray2,
-    ygray3,
-    Egray2,
-    Egray3,
-    zgray2,
-    zgray3,
-    Mgray2,
-    Mgray3,
-    kgray2,
-    kgray3,
-    Ygray2,
-    Ygray3,
-    asievert2,
-    asievert3,
-    csievert2,
-    csievert3,
-    Zsievert2,
-    Zsievert3,
-    Psievert2,
-    Psievert3,
-    dsievert2,
-    dsievert3,
-    Gsievert2,
-    Gsievert3,
-    fsievert2,
-    fsievert3,
-    hsievert2,
-    hsievert3,
-    dasievert2,
-    dasievert3,
-    msievert2,
-    msievert3,
-    nsievert2,
-    nsievert3,
-    psievert2,
-    psievert3,
-    usievert2,
-    usievert3,
-    Tsievert2,
-    Tsievert3,
-    ysievert2,
-    ysievert3,
-    Esievert2,
-    Esievert3,
-    zsievert2,
-    zsievert3,
-    Msievert2,
-    Msievert3,
-    ksievert2,
-    ksievert3,
-    Ysievert2,
-    Ysievert3,
-    akatal2,
-    akatal3,
-    ckatal2,
-    ckatal3,
-    Zkatal2,
-    Zkatal3,
-    Pkatal2,
-    Pkatal3,
-    dkatal2,
-    dkatal3,
-    Gkatal2,
-    Gkatal3,
-    fkatal2,
-    fkatal3,
-    hkatal2,
-    hkatal3,
-    dakatal2,
-    dakatal3,
-    mkatal2,
-    mkatal3,
-    nkatal2,
-    nkatal3,
-    pkatal2,
-    pkatal3,
-    ukatal2,
-    ukatal3,
-    Tkatal2,
-    Tkatal3,
-    ykatal2,
-    ykatal3,
-    Ekatal2,
-    Ekatal3,
-    zkatal2,
-    zkatal3,
-    Mkatal2,
-    Mkatal3,
-    kkatal2,
-    kkatal3,
-    Ykatal2,
-    Ykatal3,
+_lazy_unit_definitions = [
+    ("ametre", "metre", "a", 1, True),
+    ("cmetre", "metre", "c", 1, False),
+    ("Zmetre", "metre", "Z", 1, True),
+    ("Pmetre", "metre", "P", 1, True),
+    ("dmetre", "metre", "d", 1, False),
+    ("Gmetre", "metre", "G", 1, True),
+    ("fmetre", "metre", "f", 1, True),
+    ("hmetre", "metre", "h", 1, False),
+    ("dametre", "metre", "da", 1, False),
+    ("mmetre", "metre", "m", 1, True),
+    ("nmetre", "metre", "n", 1, True),
+    ("pmetre", "metre", "p", 1, True),
+    ("umetre", "metre", "u", 1, True),
+    ("Tmetre", "metre", "T", 1, True),
+    ("ymetre", "metre", "y", 1, True),
+    ("Emetre", "metre", "E", 1, True),
+    ("zmetre", "metre", "z", 1, True),
+    ("Mmetre", "metre", "M", 1, True),
+    ("kmetre", "metre", "k", 1, True),
+    ("Ymetre", "metre", "Y", 1, True),
+    ("ameter", "meter", "a", 1, True),
+    ("cmeter", "meter", "c", 1, False),
+    ("Zmeter", "meter", "Z", 1, True),
+    ("Pmeter", "meter", "P", 1, True),
+    ("dmeter", "meter", "d", 1, False),
+    ("Gmeter", "meter", "G", 1, True),
+    ("fmeter", "meter", "f", 1, True),
+    ("hmeter", "meter", "h", 1, False),
+    ("dameter", "meter", "da", 1, False),
+    ("mmeter", "meter", "m", 1, True),
+    ("nmeter", "meter", "n", 1, True),
+    ("pmeter", "meter", "p", 1, True),
+    ("umeter", "meter", "u", 1, True),
+    ("Tmeter", "meter", "T", 1, True),
+    ("ymeter", "meter", "y", 1, True),
+    ("Emeter", "meter", "E", 1, True),
+    ("zmeter", "meter", "z", 1, True),
+    ("Mmeter", "meter", "M", 1, True),
+    ("kmeter", "meter", "k", 1, True),
+    ("Ymeter", "meter", "Y", 1, True),
+    ("agram", "gram", "a", 1, True),
+    ("cgram", "gram", "c", 1, False),
+    ("Zgram", "gram", "Z", 1, True),
+    ("Pgram", "gram", "P", 1, True),
+    ("dgram", "gram", "d", 1, False),
+    ("Ggram", "gram", "G", 1, True),
+    ("fgram", "gram", "f", 1, True),
+    ("hgram", "gram", "h", 1, False),
+    ("dagram", "gram", "da", 1, False),
+    ("mgram", "gram", "m", 1, True),
+    ("ngram", "gram", "n", 1, True),
+    ("pgram", "gram", "p", 1, True),
+    ("ugram", "gram", "u", 1, True),
+    ("Tgram", "gram", "T", 1, True),
+    ("ygram", "gram", "y", 1, True),
+    ("Egram", "gram", "E", 1, True),
+    ("zgram", "gram", "z", 1, True),
+    ("Mgram", "gram", "M", 1, True),
+    ("kgram", "gram", "k", 1, True),
+    ("Ygram", "gram", "Y", 1, True),
+    ("asecond", "second", "a", 1, True),
+    ("csecond", "second", "c", 1, False),
+    ("Zsecond", "second", "Z", 1, True),
+    ("Psecond", "second", "P", 1, True),
+    ("dsecond", "second", "d", 1, False),
+    ("Gsecond", "second", "G", 1, True),
+    ("fsecond", "second", "f", 1, True),
+    ("hsecond", "second", "h", 1, False),
+    ("dasecond", "second", "da", 1, False),
+    ("msecond", "second", "m", 1, True),
+    ("nsecond", "second", "n", 1, True),
+    ("psecond", "second", "p", 1, True),
+    ("usecond", "second", "u", 1, True),
+    ("Tsecond", "second", "T", 1, True),
+    ("ysecond", "second", "y", 1, True),
+    ("Esecond", "second", "E", 1, True),
+    ("zsecond", "second", "z", 1, True),
+    ("Msecond", "second", "M", 1, True),
+    ("ksecond", "second", "k", 1, True),
+    ("Ysecond", "second", "Y", 1, True),
+    ("aamp", "amp", "a", 1, True),
+    ("camp", "amp", "c", 1, False),
+    ("Zamp", "amp", "Z", 1, True),
+    ("Pamp", "amp", "P", 1, True),
+    ("damp", "amp", "d", 1, False),
+    ("Gamp", "amp", "G", 1, True),
+    ("famp", "amp", "f", 1, True),
+    ("hamp", "amp", "h", 1, False),
+    ("daamp", "amp", "da", 1, False),
+    ("mamp", "amp", "m", 1, True),
+    ("namp", "amp", "n", 1, True),
+    ("pamp", "amp", "p", 1, True),
+    ("uamp", "amp", "u", 1, True),
+    ("Tamp", "amp", "T", 1, True),
+    ("yamp", "amp", "y", 1, True),
+    ("Eamp", "amp", "E", 1, True),
+    ("zamp", "amp", "z", 1, True),
+    ("Mamp", "amp", "M", 1, True),
+    ("kamp", "amp", "k", 1, True),
+    ("Yamp", "amp", "Y", 1, True),
+    ("akelvin", "kelvin", "a", 1, True),
+    ("ckelvin", "kelvin", "c", 1, False),
+    ("Zkelvin", "kelvin", "Z", 1, True),
+    ("Pkelvin", "kelvin", "P", 1, True),
+    ("dkelvin", "kelvin", "d", 1, False),
+    ("Gkelvin", "kelvin", "G", 1, True),
+    ("fkelvin", "kelvin", "f", 1, True),
+    ("hkelvin", "kelvin", "h", 1, False),
+    ("dakelvin", "kelvin", "da", 1, False),
+    ("mkelvin", "kelvin", "m", 1, True),
+    ("nkelvin", "kelvin", "n", 1, True),
+    ("pkelvin", "kelvin", "p", 1, True),
+    ("ukelvin", "kelvin", "u", 1, True),
+    ("Tkelvin", "kelvin", "T", 1, True),
+    ("ykelvin", "kelvin", "y", 1, True),
+    ("Ekelvin", "kelvin", "E", 1, True),
+    ("zkelvin", "kelvin", "z", 1, True),
+    ("Mkelvin", "kelvin", "M", 1, True),
+    ("kkelvin", "kelvin", "k", 1, True),
+    ("Ykelvin", "kelvin", "Y", 1, True),
+    ("amole", "mole", "a", 1, True),
+    ("cmole", "mole", "c", 1, False),
+    ("Zmole", "mole", "Z", 1, True),
+    ("Pmole", "mole", "P", 1, True),
+    ("dmole", "mole", "d", 1, False),
+    ("Gmole", "mole", "G", 1, True),
+    ("fmole", "mole", "f", 1, True),
+    ("hmole", "mole", "h", 1, False),
+    ("damole", "mole", "da", 1, False),
+    ("mmole", "mole", "m", 1, True),
+    ("nmole", "mole", "n", 1, True),
+    ("pmole", "mole", "p", 1, True),
+    ("umole", "mole", "u", 1, True),
+    ("Tmole", "mole", "T", 1, True),
+    ("ymole", "mole", "y", 1, True),
+    ("Emole", "mole", "E", 1, True),
+    ("zmole", "mole", "z", 1, True),
+    ("Mmole", "mole", "M", 1, True),
+    ("kmole", "mole", "k", 1, True),
+    ("Ymole", "mole", "Y", 1, True),
+    ("acandle", "candle", "a", 1, True),
+    ("ccandle", "candle", "c", 1, False),
+    ("Zcandle", "candle", "Z", 1, True),
+    ("Pcandle", "candle", "P", 1, True),
+    ("dcandle", "candle", "d", 1, False),
+    ("Gcandle", "candle", "G", 1, True),
+    ("fcandle", "candle", "f", 1, True),
+    ("hcandle", "candle", "h", 1, False),
+    ("dacandle", "candle", "da", 1, False),
+    ("mcandle", "candle", "m", 1, True),
+    ("ncandle", "candle", "n", 1, True),
+    ("pcandle", "candle", "p", 1, True),
+    ("ucandle", "candle", "u", 1, True),
+    ("Tcandle", "candle", "T", 1, True),
+    ("ycandle", "candle", "y", 1, True),
+    ("Ecandle", "candle", "E", 1, True),
+    ("zcandle", "candle", "z", 1, True),
+    ("Mcandle", "candle", "M", 1, True),
+    ("kcandle", "candle", "k", 1, True),
+    ("Ycandle", "candle", "Y", 1, True),
+    ("agramme", "gramme", "a", 1, True),
+    ("cgramme", "gramme", "c", 1, False),
+    ("Zgramme", "gramme", "Z", 1, True),
+    ("Pgramme", "gramme", "P", 1, True),
+    ("dgramme", "gramme", "d", 1, False),
+    ("Ggramme", "gramme", "G", 1, True),
+    ("fgramme", "gramme", "f", 1, True),
+    ("hgramme", "gramme", "h", 1, False),
+    ("dagramme", "gramme", "da", 1, False),
+    ("mgramme", "gramme", "m", 1, True),
+    ("ngramme", "gramme", "n", 1, True),
+    ("pgramme", "gramme", "p", 1, True),
+    ("ugramme", "gramme", "u", 1, True),
+    ("Tgramme", "gramme", "T", 1, True),
+    ("ygramme", "gramme", "y", 1, True),
+    ("Egramme", "gramme", "E", 1, True),
+    ("zgramme", "gramme", "z", 1, True),
+    ("Mgramme", "gramme", "M", 1, True),
+    ("kgramme", "gramme", "k", 1, True),
+    ("Ygramme", "gramme", "Y", 1, True),
+    ("akilogram", "kilogram", "a", 1, True),
+    ("ckilogram", "kilogram", "c", 1, False),
+    ("Zkilogram", "kilogram", "Z", 1, True),
+    ("Pkilogram", "kilogram", "P", 1, True),
+    ("dkilogram", "kilogram", "d", 1, False),
+    ("Gkilogram", "kilogram", "G", 1, True),
+    ("fkilogram", "kilogram", "f", 1, True),
+    ("hkilogram", "kilogram", "h", 1, False),
+    ("dakilogram", "kilogram", "da", 1, False),
+    ("mkilogram", "kilogram", "m", 1, True),
+    ("nkilogram", "kilogram", "n", 1, True),
+    ("pkilogram", "kilogram", "p", 1, True),
+    ("ukilogram", "kilogram", "u", 1, True),
+    ("Tkilogram", "kilogram", "T", 1, True),
+    ("ykilogram", "kilogram", "y", 1, True),
+    ("Ekilogram", "kilogram", "E", 1, True),
+    ("zkilogram", "kilogram", "z", 1, True),
+    ("Mkilogram", "kilogram", "M", 1, True),
+    ("kkilogram", "kilogram", "k", 1, True),
+    ("Ykilogram", "kilogram", "Y", 1, True),
+    ("aradian", "radian", "a", 1, True),
+    ("cradian", "radian", "c", 1, False),
+    ("Zradian", "radian", "Z", 1, True),
+    ("Pradian", "radian", "P", 1, True),
+    ("dradian", "radian", "d", 1, False),
+    ("Gradian", "radian", "G", 1, True),
+    ("fradian", "radian", "f", 1, True),
+    ("hradian", "radian", "h", 1, False),
+    ("daradian", "radian", "da", 1, False),
+    ("mradian", "radian", "m", 1, True),
+    ("nradian", "radian", "n", 1, True),
+    ("pradian", "radian", "p", 1, True),
+    ("uradian", "radian", "u", 1, True),
+    ("Tradian", "radian", "T", 1, True),
+    ("yradian", "radian", "y", 1, True),
+    ("Eradian", "radian", "E", 1, True),
+    ("zradian", "radian", "z", 1, True),
+    ("Mradian", "radian", "M", 1, True),
+    ("kradian", "radian", "k", 1, True),
+    ("Yradian", "radian", "Y", 1, True),
+    ("asteradian", "steradian", "a", 1, True),
+    ("csteradian", "steradian", "c", 1, False),
+    ("Zsteradian", "steradian", "Z", 1, True),
+    ("Psteradian", "steradian", "P", 1, True),
+    ("dsteradian", "steradian", "d", 1, False),
+    ("Gsteradian", "steradian", "G", 1, True),
+    ("fsteradian", "steradian", "f", 1, True),
+    ("hsteradian", "steradian", "h", 1, False),
+    ("dasteradian", "steradian", "da", 1, False),
+    ("msteradian", "steradian", "m", 1, True),
+    ("nsteradian", "steradian", "n", 1, True),
+    ("psteradian", "steradian", "p", 1, True),
+    ("usteradian", "steradian", "u", 1, True),
+    ("Tsteradian", "steradian", "T", 1, True),
+    ("ysteradian", "steradian", "y", 1, True),
+    ("Esteradian", "steradian", "E", 1, True),
+    ("zsteradian", "steradian", "z", 1, True),
+    ("Msteradian", "steradian", "M", 1, True),
+    ("ksteradian", "steradian", "k", 1, True),
+    ("Ysteradian", "steradian", "Y", 1, True),
+    ("ahertz", "hertz", "a", 1, True),
+    ("chertz", "hertz", "c", 1, False),
+    ("Zhertz", "hertz", "Z", 1, True),
+    ("Phertz", "hertz", "P", 1, True),
+    ("dhertz", "hertz", "d", 1, False),
+    ("Ghertz", "hertz", "G", 1, True),
+    ("fhertz", "hertz", "f", 1, True),
+    ("hhertz", "hertz", "h", 1, False),
+    ("dahertz", "hertz", "da", 1, False),
+    ("mhertz", "hertz", "m", 1, True),
+    ("nhertz", "hertz", "n", 1, True),
+    ("phertz", "hertz", "p", 1, True),
+    ("uhertz", "hertz", "u", 1, True),
+    ("Thertz", "hertz", "T", 1, True),
+    ("yhertz", "hertz", "y", 1, True),
+    ("Ehertz", "hertz", "E", 1, True),
+    ("zhertz", "hertz", "z", 1, True),
+    ("Mhertz", "hertz", "M", 1, True),
+    ("khertz", "hertz", "k", 1, True),
+    ("Yhertz", "hertz", "Y", 1, True),
+    ("anewton", "newton", "a", 1, True),
+    ("cnewton", "newton", "c", 1, False),
+    ("Znewton", "newton", "Z", 1, True),
+    ("Pnewton", "newton", "P", 1, True),
+    ("dnewton", "newton", "d", 1, False),
+    ("Gnewton", "newton", "G", 1, True),
+    ("fnewton", "newton", "f", 1, True),
+    ("hnewton", "newton", "h", 1, False),
+    ("danewton", "newton", "da", 1, False),
+    ("mnewton", "newton", "m", 1, True),
+    ("nnewton", "newton", "n", 1, True),
+    ("pnewton", "newton", "p", 1, True),
+    ("unewton", "newton", "u", 1, True),
+    ("Tnewton", "newton", "T", 1, True),
+    ("ynewton", "newton", "y", 1, True),
+    ("Enewton", "newton", "E", 1, True),
+    ("znewton", "newton", "z", 1, True),
+    ("Mnewton", "newton", "M", 1, True),
+    ("knewton", "newton", "k", 1, True),
+    ("Ynewton", "newton", "Y", 1, True),
+    ("apascal", "pascal", "a", 1, True),
+    ("cpascal", "pascal", "c", 1, False),
+    ("Zpascal", "pascal", "Z", 1, True),
+    ("Ppascal", "pascal", "P", 1, True),
+    ("dpascal", "pascal", "d", 1, False),
+    ("Gpascal", "pascal", "G", 1, True),
+    ("fpascal", "pascal", "f", 1, True),
+    ("hpascal", "pascal", "h", 1, False),
+    ("dapascal", "pascal", "da", 1, False),
+    ("mpascal", "pascal", "m", 1, True),
+    ("npascal", "pascal", "n", 1, True),
+    ("ppascal", "pascal", "p", 1, True),
+    ("upascal", "pascal", "u", 1, True),
+    ("Tpascal", "pascal", "T", 1, True),
+    ("ypascal", "pascal", "y", 1, True),
+    ("Epascal", "pascal", "E", 1, True),
+    ("zpascal", "pascal", "z", 1, True),
+    ("Mpascal", "pascal", "M", 1, True),
+    ("kpascal", "pascal", "k", 1, True),
+    ("Ypascal", "pascal", "Y", 1, True),
+    ("ajoule", "joule", "a", 1, True),
+    ("cjoule", "joule", "c", 1, False),
+    ("Zjoule", "joule", "Z", 1, True),
+    ("Pjoule", "joule", "P", 1, True),
+    ("djoule", "joule", "d", 1, False),
+    ("Gjoule", "joule", "G", 1, True),
+    ("fjoule", "joule", "f", 1, True),
+    ("hjoule", "joule", "h", 1, False),
+    ("dajoule", "joule", "da", 1, False),
+    ("mjoule", "joule", "m", 1, True),
+    ("njoule", "joule", "n", 1, True),
+    ("pjoule", "joule", "p", 1, True),
+    ("ujoule", "joule", "u", 1, True),
+    ("Tjoule", "joule", "T", 1, True),
+    ("yjoule", "joule", "y", 1, True),
+    ("Ejoule", "joule", "E", 1, True),
+    ("zjoule", "joule", "z", 1, True),
+    ("Mjoule", "joule", "M", 1, True),
+    ("kjoule", "joule", "k", 1, True),
+    ("Yjoule", "joule", "Y", 1, True),
+    ("awatt", "watt", "a", 1, True),
+    ("cwatt", "watt", "c", 1, False),
+    ("Zwatt", "watt", "Z", 1, True),
+    ("Pwatt", "watt", "P", 1, True),
+    ("dwatt", "watt", "d", 1, False),
+    ("Gwatt", "watt", "G", 1, True),
+    ("fwatt", "watt", "f", 1, True),
+    ("hwatt", "watt", "h", 1, False),
+    ("dawatt", "watt", "da", 1, False),
+    ("mwatt", "watt", "m", 1, True),
+    ("nwatt", "watt", "n", 1, True),
+    ("pwatt", "watt", "p", 1, True),
+    ("uwatt", "watt", "u", 1, True),
+    ("Twatt", "watt", "T", 1, True),
+    ("ywatt", "watt", "y", 1, True),
+    ("Ewatt", "watt", "E", 1, True),
+    ("zwatt", "watt", "z", 1, True),
+    ("Mwatt", "watt", "M", 1, True),
+    ("kwatt", "watt", "k", 1, True),
+    ("Ywatt", "watt", "Y", 1, True),
+    ("acoulomb", "coulomb", "a", 1, True),
+    ("ccoulomb", "coulomb", "c", 1, False),
+    ("Zcoulomb", "coulomb", "Z", 1, True),
+    ("Pcoulomb", "coulomb", "P", 1, True),
+    ("dcoulomb", "coulomb", "d", 1, False),
+    ("Gcoulomb", "coulomb", "G", 1, True),
+    ("fcoulomb", "coulomb", "f", 1, True),
+    ("hcoulomb", "coulomb", "h", 1, False),
+    ("dacoulomb", "coulomb", "da", 1, False),
+    ("mcoulomb", "coulomb", "m", 1, True),
+    ("ncoulomb", "coulomb", "n", 1, True),
+    ("pcoulomb", "coulomb", "p", 1, True),
+    ("ucoulomb", "coulomb", "u", 1, True),
+    ("Tcoulomb", "coulomb", "T", 1, True),
+    ("ycoulomb", "coulomb", "y", 1, True),
+    ("Ecoulomb", "coulomb", "E", 1, True),
+    ("zcoulomb", "coulomb", "z", 1, True),
+    ("Mcoulomb", "coulomb", "M", 1, True),
+    ("kcoulomb", "coulomb", "k", 1, True),
+    ("Ycoulomb", "coulomb", "Y", 1, True),
+    ("avolt", "volt", "a", 1, True),
+    ("cvolt", "volt", "c", 1, False),
+    ("Zvolt", "volt", "Z", 1, True),
+    ("Pvolt", "volt", "P", 1, True),
+    ("dvolt", "volt", "d", 1, False),
+    ("Gvolt", "volt", "G", 1, True),
+    ("fvolt", "volt", "f", 1, True),
+    ("hvolt", "volt", "h", 1, False),
+    ("davolt", "volt", "da", 1, False),
+    ("mvolt", "volt", "m", 1, True),
+    ("nvolt", "volt", "n", 1, True),
+    ("pvolt", "volt", "p", 1, True),
+    ("uvolt", "volt", "u", 1, True),
+    ("Tvolt", "volt", "T", 1, True),
+    ("yvolt", "volt", "y", 1, True),
+    ("Evolt", "volt", "E", 1, True),
+    ("zvolt", "volt", "z", 1, True),
+    ("Mvolt", "volt", "M", 1, True),
+    ("kvolt", "volt", "k", 1, True),
+    ("Yvolt", "volt", "Y", 1, True),
+    ("afarad", "farad", "a", 1, True),
+    ("cfarad", "farad", "c", 1, False),
+    ("Zfarad", "farad", "Z", 1, True),
+    ("Pfarad", "farad", "P", 1, True),
+    ("dfarad", "farad", "d", 1, False),
+    ("Gfarad", "farad", "G", 1, True),
+    ("ffarad", "farad", "f", 1, True),
+    ("hfarad", "farad", "h", 1, False),
+    ("dafarad", "farad", "da", 1, False),
+    ("mfarad", "farad", "m", 1, True),
+    ("nfarad", "farad", "n", 1, True),
+    ("pfarad", "farad", "p", 1, True),
+    ("ufarad", "farad", "u", 1, True),
+    ("Tfarad", "farad", "T", 1, True),
+    ("yfarad", "farad", "y", 1, True),
+    ("Efarad", "farad", "E", 1, True),
+    ("zfarad", "farad", "z", 1, True),
+    ("Mfarad", "farad", "M", 1, True),
+    ("kfarad", "farad", "k", 1, True),
+    ("Yfarad", "farad", "Y", 1, True),
+    ("aohm", "ohm", "a", 1, True),
+    ("cohm", "ohm", "c", 1, False),
+    ("Zohm", "ohm", "Z", 1, True),
+    ("Pohm", "ohm", "P", 1, True),
+    ("dohm", "ohm", "d", 1, False),
+    ("Gohm", "ohm", "G", 1, True),
+    ("fohm", "ohm", "f", 1, True),
+    ("hohm", "ohm", "h", 1, False),
+    ("daohm", "ohm", "da", 1, False),
+    ("mohm", "ohm", "m", 1, True),
+    ("nohm", "ohm", "n", 1, True),
+    ("pohm", "ohm", "p", 1, True),
+    ("uohm", "ohm", "u", 1, True),
+    ("Tohm", "ohm", "T", 1, True),
+    ("yohm", "ohm", "y", 1, True),
+    ("Eohm", "ohm", "E", 1, True),
+    ("zohm", "ohm", "z", 1, True),
+    ("Mohm", "ohm", "M", 1, True),
+    ("kohm", "ohm", "k", 1, True),
+    ("Yohm", "ohm", "Y", 1, True),
+    ("asiemens", "siemens", "a", 1, True),
+    ("csiemens", "siemens", "c", 1, False),
+    ("Zsiemens", "siemens", "Z", 1, True),
+    ("Psiemens", "siemens", "P", 1, True),
+    ("dsiemens", "siemens", "d", 1, False),
+    ("Gsiemens", "siemens", "G", 1, True),
+    ("fsiemens", "siemens", "f", 1, True),
+    ("hsiemens", "siemens", "h", 1, False),
+    ("dasiemens", "siemens", "da", 1, False),
+    ("msiemens", "siemens", "m", 1, True),
+    ("nsiemens", "siemens", "n", 1, True),
+    ("psiemens", "siemens", "p", 1, True),
+    ("usiemens", "siemens", "u", 1, True),
+    ("Tsiemens", "siemens", "T", 1, True),
+    ("ysiemens", "siemens", "y", 1, True),
+    ("Esiemens", "siemens", "E", 1, True),
+    ("zsiemens", "siemens", "z", 1, True),
+    ("Msiemens", "siemens", "M", 1, True),
+    ("ksiemens", "siemens", "k", 1, True),
+    ("Ysiemens", "siemens", "Y", 1, True),
+    ("aweber", "weber", "a", 1, True),
+    ("cweber", "weber", "c", 1, False),
+    ("Zweber", "weber", "Z", 1, True),
+    ("Pweber", "weber", "P", 1, True),
+    ("dweber", "weber", "d", 1, False),
+    ("Gweber", "weber", "G", 1, True),
+    ("fweber", "weber", "f", 1, True),
+    ("hweber", "weber", "h", 1, False),
+    ("daweber", "weber", "da", 1, False),
+    ("mweber", "weber", "m", 1, True),
+    ("nweber", "weber", "n", 1, True),
+    ("pweber", "weber", "p", 1, True),
+    ("uweber", "weber", "u", 1, True),
+    ("Tweber", "weber", "T", 1, True),
+    ("yweber", "weber", "y", 1, True),
+    ("Eweber", "weber", "E", 1, True),
+    ("zweber", "weber", "z", 1, True),
+    ("Mweber", "weber", "M", 1, True),
+    ("kweber", "weber", "k", 1, True),
+    ("Yweber", "weber", "Y", 1, True),
+    ("atesla", "tesla", "a", 1, True),
+    ("ctesla", "tesla", "c", 1, False),
+    ("Ztesla", "tesla", "Z", 1, True),
+    ("Ptesla", "tesla", "P", 1, True),
+    ("dtesla", "tesla", "d", 1, False),
+    ("Gtesla", "tesla", "G", 1, True),
+    ("ftesla", "tesla", "f", 1, True),
+    ("htesla", "tesla", "h", 1, False),
+    ("datesla", "tesla", "da", 1, False),
+    ("mtesla", "tesla", "m", 1, True),
+    ("ntesla", "tesla", "n", 1, True),
+    ("ptesla", "tesla", "p", 1, True),
+    ("utesla", "tesla", "u", 1, True),
+    ("Ttesla", "tesla", "T", 1, True),
+    ("ytesla", "tesla", "y", 1, True),
+    ("Etesla", "tesla", "E", 1, True),
+    ("ztesla", "tesla", "z", 1, True),
+    ("Mtesla", "tesla", "M", 1, True),
+    ("ktesla", "tesla", "k", 1, True),
+    ("Ytesla", "tesla", "Y", 1, True),
+    ("ahenry", "henry", "a", 1, True),
+    ("chenry", "henry", "c", 1, False),
+    ("Zhenry", "henry", "Z", 1, True),
+    ("Phenry", "henry", "P", 1, True),
+    ("dhenry", "henry", "d", 1, False),
+    ("Ghenry", "henry", "G", 1, True),
+    ("fhenry", "henry", "f", 1, True),
+    ("hhenry", "henry", "h", 1, False),
+    ("dahenry", "henry", "da", 1, False),
+    ("mhenry", "henry", "m", 1, True),
+    ("nhenry", "henry", "n", 1, True),
+    ("phenry", "henry", "p", 1, True),
+    ("uhenry", "henry", "u", 1, True),
+    ("Thenry", "henry", "T", 1, True),
+    ("yhenry", "henry", "y", 1, True),
+    ("Ehenry", "henry", "E", 1, True),
+    ("zhenry", "henry", "z", 1, True),
+    ("Mhenry", "henry", "M", 1, True),
+    ("khenry", "henry", "k", 1, True),
+    ("Yhenry", "henry", "Y", 1, True),
+    ("acelsius", "celsius", "a", 1, True),
+    ("ccelsius", "celsius", "c", 1, False),
+    ("Zcelsius", "celsius", "Z", 1, True),
+    ("Pcelsius", "celsius", "P", 1, True),
+    ("dcelsius", "celsius", "d", 1, False),
+    ("Gcelsius", "celsius", "G", 1, True),
+    ("fcelsius", "celsius", "f", 1, True),
+    ("hcelsius", "celsius", "h", 1, False),
+    ("dacelsius", "celsius", "da", 1, False),
+    ("mcelsius", "celsius", "m", 1, True),
+    ("ncelsius", "celsius", "n", 1, True),
+    ("pcelsius", "celsius", "p", 1, True),
+    ("ucelsius", "celsius", "u", 1, True),
+    ("Tcelsius", "celsius", "T", 1, True),
+    ("ycelsius", "celsius", "y", 1, True),
+    ("Ecelsius", "celsius", "E", 1, True),
+    ("zcelsius", "celsius", "z", 1, True),
+    ("Mcelsius", "celsius", "M", 1, True),
+    ("kcelsius", "celsius", "k", 1, True),
+    ("Ycelsius", "celsius", "Y", 1, True),
+    ("alumen", "lumen", "a", 1, True),
+    ("clumen", "lumen", "c", 1, False),
+    ("Zlumen", "lumen", "Z", 1, True),
+    ("Plumen", "lumen", "P", 1, True),
+    ("dlumen", "lumen", "d", 1, False),
+    ("Glumen", "lumen", "G", 1, True),
+    ("flumen", "lumen", "f", 1, True),
+    ("hlumen", "lumen", "h", 1, False),
+    ("dalumen", "lumen", "da", 1, False),
+    ("mlumen", "lumen", "m", 1, True),
+    ("nlumen", "lumen", "n", 1, True),
+    ("plumen", "lumen", "p", 1, True),
+    ("ulumen", "lumen", "u", 1, True),
+    ("Tlumen", "lumen", "T", 1, True),
+    ("ylumen", "lumen", "y", 1, True),
+    ("Elumen", "lumen", "E", 1, True),
+    ("zlumen", "lumen", "z", 1, True),
+    ("Mlumen", "lumen", "M", 1, True),
+    ("klumen", "lumen", "k", 1, True),
+    ("Ylumen", "lumen", "Y", 1, True),
+    ("alux", "lux", "a", 1, True),
+    ("clux", "lux", "c", 1, False),
+    ("Zlux", "lux", "Z", 1, True),
+    ("Plux", "lux", "P", 1, True),
+    ("dlux", "lux", "d", 1, False),
+    ("Glux", "lux", "G", 1, True),
+    ("flux", "lux", "f", 1, True),
+    ("hlux", "lux", "h", 1, False),
+    ("dalux", "lux", "da", 1, False),
+    ("mlux", "lux", "m", 1, True),
+    ("nlux", "lux", "n", 1, True),
+    ("plux", "lux", "p", 1, True),
+    ("ulux", "lux", "u", 1, True),
+    ("Tlux", "lux", "T", 1, True),
+    ("ylux", "lux", "y", 1, True),
+    ("Elux", "lux", "E", 1, True),
+    ("zlux", "lux", "z", 1, True),
+    ("Mlux", "lux", "M", 1, True),
+    ("klux", "lux", "k", 1, True),
+    ("Ylux", "lux", "Y", 1, True),
+    ("abecquerel", "becquerel", "a", 1, True),
+    ("cbecquerel", "becquerel", "c", 1, False),
+    ("Zbecquerel", "becquerel", "Z", 1, True),
+    ("Pbecquerel", "becquerel", "P", 1, True),
+    ("dbecquerel", "becquerel", "d", 1, False),
+    ("Gbecquerel", "becquerel", "G", 1, True),
+    ("fbecquerel", "becquerel", "f", 1, True),
+    ("hbecquerel", "becquerel", "h", 1, False),
+    ("dabecquerel", "becquerel", "da", 1, False),
+    ("mbecquerel", "becquerel", "m", 1, True),
+    ("nbecquerel", "becquerel", "n", 1, True),
+    ("pbecquerel", "becquerel", "p", 1, True),
+    ("ubecquerel", "becquerel", "u", 1, True),
+    ("Tbecquerel", "becquerel", "T", 1, True),
+    ("ybecquerel", "becquerel", "y", 1, True),
+    ("Ebecquerel", "becquerel", "E", 1, True),
+    ("zbecquerel", "becquerel", "z", 1, True),
+    ("Mbecquerel", "becquerel", "M", 1, True),
+    ("kbecquerel", "becquerel", "k", 1, True),
+    ("Ybecquerel", "becquerel", "Y", 1, True),
+    ("agray", "gray", "a", 1, True),
+    ("cgray", "gray", "c", 1, False),
+    ("Zgray", "gray", "Z", 1, True),
+    ("Pgray", "gray", "P", 1, True),
+    ("dgray", "gray", "d", 1, False),
+    ("Ggray", "gray", "G", 1, True),
+    ("fgray", "gray", "f", 1, True),
+    ("hgray", "gray", "h", 1, False),
+    ("dagray", "gray", "da", 1, False),
+    ("mgray", "gray", "m", 1, True),
+    ("ngray", "gray", "n", 1, True),
+    ("pgray", "gray", "p", 1, True),
+    ("ugray", "gray", "u", 1, True),
+    ("Tgray", "gray", "T", 1, True),
+    ("ygray", "gray", "y", 1, True),
+    ("Egray", "gray", "E", 1, True),
+    ("zgray", "gray", "z", 1, True),
+    ("Mgray", "gray", "M", 1, True),
+    ("kgray", "gray", "k", 1, True),
+    ("Ygray", "gray", "Y", 1, True),
+    ("asievert", "sievert", "a", 1, True),
+    ("csievert", "sievert", "c", 1, False),
+    ("Zsievert", "sievert", "Z", 1, True),
+    ("Psievert", "sievert", "P", 1, True),
+    ("dsievert", "sievert", "d", 1, False),
+    ("Gsievert", "sievert", "G", 1, True),
+    ("fsievert", "sievert", "f", 1, True),
+    ("hsievert", "sievert", "h", 1, False),
+    ("dasievert", "sievert", "da", 1, False),
+    ("msievert", "sievert", "m", 1, True),
+    ("nsievert", "sievert", "n", 1, True),
+    ("psievert", "sievert", "p", 1, True),
+    ("usievert", "sievert", "u", 1, True),
+    ("Tsievert", "sievert", "T", 1, True),
+    ("ysievert", "sievert", "y", 1, True),
+    ("Esievert", "sievert", "E", 1, True),
+    ("zsievert", "sievert", "z", 1, True),
+    ("Msievert", "sievert", "M", 1, True),
+    ("ksievert", "sievert", "k", 1, True),
+    ("Ysievert", "sievert", "Y", 1, True),
+    ("akatal", "katal", "a", 1, True),
+    ("ckatal", "katal", "c", 1, False),
+    ("Zkatal", "katal", "Z", 1, True),
+    ("Pkatal", "katal", "P", 1, True),
+    ("dkatal", "katal", "d", 1, False),
+    ("Gkatal", "katal", "G", 1, True),
+    ("fkatal", "katal", "f", 1, True),
+    ("hkatal", "katal", "h", 1, False),
+    ("dakatal", "katal", "da", 1, False),
+    ("mkatal", "katal", "m", 1, True),
+    ("nkatal", "katal", "n", 1, True),
+    ("pkatal", "katal", "p", 1, True),
+    ("ukatal", "katal", "u", 1, True),
+    ("Tkatal", "katal", "T", 1, True),
+    ("ykatal", "katal", "y", 1, True),
+    ("Ekatal", "katal", "E", 1, True),
+    ("zkatal", "katal", "z", 1, True),
+    ("Mkatal", "katal", "M", 1, True),
+    ("kkatal", "katal", "k", 1, True),
+    ("Ykatal", "katal", "Y", 1, True),
+    ("metre2", "metre", "", 2, True),
+    ("metre3", "metre", "", 3, True),
+    ("meter2", "meter", "", 2, True),
+    ("meter3", "meter", "", 3, True),
+    ("gram2", "gram", "", 2, True),
+    ("gram3", "gram", "", 3, True),
+    ("second2", "second", "", 2, True),
+    ("second3", "second", "", 3, True),
+    ("amp2", "amp", "", 2, True),
+    ("amp3", "amp", "", 3, True),
+    ("kelvin2", "kelvin", "", 2, True),
+    ("kelvin3", "kelvin", "", 3, True),
+    ("mole2", "mole", "", 2, True),
+    ("mole3", "mole", "", 3, True),
+    ("candle2", "candle", "", 2, True),
+    ("candle3", "candle", "", 3, True),
+    ("gramme2", "gramme", "", 2, True),
+    ("gramme3", "gramme", "", 3, True),
+    ("kilogram2", "kilogram", "", 2, True),
+    ("kilogram3", "kilogram", "", 3, True),
+    ("radian2", "radian", "", 2, True),
+    ("radian3", "radian", "", 3, True),
+    ("steradian2", "steradian", "", 2, True),
+    ("steradian3", "steradian", "", 3, True),
+    ("hertz2", "hertz", "", 2, True),
+    ("hertz3", "hertz", "", 3, True),
+    ("newton2", "newton", "", 2, True),
+    ("newton3", "newton", "", 3, True),
+    ("pascal2", "pascal", "", 2, True),
+    ("pascal3", "pascal", "", 3, True),
+    ("joule2", "joule", "", 2, True),
+    ("joule3", "joule", "", 3, True),
+    ("watt2", "watt", "", 2, True),
+    ("watt3", "watt", "", 3, True),
+    ("coulomb2", "coulomb", "", 2, True),
+    ("coulomb3", "coulomb", "", 3, True),
+    ("volt2", "volt", "", 2, True),
+    ("volt3", "volt", "", 3, True),
+    ("farad2", "farad", "", 2, True),
+    ("farad3", "farad", "", 3, True),
+    ("ohm2", "ohm", "", 2, True),
+    ("ohm3", "ohm", "", 3, True),
+    ("siemens2", "siemens", "", 2, True),
+    ("siemens3", "siemens", "", 3, True),
+    ("weber2", "weber", "", 2, True),
+    ("weber3", "weber", "", 3, True),
+    ("tesla2", "tesla", "", 2, True),
+    ("tesla3", "tesla", "", 3, True),
+    ("henry2", "henry", "", 2, True),
+    ("henry3", "henry", "", 3, True),
+    ("celsius2", "celsius", "", 2, True),
+    ("celsius3", "celsius", "", 3, True),
+    ("lumen2", "lumen", "", 2, True),
+    ("lumen3", "lumen", "", 3, True),
+    ("lux2", "lux", "", 2, True),
+    ("lux3", "lux", "", 3, True),
+    ("becquerel2", "becquerel", "", 2, True),
+    ("becquerel3", "becquerel", "", 3, True),
+    ("gray2", "gray", "", 2, True),
+    ("gray3", "gray", "", 3, True),
+    ("sievert2", "sievert", "", 2, True),
+    ("sievert3", "sievert", "", 3, True),
+    ("katal2", "katal", "", 2, True),
+    ("katal3", "katal", "", 3, True),
+    ("ametre2", "ametre", "", 2, True),
+    ("ametre3", "ametre", "", 3, True),
+    ("cmetre2", "cmetre", "", 2, False),
+    ("cmetre3", "cmetre", "", 3, False),
+    ("Zmetre2", "Zmetre", "", 2, True),
+    ("Zmetre3", "Zmetre", "", 3, True),
+    ("Pmetre2", "Pmetre", "", 2, True),
+    ("Pmetre3", "Pmetre", "", 3, True),
+    ("dmetre2", "dmetre", "", 2, False),
+    ("dmetre3", "dmetre", "", 3, False),
+    ("Gmetre2", "Gmetre", "", 2, True),
+    ("Gmetre3", "Gmetre", "", 3, True),
+    ("fmetre2", "fmetre", "", 2, True),
+    ("fmetre3", "fmetre", "", 3, True),
+    ("hmetre2", "hmetre", "", 2, False),
+    ("hmetre3", "hmetre", "", 3, False),
+    ("dametre2", "dametre", "", 2, False),
+    ("dametre3", "dametre", "", 3, False),
+    ("mmetre2", "mmetre", "", 2, True),
+    ("mmetre3", "mmetre", "", 3, True),
+    ("nmetre2", "nmetre", "", 2, True),
+    ("nmetre3", "nmetre", "", 3, True),
+    ("pmetre2", "pmetre", "", 2, True),
+    ("pmetre3", "pmetre", "", 3, True),
+    ("umetre2", "umetre", "", 2, True),
+    ("umetre3", "umetre", "", 3, True),
+    ("Tmetre2", "Tmetre", "", 2, True),
+    ("Tmetre3", "Tmetre", "", 3, True),
+    ("ymetre2", "ymetre", "", 2, True),
+    ("ymetre3", "ymetre", "", 3, True),
+    ("Emetre2", "Emetre", "", 2, True),
+    ("Emetre3", "Emetre", "", 3, True),
+    ("zmetre2", "zmetre", "", 2, True),
+    ("zmetre3", "zmetre", "", 3, True),
+    ("Mmetre2", "Mmetre", "", 2, True),
+    ("Mmetre3", "Mmetre", "", 3, True),
+    ("kmetre2", "kmetre", "", 2, True),
+    ("kmetre3", "kmetre", "", 3, True),
+    ("Ymetre2", "Ymetre", "", 2, True),
+    ("Ymetre3", "Ymetre", "", 3, True),
+    ("ameter2", "ameter", "", 2, True),
+    ("ameter3", "ameter", "", 3, True),
+    ("cmeter2", "cmeter", "", 2, False),
+    ("cmeter3", "cmeter", "", 3, False),
+    ("Zmeter2", "Zmeter", "", 2, True),
+    ("Zmeter3", "Zmeter", "", 3, True),
+    ("Pmeter2", "Pmeter", "", 2, True),
+    ("Pmeter3", "Pmeter", "", 3, True),
+    ("dmeter2", "dmeter", "", 2, False),
+    ("dmeter3", "dmeter", "", 3, False),
+    ("Gmeter2", "Gmeter", "", 2, True),
+    ("Gmeter3", "Gmeter", "", 3, True),
+    ("fmeter2", "fmeter", "", 2, True),
+    ("fmeter3", "fmeter", "", 3, True),
+    ("hmeter2", "hmeter", "", 2, False),
+    ("hmeter3", "hmeter", "", 3, False),
+    ("dameter2", "dameter", "", 2, False),
+    ("dameter3", "dameter", "", 3, False),
+    ("mmeter2", "mmeter", "", 2, True),
+    ("mmeter3", "mmeter", "", 3, True),
+    ("nmeter2", "nmeter", "", 2, True),
+    ("nmeter3", "nmeter", "", 3, True),
+    ("pmeter2", "pmeter", "", 2, True),
+    ("pmeter3", "pmeter", "", 3, True),
+    ("umeter2", "umeter", "", 2, True),
+    ("umeter3", "umeter", "", 3, True),
+    ("Tmeter2", "Tmeter", "", 2, True),
+    ("Tmeter3", "Tmeter", "", 3, True),
+    ("ymeter2", "ymeter", "", 2, True),
+    ("ymeter3", "ymeter", "", 3, True),
+    ("Emeter2", "Emeter", "", 2, True),
+    ("Emeter3", "Emeter", "", 3, True),
+    ("zmeter2", "zmeter", "", 2, True),
+    ("zmeter3", "zmeter", "", 3, True),
+    ("Mmeter2", "Mmeter", "", 2, True),
+    ("Mmeter3", "Mmeter", "", 3, True),
+    ("kmeter2", "kmeter", "", 2, True),
+    ("kmeter3", "kmeter", "", 3, True),
+    ("Ymeter2", "Ymeter", "", 2, True),
+    ("Ymeter3", "Ymeter", "", 3, True),
+    ("agram2", "agram", "", 2, True),
+    ("agram3", "agram", "", 3, True),
+    ("cgram2", "cgram", "", 2, False),
+    ("cgram3", "cgram", "", 3, False),
+    ("Zgram2", "Zgram", "", 2, True),
+    ("Zgram3", "Zgram", "", 3, True),
+    ("Pgram2", "Pgram", "", 2, True),
+    ("Pgram3", "Pgram", "", 3, True),
+    ("dgram2", "dgram", "", 2, False),
+    ("dgram3", "dgram", "", 3, False),
+    ("Ggram2", "Ggram", "", 2, True),
+    ("Ggram3", "Ggram", "", 3, True),
+    ("fgram2", "fgram", "", 2, True),
+    ("fgram3", "fgram", "", 3, True),
+    ("hgram2", "hgram", "", 2, False),
+    ("hgram3", "hgram", "", 3, False),
+    ("dagram2", "dagram", "", 2, False),
+    ("dagram3", "dagram", "", 3, False),
+    ("mgram2", "mgram", "", 2, True),
+    ("mgram3", "mgram", "", 3, True),
+    ("ngram2", "ngram", "", 2, True),
+    ("ngram3", "ngram", "", 3, True),
+    ("pgram2", "pgram", "", 2, True),
+    ("pgram3", "pgram", "", 3, True),
+    ("ugram2", "ugram", "", 2, True),
+    ("ugram3", "ugram", "", 3, True),
+    ("Tgram2", "Tgram", "", 2, True),
+    ("Tgram3", "Tgram", "", 3, True),
+    ("ygram2", "ygram", "", 2, True),
+    ("ygram3", "ygram", "", 3, True),
+    ("Egram2", "Egram", "", 2, True),
+    ("Egram3", "Egram", "", 3, True),
+    ("zgram2", "zgram", "", 2, True),
+    ("zgram3", "zgram", "", 3, True),
+    ("Mgram2", "Mgram", "", 2, True),
+    ("Mgram3", "Mgram", "", 3, True),
+    ("kgram2", "kgram", "", 2, True),
+    ("kgram3", "kgram", "", 3, True),
+    ("Ygram2", "Ygram", "", 2, True),
+    ("Ygram3", "Ygram", "", 3, True),
+    ("asecond2", "asecond", "", 2, True),
+    ("asecond3", "asecond", "", 3, True),
+    ("csecond2", "csecond", "", 2, False),
+    ("csecond3", "csecond", "", 3, False),
+    ("Zsecond2", "Zsecond", "", 2, True),
+    ("Zsecond3", "Zsecond", "", 3, True),
+    ("Psecond2", "Psecond", "", 2, True),
+    ("Psecond3", "Psecond", "", 3, True),
+    ("dsecond2", "dsecond", "", 2, False),
+    ("dsecond3", "dsecond", "", 3, False),
+    ("Gsecond2", "Gsecond", "", 2, True),
+    ("Gsecond3", "Gsecond", "", 3, True),
+    ("fsecond2", "fsecond", "", 2, True),
+    ("fsecond3", "fsecond", "", 3, True),
+    ("hsecond2", "hsecond", "", 2, False),
+    ("hsecond3", "hsecond", "", 3, False),
+    ("dasecond2", "dasecond", "", 2, False),
+    ("dasecond3", "dasecond", "", 3, False),
+    ("msecond2", "msecond", "", 2, True),
+    ("msecond3", "msecond", "", 3, True),
+    ("nsecond2", "nsecond", "", 2, True),
+    ("nsecond3", "nsecond", "", 3, True),
+    ("psecond2", "psecond", "", 2, True),
+    ("psecond3", "psecond", "", 3, True),
+    ("usecond2", "usecond", "", 2, True),
+    ("usecond3", "usecond", "", 3, True),
+    ("Tsecond2", "Tsecond", "", 2, True),
+    ("Tsecond3", "Tsecond", "", 3, True),
+    ("ysecond2", "ysecond", "", 2, True),
+    ("ysecond3", "ysecond", "", 3, True),
+    ("Esecond2", "Esecond", "", 2, True),
+    ("Esecond3", "Esecond", "", 3, True),
+    ("zsecond2", "zsecond", "", 2, True),
+    ("zsecond3", "zsecond", "", 3, True),
+    ("Msecond2", "Msecond", "", 2, True),
+    ("Msecond3", "Msecond", "", 3, True),
+    ("ksecond2", "ksecond", "", 2, True),
+    ("ksecond3", "ksecond", "", 3, True),
+    ("Ysecond2", "Ysecond", "", 2, True),
+    ("Ysecond3", "Ysecond", "", 3, True),
+    ("aamp2", "aamp", "", 2, True),
+    ("aamp3", "aamp", "", 3, True),
+    ("camp2", "camp", "", 2, False),
+    ("camp3", "camp", "", 3, False),
+    ("Zamp2", "Zamp", "", 2, True),
+    ("Zamp3", "Zamp", "", 3, True),
+    ("Pamp2", "Pamp", "", 2, True),
+    ("Pamp3", "Pamp", "", 3, True),
+    ("damp2", "damp", "", 2, False),
+    ("damp3", "damp", "", 3, False),
+    ("Gamp2", "Gamp", "", 2, True),
+    ("Gamp3", "Gamp", "", 3, True),
+    ("famp2", "famp", "", 2, True),
+    ("famp3", "famp", "", 3, True),
+    ("hamp2", "hamp", "", 2, False),
+    ("hamp3", "hamp", "", 3, False),
+    ("daamp2", "daamp", "", 2, False),
+    ("daamp3", "daamp", "", 3, False),
+    ("mamp2", "mamp", "", 2, True),
+    ("mamp3", "mamp", "", 3, True),
+    ("namp2", "namp", "", 2, True),
+    ("namp3", "namp", "", 3, True),
+    ("pamp2", "pamp", "", 2, True),
+    ("pamp3", "pamp", "", 3, True),
+    ("uamp2", "uamp", "", 2, True),
+    ("uamp3", "uamp", "", 3, True),
+    ("Tamp2", "Tamp", "", 2, True),
+    ("Tamp3", "Tamp", "", 3, True),
+    ("yamp2", "yamp", "", 2, True),
+    ("yamp3", "yamp", "", 3, True),
+    ("Eamp2", "Eamp", "", 2, True),
+    ("Eamp3", "Eamp", "", 3, True),
+    ("zamp2", "zamp", "", 2, True),
+    ("zamp3", "zamp", "", 3, True),
+    ("Mamp2", "Mamp", "", 2, True),
+    ("Mamp3", "Mamp", "", 3, True),
+    ("kamp2", "kamp", "", 2, True),
+    ("kamp3", "kamp", "", 3, True),
+    ("Yamp2", "Yamp", "", 2, True),
+    ("Yamp3", "Yamp", "", 3, True),
+    ("akelvin2", "akelvin", "", 2, True),
+    ("akelvin3", "akelvin", "", 3, True),
+    ("ckelvin2", "ckelvin", "", 2, False),
+    ("ckelvin3", "ckelvin", "", 3, False),
+    ("Zkelvin2", "Zkelvin", "", 2, True),
+    ("Zkelvin3", "Zkelvin", "", 3, True),
+    ("Pkelvin2", "Pkelvin", "", 2, True),
+    ("Pkelvin3", "Pkelvin", "", 3, True),
+    ("dkelvin2", "dkelvin", "", 2, False),
+    ("dkelvin3", "dkelvin", "", 3, False),
+    ("Gkelvin2", "Gkelvin", "", 2, True),
+    ("Gkelvin3", "Gkelvin", "", 3, True),
+    ("fkelvin2", "fkelvin", "", 2, True),
+    ("fkelvin3", "fkelvin", "", 3, True),
+    ("hkelvin2", "hkelvin", "", 2, False),
+    ("hkelvin3", "hkelvin", "", 3, False),
+    ("dakelvin2", "dakelvin", "", 2, False),
+    ("dakelvin3", "dakelvin", "", 3, False),
+    ("mkelvin2", "mkelvin", "", 2, True),
+    ("mkelvin3", "mkelvin", "", 3, True),
+    ("nkelvin2", "nkelvin", "", 2, True),
+    ("nkelvin3", "nkelvin", "", 3, True),
+    ("pkelvin2", "pkelvin", "", 2, True),
+    ("pkelvin3", "pkelvin", "", 3, True),
+    ("ukelvin2", "ukelvin", "", 2, True),
+    ("ukelvin3", "ukelvin", "", 3, True),
+    ("Tkelvin2", "Tkelvin", "", 2, True),
+    ("Tkelvin3", "Tkelvin", "", 3, True),
+    ("ykelvin2", "ykelvin", "", 2, True),
+    ("ykelvin3", "ykelvin", "", 3, True),
+    ("Ekelvin2", "Ekelvin", "", 2, True),
+    ("Ekelvin3", "Ekelvin", "", 3, True),
+    ("zkelvin2", "zkelvin", "", 2, True),
+    ("zkelvin3", "zkelvin", "", 3, True),
+    ("Mkelvin2", "Mkelvin", "", 2, True),
+    ("Mkelvin3", "Mkelvin", "", 3, True),
+    ("kkelvin2", "kkelvin", "", 2, True),
+    ("kkelvin3", "kkelvin", "", 3, True),
+    ("Ykelvin2", "Ykelvin", "", 2, True),
+    ("Ykelvin3", "Ykelvin", "", 3, True),
+    ("amole2", "amole", "", 2, True),
+    ("amole3", "amole", "", 3, True),
+    ("cmole2", "cmole", "", 2, False),
+    ("cmole3", "cmole", "", 3, False),
+    ("Zmole2", "Zmole", "", 2, True),
+    ("Zmole3", "Zmole", "", 3, True),
+    ("Pmole2", "Pmole", "", 2, True),
+    ("Pmole3", "Pmole", "", 3, True),
+    ("dmole2", "dmole", "", 2, False),
+    ("dmole3", "dmole", "", 3, False),
+    ("Gmole2", "Gmole", "", 2, True),
+    ("Gmole3", "Gmole", "", 3, True),
+    ("fmole2", "fmole", "", 2, True),
+    ("fmole3", "fmole", "", 3, True),
+    ("hmole2", "hmole", "", 2, False),
+    ("hmole3", "hmole", "", 3, False),
+    ("damole2", "damole", "", 2, False),
+    ("damole3", "damole", "", 3, False),
+    ("mmole2", "mmole", "", 2, True),
+    ("mmole3", "mmole", "", 3, True),
+    ("nmole2", "nmole", "", 2, True),
+    ("nmole3", "nmole", "", 3, True),
+    ("pmole2", "pmole", "", 2, True),
+    ("pmole3", "pmole", "", 3, True),
+    ("umole2", "umole", "", 2, True),
+    ("umole3", "umole", "", 3, True),
+    ("Tmole2", "Tmole", "", 2, True),
+    ("Tmole3", "Tmole", "", 3, True),
+    ("ymole2", "ymole", "", 2, True),
+    ("ymole3", "ymole", "", 3, True),
+    ("Emole2", "Emole", "", 2, True),
+    ("Emole3", "Emole", "", 3, True),
+    ("zmole2", "zmole", "", 2, True),
+    ("zmole3", "zmole", "", 3, True),
+    ("Mmole2", "Mmole", "", 2, True),
+    ("Mmole3", "Mmole", "", 3, True),
+    ("kmole2", "kmole", "", 2, True),
+    ("kmole3", "kmole", "", 3, True),
+    ("Ymole2", "Ymole", "", 2, True),
+    ("Ymole3", "Ymole", "", 3, True),
+    ("acandle2", "acandle", "", 2, True),
+    ("acandle3", "acandle", "", 3, True),
+    ("ccandle2", "ccandle", "", 2, False),
+    ("ccandle3", "ccandle", "", 3, False),
+    ("Zcandle2", "Zcandle", "", 2, True),
+    ("Zcandle3", "Zcandle", "", 3, True),
+    ("Pcandle2", "Pcandle", "", 2, True),
+    ("Pcandle3", "Pcandle", "", 3, True),
+    ("dcandle2", "dcandle", "", 2, False),
+    ("dcandle3", "dcandle", "", 3, False),
+    ("Gcandle2", "Gcandle", "", 2, True),
+    ("Gcandle3", "Gcandle", "", 3, True),
+    ("fcandle2", "fcandle", "", 2, True),
+    ("fcandle3", "fcandle", "", 3, True),
+    ("hcandle2", "hcandle", "", 2, False),
+    ("hcandle3", "hcandle", "", 3, False),
+    ("dacandle2", "dacandle", "", 2, False),
+    ("dacandle3", "dacandle", "", 3, False),
+    ("mcandle2", "mcandle", "", 2, True),
+    ("mcandle3", "mcandle", "", 3, True),
+    ("ncandle2", "ncandle", "", 2, True),
+    ("ncandle3", "ncandle", "", 3, True),
+    ("pcandle2", "pcandle", "", 2, True),
+    ("pcandle3", "pcandle", "", 3, True),
+    ("ucandle2", "ucandle", "", 2, True),
+    ("ucandle3", "ucandle", "", 3, True),
+    ("Tcandle2", "Tcandle", "", 2, True),
+    ("Tcandle3", "Tcandle", "", 3, True),
+    ("ycandle2", "ycandle", "", 2, True),
+    ("ycandle3", "ycandle", "", 3, True),
+    ("Ecandle2", "Ecandle", "", 2, True),
+    ("Ecandle3", "Ecandle", "", 3, True),
+    ("zcandle2", "zcandle", "", 2, True),
+    ("zcandle3", "zcandle", "", 3, True),
+    ("Mcandle2", "Mcandle", "", 2, True),
+    ("Mcandle3", "Mcandle", "", 3, True),
+    ("kcandle2", "kcandle", "", 2, True),
+    ("kcandle3", "kcandle", "", 3, True),
+    ("Ycandle2", "Ycandle", "", 2, True),
+    ("Ycandle3", "Ycandle", "", 3, True),
+    ("agramme2", "agramme", "", 2, True),
+    ("agramme3", "agramme", "", 3, True),
+    ("cgramme2", "cgramme", "", 2, False),
+    ("cgramme3", "cgramme", "", 3, False),
+    ("Zgramme2", "Zgramme", "", 2, True),
+    ("Zgramme3", "Zgramme", "", 3, True),
+    ("Pgramme2", "Pgramme", "", 2, True),
+    ("Pgramme3", "Pgramme", "", 3, True),
+    ("dgramme2", "dgramme", "", 2, False),
+    ("dgramme3", "dgramme", "", 3, False),
+    ("Ggramme2", "Ggramme", "", 2, True),
+    ("Ggramme3", "Ggramme", "", 3, True),
+    ("fgramme2", "fgramme", "", 2, True),
+    ("fgramme3", "fgramme", "", 3, True),
+    ("hgramme2", "hgramme", "", 2, False),
+    ("hgramme3", "hgramme", "", 3, False),
+    ("dagramme2", "dagramme", "", 2, False),
+    ("dagramme3", "dagramme", "", 3, False),
+    ("mgramme2", "mgramme", "", 2, True),
+    ("mgramme3", "mgramme", "", 3, True),
+    ("ngramme2", "ngramme", "", 2, True),
+    ("ngramme3", "ngramme", "", 3, True),
+    ("pgramme2", "pgramme", "", 2, True),
+    ("pgramme3", "pgramme", "", 3, True),
+    ("ugramme2", "ugramme", "", 2, True),
+    ("ugramme3", "ugramme", "", 3, True),
+    ("Tgramme2", "Tgramme", "", 2, True),
+    ("Tgramme3", "Tgramme", "", 3, True),
+    ("ygramme2", "ygramme", "", 2, True),
+    ("ygramme3", "ygramme", "", 3, True),
+    ("Egramme2", "Egramme", "", 2, True),
+    ("Egramme3", "Egramme", "", 3, True),
+    ("zgramme2", "zgramme", "", 2, True),
+    ("zgramme3", "zgramme", "", 3, True),
+    ("Mgramme2", "Mgramme", "", 2, True),
+    ("Mgramme3", "Mgramme", "", 3, True),
+    ("kgramme2", "kgramme", "", 2, True),
+    ("kgramme3", "kgramme", "", 3, True),
+    ("Ygramme2", "Ygramme", "", 2, True),
+    ("Ygramme3", "Ygramme", "", 3, True),
+    ("akilogram2", "akilogram", "", 2, True),
+    ("akilogram3", "akilogram", "", 3, True),
+    ("ckilogram2", "ckilogram", "", 2, False),
+    ("ckilogram3", "ckilogram", "", 3, False),
+    ("Zkilogram2", "Zkilogram", "", 2, True),
+    ("Zkilogram3", "Zkilogram", "", 3, True),
+    ("Pkilogram2", "Pkilogram", "", 2, True),
+    ("Pkilogram3", "Pkilogram", "", 3, True),
+    ("dkilogram2", "dkilogram", "", 2, False),
+    ("dkilogram3", "dkilogram", "", 3, False),
+    ("Gkilogram2", "Gkilogram", "", 2, True),
+    ("Gkilogram3", "Gkilogram", "", 3, True),
+    ("fkilogram2", "fkilogram", "", 2, True),
+    ("fkilogram3", "fkilogram", "", 3, True),
+    ("hkilogram2", "hkilogram", "", 2, False),
+    ("hkilogram3", "hkilogram", "", 3, False),
+    ("dakilogram2", "dakilogram", "", 2, False),
+    ("dakilogram3", "dakilogram", "", 3, False),
+    ("mkilogram2", "mkilogram", "", 2, True),
+    ("mkilogram3", "mkilogram", "", 3, True),
+    ("nkilogram2", "nkilogram", "", 2, True),
+    ("nkilogram3", "nkilogram", "", 3, True),
+    ("pkilogram2", "pkilogram", "", 2, True),
+    ("pkilogram3", "pkilogram", "", 3, True),
+    ("ukilogram2", "ukilogram", "", 2, True),
+    ("ukilogram3", "ukilogram", "", 3, True),
+    ("Tkilogram2", "Tkilogram", "", 2, True),
+    ("Tkilogram3", "Tkilogram", "", 3, True),
+    ("ykilogram2", "ykilogram", "", 2, True),
+    ("ykilogram3", "ykilogram", "", 3, True),
+    ("Ekilogram2", "Ekilogram", "", 2, True),
+    ("Ekilogram3", "Ekilogram", "", 3, True),
+    ("zkilogram2", "zkilogram", "", 2, True),
+    ("zkilogram3", "zkilogram", "", 3, True),
+    ("Mkilogram2", "Mkilogram", "", 2, True),
+    ("Mkilogram3", "Mkilogram", "", 3, True),
+    ("kkilogram2", "kkilogram", "", 2, True),
+    ("kkilogram3", "kkilogram", "", 3, True),
+    ("Ykilogram2", "Ykilogram", "", 2, True),
+    ("Ykilogram3", "Ykilogram", "", 3, True),
+    ("aradian2", "aradian", "", 2, True),
+    ("aradian3", "aradian", "", 3, True),
+    ("cradian2", "cradian", "", 2, False),
+    ("cradian3", "cradian", "", 3, False),
+    ("Zradian2", "Zradian", "", 2, True),
+    ("Zradian3", "Zradian", "", 3, True),
+    ("Pradian2", "Pradian", "", 2, True),
+    ("Pradian3", "Pradian", "", 3, True),
+    ("dradian2", "dradian", "", 2, False),
+    ("dradian3", "dradian", "", 3, False),
+    ("Gradian2", "Gradian", "", 2, True),
+    ("Gradian3", "Gradian", "", 3, True),
+    ("fradian2", "fradian", "", 2, True),
+    ("fradian3", "fradian", "", 3, True),
+    ("hradian2", "hradian", "", 2, False),
+    ("hradian3", "hradian", "", 3, False),
+    ("daradian2", "daradian", "", 2, False),
+    ("daradian3", "daradian", "", 3, False),
+    ("mradian2", "mradian", "", 2, True),
+    ("mradian3", "mradian", "", 3, True),
+    ("nradian2", "nradian", "", 2, True),
+    ("nradian3", "nradian", "", 3, True),
+    ("pradian2", "pradian", "", 2, True),
+    ("pradian3", "pradian", "", 3, True),
+    ("uradian2", "uradian", "", 2, True),
+    ("uradian3", "uradian", "", 3, True),
+    ("Tradian2", "Tradian", "", 2, True),
+    ("Tradian3", "Tradian", "", 3, True),
+    ("yradian2", "yradian", "", 2, True),
+    ("yradian3", "yradian", "", 3, True),
+    ("Eradian2", "Eradian", "", 2, True),
+    ("Eradian3", "Eradian", "", 3, True),
+    ("zradian2", "zradian", "", 2, True),
+    ("zradian3", "zradian", "", 3, True),
+    ("Mradian2", "Mradian", "", 2, True),
+    ("Mradian3", "Mradian", "", 3, True),
+    ("kradian2", "kradian", "", 2, True),
+    ("kradian3", "kradian", "", 3, True),
+    ("Yradian2", "Yradian", "", 2, True),
+    ("Yradian3", "Yradian", "", 3, True),
+    ("asteradian2", "asteradian", "", 2, True),
+    ("asteradian3", "asteradian", "", 3, True),
+    ("csteradian2", "csteradian", "", 2, False),
+    ("csteradian3", "csteradian", "", 3, False),
+    ("Zsteradian2", "Zsteradian", "", 2, True),
+    ("Zsteradian3", "Zsteradian", "", 3, True),
+    ("Psteradian2", "Psteradian", "", 2, True),
+    ("Psteradian3", "Psteradian", "", 3, True),
+    ("dsteradian2", "dsteradian", "", 2, False),
+    ("dsteradian3", "dsteradian", "", 3, False),
+    ("Gsteradian2", "Gsteradian", "", 2, True),
+    ("Gsteradian3", "Gsteradian", "", 3, True),
+    ("fsteradian2", "fsteradian", "", 2, True),
+    ("fsteradian3", "fsteradian", "", 3, True),
+    ("hsteradian2", "hsteradian", "", 2, False),
+    ("hsteradian3", "hsteradian", "", 3, False),
+    ("dasteradian2", "dasteradian", "", 2, False),
+    ("dasteradian3", "dasteradian", "", 3, False),
+    ("msteradian2", "msteradian", "", 2, True),
+    ("msteradian3", "msteradian", "", 3, True),
+    ("nsteradian2", "nsteradian", "", 2, True),
+    ("nsteradian3", "nsteradian", "", 3, True),
+    ("psteradian2", "psteradian", "", 2, True),
+    ("psteradian3", "psteradian", "", 3, True),
+    ("usteradian2", "usteradian", "", 2, True),
+    ("usteradian3", "usteradian", "", 3, True),
+    ("Tsteradian2", "Tsteradian", "", 2, True),
+    ("Tsteradian3", "Tsteradian", "", 3, True),
+    ("ysteradian2", "ysteradian", "", 2, True),
+    ("ysteradian3", "ysteradian", "", 3, True),
+    ("Esteradian2", "Esteradian", "", 2, True),
+    ("Esteradian3", "Esteradian", "", 3, True),
+    ("zsteradian2", "zsteradian", "", 2, True),
+    ("zsteradian3", "zsteradian", "", 3, True),
+    ("Msteradian2", "Msteradian", "", 2, True),
+    ("Msteradian3", "Msteradian", "", 3, True),
+    ("ksteradian2", "ksteradian", "", 2, True),
+    ("ksteradian3", "ksteradian", "", 3, True),
+    ("Ysteradian2", "Ysteradian", "", 2, True),
+    ("Ysteradian3", "Ysteradian", "", 3, True),
+    ("ahertz2", "ahertz", "", 2, True),
+    ("ahertz3", "ahertz", "", 3, True),
+    ("chertz2", "chertz", "", 2, False),
+    ("chertz3", "chertz", "", 3, False),
+    ("Zhertz2", "Zhertz", "", 2, True),
+    ("Zhertz3", "Zhertz", "", 3, True),
+    ("Phertz2", "Phertz", "", 2, True),
+    ("Phertz3", "Phertz", "", 3, True),
+    ("dhertz2", "dhertz", "", 2, False),
+    ("dhertz3", "dhertz", "", 3, False),
+    ("Ghertz2", "Ghertz", "", 2, True),
+    ("Ghertz3", "Ghertz", "", 3, True),
+    ("fhertz2", "fhertz", "", 2, True),
+    ("fhertz3", "fhertz", "", 3, True),
+    ("hhertz2", "hhertz", "", 2, False),
+    ("hhertz3", "hhertz", "", 3, False),
+    ("dahertz2", "dahertz", "", 2, False),
+    ("dahertz3", "dahertz", "", 3, False),
+    ("mhertz2", "mhertz", "", 2, True),
+    ("mhertz3", "mhertz", "", 3, True),
+    ("nhertz2", "nhertz", "", 2, True),
+    ("nhertz3", "nhertz", "", 3, True),
+    ("phertz2", "phertz", "", 2, True),
+    ("phertz3", "phertz", "", 3, True),
+    ("uhertz2", "uhertz", "", 2, True),
+    ("uhertz3", "uhertz", "", 3, True),
+    ("Thertz2", "Thertz", "", 2, True),
+    ("Thertz3", "Thertz", "", 3, True),
+    ("yhertz2", "yhertz", "", 2, True),
+    ("yhertz3", "yhertz", "", 3, True),
+    ("Ehertz2", "Ehertz", "", 2, True),
+    ("Ehertz3", "Ehertz", "", 3, True),
+    ("zhertz2", "zhertz", "", 2, True),
+    ("zhertz3", "zhertz", "", 3, True),
+    ("Mhertz2", "Mhertz", "", 2, True),
+    ("Mhertz3", "Mhertz", "", 3, True),
+    ("khertz2", "khertz", "", 2, True),
+    ("khertz3", "khertz", "", 3, True),
+    ("Yhertz2", "Yhertz", "", 2, True),
+    ("Yhertz3", "Yhertz", "", 3, True),
+    ("anewton2", "anewton", "", 2, True),
+    ("anewton3", "anewton", "", 3, True),
+    ("cnewton2", "cnewton", "", 2, False),
+    ("cnewton3", "cnewton", "", 3, False),
+    ("Znewton2", "Znewton", "", 2, True),
+    ("Znewton3", "Znewton", "", 3, True),
+    ("Pnewton2", "Pnewton", "", 2, True),
+    ("Pnewton3", "Pnewton", "", 3, True),
+    ("dnewton2", "dnewton", "", 2, False),
+    ("dnewton3", "dnewton", "", 3, False),
+    ("Gnewton2", "Gnewton", "", 2, True),
+    ("Gnewton3", "Gnewton", "", 3, True),
+    ("fnewton2", "fnewton", "", 2, True),
+    ("fnewton3", "fnewton", "", 3, True),
+    ("hnewton2", "hnewton", "", 2, False),
+    ("hnewton3", "hnewton", "", 3, False),
+    ("danewton2", "danewton", "", 2, False),
+    ("danewton3", "danewton", "", 3, False),
+    ("mnewton2", "mnewton", "", 2, True),
+    ("mnewton3", "mnewton", "", 3, True),
+    ("nnewton2", "nnewton", "", 2, True),
+    ("nnewton3", "nnewton", "", 3, True),
+    ("pnewton2", "pnewton", "", 2, True),
+    ("pnewton3", "pnewton", "", 3, True),
+    ("unewton2", "unewton", "", 2, True),
+    ("unewton3", "unewton", "", 3, True),
+    ("Tnewton2", "Tnewton", "", 2, True),
+    ("Tnewton3", "Tnewton", "", 3, True),
+    ("ynewton2", "ynewton", "", 2, True),
+    ("ynewton3", "ynewton", "", 3, True),
+    ("Enewton2", "Enewton", "", 2, True),
+    ("Enewton3", "Enewton", "", 3, True),
+    ("znewton2", "znewton", "", 2, True),
+    ("znewton3", "znewton", "", 3, True),
+    ("Mnewton2", "Mnewton", "", 2, True),
+    ("Mnewton3", "Mnewton", "", 3, True),
+    ("knewton2", "knewton", "", 2, True),
+    ("knewton3", "knewton", "", 3, True),
+    ("Ynewton2", "Ynewton", "", 2, True),
+    ("Ynewton3", "Ynewton", "", 3, True),
+    ("apascal2", "apascal", "", 2, True),
+    ("apascal3", "apascal", "", 3, True),
+    ("cpascal2", "cpascal", "", 2, False),
+    ("cpascal3", "cpascal", "", 3, False),
+    ("Zpascal2", "Zpascal", "", 2, True),
+    ("Zpascal3", "Zpascal", "", 3, True),
+    ("Ppascal2", "Ppascal", "", 2, True),
+    ("Ppascal3", "Ppascal", "", 3, True),
+    ("dpascal2", "dpascal", "", 2, False),
+    ("dpascal3", "dpascal", "", 3, False),
+    ("Gpascal2", "Gpascal", "", 2, True),
+    ("Gpascal3", "Gpascal", "", 3, True),
+    ("fpascal2", "fpascal", "", 2, True),
+    ("fpascal3", "fpascal", "", 3, True),
+    ("hpascal2", "hpascal", "", 2, False),
+    ("hpascal3", "hpascal", "", 3, False),
+    ("dapascal2", "dapascal", "", 2, False),
+    ("dapascal3", "dapascal", "", 3, False),
+    ("mpascal2", "mpascal", "", 2, True),
+    ("mpascal3", "mpascal", "", 3, True),
+    ("npascal2", "npascal", "", 2, True),
+    ("npascal3", "npascal", "", 3, True),
+    ("ppascal2", "ppascal", "", 2, True),
+    ("ppascal3", "ppascal", "", 3, True),
+    ("upascal2", "upascal", "", 2, True),
+    ("upascal3", "upascal", "", 3, True),
+    ("Tpascal2", "Tpascal", "", 2, True),
+    ("Tpascal3", "Tpascal", "", 3, True),
+    ("ypascal2", "ypascal", "", 2, True),
+    ("ypascal3", "ypascal", "", 3, True),
+    ("Epascal2", "Epascal", "", 2, True),
+    ("Epascal3", "Epascal", "", 3, True),
+    ("zpascal2", "zpascal", "", 2, True),
+    ("zpascal3", "zpascal", "", 3, True),
+    ("Mpascal2", "Mpascal", "", 2, True),
+    ("Mpascal3", "Mpascal", "", 3, True),
+    ("kpascal2", "kpascal", "", 2, True),
+    ("kpascal3", "kpascal", "", 3, True),
+    ("Ypascal2", "Ypascal", "", 2, True),
+    ("Ypascal3", "Ypascal", "", 3, True),
+    ("ajoule2", "ajoule", "", 2, True),
+    ("ajoule3", "ajoule", "", 3, True),
+    ("cjoule2", "cjoule", "", 2, False),
+    ("cjoule3", "cjoule", "", 3, False),
+    ("Zjoule2", "Zjoule", "", 2, True),
+    ("Zjoule3", "Zjoule", "", 3, True),
+    ("Pjoule2", "Pjoule", "", 2, True),
+    ("Pjoule3", "Pjoule", "", 3, True),
+    ("djoule2", "djoule", "", 2, False),
+    ("djoule3", "djoule", "", 3, False),
+    ("Gjoule2", "Gjoule", "", 2, True),
+    ("Gjoule3", "Gjoule", "", 3, True),
+    ("fjoule2", "fjoule", "", 2, True),
+    ("fjoule3", "fjoule", "", 3, True),
+    ("hjoule2", "hjoule", "", 2, False),
+    ("hjoule3", "hjoule", "", 3, False),
+    ("dajoule2", "dajoule", "", 2, False),
+    ("dajoule3", "dajoule", "", 3, False),
+    ("mjoule2", "mjoule", "", 2, True),
+    ("mjoule3", "mjoule", "", 3, True),
+    ("njoule2", "njoule", "", 2, True),
+    ("njoule3", "njoule", "", 3, True),
+    ("pjoule2", "pjoule", "", 2, True),
+    ("pjoule3", "pjoule", "", 3, True),
+    ("ujoule2", "ujoule", "", 2, True),
+    ("ujoule3", "ujoule", "", 3, True),
+    ("Tjoule2", "Tjoule", "", 2, True),
+    ("Tjoule3", "Tjoule", "", 3, True),
+    ("yjoule2", "yjoule", "", 2, True),
+    ("yjoule3", "yjoule", "", 3, True),
+    ("Ejoule2", "Ejoule", "", 2, True),
+    ("Ejoule3", "Ejoule", "", 3, True),
+    ("zjoule2", "zjoule", "", 2, True),
+    ("zjoule3", "zjoule", "", 3, True),
+    ("Mjoule2", "Mjoule", "", 2, True),
+    ("Mjoule3", "Mjoule", "", 3, True),
+    ("kjoule2", "kjoule", "", 2, True),
+    ("kjoule3", "kjoule", "", 3, True),
+    ("Yjoule2", "Yjoule", "", 2, True),
+    ("Yjoule3", "Yjoule", "", 3, True),
+    ("awatt2", "awatt", "", 2, True),
+    ("awatt3", "awatt", "", 3, True),
+    ("cwatt2", "cwatt", "", 2, False),
+    ("cwatt3", "cwatt", "", 3, False),
+    ("Zwatt2", "Zwatt", "", 2, True),
+    ("Zwatt3", "Zwatt", "", 3, True),
+    ("Pwatt2", "Pwatt", "", 2, True),
+    ("Pwatt3", "Pwatt", "", 3, True),
+    ("dwatt2", "dwatt", "", 2, False),
+    ("dwatt3", "dwatt", "", 3, False),
+    ("Gwatt2", "Gwatt", "", 2, True),
+    ("Gwatt3", "Gwatt", "", 3, True),
+    ("fwatt2", "fwatt", "", 2, True),
+    ("fwatt3", "fwatt", "", 3, True),
+    ("hwatt2", "hwatt", "", 2, False),
+    ("hwatt3", "hwatt", "", 3, False),
+    ("dawatt2", "dawatt", "", 2, False),
+    ("dawatt3", "dawatt", "", 3, False),
+    ("mwatt2", "mwatt", "", 2, True),
+    ("mwatt3", "mwatt", "", 3, True),
+    ("nwatt2", "nwatt", "", 2, True),
+    ("nwatt3", "nwatt", "", 3, True),
+    ("pwatt2", "pwatt", "", 2, True),
+    ("pwatt3", "pwatt", "", 3, True),
+    ("uwatt2", "uwatt", "", 2, True),
+    ("uwatt3", "uwatt", "", 3, True),
+    ("Twatt2", "Twatt", "", 2, True),
+    ("Twatt3", "Twatt", "", 3, True),
+    ("ywatt2", "ywatt", "", 2, True),
+    ("ywatt3", "ywatt", "", 3, True),
+    ("Ewatt2", "Ewatt", "", 2, True),
+    ("Ewatt3", "Ewatt", "", 3, True),
+    ("zwatt2", "zwatt", "", 2, True),
+    ("zwatt3", "zwatt", "", 3, True),
+    ("Mwatt2", "Mwatt", "", 2, True),
+    ("Mwatt3", "Mwatt", "", 3, True),
+    ("kwatt2", "kwatt", "", 2, True),
+    ("kwatt3", "kwatt", "", 3, True),
+    ("Ywatt2", "Ywatt", "", 2, True),
+    ("Ywatt3", "Ywatt", "", 3, True),
+    ("acoulomb2", "acoulomb", "", 2, True),
+    ("acoulomb3", "acoulomb", "", 3, True),
+    ("ccoulomb2", "ccoulomb", "", 2, False),
+    ("ccoulomb3", "ccoulomb", "", 3, False),
+    ("Zcoulomb2", "Zcoulomb", "", 2, True),
+    ("Zcoulomb3", "Zcoulomb", "", 3, True),
+    ("Pcoulomb2", "Pcoulomb", "", 2, True),
+    ("Pcoulomb3", "Pcoulomb", "", 3, True),
+    ("dcoulomb2", "dcoulomb", "", 2, False),
+    ("dcoulomb3", "dcoulomb", "", 3, False),
+    ("Gcoulomb2", "Gcoulomb", "", 2, True),
+    ("Gcoulomb3", "Gcoulomb", "", 3, True),
+    ("fcoulomb2", "fcoulomb", "", 2, True),
+    ("fcoulomb3", "fcoulomb", "", 3, True),
+    ("hcoulomb2", "hcoulomb", "", 2, False),
+    ("hcoulomb3", "hcoulomb", "", 3, False),
+    ("dacoulomb2", "dacoulomb", "", 2, False),
+    ("dacoulomb3", "dacoulomb", "", 3, False),
+    ("mcoulomb2", "mcoulomb", "", 2, True),
+    ("mcoulomb3", "mcoulomb", "", 3, True),
+    ("ncoulomb2", "ncoulomb", "", 2, True),
+    ("ncoulomb3", "ncoulomb", "", 3, True),
+    ("pcoulomb2", "pcoulomb", "", 2, True),
+    ("pcoulomb3", "pcoulomb", "", 3, True),
+    ("ucoulomb2", "ucoulomb", "", 2, True),
+    ("ucoulomb3", "ucoulomb", "", 3, True),
+    ("Tcoulomb2", "Tcoulomb", "", 2, True),
+    ("Tcoulomb3", "Tcoulomb", "", 3, True),
+    ("ycoulomb2", "ycoulomb", "", 2, True),
+    ("ycoulomb3", "ycoulomb", "", 3, True),
+    ("Ecoulomb2", "Ecoulomb", "", 2, True),
+    ("Ecoulomb3", "Ecoulomb", "", 3, True),
+    ("zcoulomb2", "zcoulomb", "", 2, True),
+    ("zcoulomb3", "zcoulomb", "", 3, True),
+    ("Mcoulomb2", "Mcoulomb", "", 2, True),
+    ("Mcoulomb3", "Mcoulomb", "", 3, True),
+    ("kcoulomb2", "kcoulomb", "", 2, True),
+    ("kcoulomb3", "kcoulomb", "", 3, True),
+    ("Ycoulomb2", "Ycoulomb", "", 2, True),
+    ("Ycoulomb3", "Ycoulomb", "", 3, True),
+    ("avolt2", "avolt", "", 2, True),
+    ("avolt3", "avolt", "", 3, True),
+    ("cvolt2", "cvolt", "", 2, False),
+    ("cvolt3", "cvolt", "", 3, False),
+    ("Zvolt2", "Zvolt", "", 2, True),
+    ("Zvolt3", "Zvolt", "", 3, True),
+    ("Pvolt2", "Pvolt", "", 2, True),
+    ("Pvolt3", "Pvolt", "", 3, True),
+    ("dvolt2", "dvolt", "", 2, False),
+    ("dvolt3", "dvolt", "", 3, False),
+    ("Gvolt2", "Gvolt", "", 2, True),
+    ("Gvolt3", "Gvolt", "", 3, True),
+    ("fvolt2", "fvolt", "", 2, True),
+    ("fvolt3", "fvolt", "", 3, True),
+    ("hvolt2", "hvolt", "", 2, False),
+    ("hvolt3", "hvolt", "", 3, False),
+    ("davolt2", "davolt", "", 2, False),
+    ("davolt3", "davolt", "", 3, False),
+    ("mvolt2", "mvolt", "", 2, True),
+    ("mvolt3", "mvolt", "", 3, True),
+    ("nvolt2", "nvolt", "", 2, True),
+    ("nvolt3", "nvolt", "", 3, True),
+    ("pvolt2", "pvolt", "", 2, True),
+    ("pvolt3", "pvolt", "", 3, True),
+    ("uvolt2", "uvolt", "", 2, True),
+    ("uvolt3", "uvolt", "", 3, True),
+    ("Tvolt2", "Tvolt", "", 2, True),
+    ("Tvolt3", "Tvolt", "", 3, True),
+    ("yvolt2", "yvolt", "", 2, True),
+    ("yvolt3", "yvolt", "", 3, True),
+    ("Evolt2", "Evolt", "", 2, True),
+    ("Evolt3", "Evolt", "", 3, True),
+    ("zvolt2", "zvolt", "", 2, True),
+    ("zvolt3", "zvolt", "", 3, True),
+    ("Mvolt2", "Mvolt", "", 2, True),
+    ("Mvolt3", "Mvolt", "", 3, True),
+    ("kvolt2", "kvolt", "", 2, True),
+    ("kvolt3", "kvolt", "", 3, True),
+    ("Yvolt2", "Yvolt", "", 2, True),
+    ("Yvolt3", "Yvolt", "", 3, True),
+    ("afarad2", "afarad", "", 2, True),
+    ("afarad3", "afarad", "", 3, True),
+    ("cfarad2", "cfarad", "", 2, False),
+    ("cfarad3", "cfarad", "", 3, False),
+    ("Zfarad2", "Zfarad", "", 2, True),
+    ("Zfarad3", "Zfarad", "", 3, True),
+    ("Pfarad2", "Pfarad", "", 2, True),
+    ("Pfarad3", "Pfarad", "", 3, True),
+    ("dfarad2", "dfarad", "", 2, False),
+    ("dfarad3", "dfarad", "", 3, False),
+    ("Gfarad2", "Gfarad", "", 2, True),
+    ("Gfarad3", "Gfarad", "", 3, True),
+    ("ffarad2", "ffarad", "", 2, True),
+    ("ffarad3", "ffarad", "", 3, True),
+    ("hfarad2", "hfarad", "", 2, False),
+    ("hfarad3", "hfarad", "", 3, False),
+    ("dafarad2", "dafarad", "", 2, False),
+    ("dafarad3", "dafarad", "", 3, False),
+    ("mfarad2", "mfarad", "", 2, True),
+    ("mfarad3", "mfarad", "", 3, True),
+    ("nfarad2", "nfarad", "", 2, True),
+    ("nfarad3", "nfarad", "", 3, True),
+    ("pfarad2", "pfarad", "", 2, True),
+    ("pfarad3", "pfarad", "", 3, True),
+    ("ufarad2", "ufarad", "", 2, True),
+    ("ufarad3", "ufarad", "", 3, True),
+    ("Tfarad2", "Tfarad", "", 2, True),
+    ("Tfarad3", "Tfarad", "", 3, True),
+    ("yfarad2", "yfarad", "", 2, True),
+    ("yfarad3", "yfarad", "", 3, True),
+    ("Efarad2", "Efarad", "", 2, True),
+    ("Efarad3", "Efarad", "", 3, True),
+    ("zfarad2", "zfarad", "", 2, True),
+    ("zfarad3", "zfarad", "", 3, True),
+    ("Mfarad2", "Mfarad", "", 2, True),
+    ("Mfarad3", "Mfarad", "", 3, True),
+    ("kfarad2", "kfarad", "", 2, True),
+    ("kfarad3", "kfarad", "", 3, True),
+    ("Yfarad2", "Yfarad", "", 2, True),
+    ("Yfarad3", "Yfarad", "", 3, True),
+    ("aohm2", "aohm", "", 2, True),
+    ("aohm3", "aohm", "", 3, True),
+    ("cohm2", "cohm", "", 2, False),
+    ("cohm3", "cohm", "", 3, False),
+    ("Zohm2", "Zohm", "", 2, True),
+    ("Zohm3", "Zohm", "", 3, True),
+    ("Pohm2", "Pohm", "", 2, True),
+    ("Pohm3", "Pohm", "", 3, True),
+    ("dohm2", "dohm", "", 2, False),
+    ("dohm3", "dohm", "", 3, False),
+    ("Gohm2", "Gohm", "", 2, True),
+    ("Gohm3", "Gohm", "", 3, True),
+    ("fohm2", "fohm", "", 2, True),
+    ("fohm3", "fohm", "", 3, True),
+    ("hohm2", "hohm", "", 2, False),
+    ("hohm3", "hohm", "", 3, False),
+    ("daohm2", "daohm", "", 2, False),
+    ("daohm3", "daohm", "", 3, False),
+    ("mohm2", "mohm", "", 2, True),
+    ("mohm3", "mohm", "", 3, True),
+    ("nohm2", "nohm", "", 2, True),
+    ("nohm3", "nohm", "", 3, True),
+    ("pohm2", "pohm", "", 2, True),
+    ("pohm3", "pohm", "", 3, True),
+    ("uohm2", "uohm", "", 2, True),
+    ("uohm3", "uohm", "", 3, True),
+    ("Tohm2", "Tohm", "", 2, True),
+    ("Tohm3", "Tohm", "", 3, True),
+    ("yohm2", "yohm", "", 2, True),
+    ("yohm3", "yohm", "", 3, True),
+    ("Eohm2", "Eohm", "", 2, True),
+    ("Eohm3", "Eohm", "", 3, True),
+    ("zohm2", "zohm", "", 2, True),
+    ("zohm3", "zohm", "", 3, True),
+    ("Mohm2", "Mohm", "", 2, True),
+    ("Mohm3", "Mohm", "", 3, True),
+    ("kohm2", "kohm", "", 2, True),
+    ("kohm3", "kohm", "", 3, True),
+    ("Yohm2", "Yohm", "", 2, True),
+    ("Yohm3", "Yohm", "", 3, True),
+    ("asiemens2", "asiemens", "", 2, True),
+    ("asiemens3", "asiemens", "", 3, True),
+    ("csiemens2", "csiemens", "", 2, False),
+    ("csiemens3", "csiemens", "", 3, False),
+    ("Zsiemens2", "Zsiemens", "", 2, True),
+    ("Zsiemens3", "Zsiemens", "", 3, True),
+    ("Psiemens2", "Psiemens", "", 2, True),
+    ("Psiemens3", "Psiemens", "", 3, True),
+    ("dsiemens2", "dsiemens", "", 2, False),
+    ("dsiemens3", "dsiemens", "", 3, False),
+    ("Gsiemens2", "Gsiemens", "", 2, True),
+    ("Gsiemens3", "Gsiemens", "", 3, True),
+    ("fsiemens2", "fsiemens", "", 2, True),
+    ("fsiemens3", "fsiemens", "", 3, True),
+    ("hsiemens2", "hsiemens", "", 2, False),
+    ("hsiemens3", "hsiemens", "", 3, False),
+    ("dasiemens2", "dasiemens", "", 2, False),
+    ("dasiemens3", "dasiemens", "", 3, False),
+    ("msiemens2", "msiemens", "", 2, True),
+    ("msiemens3", "msiemens", "", 3, True),
+    ("nsiemens2", "nsiemens", "", 2, True),
+    ("nsiemens3", "nsiemens", "", 3, True),
+    ("psiemens2", "psiemens", "", 2, True),
+    ("psiemens3", "psiemens", "", 3, True),
+    ("usiemens2", "usiemens", "", 2, True),
+    ("usiemens3", "usiemens", "", 3, True),
+    ("Tsiemens2", "Tsiemens", "", 2, True),
+    ("Tsiemens3", "Tsiemens", "", 3, True),
+    ("ysiemens2", "ysiemens", "", 2, True),
+    ("ysiemens3", "ysiemens", "", 3, True),
+    ("Esiemens2", "Esiemens", "", 2, True),
+    ("Esiemens3", "Esiemens", "", 3, True),
+    ("zsiemens2", "zsiemens", "", 2, True),
+    ("zsiemens3", "zsiemens", "", 3, True),
+    ("Msiemens2", "Msiemens", "", 2, True),
+    ("Msiemens3", "Msiemens", "", 3, True),
+    ("ksiemens2", "ksiemens", "", 2, True),
+    ("ksiemens3", "ksiemens", "", 3, True),
+    ("Ysiemens2", "Ysiemens", "", 2, True),
+    ("Ysiemens3", "Ysiemens", "", 3, True),
+    ("aweber2", "aweber", "", 2, True),
+    ("aweber3", "aweber", "", 3, True),
+    ("cweber2", "cweber", "", 2, False),
+    ("cweber3", "cweber", "", 3, False),
+    ("Zweber2", "Zweber", "", 2, True),
+    ("Zweber3", "Zweber", "", 3, True),
+    ("Pweber2", "Pweber", "", 2, True),
+    ("Pweber3", "Pweber", "", 3, True),
+    ("dweber2", "dweber", "", 2, False),
+    ("dweber3", "dweber", "", 3, False),
+    ("Gweber2", "Gweber", "", 2, True),
+    ("Gweber3", "Gweber", "", 3, True),
+    ("fweber2", "fweber", "", 2, True),
+    ("fweber3", "fweber", "", 3, True),
+    ("hweber2", "hweber", "", 2, False),
+    ("hweber3", "hweber", "", 3, False),
+    ("daweber2", "daweber", "", 2, False),
+    ("daweber3", "daweber", "", 3, False),
+    ("mweber2", "mweber", "", 2, True),
+    ("mweber3", "mweber", "", 3, True),
+    ("nweber2", "nweber", "", 2, True),
+    ("nweber3", "nweber", "", 3, True),
+    ("pweber2", "pweber", "", 2, True),
+    ("pweber3", "pweber", "", 3, True),
+    ("uweber2", "uweber", "", 2, True),
+    ("uweber3", "uweber", "", 3, True),
+    ("Tweber2", "Tweber", "", 2, True),
+    ("Tweber3", "Tweber", "", 3, True),
+    ("yweber2", "yweber", "", 2, True),
+    ("yweber3", "yweber", "", 3, True),
+    ("Eweber2", "Eweber", "", 2, True),
+    ("Eweber3", "Eweber", "", 3, True),
+    ("zweber2", "zweber", "", 2, True),
+    ("zweber3", "zweber", "", 3, True),
+    ("Mweber2", "Mweber", "", 2, True),
+    ("Mweber3", "Mweber", "", 3, True),
+    ("kweber2", "kweber", "", 2, True),
+    ("kweber3", "kweber", "", 3, True),
+    ("Yweber2", "Yweber", "", 2, True),
+    ("Yweber3", "Yweber", "", 3, True),
+    ("atesla2", "atesla", "", 2, True),
+    ("atesla3", "atesla", "", 3, True),
+    ("ctesla2", "ctesla", "", 2, False),
+    ("ctesla3", "ctesla", "", 3, False),
+    ("Ztesla2", "Ztesla", "", 2, True),
+    ("Ztesla3", "Ztesla", "", 3, True),
+    ("Ptesla2", "Ptesla", "", 2, True),
+    ("Ptesla3", "Ptesla", "", 3, True),
+    ("dtesla2", "dtesla", "", 2, False),
+    ("dtesla3", "dtesla", "", 3, False),
+    ("Gtesla2", "Gtesla", "", 2, True),
+    ("Gtesla3", "Gtesla", "", 3, True),
+    ("ftesla2", "ftesla", "", 2, True),
+    ("ftesla3", "ftesla", "", 3, True),
+    ("htesla2", "htesla", "", 2, False),
+    ("htesla3", "htesla", "", 3, False),
+    ("datesla2", "datesla", "", 2, False),
+    ("datesla3", "datesla", "", 3, False),
+    ("mtesla2", "mtesla", "", 2, True),
+    ("mtesla3", "mtesla", "", 3, True),
+    ("ntesla2", "ntesla", "", 2, True),
+    ("ntesla3", "ntesla", "", 3, True),
+    ("ptesla2", "ptesla", "", 2, True),
+    ("ptesla3", "ptesla", "", 3, True),
+    ("utesla2", "utesla", "", 2, True),
+    ("utesla3", "utesla", "", 3, True),
+    ("Ttesla2", "Ttesla", "", 2, True),
+    ("Ttesla3", "Ttesla", "", 3, True),
+    ("ytesla2", "ytesla", "", 2, True),
+    ("ytesla3", "ytesla", "", 3, True),
+    ("Etesla2", "Etesla", "", 2, True),
+    ("Etesla3", "Etesla", "", 3, True),
+    ("ztesla2", "ztesla", "", 2, True),
+    ("ztesla3", "ztesla", "", 3, True),
+    ("Mtesla2", "Mtesla", "", 2, True),
+    ("Mtesla3", "Mtesla", "", 3, True),
+    ("ktesla2", "ktesla", "", 2, True),
+    ("ktesla3", "ktesla", "", 3, True),
+    ("Ytesla2", "Ytesla", "", 2, True),
+    ("Ytesla3", "Ytesla", "", 3, True),
+    ("ahenry2", "ahenry", "", 2, True),
+    ("ahenry3", "ahenry", "", 3, True),
+    ("chenry2", "chenry", "", 2, False),
+    ("chenry3", "chenry", "", 3, False),
+    ("Zhenry2", "Zhenry", "", 2, True),
+    ("Zhenry3", "Zhenry", "", 3, True),
+    ("Phenry2", "Phenry", "", 2, True),
+    ("Phenry3", "Phenry", "", 3, True),
+    ("dhenry2", "dhenry", "", 2, False),
+    ("dhenry3", "dhenry", "", 3, False),
+    ("Ghenry2", "Ghenry", "", 2, True),
+    ("Ghenry3", "Ghenry", "", 3, True),
+    ("fhenry2", "fhenry", "", 2, True),
+    ("fhenry3", "fhenry", "", 3, True),
+    ("hhenry2", "hhenry", "", 2, False),
+    ("hhenry3", "hhenry", "", 3, False),
+    ("dahenry2", "dahenry", "", 2, False),
+    ("dahenry3", "dahenry", "", 3, False),
+    ("mhenry2", "mhenry", "", 2, True),
+    ("mhenry3", "mhenry", "", 3, True),
+    ("nhenry2", "nhenry", "", 2, True),
+    ("nhenry3", "nhenry", "", 3, True),
+    ("phenry2", "phenry", "", 2, True),
+    ("phenry3", "phenry", "", 3, True),
+    ("uhenry2", "uhenry", "", 2, True),
+    ("uhenry3", "uhenry", "", 3, True),
+    ("Thenry2", "Thenry", "", 2, True),
+    ("Thenry3", "Thenry", "", 3, True),
+    ("yhenry2", "yhenry", "", 2, True),
+    ("yhenry3", "yhenry", "", 3, True),
+    ("Ehenry2", "Ehenry", "", 2, True),
+    ("Ehenry3", "Ehenry", "", 3, True),
+    ("zhenry2", "zhenry", "", 2, True),
+    ("zhenry3", "zhenry", "", 3, True),
+    ("Mhenry2", "Mhenry", "", 2, True),
+    ("Mhenry3", "Mhenry", "", 3, True),
+    ("khenry2", "khenry", "", 2, True),
+    ("khenry3", "khenry", "", 3, True),
+    ("Yhenry2", "Yhenry", "", 2, True),
+    ("Yhenry3", "Yhenry", "", 3, True),
+    ("acelsius2", "acelsius", "", 2, True),
+    ("acelsius3", "acelsius", "", 3, True),
+    ("ccelsius2", "ccelsius", "", 2, False),
+    ("ccelsius3", "ccelsius", "", 3, False),
+    ("Zcelsius2", "Zcelsius", "", 2, True),
+    ("Zcelsius3", "Zcelsius", "", 3, True),
+    ("Pcelsius2", "Pcelsius", "", 2, True),
+    ("Pcelsius3", "Pcelsius", "", 3, True),
+    ("dcelsius2", "dcelsius", "", 2, False),
+    ("dcelsius3", "dcelsius", "", 3, False),
+    ("Gcelsius2", "Gcelsius", "", 2, True),
+    ("Gcelsius3", "Gcelsius", "", 3, True),
+    ("fcelsius2", "fcelsius", "", 2, True),
+    ("fcelsius3", "fcelsius", "", 3, True),
+    ("hcelsius2", "hcelsius", "", 2, False),
+    ("hcelsius3", "hcelsius", "", 3, False),
+    ("dacelsius2", "dacelsius", "", 2, False),
+    ("dacelsius3", "dacelsius", "", 3, False),
+    ("mcelsius2", "mcelsius", "", 2, True),
+    ("mcelsius3", "mcelsius", "", 3, True),
+    ("ncelsius2", "ncelsius", "", 2, True),
+    ("ncelsius3", "ncelsius", "", 3, True),
+    ("pcelsius2", "pcelsius", "", 2, True),
+    ("pcelsius3", "pcelsius", "", 3, True),
+    ("ucelsius2", "ucelsius", "", 2, True),
+    ("ucelsius3", "ucelsius", "", 3, True),
+    ("Tcelsius2", "Tcelsius", "", 2, True),
+    ("Tcelsius3", "Tcelsius", "", 3, True),
+    ("ycelsius2", "ycelsius", "", 2, True),
+    ("ycelsius3", "ycelsius", "", 3, True),
+    ("Ecelsius2", "Ecelsius", "", 2, True),
+    ("Ecelsius3", "Ecelsius", "", 3, True),
+    ("zcelsius2", "zcelsius", "", 2, True),
+    ("zcelsius3", "zcelsius", "", 3, True),
+    ("Mcelsius2", "Mcelsius", "", 2, True),
+    ("Mcelsius3", "Mcelsius", "", 3, True),
+    ("kcelsius2", "kcelsius", "", 2, True),
+    ("kcelsius3", "kcelsius", "", 3, True),
+    ("Ycelsius2", "Ycelsius", "", 2, True),
+    ("Ycelsius3", "Ycelsius", "", 3, True),
+    ("alumen2", "alumen", "", 2, True),
+    ("alumen3", "alumen", "", 3, True),
+    ("clumen2", "clumen", "", 2, False),
+    ("clumen3", "clumen", "", 3, False),
+    ("Zlumen2", "Zlumen", "", 2, True),
+    ("Zlumen3", "Zlumen", "", 3, True),
+    ("Plumen2", "Plumen", "", 2, True),
+    ("Plumen3", "Plumen", "", 3, True),
+    ("dlumen2", "dlumen", "", 2, False),
+    ("dlumen3", "dlumen", "", 3, False),
+    ("Glumen2", "Glumen", "", 2, True),
+    ("Glumen3", "Glumen", "", 3, True),
+    ("flumen2", "flumen", "", 2, True),
+    ("flumen3", "flumen", "", 3, True),
+    ("hlumen2", "hlumen", "", 2, False),
+    ("hlumen3", "hlumen", "", 3, False),
+    ("dalumen2", "dalumen", "", 2, False),
+    ("dalumen3", "dalumen", "", 3, False),
+    ("mlumen2", "mlumen", "", 2, True),
+    ("mlumen3", "mlumen", "", 3, True),
+    ("nlumen2", "nlumen", "", 2, True),
+    ("nlumen3", "nlumen", "", 3, True),
+    ("plumen2", "plumen", "", 2, True),
+    ("plumen3", "plumen", "", 3, True),
+    ("ulumen2", "ulumen", "", 2, True),
+    ("ulumen3", "ulumen", "", 3, True),
+    ("Tlumen2", "Tlumen", "", 2, True),
+    ("Tlumen3", "Tlumen", "", 3, True),
+    ("ylumen2", "ylumen", "", 2, True),
+    ("ylumen3", "ylumen", "", 3, True),
+    ("Elumen2", "Elumen", "", 2, True),
+    ("Elumen3", "Elumen", "", 3, True),
+    ("zlumen2", "zlumen", "", 2, True),
+    ("zlumen3", "zlumen", "", 3, True),
+    ("Mlumen2", "Mlumen", "", 2, True),
+    ("Mlumen3", "Mlumen", "", 3, True),
+    ("klumen2", "klumen", "", 2, True),
+    ("klumen3", "klumen", "", 3, True),
+    ("Ylumen2", "Ylumen", "", 2, True),
+    ("Ylumen3", "Ylumen", "", 3, True),
+    ("alux2", "alux", "", 2, True),
+    ("alux3", "alux", "", 3, True),
+    ("clux2", "clux", "", 2, False),
+    ("clux3", "clux", "", 3, False),
+    ("Zlux2", "Zlux", "", 2, True),
+    ("Zlux3", "Zlux", "", 3, True),
+    ("Plux2", "Plux", "", 2, True),
+    ("Plux3", "Plux", "", 3, True),
+    ("dlux2", "dlux", "", 2, False),
+    ("dlux3", "dlux", "", 3, False),
+    ("Glux2", "Glux", "", 2, True),
+    ("Glux3", "Glux", "", 3, True),
+    ("flux2", "flux", "", 2, True),
+    ("flux3", "flux", "", 3, True),
+    ("hlux2", "hlux", "", 2, False),
+    ("hlux3", "hlux", "", 3, False),
+    ("dalux2", "dalux", "", 2, False),
+    ("dalux3", "dalux", "", 3, False),
+    ("mlux2", "mlux", "", 2, True),
+    ("mlux3", "mlux", "", 3, True),
+    ("nlux2", "nlux", "", 2, True),
+    ("nlux3", "nlux", "", 3, True),
+    ("plux2", "plux", "", 2, True),
+    ("plux3", "plux", "", 3, True),
+    ("ulux2", "ulux", "", 2, True),
+    ("ulux3", "ulux", "", 3, True),
+    ("Tlux2", "Tlux", "", 2, True),
+    ("Tlux3", "Tlux", "", 3, True),
+    ("ylux2", "ylux", "", 2, True),
+    ("ylux3", "ylux", "", 3, True),
+    ("Elux2", "Elux", "", 2, True),
+    ("Elux3", "Elux", "", 3, True),
+    ("zlux2", "zlux", "", 2, True),
+    ("zlux3", "zlux", "", 3, True),
+    ("Mlux2", "Mlux", "", 2, True),
+    ("Mlux3", "Mlux", "", 3, True),
+    ("klux2", "klux", "", 2, True),
+    ("klux3", "klux", "", 3, True),
+    ("Ylux2", "Ylux", "", 2, True),
+    ("Ylux3", "Ylux", "", 3, True),
+    ("abecquerel2", "abecquerel", "", 2, True),
+    ("abecquerel3", "abecquerel", "", 3, True),
+    ("cbecquerel2", "cbecquerel", "", 2, False),
+    ("cbecquerel3", "cbecquerel", "", 3, False),
+    ("Zbecquerel2", "Zbecquerel", "", 2, True),
+    ("Zbecquerel3", "Zbecquerel", "", 3, True),
+    ("Pbecquerel2", "Pbecquerel", "", 2, True),
+    ("Pbecquerel3", "Pbecquerel", "", 3, True),
+    ("dbecquerel2", "dbecquerel", "", 2, False),
+    ("dbecquerel3", "dbecquerel", "", 3, False),
+    ("Gbecquerel2", "Gbecquerel", "", 2, True),
+    ("Gbecquerel3", "Gbecquerel", "", 3, True),
+    ("fbecquerel2", "fbecquerel", "", 2, True),
+    ("fbecquerel3", "fbecquerel", "", 3, True),
+    ("hbecquerel2", "hbecquerel", "", 2, False),
+    ("hbecquerel3", "hbecquerel", "", 3, False),
+    ("dabecquerel2", "dabecquerel", "", 2, False),
+    ("dabecquerel3", "dabecquerel", "", 3, False),
+    ("mbecquerel2", "mbecquerel", "", 2, True),
+    ("mbecquerel3", "mbecquerel", "", 3, True),
+    ("nbecquerel2", "nbecquerel", "", 2, True),
+    ("nbecquerel3", "nbecquerel", "", 3, True),
+    ("pbecquerel2", "pbecquerel", "", 2, True),
+    ("pbecquerel3", "pbecquerel", "", 3, True),
+    ("ubecquerel2", "ubecquerel", "", 2, True),
+    ("ubecquerel3", "ubecquerel", "", 3, True),
+    ("Tbecquerel2", "Tbecquerel", "", 2, True),
+    ("Tbecquerel3", "Tbecquerel", "", 3, True),
+    ("ybecquerel2", "ybecquerel", "", 2, True),
+    ("ybecquerel3", "ybecquerel", "", 3, True),
+    ("Ebecquerel2", "Ebecquerel", "", 2, True),
+    ("Ebecquerel3", "Ebecquerel", "", 3, True),
+    ("zbecquerel2", "zbecquerel", "", 2, True),
+    ("zbecquerel3", "zbecquerel", "", 3, True),
+    ("Mbecquerel2", "Mbecquerel", "", 2, True),
+    ("Mbecquerel3", "Mbecquerel", "", 3, True),
+    ("kbecquerel2", "kbecquerel", "", 2, True),
+    ("kbecquerel3", "kbecquerel", "", 3, True),
+    ("Ybecquerel2", "Ybecquerel", "", 2, True),
+    ("Ybecquerel3", "Ybecquerel", "", 3, True),
+    ("agray2", "agray", "", 2, True),
+    ("agray3", "agray", "", 3, True),
+    ("cgray2", "cgray", "", 2, False),
+    ("cgray3", "cgray", "", 3, False),
+    ("Zgray2", "Zgray", "", 2, True),
+    ("Zgray3", "Zgray", "", 3, True),
+    ("Pgray2", "Pgray", "", 2, True),
+    ("Pgray3", "Pgray", "", 3, True),
+    ("dgray2", "dgray", "", 2, False),
+    ("dgray3", "dgray", "", 3, False),
+    ("Ggray2", "Ggray", "", 2, True),
+    ("Ggray3", "Ggray", "", 3, True),
+    ("fgray2", "fgray", "", 2, True),
+    ("fgray3", "fgray", "", 3, True),
+    ("hgray2", "hgray", "", 2, False),
+    ("hgray3", "hgray", "", 3, False),
+    ("dagray2", "dagray", "", 2, False),
+    ("dagray3", "dagray", "", 3, False),
+    ("mgray2", "mgray", "", 2, True),
+    ("mgray3", "mgray", "", 3, True),
+    ("ngray2", "ngray", "", 2, True),
+    ("ngray3", "ngray", "", 3, True),
+    ("pgray2", "pgray", "", 2, True),
+    ("pgray3", "pgray", "", 3, True),
+    ("ugray2", "ugray", "", 2, True),
+    ("ugray3", "ugray", "", 3, True),
+    ("Tgray2", "Tgray", "", 2, True),
+    ("Tgray3", "Tgray", "", 3, True),
+    ("ygray2", "ygray", "", 2, True),
+    ("ygray3", "ygray", "", 3, True),
+    ("Egray2", "Egray", "", 2, True),
+    ("Egray3", "Egray", "", 3, True),
+    ("zgray2", "zgray", "", 2, True),
+    ("zgray3", "zgray", "", 3, True),
+    ("Mgray2", "Mgray", "", 2, True),
+    ("Mgray3", "Mgray", "", 3, True),
+    ("kgray2", "kgray", "", 2, True),
+    ("kgray3", "kgray", "", 3, True),
+    ("Ygray2", "Ygray", "", 2, True),
+    ("Ygray3", "Ygray", "", 3, True),
+    ("asievert2", "asievert", "", 2, True),
+    ("asievert3", "asievert", "", 3, True),
+    ("csievert2", "csievert", "", 2, False),
+    ("csievert3", "csievert", "", 3, False),
+    ("Zsievert2", "Zsievert", "", 2, True),
+    ("Zsievert3", "Zsievert", "", 3, True),
+    ("Psievert2", "Psievert", "", 2, True),
+    ("Psievert3", "Psievert", "", 3, True),
+    ("dsievert2", "dsievert", "", 2, False),
+    ("dsievert3", "dsievert", "", 3, False),
+    ("Gsievert2", "Gsievert", "", 2, True),
+    ("Gsievert3", "Gsievert", "", 3, True),
+    ("fsievert2", "fsievert", "", 2, True),
+    ("fsievert3", "fsievert", "", 3, True),
+    ("hsievert2", "hsievert", "", 2, False),
+    ("hsievert3", "hsievert", "", 3, False),
+    ("dasievert2", "dasievert", "", 2, False),
+    ("dasievert3", "dasievert", "", 3, False),
+    ("msievert2", "msievert", "", 2, True),
+    ("msievert3", "msievert", "", 3, True),
+    ("nsievert2", "nsievert", "", 2, True),
+    ("nsievert3", "nsievert", "", 3, True),
+    ("psievert2", "psievert", "", 2, True),
+    ("psievert3", "psievert", "", 3, True),
+    ("usievert2", "usievert", "", 2, True),
+    ("usievert3", "usievert", "", 3, True),
+    ("Tsievert2", "Tsievert", "", 2, True),
+    ("Tsievert3", "Tsievert", "", 3, True),
+    ("ysievert2", "ysievert", "", 2, True),
+    ("ysievert3", "ysievert", "", 3, True),
+    ("Esievert2", "Esievert", "", 2, True),
+    ("Esievert3", "Esievert", "", 3, True),
+    ("zsievert2", "zsievert", "", 2, True),
+    ("zsievert3", "zsievert", "", 3, True),
+    ("Msievert2", "Msievert", "", 2, True),
+    ("Msievert3", "Msievert", "", 3, True),
+    ("ksievert2", "ksievert", "", 2, True),
+    ("ksievert3", "ksievert", "", 3, True),
+    ("Ysievert2", "Ysievert", "", 2, True),
+    ("Ysievert3", "Ysievert", "", 3, True),
+    ("akatal2", "akatal", "", 2, True),
+    ("akatal3", "akatal", "", 3, True),
+    ("ckatal2", "ckatal", "", 2, False),
+    ("ckatal3", "ckatal", "", 3, False),
+    ("Zkatal2", "Zkatal", "", 2, True),
+    ("Zkatal3", "Zkatal", "", 3, True),
+    ("Pkatal2", "Pkatal", "", 2, True),
+    ("Pkatal3", "Pkatal", "", 3, True),
+    ("dkatal2", "dkatal", "", 2, False),
+    ("dkatal3", "dkatal", "", 3, False),
+    ("Gkatal2", "Gkatal", "", 2, True),
+    ("Gkatal3", "Gkatal", "", 3, True),
+    ("fkatal2", "fkatal", "", 2, True),
+    ("fkatal3", "fkatal", "", 3, True),
+    ("hkatal2", "hkatal", "", 2, False),
+    ("hkatal3", "hkatal", "", 3, False),
+    ("dakatal2", "dakatal", "", 2, False),
+    ("dakatal3", "dakatal", "", 3, False),
+    ("mkatal2", "mkatal", "", 2, True),
+    ("mkatal3", "mkatal", "", 3, True),
+    ("nkatal2", "nkatal", "", 2, True),
+    ("nkatal3", "nkatal", "", 3, True),
+    ("pkatal2", "pkatal", "", 2, True),
+    ("pkatal3", "pkatal", "", 3, True),
+    ("ukatal2", "ukatal", "", 2, True),
+    ("ukatal3", "ukatal", "", 3, True),
+    ("Tkatal2", "Tkatal", "", 2, True),
+    ("Tkatal3", "Tkatal", "", 3, True),
+    ("ykatal2", "ykatal", "", 2, True),
+    ("ykatal3", "ykatal", "", 3, True),
+    ("Ekatal2", "Ekatal", "", 2, True),
+    ("Ekatal3", "Ekatal", "", 3, True),
+    ("zkatal2", "zkatal", "", 2, True),
+    ("zkatal3", "zkatal", "", 3, True),
+    ("Mkatal2", "Mkatal", "", 2, True),
+    ("Mkatal3", "Mkatal", "", 3, True),
+    ("kkatal2", "kkatal", "", 2, True),
+    ("kkatal3", "kkatal", "", 3, True),
+    ("Ykatal2", "Ykatal", "", 2, True),
+    ("Ykatal3", "Ykatal", "", 3, True),
     ]
 
 
-Unit.automatically_register_units = True
-
-map(standard_unit_register.add, base_units + scaled_units + powered_units)
-map(additional_unit_register.add, additional_units)
+#: Names of all units (including units that have not been created yet)
+
+all_units = [
+    "metre",
+    "meter",
+    "gram",
+    "second",
+    "amp",
+    "kelvin",
+    "mole",
+    "candle",
+    "gramme",
+    "kilogram",
+    "radian",
+    "steradian",
+    "hertz",
+    "newton",
+    "pascal",
+    "joule",
+    "watt",
+    "coulomb",
+    "volt",
+    "farad",
+    "ohm",
+    "siemens",
+    "weber",
+    "tesla",
+    "henry",
+    "celsius",
+    "lumen",
+    "lux",
+    "becquerel",
+    "gray",
+    "sievert",
+    "katal",
+    "ametre",
+    "cmetre",
+    "Zmetre",
+    "Pmetre",
+    "dmetre",
+    "Gmetre",
+    "fmetre",
+    "hmetre",
+    "dametre",
+    "mmetre",
+    "nmetre",
+    "pmetre",
+    "umetre",
+    "Tmetre",
+    "ymetre",
+    "Emetre",
+    "zmetre",
+    "Mmetre",
+    "kmetre",
+    "Ymetre",
+    "ameter",
+    "cmeter",
+    "Zmeter",
+    "Pmeter",
+    "dmeter",
+    "Gmeter",
+    "fmeter",
+    "hmeter",
+    "dameter",
+    "mmeter",
+    "nmeter",
+    "pmeter",
+    "umeter",
+    "Tmeter",
+    "ymeter",
+    "Emeter",
+    "zmeter",
+    "Mmeter",
+    "kmeter",
+    "Ymeter",
+    "agram",
+    "cgram",
+    "Zgram",
+    "Pgram",
+    "dgram",
+    "Ggram",
+    "fgram",
+    "hgram",
+    "dagram",
+    "mgram",
+    "ngram",
+    "pgram",
+    "ugram",
+    "Tgram",
+    "ygram",
+    "Egram",
+    "zgram",
+    "Mgram",
+    "kgram",
+    "Ygram",
+    "asecond",
+    "csecond",
+    "Zsecond",
+    "Psecond",
+    "dsecond",
+    "Gsecond",
+    "fsecond",
+    "hsecond",
+    "dasecond",
+    "msecond",
+    "nsecond",
+    "psecond",
+    "usecond",
+    "Tsecond",
+    "ysecond",
+    "Esecond",
+    "zsecond",
+    "Msecond",
+    "ksecond",
+    "Ysecond",
+    "aamp",
+    "camp",
+    "Zamp",
+    "Pamp",
+    "damp",
+    "Gamp",
+    "famp",
+    "hamp",
+    "daamp",
+    "mamp",
+    "namp",
+    "pamp",
+    "uamp",
+    "Tamp",
+    "yamp",
+    "Eamp",
+    "zamp",
+    "Mamp",
+    "kamp",
+    "Yamp",
+    "akelvin",
+    "ckelvin",
+    "Zkelvin",
+    "Pkelvin",
+    "dkelvin",
+    "Gkelvin",
+    "fkelvin",
+    "hkelvin",
+    "dakelvin",
+    "mkelvin",
+    "nkelvin",
+    "pkelvin",
+    "ukelvin",
+    "Tkelvin",
+    "ykelvin",
+    "Ekelvin",
+    "zkelvin",
+    "Mkelvin",
+    "kkelvin",
+    "Ykelvin",
+    "amole",
+    "cmole",
+    "Zmole",
+    "Pmole",
+    "dmole",
+    "Gmole",
+    "fmole",
+    "hmole",
+    "damole",
+    "mmole",
+    "nmole",
+    "pmole",
+    "umole",
+    "Tmole",
+    "ymole",
+    "Emole",
+    "zmole",
+    "Mmole",
+    "kmole",
+    "Ymole",
+    "acandle",
+    "ccandle",
+    "Zcandle",
+    "Pcandle",
+    "dcandle",
+    "Gcandle",
+    "fcandle",
+    "hcandle",
+    "dacandle",
+    "mcandle",
+    "ncandle",
+    "pcandle",
+    "ucandle",
+    "Tcandle",
+    "ycandle",
+    "Ecandle",
+    "zcandle",
+    "Mcandle",
+    "kcandle",
+    "Ycandle",
+    "agramme",
+    "cgramme",
+    "Zgramme",
+    "Pgramme",
+    "dgramme",
+    "Ggramme",
+    "fgramme",
+    "hgramme",
+    "dagramme",
+    "mgramme",
+    "ngramme",
+    "pgramme",
+    "ugramme",
+    "Tgramme",
+    "ygramme",
+    "Egramme",
+    "zgramme",
+    "Mgramme",
+    "kgramme",
+    "Ygramme",
+    "akilogram",
+    "ckilogram",
+    "Zkilogram",
+    "Pkilogram",
+    "dkilogram",
+    "Gkilogram",
+    "fkilogram",
+    "hkilogram",
+    "dakilogram",
+    "mkilogram",
+    "nkilogram",
+    "pkilogram",
+    "ukilogram",
+    "Tkilogram",
+    "ykilogram",
+    "Ekilogram",
+    "zkilogram",
+    "Mkilogram",
+    "kkilogram",
+    "Ykilogram",
+    "aradian",
+    "cradian",
+    "Zradian",
+    "Pradian",
+    "dradian",
+    "Gradian",
+    "fradian",
+    "hradian",
+    "daradian",
+    "mradian",
+    "nradian",
+    "pradian",
+    "uradian",
+    "Tradian",
+    "yradian",
+    "Eradian",
+    "zradian",
+    "Mradian",
+    "kradian",
+    "Yradian",
+    "asteradian",
+    "csteradian",
+    "Zsteradian",
+    "Psteradian",
+    "dsteradian",
+    "Gsteradian",
+    "fsteradian",
+    "hsteradian",
+    "dasteradian",
+    "msteradian",
+    "nsteradian",
+    "psteradian",
+    "usteradian",
+    "Tsteradian",
+    "ysteradian",
+    "Esteradian",
+    "zsteradian",
+    "Msteradian",
+    "ksteradian",
+    "Ysteradian",
+    "ahertz",
+    "chertz",
+    "Zhertz",
+    "Phertz",
+    "dhertz",
+    "Ghertz",
+    "fhertz",
+    "hhertz",
+    "dahertz",
+    "mhertz",
+    "nhertz",
+    "phertz",
+    "uhertz",
+    "Thertz",
+    "yhertz",
+    "Ehertz",
+    "zhertz",
+    "Mhertz",
+    "khertz",
+    "Yhertz",
+    "anewton",
+    "cnewton",
+    "Znewton",
+    "Pnewton",
+    "dnewton",
+    "Gnewton",
+    "fnewton",
+    "hnewton",
+    "danewton",
+    "mnewton",
+    "nnewton",
+    "pnewton",
+    "unewton",
+    "Tnewton",
+    "ynewton",
+    "Enewton",
+    "znewton",
+    "Mnewton",
+    "knewton",
+    "Ynewton",
+    "apascal",
+    "cpascal",
+    "Zpascal",
+    "Ppascal",
+    "dpascal",
+    "Gpascal",
+    "fpascal",
+    "hpascal",
+    "dapascal",
+    "mpascal",
+    "npascal",
+    "ppascal",
+    "upascal",
+    "Tpascal",
+    "ypascal",
+    "Epascal",
+    "zpascal",
+    "Mpascal",
+    "kpascal",
+    "Ypascal",
+    "ajoule",
+    "cjoule",
+    "Zjoule",
+    "Pjoule",
+    "djoule",
+    "Gjoule",
+    "fjoule",
+    "hjoule",
+    "dajoule",
+    "mjoule",
+    "njoule",
+    "pjoule",
+    "ujoule",
+    "Tjoule",
+    "yjoule",
+    "Ejoule",
+    "zjoule",
+    "Mjoule",
+    "kjoule",
+    "Yjoule",
+    "awatt",
+    "cwatt",
+    "Zwatt",
+    "Pwatt",
+    "dwatt",
+    "Gwatt",
+    "fwatt",
+    "hwatt",
+    "dawatt",
+    "mwatt",
+    "nwatt",
+    "pwatt",
+    "uwatt",
+    "Twatt",
+    "ywatt",
+    "Ewatt",
+    "zwatt",
+    "Mwatt",
+    "kwatt",
+    "Ywatt",
+    "acoulomb",
+    "ccoulomb",
+    "Zcoulomb",
+    "Pcoulomb",
+    "dcoulomb",
+    "Gcoulomb",
+    "fcoulomb",
+    "hcoulomb",
+    "dacoulomb",
+    "mcoulomb",
+    "ncoulomb",
+    "pcoulomb",
+    "ucoulomb",
+    "Tcoulomb",
+    "ycoulomb",
+    "Ecoulomb",
+    "zcoulomb",
+    "Mcoulomb",
+    "kcoulomb",
+    "Ycoulomb",
+    "avolt",
+    "cvolt",
+    "Zvolt",
+    "Pvolt",
+    "dvolt",
+    "Gvolt",
+    "fvolt",
+    "hvolt",
+    "davolt",
+    "mvolt",
+    "nvolt",
+    "pvolt",
+    "uvolt",
+    "Tvolt",
+    "yvolt",
+    "Evolt",
+    "zvolt",
+    "Mvolt",
+    "kvolt",
+    "Yvolt",
+    "afarad",
+    "cfarad",
+    "Zfarad",
+    "Pfarad",
+    "dfarad",
+    "Gfarad",
+    "ffarad",
+    "hfarad",
+    "dafarad",
+    "mfarad",
+    "nfarad",
+    "pfarad",
+    "ufarad",
+    "Tfarad",
+    "yfarad",
+    "Efarad",
+    "zfarad",
+    "Mfarad",
+    "kfarad",
+    "Yfarad",
+    "aohm",
+    "cohm",
+    "Zohm",
+    "Pohm",
+    "dohm",
+    "Gohm",
+    "fohm",
+    "hohm",
+    "daohm",
+    "mohm",
+    "nohm",
+    "pohm",
+    "uohm",
+    "Tohm",
+    "yohm",
+    "Eohm",
+    "zohm",
+    "Mohm",
+    "kohm",
+    "Yohm",
+    "asiemens",
+    "csiemens",
+    "Zsiemens",
+    "Psiemens",
+    "dsiemens",
+    "Gsiemens",
+    "fsiemens",
+    "hsiemens",
+    "dasiemens",
+    "msiemens",
+    "nsiemens",
+    "psiemens",
+    "usiemens",
+    "Tsiemens",
+    "ysiemens",
+    "Esiemens",
+    "zsiemens",
+    "Msiemens",
+    "ksiemens",
+    "Ysiemens",
+    "aweber",
+    "cweber",
+    "Zweber",
+    "Pweber",
+    "dweber",
+    "Gweber",
+    "fweber",
+    "hweber",
+    "daweber",
+    "mweber",
+    "nweber",
+    "pweber",
+    "uweber",
+    "Tweber",
+    "yweber",
+    "Eweber",
+    "zweber",
+    "Mweber",
+    "kweber",
+    "Yweber",
+    "atesla",
+    "ctesla",
+    "Ztesla",
+    "Ptesla",
+    "dtesla",
+    "Gtesla",
+    "ftesla",
+    "htesla",
+    "datesla",
+    "mtesla",
+    "ntesla",
+    "ptesla",
+    "utesla",
+    "Ttesla",
+    "ytesla",
+    "Etesla",
+    "ztesla",
+    "Mtesla",
+    "ktesla",
+    "Ytesla",
+    "ahenry",
+    "chenry",
+    "Zhenry",
+    "Phenry",
+    "dhenry",
+    "Ghenry",
+    "fhenry",
+    "hhenry",
+    "dahenry",
+    "mhenry",
+    "nhenry",
+    "phenry",
+    "uhenry",
+    "Thenry",
+    "yhenry",
+    "Ehenry",
+    "zhenry",
+    "Mhenry",
+    "khenry",
+    "Yhenry",
+    "acelsius",
+    "ccelsius",
+    "Zcelsius",
+    "Pcelsius",
+    "dcelsius",
+    "Gcelsius",
+    "fcelsius",
+    "hcelsius",
+    "dacelsius",
+    "mcelsius",
+    "ncelsius",
+    "pcelsius",
+    "ucelsius",
+    "Tcelsius",
+    "ycelsius",
+    "Ecelsius",
+    "zcelsius",
+    "Mcelsius",
+    "kcelsius",
+    "Ycelsius",
+    "alumen",
+    "clumen",
+    "Zlumen",
+    "Plumen",
+    "dlumen",
+    "Glumen",
+    "flumen",
+    "hlumen",
+    "dalumen",
+    "mlumen",
+    "nlumen",
+    "plumen",
+    "ulumen",
+    "Tlumen",
+    "ylumen",
+    "Elumen",
+    "zlumen",
+    "Mlumen",
+    "klumen",
+    "Ylumen",
+    "alux",
+    "clux",
+    "Zlux",
+    "Plux",
+    "dlux",
+    "Glux",
+    "flux",
+    "hlux",
+    "dalux",
+    "mlux",
+    "nlux",
+    "plux",
+    "ulux",
+    "Tlux",
+    "ylux",
+    "Elux",
+    "zlux",
+    "Mlux",
+    "klux",
+    "Ylux",
+    "abecquerel",
+    "cbecquerel",
+    "Zbecquerel",
+    "Pbecquerel",
+    "dbecquerel",
+    "Gbecquerel",
+    "fbecquerel",
+    "hbecquerel",
+    "dabecquerel",
+    "mbecquerel",
+    "nbecquerel",
+    "pbecquerel",
+    "ubecquerel",
+    "Tbecquerel",
+    "ybecquerel",
+    "Ebecquerel",
+    "zbecquerel",
+    "Mbecquerel",
+    "kbecquerel",
+    "Ybecquerel",
+    "agray",
+    "cgray",
+    "Zgray",
+    "Pgray",
+    "dgray",
+    "Ggray",
+    "fgray",
+    "hgray",
+    "dagray",
+    "mgray",
+    "ngray",
+    "pgray",
+    "ugray",
+    "Tgray",
+    "ygray",
+    "Egray",
+    "zgray",
+    "Mgray",
+    "kgray",
+    "Ygray",
+    "asievert",
+    "csievert",
+    "Zsievert",
+    "Psievert",
+    "dsievert",
+    "Gsievert",
+    "fsievert",
+    "hsievert",
+    "dasievert",
+    "msievert",
+    "nsievert",
+    "psievert",
+    "usievert",
+    "Tsievert",
+    "ysievert",
+    "Esievert",
+    "zsievert",
+    "Msievert",
+    "ksievert",
+    "Ysievert",
+    "akatal",
+    "ckatal",
+    "Zkatal",
+    "Pkatal",
+    "dkatal",
+    "Gkatal",
+    "fkatal",
+    "hkatal",
+    "dakatal",
+    "mkatal",
+    "nkatal",
+    "pkatal",
+    "ukatal",
+    "Tkatal",
+    "ykatal",
+    "Ekatal",
+    "zkatal",
+    "Mkatal",
+    "kkatal",
+    "Ykatal",
+    "metre2",
+    "metre3",
+    "meter2",
+    "meter3",
+    "gram2",
+    "gram3",
+    "second2",
+    "second3",
+    "amp2",
+    "amp3",
+    "kelvin2",
+    "kelvin3",
+    "mole2",
+    "mole3",
+    "candle2",
+    "candle3",
+    "gramme2",
+    "gramme3",
+    "kilogram2",
+    "kilogram3",
+    "radian2",
+    "radian3",
+    "steradian2",
+    "steradian3",
+    "hertz2",
+    "hertz3",
+    "newton2",
+    "newton3",
+    "pascal2",
+    "pascal3",
+    "joule2",
+    "joule3",
+    "watt2",
+    "watt3",
+    "coulomb2",
+    "coulomb3",
+    "volt2",
+    "volt3",
+    "farad2",
+    "farad3",
+    "ohm2",
+    "ohm3",
+    "siemens2",
+    "siemens3",
+    "weber2",
+    "weber3",
+    "tesla2",
+    "tesla3",
+    "henry2",
+    "henry3",
+    "celsius2",
+    "celsius3",
+    "lumen2",
+    "lumen3",
+    "lux2",
+    "lux3",
+    "becquerel2",
+    "becquerel3",
+    "gray2",
+    "gray3",
+    "sievert2",
+    "sievert3",
+    "katal2",
+    "katal3",
+    "ametre2",
+    "ametre3",
+    "cmetre2",
+    "cmetre3",
+    "Zmetre2",
+    "Zmetre3",
+    "Pmetre2",
+    "Pmetre3",
+    "dmetre2",
+    "dmetre3",
+    "Gmetre2",
+    "Gmetre3",
+    "fmetre2",
+    "fmetre3",
+    "hmetre2",
+    "hmetre3",
+    "dametre2",
+    "dametre3",
+    "mmetre2",
+    "mmetre3",
+    "nmetre2",
+    "nmetre3",
+    "pmetre2",
+    "pmetre3",
+    "umetre2",
+    "umetre3",
+    "Tmetre2",
+    "Tmetre3",
+    "ymetre2",
+    "ymetre3",
+    "Emetre2",
+    "Emetre3",
+    "zmetre2",
+    "zmetre3",
+    "Mmetre2",
+    "Mmetre3",
+    "kmetre2",
+    "kmetre3",
+    "Ymetre2",
+    "Ymetre3",
+    "ameter2",
+    "ameter3",
+    "cmeter2",
+    "cmeter3",
+    "Zmeter2",
+    "Zmeter3",
+    "Pmeter2",
+    "Pmeter3",
+    "dmeter2",
+    "dmeter3",
+    "Gmeter2",
+    "Gmeter3",
+    "fmeter2",
+    "fmeter3",
+    "hmeter2",
+    "hmeter3",
+    "dameter2",
+    "dameter3",
+    "mmeter2",
+    "mmeter3",
+    "nmeter2",
+    "nmeter3",
+    "pmeter2",
+    "pmeter3",
+    "umeter2",
+    "umeter3",
+    "Tmeter2",
+    "Tmeter3",
+    "ymeter2",
+    "ymeter3",
+    "Emeter2",
+    "Emeter3",
+    "zmeter2",
+    "zmeter3",
+    "Mmeter2",
+    "Mmeter3",
+    "kmeter2",
+    "kmeter3",
+    "Ymeter2",
+    "Ymeter3",
+    "agram2",
+    "agram3",
+    "cgram2",
+    "cgram3",
+    "Zgram2",
+    "Zgram3",
+    "Pgram2",
+    "Pgram3",
+    "dgram2",
+    "dgram3",
+    "Ggram2",
+    "Ggram3",
+    "fgram2",
+    "fgram3",
+    "hgram2",
+    "hgram3",
+    "dagram2",
+    "dagram3",
+    "mgram2",
+    "mgram3",
+    "ngram2",
+    "ngram3",
+    "pgram2",
+    "pgram3",
+    "ugram2",
+    "ugram3",
+    "Tgram2",
+    "Tgram3",
+    "ygram2",
+    "ygram3",
+    "Egram2",
+    "Egram3",
+    "zgram2",
+    "zgram3",
+    "Mgram2",
+    "Mgram3",
+    "kgram2",
+    "kgram3",
+    "Ygram2",
+    "Ygram3",
+    "asecond2",
+    "asecond3",
+    "csecond2",
+    "csecond3",
+    "Zsecond2",
+    "Zsecond3",
+    "Psecond2",
+    "Psecond3",
+    "dsecond2",
+    "dsecond3",
+    "Gsecond2",
+    "Gsecond3",
+    "fsecond2",
+    "fsecond3",
+    "hsecond2",
+    "hsecond3",
+    "dasecond2",
+    "dasecond3",
+    "msecond2",
+    "msecond3",
+    "nsecond2",
+    "nsecond3",
+    "psecond2",
+    "psecond3",
+    "usecond2",
+    "usecond3",
+    "Tsecond2",
+    "Tsecond3",
+    "ysecond2",
+    "ysecond3",
+    "Esecond2",
+    "Esecond3",
+    "zsecond2",
+    "zsecond3",
+    "Msecond2",
+    "Msecond3",
+    "ksecond2",
+    "ksecond3",
+    "Ysecond2",
+    "Ysecond3",
+    "aamp2",
+    "aamp3",
+    "camp2",
+    "camp3",
+    "Zamp2",
+    "Zamp3",
+    "Pamp2",
+    "Pamp3",
+    "damp2",
+    "damp3",
+    "Gamp2",
+    "Gamp3",
+    "famp2",
+    "famp3",
+    "hamp2",
+    "hamp3",
+    "daamp2",
+    "daamp3",
+    "mamp2",
+    "mamp3",
+    "namp2",
+    "namp3",
+    "pamp2",
+    "pamp3",
+    "uamp2",
+    "uamp3",
+    "Tamp2",
+    "Tamp3",
+    "yamp2",
+    "yamp3",
+    "Eamp2",
+    "Eamp3",
+    "zamp2",
+    "zamp3",
+    "Mamp2",
+    "Mamp3",
+    "kamp2",
+    "kamp3",
+    "Yamp2",
+    "Yamp3",
+    "akelvin2",
+    "akelvin3",
+    "ckelvin2",
+    "ckelvin3",
+    "Zkelvin2",
+    "Zkelvin3",
+    "Pkelvin2",
+    "Pkelvin3",
+    "dkelvin2",
+    "dkelvin3",
+    "Gkelvin2",
+    "Gkelvin3",
+    "fkelvin2",
+    "fkelvin3",
+    "hkelvin2",
+    "hkelvin3",
+    "dakelvin2",
+    "dakelvin3",
+    "mkelvin2",
+    "mkelvin3",
+    "nkelvin2",
+    "nkelvin3",
+    "pkelvin2",
+    "pkelvin3",
+    "ukelvin2",
+    "ukelvin3",
+    "Tkelvin2",
+    "Tkelvin3",
+    "ykelvin2",
+    "ykelvin3",
+    "Ekelvin2",
+    "Ekelvin3",
+    "zkelvin2",
+    "zkelvin3",
+    "Mkelvin2",
+    "Mkelvin3",
+    "kkelvin2",
+    "kkelvin3",
+    "Ykelvin2",
+    "Ykelvin3",
+    "amole2",
+    "amole3",
+    "cmole2",
+    "cmole3",
+    "Zmole2",
+    "Zmole3",
+    "Pmole2",
+    "Pmole3",
+    "dmole2",
+    "dmole3",
+    "Gmole2",
+    "Gmole3",
+    "fmole2",
+    "fmole3",
+    "hmole2",
+    "hmole3",
+    "damole2",
+    "damole3",
+    "mmole2",
+    "mmole3",
+    "nmole2",
+    "nmole3",
+    "pmole2",
+    "pmole3",
+    "umole2",
+    "umole3",
+    "Tmole2",
+    "Tmole3",
+    "ymole2",
+    "ymole3",
+    "Emole2",
+    "Emole3",
+    "zmole2",
+    "zmole3",
+    "Mmole2",
+    "Mmole3",
+    "kmole2",
+    "kmole3",
+    "Ymole2",
+    "Ymole3",
+    "acandle2",
+    "acandle3",
+    "ccandle2",
+    "ccandle3",
+    "Zcandle2",
+    "Zcandle3",
+    "Pcandle2",
+    "Pcandle3",
+    "dcandle2",
+    "dcandle3",
+    "Gcandle2",
+    "Gcandle3",
+    "fcandle2",
+    "fcandle3",
+    "hcandle2",
+    "hcandle3",
+    "dacandle2",
+    "dacandle3",
+    "mcandle2",
+    "mcandle3",
+    "ncandle2",
+    "ncandle3",
+    "pcandle2",
+    "pcandle3",
+    "ucandle2",
+    "ucandle3",
+    "Tcandle2",
+    "Tcandle3",
+    "ycandle2",
+    "ycandle3",
+    "Ecandle2",
+    "Ecandle3",
+    "zcandle2",
+    "zcandle3",
+    "Mcandle2",
+    "Mcandle3",
+    "kcandle2",
+    "kcandle3",
+    "Ycandle2",
+    "Ycandle3",
+    "agramme2",
+    "agramme3",
+    "cgramme2",
+    "cgramme3",
+    "Zgramme2",
+    "Zgramme3",
+    "Pgramme2",
+    "Pgramme3",
+    "dgramme2",
+    "dgramme3",
+    "Ggramme2",
+    "Ggramme3",
+    "fgramme2",
+    "fgramme3",
+    "hgramme2",
+    "hgramme3",
+    "dagramme2",
+    "dagramme3",
+    "mgramme2",
+    "mgramme3",
+    "ngramme2",
+    "ngramme3",
+    "pgramme2",
+    "pgramme3",
+    "ugramme2",
+    "ugramme3",
+    "Tgramme2",
+    "Tgramme3",
+    "ygramme2",
+    "ygramme3",
+    "Egramme2",
+    "Egramme3",
+    "zgramme2",
+    "zgramme3",
+    "Mgramme2",
+    "Mgramme3",
+    "kgramme2",
+    "kgramme3",
+    "Ygramme2",
+    "Ygramme3",
+    "akilogram2",
+    "akilogram3",
+    "ckilogram2",
+    "ckilogram3",
+    "Zkilogram2",
+    "Zkilogram3",
+    "Pkilogram2",
+    "Pkilogram3",
+    "dkilogram2",
+    "dkilogram3",
+    "Gkilogram2",
+    "Gkilogram3",
+    "fkilogram2",
+    "fkilogram3",
+    "hkilogram2",
+    "hkilogram3",
+    "dakilogram2",
+    "dakilogram3",
+    "mkilogram2",
+    "mkilogram3",
+    "nkilogram2",
+    "nkilogram3",
+    "pkilogram2",
+    "pkilogram3",
+    "ukilogram2",
+    "ukilogram3",
+    "Tkilogram2",
+    "Tkilogram3",
+    "ykilogram2",
+    "ykilogram3",
+    "Ekilogram2",
+    "Ekilogram3",
+    "zkilogram2",
+    "zkilogram3",
+    "Mkilogram2",
+    "Mkilogram3",
+    "kkilogram2",
+    "kkilogram3",
+    "Ykilogram2",
+    "Ykilogram3",
+    "aradian2",
+    "aradian3",
+    "cradian2",
+    "cradian3",
+    "Zradian2",
+    "Zradian3",
+    "Pradian2",
+    "Pradian3",
+    "dradian2",
+    "dradian3",
+    "Gradian2",
+    "Gradian3",
+    "fradian2",
+    "fradian3",
+    "hradian2",
+    "hradian3",
+    "daradian2",
+    "daradian3",
+    "mradian2",
+    "mradian3",
+    "nradian2",
+    "nradian3",
+    "pradian2",
+    "pradian3",
+    "uradian2",
+    "uradian3",
+    "Tradian2",
+    "Tradian3",
+    "yradian2",
+    "yradian3",
+    "Eradian2",
+    "Eradian3",
+    "zradian2",
+    "zradian3",
+    "Mradian2",
+    "Mradian3",
+    "kradian2",
+    "kradian3",
+    "Yradian2",
+    "Yradian3",
+    "asteradian2",
+    "asteradian3",
+    "csteradian2",
+    "csteradian3",
+    "Zsteradian2",
+    "Zsteradian3",
+    "Psteradian2",
+    "Psteradian3",
+    "dsteradian2",
+    "dsteradian3",
+    "Gsteradian2",
+    "Gsteradian3",
+    "fsteradian2",
+    "fsteradian3",
+    "hsteradian2",
+    "hsteradian3",
+    "dasteradian2",
+    "dasteradian3",
+    "msteradian2",
+    "msteradian3",
+    "nsteradian2",
+    "nsteradian3",
+    "psteradian2",
+    "psteradian3",
+    "usteradian2",
+    "usteradian3",
+    "Tsteradian2",
+    "Tsteradian3",
+    "ysteradian2",
+    "ysteradian3",
+    "Esteradian2",
+    "Esteradian3",
+    "zsteradian2",
+    "zsteradian3",
+    "Msteradian2",
+    "Msteradian3",
+    "ksteradian2",
+    "ksteradian3",
+    "Ysteradian2",
+    "Ysteradian3",
+    "ahertz2",
+    "ahertz3",
+    "chertz2",
+    "chertz3",
+    "Zhertz2",
+    "Zhertz3",
+    "Phertz2",
+    "Phertz3",
+    "dhertz2",
+    "dhertz3",
+    "Ghertz2",
+    "Ghertz3",
+    "fhertz2",
+    "fhertz3",
+    "hhertz2",
+    "hhertz3",
+    "dahertz2",
+    "dahertz3",
+    "mhertz2",
+    "mhertz3",
+    "nhertz2",
+    "nhertz3",
+    "phertz2",
+    "phertz3",
+    "uhertz2",
+    "uhertz3",
+    "Thertz2",
+    "Thertz3",
+    "yhertz2",
+    "yhertz3",
+    "Ehertz2",
+    "Ehertz3",
+    "zhertz2",
+    "zhertz3",
+    "Mhertz2",
+    "Mhertz3",
+    "khertz2",
+    "khertz3",
+    "Yhertz2",
+    "Yhertz3",
+    "anewton2",
+    "anewton3",
+    "cnewton2",
+    "cnewton3",
+    "Znewton2",
+    "Znewton3",
+    "Pnewton2",
+    "Pnewton3",
+    "dnewton2",
+    "dnewton3",
+    "Gnewton2",
+    "Gnewton3",
+    "fnewton2",
+    "fnewton3",
+    "hnewton2",
+    "hnewton3",
+    "danewton2",
+    "danewton3",
+    "mnewton2",
+    "mnewton3",
+    "nnewton2",
+    "nnewton3",
+    "pnewton2",
+    "pnewton3",
+    "unewton2",
+    "unewton3",
+    "Tnewton2",
+    "Tnewton3",
+    "ynewton2",
+    "ynewton3",
+    "Enewton2",
+    "Enewton3",
+    "znewton2",
+    "znewton3",
+    "Mnewton2",
+    "Mnewton3",
+    "knewton2",
+    "knewton3",
+    "Ynewton2",
+    "Ynewton3",
+    "apascal2",
+    "apascal3",
+    "cpascal2",
+    "cpascal3",
+    "Zpascal2",
+    "Zpascal3",
+    "Ppascal2",
+    "Ppascal3",
+    "dpascal2",
+    "dpascal3",
+    "Gpascal2",
+    "Gpascal3",
+    "fpascal2",
+    "fpascal3",
+    "hpascal2",
+    "hpascal3",
+    "dapascal2",
+    "dapascal3",
+    "mpascal2",
+    "mpascal3",
+    "npascal2",
+    "npascal3",
+    "ppascal2",
+    "ppascal3",
+    "upascal2",
+    "upascal3",
+    "Tpascal2",
+    "Tpascal3",
+    "ypascal2",
+    "ypascal3",
+    "Epascal2",
+    "Epascal3",
+    "zpascal2",
+    "zpascal3",
+    "Mpascal2",
+    "Mpascal3",
+    "kpascal2",
+    "kpascal3",
+    "Ypascal2",
+    "Ypascal3",
+    "ajoule2",
+    "ajoule3",
+    "cjoule2",
+    "cjoule3",
+    "Zjoule2",
+    "Zjoule3",
+    "Pjoule2",
+    "Pjoule3",
+    "djoule2",
+    "djoule3",
+    "Gjoule2",
+    "Gjoule3",
+    "fjoule2",
+    "fjoule3",
+    "hjoule2",
+    "hjoule3",
+    "dajoule2",
+    "dajoule3",
+    "mjoule2",
+    "mjoule3",
+    "njoule2",
+    "njoule3",
+    "pjoule2",
+    "pjoule3",
+    "ujoule2",
+    "ujoule3",
+    "Tjoule2",
+    "Tjoule3",
+    "yjoule2",
+    "yjoule3",
+    "Ejoule2",
+    "Ejoule3",
+    "zjoule2",
+    "zjoule3",
+    "Mjoule2",
+    "Mjoule3",
+    "kjoule2",
+    "kjoule3",
+    "Yjoule2",
+    "Yjoule3",
+    "awatt2",
+    "awatt3",
+    "cwatt2",
+    "cwatt3",
+    "Zwatt2",
+    "Zwatt3",
+    "Pwatt2",
+    "Pwatt3",
+    "dwatt2",
+    "dwatt3",
+    "Gwatt2",
+    "Gwatt3",
+    "fwatt2",
+    "fwatt3",
+    "hwatt2",
+    "hwatt3",
+    "dawatt2",
+    "dawatt3",
+    "mwatt2",
+    "mwatt3",
+    "nwatt2",
+    "nwatt3",
+    "pwatt2",
+    "pwatt3",
+    "uwatt2",
+    "uwatt3",
+    "Twatt2",
+    "Twatt3",
+    "ywatt2",
+    "ywatt3",
+    "Ewatt2",
+    "Ewatt3",
+    "zwatt2",
+    "zwatt3",
+    "Mwatt2",
+    "Mwatt3",
+    "kwatt2",
+    "kwatt3",
+    "Ywatt2",
+    "Ywatt3",
+    "acoulomb2",
+    "acoulomb3",
+    "ccoulomb2",
+    "ccoulomb3",
+    "Zcoulomb2",
+    "Zcoulomb3",
+    "Pcoulomb2",
+    "Pcoulomb3",
+    "dcoulomb2",
+    "dcoulomb3",
+    "Gcoulomb2",
+    "Gcoulomb3",
+    "fcoulomb2",
+    "fcoulomb3",
+    "hcoulomb2",
+    "hcoulomb3",
+    "dacoulomb2",
+    "dacoulomb3",
+    "mcoulomb2",
+    "mcoulomb3",
+    "ncoulomb2",
+    "ncoulomb3",
+    "pcoulomb2",
+    "pcoulomb3",
+    "ucoulomb2",
+    "ucoulomb3",
+    "Tcoulomb2",
+    "Tcoulomb3",
+    "ycoulomb2",
+    "ycoulomb3",
+    "Ecoulomb2",
+    "Ecoulomb3",
+    "zcoulomb2",
+    "zcoulomb3",
+    "Mcoulomb2",
+    "Mcoulomb3",
+    "kcoulomb2",
+    "kcoulomb3",
+    "Ycoulomb2",
+    "Ycoulomb3",
+    "avolt2",
+    "avolt3",
+    "cvolt2",
+    "cvolt3",
+    "Zvolt2",
+    "Zvolt3",
+    "Pvolt2",
+    "Pvolt3",
+    "dvolt2",
+    "dvolt3",
+    "Gvolt2",
+    "Gvolt3",
+    "fvolt2",
+    "fvolt3",
+    "hvolt2",
+    "hvolt3",
+    "davolt2",
+    "davolt3",
+    "mvolt2",
+    "mvolt3",
+    "nvolt2",
+    "nvolt3",
+    "pvolt2",
+    "pvolt3",
+    "uvolt2",
+    "uvolt3",
+    "Tvolt2",
+    "Tvolt3",
+    "yvolt2",
+    "yvolt3",
+    "Evolt2",
+    "Evolt3",
+    "zvolt2",
+    "zvolt3",
+    "Mvolt2",
+    "Mvolt3",
+    "kvolt2",
+    "kvolt3",
+    "Yvolt2",
+    "Yvolt3",
+    "afarad2",
+    "afarad3",
+    "cfarad2",
+    "cfarad3",
+    "Zfarad2",
+    "Zfarad3",
+    "Pfarad2",
+    "Pfarad3",
+    "dfarad2",
+    "dfarad3",
+    "Gfarad2",
+    "Gfarad3",
+    "ffarad2",
+    "ffarad3",
+    "hfarad2",
+    "hfarad3",
+    "dafarad2",
+    "dafarad3",
+    "mfarad2",
+    "mfarad3",
+    "nfarad2",
+    "nfarad3",
+    "pfarad2",
+    "pfarad3",
+    "ufarad2",
+    "ufarad3",
+    "Tfarad2",
+    "Tfarad3",
+    "yfarad2",
+    "yfarad3",
+    "Efarad2",
+    "Efarad3",
+    "zfarad2",
+    "zfarad3",
+    "Mfarad2",
+    "Mfarad3",
+    "kfarad2",
+    "kfarad3",
+    "Yfarad2",
+    "Yfarad3",
+    "aohm2",
+    "aohm3",
+    "cohm2",
+    "cohm3",
+    "Zohm2",
+    "Zohm3",
+    "Pohm2",
+    "Pohm3",
+    "dohm2",
+    "dohm3",
+    "Gohm2",
+    "Gohm3",
+    "fohm2",
+    "fohm3",
+    "hohm2",
+    "hohm3",
+    "daohm2",
+    "daohm3",
+    "mohm2",
+    "mohm3",
+    "nohm2",
+    "nohm3",
+    "pohm2",
+    "pohm3",
+    "uohm2",
+    "uohm3",
+    "Tohm2",
+    "Tohm3",
+    "yohm2",
+    "yohm3",
+    "Eohm2",
+    "Eohm3",
+    "zohm2",
+    "zohm3",
+    "Mohm2",
+    "Mohm3",
+    "kohm2",
+    "kohm3",
+    "Yohm2",
+    "Yohm3",
+    "asiemens2",
+    "asiemens3",
+    "csiemens2",
+    "csiemens3",
+    "Zsiemens2",
+    "Zsiemens3",
+    "Psiemens2",
+    "Psiemens3",
+    "dsiemens2",
+    "dsiemens3",
+    "Gsiemens2",
+    "Gsiemens3",
+    "fsiemens2",
+    "fsiemens3",
+    "hsiemens2",
+    "hsiemens3",
+    "dasiemens2",
+    "dasiemens3",
+    "msiemens2",
+    "msiemens3",
+    "nsiemens2",
+    "nsiemens3",
+    "psiemens2",
+    "psiemens3",
+    "usiemens2",
+    "usiemens3",
+    "Tsiemens2",
+    "Tsiemens3",
+    "ysiemens2",
+    "ysiemens3",
+    "Esiemens2",
+    "Esiemens3",
+    "zsiemens2",
+    "zsiemens3",
+    "Msiemens2",
+    "Msiemens3",
+    "ksiemens2",
+    "ksiemens3",
+    "Ysiemens2",
+    "Ysiemens3",
+    "aweber2",
+    "aweber3",
+    "cweber2",
+    "cweber3",
+    "Zweber2",
+    "Zweber3",
+    "Pweber2",
+    "Pweber3",
+    "dweber2",
+    "dweber3",
+    "Gweber2",
+    "Gweber3",
+    "fweber2",
+    "fweber3",
+    "hweber2",
+    "hweber3",
+    "daweber2",
+    "daweber3",
+    "mweber2",
+    "mweber3",
+    "nweber2",
+    "nweber3",
+    "pweber2",
+    "pweber3",
+    "uweber2",
+    "uweber3",
+    "Tweber2",
+    "Tweber3",
+    "yweber2",
+    "yweber3",
+    "Eweber2",
+    "Eweber3",
+    "zweber2",
+    "zweber3",
+    "Mweber2",
+    "Mweber3",
+    "kweber2",
+    "kweber3",
+    "Yweber2",
+    "Yweber3",
+    "atesla2",
+    "atesla3",
+    "ctesla2",
+    "ctesla3",
+    "Ztesla2",
+    "Ztesla3",
+    "Ptesla2",
+    "Ptesla3",
+    "dtesla2",
+    "dtesla3",
+    "Gtesla2",
+    "Gtesla3",
+    "ftesla2",
+    "ftesla3",
+    "htesla2",
+    "htesla3",
+    "datesla2",
+    "datesla3",
+    "mtesla2",
+    "mtesla3",
+    "ntesla2",
+    "ntesla3",
+    "ptesla2",
+    "ptesla3",
+    "utesla2",
+    "utesla3",
+    "Ttesla2",
+    "Ttesla3",
+    "ytesla2",
+    "ytesla3",
+    "Etesla2",
+    "Etesla3",
+    "ztesla2",
+    "ztesla3",
+    "Mtesla2",
+    "Mtesla3",
+    "ktesla2",
+    "ktesla3",
+    "Ytesla2",
+    "Ytesla3",
+    "ahenry2",
+    "ahenry3",
+    "chenry2",
+    "chenry3",
+    "Zhenry2",
+    "Zhenry3",
+    "Phenry2",
+    "Phenry3",
+    "dhenry2",
+    "dhenry3",
+    "Ghenry2",
+    "Ghenry3",
+    "fhenry2",
+    "fhenry3",
+    "hhenry2",
+    "hhenry3",
+    "dahenry2",
+    "dahenry3",
+    "mhenry2",
+    "mhenry3",
+    "nhenry2",
+    "nhenry3",
+    "phenry2",
+    "phenry3",
+    "uhenry2",
+    "uhenry3",
+    "Thenry2",
+    "Thenry3",
+    "yhenry2",
+    "yhenry3",
+    "Ehenry2",
+    "Ehenry3",
+    "zhenry2",
+    "zhenry3",
+    "Mhenry2",
+    "Mhenry3",
+    "khenry2",
+    "khenry3",
+    "Yhenry2",
+    "Yhenry3",
+    "acelsius2",
+    "acelsius3",
+    "ccelsius2",
+    "ccelsius3",
+    "Zcelsius2",
+    "Zcelsius3",
+    "Pcelsius2",
+    "Pcelsius3",
+    "dcelsius2",
+    "dcelsius3",
+    "Gcelsius2",
+    "Gcelsius3",
+    "fcelsius2",
+    "fcelsius3",
+    "hcelsius2",
+    "hcelsius3",
+    "dacelsius2",
+    "dacelsius3",
+    "mcelsius2",
+    "mcelsius3",
+    "ncelsius2",
+    "ncelsius3",
+    "pcelsius2",
+    "pcelsius3",
+    "ucelsius2",
+    "ucelsius3",
+    "Tcelsius2",
+    "Tcelsius3",
+    "ycelsius2",
+    "ycelsius3",
+    "Ecelsius2",
+    "Ecelsius3",
+    "zcelsius2",
+    "zcelsius3",
+    "Mcelsius2",
+    "Mcelsius3",
+    "kcelsius2",
+    "kcelsius3",
+    "Ycelsius2",
+    "Ycelsius3",
+    "alumen2",
+    "alumen3",
+    "clumen2",
+    "clumen3",
+    "Zlumen2",
+    "Zlumen3",
+    "Plumen2",
+    "Plumen3",
+    "dlumen2",
+    "dlumen3",
+    "Glumen2",
+    "Glumen3",
+    "flumen2",
+    "flumen3",
+    "hlumen2",
+    "hlumen3",
+    "dalumen2",
+    "dalumen3",
+    "mlumen2",
+    "mlumen3",
+    "nlumen2",
+    "nlumen3",
+    "plumen2",
+    "plumen3",
+    "ulumen2",
+    "ulumen3",
+    "Tlumen2",
+    "Tlumen3",
+    "ylumen2",
+    "ylumen3",
+    "Elumen2",
+    "Elumen3",
+    "zlumen2",
+    "zlumen3",
+    "Mlumen2",
+    "Mlumen3",
+    "klumen2",
+    "klumen3",
+    "Ylumen2",
+    "Ylumen3",
+    "alux2",
+    "alux3",
+    "clux2",
+    "clux3",
+    "Zlux2",
+    "Zlux3",
+    "Plux2",
+    "Plux3",
+    "dlux2",
+    "dlux3",
+    "Glux2",
+    "Glux3",
+    "flux2",
+    "flux3",
+    "hlux2",
+    "hlux3",
+    "dalux2",
+    "dalux3",
+    "mlux2",
+    "mlux3",
+    "nlux2",
+    "nlux3",
+    "plux2",
+    "plux3",
+    "ulux2",
+    "ulux3",
+    "Tlux2",
+    "Tlux3",
+    "ylux2",
+    "ylux3",
+    "Elux2",
+    "Elux3",
+    "zlux2",
+    "zlux3",
+    "Mlux2",
+    "Mlux3",
+    "klux2",
+    "klux3",
+    "Ylux2",
+    "Ylux3",
+    "abecquerel2",
+    "abecquerel3",
+    "cbecquerel2",
+    "cbecquerel3",
+    "Zbecquerel2",
+    "Zbecquerel3",
+    "Pbecquerel2",
+    "Pbecquerel3",
+    "dbecquerel2",
+    "dbecquerel3",
+    "Gbecquerel2",
+    "Gbecquerel3",
+    "fbecquerel2",
+    "fbecquerel3",
+    "hbecquerel2",
+    "hbecquerel3",
+    "dabecquerel2",
+    "dabecquerel3",
+    "mbecquerel2",
+    "mbecquerel3",
+    "nbecquerel2",
+    "nbecquerel3",
+    "pbecquerel2",
+    "pbecquerel3",
+    "ubecquerel2",
+    "ubecquerel3",
+    "Tbecquerel2",
+    "Tbecquerel3",
+    "ybecquerel2",
+    "ybecquerel3",
+    "Ebecquerel2",
+    "Ebecquerel3",
+    "zbecquerel2",
+    "zbecquerel3",
+    "Mbecquerel2",
+    "Mbecquerel3",
+    "kbecquerel2",
+    "kbecquerel3",
+    "Ybecquerel2",
+    "Ybecquerel3",
+    "agray2",
+    "agray3",
+    "cgray2",
+    "cgray3",
+    "Zgray2",
+    "Zgray3",
+    "Pgray2",
+    "Pgray3",
+    "dgray2",
+    "dgray3",
+    "Ggray2",
+    "Ggray3",
+    "fgray2",
+    "fgray3",
+    "hgray2",
+    "hgray3",
+    "dagray2",
+    "dagray3",
+    "mgray2",
+    "mgray3",
+    "ngray2",
+    "ngray3",
+    "pgray2",
+    "pgray3",
+    "ugray2",
+    "ugray3",
+    "Tgray2",
+    "Tgray3",
+    "ygray2",
+    "ygray3",
+    "Egray2",
+    "Egray3",
+    "zgray2",
+    "zgray3",
+    "Mgray2",
+    "Mgray3",
+    "kgray2",
+    "kgray3",
+    "Ygray2",
+    "Ygray3",
+    "asievert2",
+    "asievert3",
+    "csievert2",
+    "csievert3",
+    "Zsievert2",
+    "Zsievert3",
+    "Psievert2",
+    "Psievert3",
+    "dsievert2",
+    "dsievert3",
+    "Gsievert2",
+    "Gsievert3",
+    "fsievert2",
+    "fsievert3",
+    "hsievert2",
+    "hsievert3",
+    "dasievert2",
+    "dasievert3",
+    "msievert2",
+    "msievert3",
+    "nsievert2",
+    "nsievert3",
+    "psievert2",
+    "psievert3",
+    "usievert2",
+    "usievert3",
+    "Tsievert2",
+    "Tsievert3",
+    "ysievert2",
+    "ysievert3",
+    "Esievert2",
+    "Esievert3",
+    "zsievert2",
+    "zsievert3",
+    "Msievert2",
+    "Msievert3",
+    "ksievert2",
+    "ksievert3",
+    "Ysievert2",
+    "Ysievert3",
+    "akatal2",
+    "akatal3",
+    "ckatal2",
+    "ckatal3",
+    "Zkatal2",
+    "Zkatal3",
+    "Pkatal2",
+    "Pkatal3",
+    "dkatal2",
+    "dkatal3",
+    "Gkatal2",
+    "Gkatal3",
+    "fkatal2",
+    "fkatal3",
+    "hkatal2",
+    "hkatal3",
+    "dakatal2",
+    "dakatal3",
+    "mkatal2",
+    "mkatal3",
+    "nkatal2",
+    "nkatal3",
+    "pkatal2",
+    "pkatal3",
+    "ukatal2",
+    "ukatal3",
+    "Tkatal2",
+    "Tkatal3",
+    "ykatal2",
+    "ykatal3",
+    "Ekatal2",
+    "Ekatal3",
+    "zkatal2",
+    "zkatal3",
+    "Mkatal2",
+    "Mkatal3",
+    "kkatal2",
+    "kkatal3",
+    "Ykatal2",
+    "Ykatal3",
+    ]
+
+
+_lazy_definitions = dict((definition[0], definition)
+                         for definition in _lazy_unit_definitions)
+
+#: Names of all units in the standard unit registry
+standard_unit_names = frozenset([u.name for u in base_units] +
+                                [definition[0]
+                                 for definition in _lazy_unit_definitions
+                                 if definition[4]])
+
+_lazy_units = dict()
+_lazy_dimensions = dict()
+
+
+def _get_unit(name):
+    '''
+    Return the unit with the given name, creating it if necessary.
+    '''
+    if name in _lazy_definitions:
+        return _create_lazy_unit(name)
+    else:
+        return globals()[name]
+
+
+def _get_dimensions(name):
+    '''
+    Return the dimensions of the unit with the given name, without creating
+    the unit.
+    '''
+    if not name in _lazy_definitions:
+        return globals()[name].dim
+    _, base_name, _, power, _ = _lazy_definitions[name]
+    dim = _get_dimensions(base_name)
+    if power != 1:
+        if not (dim, power) in _lazy_dimensions:
+            _lazy_dimensions[(dim, power)] = dim ** power
+        dim = _lazy_dimensions[(dim, power)]
+    return dim
+
+
+def _create_lazy_unit(name):
+    '''
+    Create the unit with the given name (or return it if it has already been
+    created).
+    '''
+    if not name in _lazy_units:
+        _, base_name, scalefactor, power, _ = _lazy_definitions[name]
+        base_unit = _get_unit(base_name)
+        # The units are registered in the standard registry (or not at all),
+        # they should not end up in the user registry
+        Unit.automatically_register_units = False
+        try:
+            if scalefactor:
+                unit = Unit.create_scaled_unit(base_unit, scalefactor)
+            else:
+                unit = base_unit ** power
+                unit.name = name
+        finally:
+            Unit.automatically_register_units = True
+        _lazy_units[name] = unit
+    return _lazy_units[name]
+
+
+class _LazyUnitsModule(types.ModuleType):
+    '''
+    Module class for this module, creates units from
+    ``_lazy_unit_definitions`` on first attribute access.
+    '''
+    def __getattr__(self, name):
+        if not name in _lazy_definitions:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        unit = _create_lazy_unit(name)
+        setattr(self, name, unit)
+        return unit
+
+
+map(standard_unit_register.add, base_units)
+for _definition in _lazy_unit_definitions:
+    if _definition[4]:
+        standard_unit_register.add_deferred(_get_dimensions(_definition[0]),
+                                            partial(_create_lazy_unit,
+                                                    _definition[0]))
+map(additional_unit_register.add, additional_units)
+
+_module = _LazyUnitsModule(__name__, __doc__)
+_module.__dict__.update(globals())
+# Keep a reference to the original module, otherwise its globals (used by the
+# functions above) are cleared when it is garbage collected
+_module._original_module = sys.modules[__name__]
+sys.modules[__name__] = _module
@@ -1828,9 +1828,16 @@ class UnitRegistry(object):
     built in to the module, including volt, amp, etc. Additional
     units defines some compound units like newton metre (Nm) etc.
 
+    Units can also be added in a "deferred" way, i.e. only their dimensions
+    are known and they are only created when the registry is asked for a unit
+    with these dimensions (this is used for the scaled standard units, e.g.
+    mvolt, which are created on demand).
+
     Methods
     -------
     add
+    add_deferred
+    create_deferred_units
     __getitem__
     """
 
@@ -1838,6 +1845,7 @@ class UnitRegistry(object):
     def __init__(self):
         self.units = []
         self.units_for_dimensions = {}
+        self.deferred_units = {}
 
 
     def add(self, u):
@@ -1850,6 +1858,39 @@ class UnitRegistry(object):
         else:
             self.units_for_dimensions[dim].append(u)
 
+    def add_deferred(self, dim, create_unit):
+        """Add a unit to the registry that is only created when needed
+
+        Parameters
+        ----------
+        dim : `Dimension`
+            The dimensions of the unit.
+        create_unit : callable
+            A function without arguments returning the unit, called when a
+            unit with dimensions `dim` is requested for the first time.
+        """
+        if not dim in self.deferred_units:
+            self.deferred_units[dim] = [create_unit]
+        else:
+            self.deferred_units[dim].append(create_unit)
+
+    def create_deferred_units(self, dim=None):
+        """Create and add all deferred units (with the given dimensions)
+
+        Parameters
+        ----------
+        dim : `Dimension`, optional
+            Only create units with the given dimensions. If not given, all
+            deferred units are created.
+        """
+        if dim is None:
+            dims = self.deferred_units.keys()
+        else:
+            dims = [dim]
+        for dim in dims:
+            for create_unit in self.deferred_units.pop(dim, []):
+                self.add(create_unit())
+
     def __getitem__(self, x):
         """Returns the best unit for quantity x
 
@@ -1862,6 +1903,8 @@ class UnitRegistry(object):
         most array members. Otherwise, we select the first matching unit
         (which will typically be the unscaled version).
         """
+        if x.dim in self.deferred_units:
+            self.create_deferred_units(x.dim)
         matching = self.units_for_dimensions.get(x.dim, [])
         if len(matching) == 0:
             raise KeyError("Unit not found in registry.")
@@ -1924,6 +1967,7 @@ def all_registered_units(*regs):
                 user_unit_register,
                 additional_unit_register]
     for r in regs:
+        r.create_deferred_units()
         for u in r.units:
             yield u
 
@@ -0,0 +1,80 @@
+'''
+A simple cache for the results of expensive operations like parsing.
+'''
+from collections import OrderedDict
+
+__all__ = ['LRUCache']
+
+
+class LRUCache(object):
+    '''
+    A dictionary-like cache with a bounded size. If the cache is full, the
+    least recently used entry is discarded when a new entry is added. The
+    number of successful (hits) and unsuccessful (misses) lookups are
+    recorded.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximal number of entries in the cache, defaults to 1000.
+
+    Examples
+    --------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a']
+    1
+    >>> cache['c'] = 3  # discards 'b', the least recently used entry
+    >>> 'b' in cache
+    False
+    >>> print cache
+    LRUCache(hits=1, misses=0, maxsize=2, size=2)
+    '''
+    def __init__(self, maxsize=1000):
+        #: The maximal number of entries in the cache
+        self.maxsize = maxsize
+        #: The number of successful lookups
+        self.hits = 0
+        #: The number of unsuccessful lookups
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __getitem__(self, key):
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        # Re-insert the entry to mark it as the most recently used one
+        self._entries[key] = value
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._entries:
+            del self._entries[key]
+        elif len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+        self._entries[key] = value
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        '''
+        Remove all entries from the cache and reset the hit/miss counters.
+        '''
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return '%s(hits=%d, misses=%d, maxsize=%d, size=%d)' % (self.__class__.__name__,
+                                                                self.hits,
+                                                                self.misses,
+                                                                self.maxsize,
+                                                                len(self))
@@ -12,8 +12,6 @@ import time
 from warnings import warn
 
 import numpy
-import scipy
-import sympy
 
 import brian2
 from brian2.core.preferences import brian_prefs
@@ -96,8 +94,6 @@ logger.debug('Python interpreter: %s' % sys.executable)
 logger.debug('Platform: %s' % sys.platform)
 version_infos = {'brian': brian2.__version__,
                  'numpy': numpy.__version__,
-                 'scipy': scipy.__version__,
-                 'sympy': sympy.__version__,
                  'python': sys.version,
                  }
 for _name, _version in version_infos.iteritems():
@@ -105,6 +101,22 @@ for _name, _version in version_infos.iteritems():
                                                        version=str(_version)))
 
 
+def log_dependency_versions():
+    '''
+    Log the versions of the dependencies that are only imported on first use
+    (scipy and sympy). These are not imported at startup to keep the import of
+    Brian fast, therefore their versions are only logged in case of an error.
+    '''
+    for name in ['scipy', 'sympy']:
+        try:
+            module = __import__(name)
+            version = module.__version__
+        except ImportError as ex:
+            version = 'not available (%s)' % ex
+        logger.debug('{name} version is: {version}'.format(name=name,
+                                                           version=version))
+
+
 UNHANDLED_ERROR_MESSAGE = ('Brian encountered an unexpected error. '
 'If you think this is bug in Brian, please report this issue either to the '
 'mailing list at <http://groups.google.com/group/brian-support/>, '
@@ -121,6 +133,7 @@ def brian_excepthook(exc_type, exc_obj, exc_tb):
     '''
     BrianLogger.exception_occured = True
     
+    log_dependency_versions()
     logger.error(UNHANDLED_ERROR_MESSAGE,
                  exc_info=(exc_type, exc_obj, exc_tb))
 
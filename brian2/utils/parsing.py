@@ -3,16 +3,12 @@ Utility functions for parsing expressions to sympy.
 '''
 from StringIO import StringIO
 
-import sympy
-from sympy.parsing.sympy_tokenize import (generate_tokens, untokenize, NUMBER,
-                                          NAME, OP)
+from .caching import LRUCache
 
-SYMPY_DICT = {'I': sympy.I,
-              'Float': sympy.Float,
-              'Integer': sympy.Integer,
-              'Symbol': sympy.Symbol}
+#: Cache for sympy expressions returned by `parse_to_sympy`
+sympy_expression_cache = LRUCache(maxsize=1000)
 
-def parse_to_sympy(expr, local_dict=None):
+def parse_to_sympy(expr, local_dict=None, use_cache=True):
     '''
     Parses a string into a sympy expression. The reason for not using `sympify`
     directly is that sympify does a ``from sympy import *``, adding all functions
@@ -28,6 +24,11 @@ def parse_to_sympy(expr, local_dict=None):
     local_dict : dict
         A dictionary mapping names to objects. These names will be left
         untouched and not wrapped in Symbol(...).
+    use_cache : bool, optional
+        Whether to look up (and store) the result in the
+        `sympy_expression_cache`, keyed by the expression and the contents
+        of `local_dict`. Defaults to ``True``, caching is only possible if
+        all objects in `local_dict` are hashable.
     
     Returns
     -------
@@ -48,7 +49,28 @@ def parse_to_sympy(expr, local_dict=None):
     '''
     if local_dict is None:
         local_dict = {}
-    
+
+    key = None
+    if use_cache:
+        try:
+            key = (expr, frozenset(local_dict.iteritems()))
+            return sympy_expression_cache[key]
+        except TypeError:
+            # unhashable objects in local_dict, do not use the cache
+            key = None
+        except KeyError:
+            pass
+
+    # sympy is only imported on first use, importing it takes a considerable
+    # amount of time and it is not needed for every use of Brian
+    import sympy
+    from sympy.parsing.sympy_tokenize import (generate_tokens, untokenize,
+                                              NUMBER, NAME, OP)
+    sympy_dict = {'I': sympy.I,
+                  'Float': sympy.Float,
+                  'Integer': sympy.Integer,
+                  'Symbol': sympy.Symbol}
+
     tokens = generate_tokens(StringIO(expr).readline)
     
     result = []
@@ -98,9 +120,12 @@ def parse_to_sympy(expr, local_dict=None):
     code = untokenize(result)
     
     try:
-        s_expr = eval(code, SYMPY_DICT, local_dict)
+        s_expr = eval(code, sympy_dict, local_dict)
     except Exception as ex:
         raise SyntaxError('Expression "%s" could not be parsed: %s' %
                           (expr, str(ex)))
 
-    return s_expr
\ No newline at end of file
+    if key is not None:
+        sympy_expression_cache[key] = s_expr
+
+    return s_expr
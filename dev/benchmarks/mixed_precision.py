@@ -0,0 +1,62 @@
+'''
+Validation benchmark for the mixed precision mode (see the
+``mixed_precision`` preference): simulates the same population of leaky
+integrators with a heterogeneous, oscillating input once with double
+precision and once with single precision storage and double precision
+calculations, and reports the runtime, the memory used for the state
+variables and the error of the mixed precision run with respect to the double
+precision run.
+
+The model has no threshold and reset, and its constants are stored as
+parameters of the group (external constants are not resolved in the
+generated code yet).
+'''
+import time
+
+import numpy as np
+
+from brian2 import *
+
+N = 10000
+duration = 1*second
+
+
+def simulate(mixed_precision):
+    brian_prefs.mixed_precision = mixed_precision
+    np.random.seed(2013)
+    eqs = '''
+    dv/dt = (I + w - v) / tau : 1
+    dw/dt = -w * k : 1
+    I : 1
+    k : Hz
+    tau : second
+    '''
+    G = NeuronGroup(N, eqs, method='auto')
+    G.tau = 20*ms
+    G.k = 5*Hz
+    G.I = np.linspace(0.9, 1.5, N)
+    G.v = np.random.rand(N)
+    G.w = np.random.rand(N)
+    states = StateMonitor(G, 'v', record=np.arange(0, N, N // 100))
+    net = Network(G, states)
+    start = time.time()
+    net.run(duration)
+    runtime = time.time() - start
+    state_bytes = sum(arr.nbytes for arr in G.arrays.itervalues())
+    return runtime, state_bytes, states.v_, G.v_.astype(np.float64)
+
+
+if __name__ == '__main__':
+    runtime_double, bytes_double, v_double, final_double = simulate(False)
+    runtime_mixed, bytes_mixed, v_mixed, final_mixed = simulate(True)
+    abs_error = np.abs(v_mixed - v_double)
+    final_error = np.abs(final_mixed - final_double)
+    print 'Double precision: %.2fs, %d bytes of state variables' % (runtime_double,
+                                                                   bytes_double)
+    print 'Mixed precision:  %.2fs, %d bytes of state variables' % (runtime_mixed,
+                                                                   bytes_mixed)
+    print 'Recorded v error: max %.3g, mean %.3g' % (abs_error.max(),
+                                                    abs_error.mean())
+    print 'Final v error (all neurons): max %.3g, mean %.3g' % (final_error.max(),
+                                                               final_error.mean())
+    print 'float32 resolution (machine epsilon): %.3g' % np.finfo(np.float32).eps
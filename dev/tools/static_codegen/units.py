@@ -56,34 +56,31 @@ for longname, shortname, definition in derived_unit_table:
 
 all_units = base_units + []
 
-definitions = '######### SCALED BASE UNITS ###########\n'
+# Scaled and powered units are only defined by a tuple
+# (name, base unit name, scale factor, power, standard) and created on demand
+lazy_units = []
 
 # Generate scaled units for all base units
-scaled_units = []
 excluded_scaled_units = set()
 for _bu in base_units:
     for _k in _siprefixes.keys():
         if len(_k):
             _u = _k+_bu
             all_units.append(_u)
-            definitions += '{_u} = Unit.create_scaled_unit({_bu}, "{_k}")\n'.format(
-                                                        _u=_u, _bu=_bu, _k=_k)
-            if not _k in ["da", "d", "c", "h"]:
-                scaled_units.append(_u)
-            else:
+            standard = not _k in ["da", "d", "c", "h"]
+            if not standard:
                 excluded_scaled_units.add(_u)
+            lazy_units.append('("{_u}", "{_bu}", "{_k}", 1, {standard})'.format(
+                                  _u=_u, _bu=_bu, _k=_k, standard=standard))
 
 # Generate 2nd and 3rd powers for all scaled base units
-definitions += '######### SCALED BASE UNITS TO POWERS ###########\n'
-powered_units = []
 for bu in all_units + []:
     for i in [2, 3]:
         u = bu+str(i)
-        definitions += '{u} = {bu}**{i}\n'.format(u=u, bu=bu, i=i)
-        definitions += '{u}.name = "{u}"\n'.format(u=u)
         all_units.append(u)
-        if bu not in excluded_scaled_units:
-            powered_units.append(u)
+        lazy_units.append('("{u}", "{bu}", "", {i}, {standard})'.format(
+                              u=u, bu=bu, i=i,
+                              standard=bu not in excluded_scaled_units))
 
 # Add unit names to __all__
 all = '''
@@ -101,11 +98,10 @@ def to_definition(name, x):
 
 template = open('units_template.py').read()
 units_str = template.format(
-    derived=derived, all=all, definitions=definitions,
+    derived=derived, all=all,
     base_units=to_definition('base_units', base_units),
-    scaled_units=to_definition('scaled_units', scaled_units),
-    powered_units=to_definition('powered_units', powered_units),
-    all_units=to_definition('all_units', all_units),
+    lazy_units=to_definition('_lazy_unit_definitions', lazy_units),
+    all_units=to_definition('all_units', ['"'+u+'"' for u in all_units]),
     additional_units=additional_units,
     )
 
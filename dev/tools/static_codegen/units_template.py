@@ -6,6 +6,10 @@ Instead edit the template:
 
     dev/tools/static_codegen/units_template.py
 '''
+import sys
+import types
+from functools import partial
+
 from .fundamentalunits import (Unit, get_or_create_dimension,
                                standard_unit_register,
                                additional_unit_register)
@@ -33,15 +37,108 @@ fundamental_units = [metre, meter, gram, second, amp, kelvin, mole, candle]
 
 {derived}
 
-{definitions}
-
 {base_units}
-{scaled_units}
-{powered_units}
 {additional_units}
-{all_units}
 
 Unit.automatically_register_units = True
 
-map(standard_unit_register.add, base_units + scaled_units + powered_units)
+# Scaled units (e.g. mvolt) and powers of units (e.g. metre2, mvolt2) are not
+# created when this module is imported, but when they are accessed for the
+# first time -- either as an attribute of this module or when the standard
+# unit registry is asked for a unit with their dimensions.
+# Each entry is a tuple (name, base unit name, scale factor, power, standard)
+# where "standard" states whether the unit is part of the standard registry.
+{lazy_units}
+
+#: Names of all units (including units that have not been created yet)
+{all_units}
+
+_lazy_definitions = dict((definition[0], definition)
+                         for definition in _lazy_unit_definitions)
+
+#: Names of all units in the standard unit registry
+standard_unit_names = frozenset([u.name for u in base_units] +
+                                [definition[0]
+                                 for definition in _lazy_unit_definitions
+                                 if definition[4]])
+
+_lazy_units = dict()
+_lazy_dimensions = dict()
+
+
+def _get_unit(name):
+    '''
+    Return the unit with the given name, creating it if necessary.
+    '''
+    if name in _lazy_definitions:
+        return _create_lazy_unit(name)
+    else:
+        return globals()[name]
+
+
+def _get_dimensions(name):
+    '''
+    Return the dimensions of the unit with the given name, without creating
+    the unit.
+    '''
+    if not name in _lazy_definitions:
+        return globals()[name].dim
+    _, base_name, _, power, _ = _lazy_definitions[name]
+    dim = _get_dimensions(base_name)
+    if power != 1:
+        if not (dim, power) in _lazy_dimensions:
+            _lazy_dimensions[(dim, power)] = dim ** power
+        dim = _lazy_dimensions[(dim, power)]
+    return dim
+
+
+def _create_lazy_unit(name):
+    '''
+    Create the unit with the given name (or return it if it has already been
+    created).
+    '''
+    if not name in _lazy_units:
+        _, base_name, scalefactor, power, _ = _lazy_definitions[name]
+        base_unit = _get_unit(base_name)
+        # The units are registered in the standard registry (or not at all),
+        # they should not end up in the user registry
+        Unit.automatically_register_units = False
+        try:
+            if scalefactor:
+                unit = Unit.create_scaled_unit(base_unit, scalefactor)
+            else:
+                unit = base_unit ** power
+                unit.name = name
+        finally:
+            Unit.automatically_register_units = True
+        _lazy_units[name] = unit
+    return _lazy_units[name]
+
+
+class _LazyUnitsModule(types.ModuleType):
+    '''
+    Module class for this module, creates units from
+    ``_lazy_unit_definitions`` on first attribute access.
+    '''
+    def __getattr__(self, name):
+        if not name in _lazy_definitions:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        unit = _create_lazy_unit(name)
+        setattr(self, name, unit)
+        return unit
+
+
+map(standard_unit_register.add, base_units)
+for _definition in _lazy_unit_definitions:
+    if _definition[4]:
+        standard_unit_register.add_deferred(_get_dimensions(_definition[0]),
+                                            partial(_create_lazy_unit,
+                                                    _definition[0]))
 map(additional_unit_register.add, additional_units)
+
+_module = _LazyUnitsModule(__name__, __doc__)
+_module.__dict__.update(globals())
+# Keep a reference to the original module, otherwise its globals (used by the
+# functions above) are cleared when it is garbage collected
+_module._original_module = sys.modules[__name__]
+sys.modules[__name__] = _module